@@ -0,0 +1,45 @@
+"""add_id_blocks_table
+
+Revision ID: b7d2e4f1a9c3
+Revises: f9e8d7c6b5a4
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f1a9c3'
+down_revision: Union[str, None] = 'f9e8d7c6b5a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create id_blocks table for client-side primary key allocation.
+
+    Conversation rows are inserted write-behind, after the chat response
+    that carries their id was returned, so processes reserve their ids in
+    blocks from this table instead of relying on AUTO_INCREMENT.
+    """
+    op.create_table(
+        'id_blocks',
+        sa.Column('table_name', sa.String(length=64), nullable=False),
+        sa.Column('next_id', sa.BigInteger(), nullable=False, comment='First id not reserved by any process yet'),
+        sa.PrimaryKeyConstraint('table_name'),
+    )
+
+    # Continue after the ids AUTO_INCREMENT already handed out
+    op.execute(
+        "INSERT INTO id_blocks (table_name, next_id) "
+        "SELECT 'conversations', COALESCE(MAX(id), 0) + 1 FROM conversations"
+    )
+
+
+def downgrade() -> None:
+    """Drop id_blocks table"""
+    op.drop_table('id_blocks')
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Make every worker reload its in-memory pincode coverage
+
+The chat-side location and provider checks (EntityValidator, BookingAgent)
+answer from the pincode coverage index, which no application code writes to.
+Run this after changing Pincode, ProviderPincode or provider status rows
+(seed scripts, migrations, manual SQL):
+
+    python scripts/refresh_pincode_coverage.py                # full reload
+    python scripts/refresh_pincode_coverage.py --provider 12  # only these providers
+
+It publishes the change to Redis; workers pick it up within
+PINCODE_COVERAGE_VERSION_CHECK_SECONDS. Without Redis nothing can be
+signalled and workers keep their coverage until it is
+PINCODE_COVERAGE_MAX_AGE_SECONDS old (or they restart).
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.cache.redis_client import redis_client
+from src.core.config import settings
+from src.services.pincode_coverage import publish_coverage_change
+
+
+async def refresh_pincode_coverage(provider_ids: list) -> int:
+    """Publish a coverage change; returns the exit status"""
+    await redis_client.connect()
+    try:
+        versions = [await publish_coverage_change(provider_id) for provider_id in provider_ids or [None]]
+    finally:
+        await redis_client.disconnect()
+
+    if not all(versions):
+        print(
+            "Redis is unavailable: workers reload coverage once it is "
+            f"{settings.PINCODE_COVERAGE_MAX_AGE_SECONDS}s old or on restart"
+        )
+        return 1
+
+    scope = f"providers {', '.join(map(str, provider_ids))}" if provider_ids else "all coverage"
+    print(
+        f"Published coverage v{versions[-1]} ({scope}); workers reload within "
+        f"{settings.PINCODE_COVERAGE_VERSION_CHECK_SECONDS}s"
+    )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--provider",
+        type=int,
+        action="append",
+        dest="provider_ids",
+        default=[],
+        help="Provider whose coverage or status changed (repeatable; default: reload everything)"
+    )
+    args = parser.parse_args()
+    return asyncio.run(refresh_pincode_coverage(args.provider_ids))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,8 +16,9 @@ from datetime import datetime, timedelta
 import logging
 
 from src.services.booking_service import BookingService
+from src.services.pincode_coverage import get_pincode_coverage
 from src.services.response_generator import ResponseGenerator
-from src.core.models import User, Address, Cart, CartItem, RateCard, Provider, ProviderPincode, Pincode, Booking
+from src.core.models import User, Address, Cart, CartItem, RateCard, Booking
 from src.schemas.customer import CreateBookingRequest
 
 logger = logging.getLogger(__name__)
@@ -392,11 +393,10 @@ class BookingAgent:
                 "pincode_id": int
             }
         """
+        coverage = await get_pincode_coverage(self.db)
+
         # Step 1: Check if pincode exists and is serviceable
-        pincode_result = await self.db.execute(
-            select(Pincode).where(Pincode.pincode == pincode)
-        )
-        pincode_obj = pincode_result.scalar_one_or_none()
+        pincode_obj = coverage.get_pincode(pincode)
         
         if not pincode_obj:
             return {
@@ -415,18 +415,9 @@ class BookingAgent:
             }
         
         # Step 2: Check if any active providers service this pincode
-        provider_count_result = await self.db.execute(
-            select(ProviderPincode)
-            .join(Provider, ProviderPincode.provider_id == Provider.id)
-            .where(
-                ProviderPincode.pincode_id == pincode_obj.id,
-                Provider.is_active == True,
-                Provider.is_verified == True
-            )
-        )
-        provider_associations = provider_count_result.all()
+        available_providers = coverage.available_providers(pincode_obj.id)
         
-        if not provider_associations:
+        if not available_providers:
             return {
                 "is_valid": False,
                 "message": f"Sorry, no service providers are available in pincode {pincode} right now.",
@@ -437,7 +428,7 @@ class BookingAgent:
         return {
             "is_valid": True,
             "message": f"Service available in pincode {pincode}",
-            "available_providers": len(provider_associations),
+            "available_providers": available_providers,
             "pincode_id": pincode_obj.id
         }
     
@@ -17,10 +17,10 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database.id_allocator import get_id_allocator
+from src.core.database.write_behind import get_write_behind_queue
 from src.core.models import User, Conversation
-from src.nlp.intent.classifier import IntentClassifier
 from src.nlp.intent.config import IntentType as IntentTypeEnum
-from src.llm.gemini.client import LLMClient
 from src.schemas.intent import IntentClassificationResult, IntentResult
 from src.agents.policy.policy_agent import PolicyAgent
 from src.agents.service.service_agent import ServiceAgent
@@ -36,6 +36,9 @@ from src.monitoring.metrics import (
     agent_concurrent_executions,
     chat_sessions_total
 )
+from src.llm.context.conversation_cache import get_conversation_context_cache
+from src.services.dialog_state_manager import DIALOG_STATE_NOT_LOADED
+from src.utils.stream_events import emit_stage_event
 
 
 class CoordinatorAgent:
@@ -71,20 +74,24 @@ class CoordinatorAgent:
         "unclear_intent": "coordinator",  # Handle unclear intents in coordinator
     }
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, resources=None):
         """
         Initialize CoordinatorAgent
 
         Args:
             db: Database session for operations
+            resources: Shared AgentResources (default: new resources for this agent)
         """
         self.db = db
         self.logger = logging.getLogger(__name__)
 
         # Initialize intent classifier
         try:
-            self.llm_client = LLMClient.create_for_intent_classification()
-            self.intent_classifier = IntentClassifier(llm_client=self.llm_client)
+            if resources is None:
+                from src.core.services import AgentResources
+                resources = AgentResources()
+            self.llm_client = resources.llm_client
+            self.intent_classifier = resources.intent_classifier
 
             # Lazy initialization: agents are created only when needed
             self._policy_agent = None
@@ -153,7 +160,7 @@ class CoordinatorAgent:
         """Lazy initialization of SQLAgent"""
         if self._sql_agent is None:
             self.logger.info("Initializing SQLAgent (lazy)")
-            self._sql_agent = SQLAgent(db=self.db)
+            self._sql_agent = SQLAgent(db=self.db, llm_client=self.llm_client)
         return self._sql_agent
     
     async def execute(
@@ -161,7 +168,8 @@ class CoordinatorAgent:
         message: str,
         user: User,
         session_id: str,
-        conversation_history: Optional[List[Dict[str, str]]] = None
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        dialog_state: Any = DIALOG_STATE_NOT_LOADED
     ) -> Dict[str, Any]:
         """
         Main execution method for CoordinatorAgent with slot-filling support
@@ -174,6 +182,8 @@ class CoordinatorAgent:
             user: User object
             session_id: Session ID for tracking
             conversation_history: Optional conversation history for context
+            dialog_state: Active dialog state already loaded by the caller (None if there
+                is none); loaded here when omitted
 
         Returns:
             Dictionary with response, intent, agent_used, and metadata
@@ -193,7 +203,8 @@ class CoordinatorAgent:
             from src.services.dialog_state_manager import DialogStateManager
             from src.core.models.dialog_state import DialogStateType
             dialog_manager = DialogStateManager(self.db)
-            dialog_state = await dialog_manager.get_active_state(session_id)
+            if dialog_state is DIALOG_STATE_NOT_LOADED:
+                dialog_state = await dialog_manager.get_active_state(session_id)
 
             self.logger.info(f"[COORDINATOR] Dialog state: {dialog_state.state if dialog_state else 'None'}, Intent: {dialog_state.intent if dialog_state else 'None'}")
 
@@ -582,6 +593,7 @@ class CoordinatorAgent:
             # Use explicit None check and getattr to avoid evaluating SQLAlchemy ColumnElement in boolean context
             if dialog_state is not None and getattr(dialog_state, "state", None) == DialogStateType.COLLECTING_INFO:
                 self.logger.info(f"Active dialog state found: {getattr(dialog_state, 'intent', None)}, state: {getattr(dialog_state, 'state', None)}")
+                emit_stage_event("agent_selected", agent="slot_filling", intent=getattr(dialog_state.intent, "value", dialog_state.intent))
                 from src.services.slot_filling_service import SlotFillingService
                 from src.services.question_generator import QuestionGenerator
                 from src.services.entity_extractor import EntityExtractor
@@ -618,6 +630,7 @@ class CoordinatorAgent:
                         message=message,
                         conversation_history=conversation_history
                     )
+                    self._emit_classified(intent_result, classification_method)
 
                     # Get primary intent details
                     primary_intent_obj = intent_result.intents[0]
@@ -836,6 +849,7 @@ class CoordinatorAgent:
                 message=message,
                 conversation_history=conversation_history
             )
+            self._emit_classified(intent_result, classification_method)
 
             # Get primary intent details
             primary_intent_obj = intent_result.intents[0]  # First intent is primary
@@ -1173,6 +1187,7 @@ class CoordinatorAgent:
                 )
             else:
                 # Multiple intents - handle sequentially
+                emit_stage_event("agent_selected", agent="multi_agent", intent=intent_result.primary_intent)
                 response = await self._handle_multi_intent(
                     intent_result=intent_result,
                     user=user,
@@ -1228,6 +1243,23 @@ class CoordinatorAgent:
             agent_execution_duration_seconds.labels(agent_name="coordinator", intent="all").observe(execution_time)
             agent_executions_total.labels(agent_name="coordinator", intent="all", status="completed").inc()
     
+    def _emit_classified(self, intent_result: IntentClassificationResult, classification_method: str) -> None:
+        """
+        Publish the classification stage event for streaming chat turns
+
+        Args:
+            intent_result: Classification result
+            classification_method: How the intent was classified
+        """
+        primary_intent_obj = intent_result.intents[0] if intent_result.intents else None
+        emit_stage_event(
+            "classified",
+            intent=intent_result.primary_intent,
+            confidence=primary_intent_obj.confidence if primary_intent_obj else None,
+            method=classification_method,
+            all_intents=[i.intent for i in intent_result.intents]
+        )
+
     async def _route_to_agent(
         self,
         intent_result: IntentResult,
@@ -1271,6 +1303,8 @@ class CoordinatorAgent:
         else:
             self.logger.info(f"Routing intent '{intent}' to {agent_type} agent")
 
+        emit_stage_event("agent_selected", agent=agent_type, intent=intent)
+
         try:
             # Handle coordinator-level intents (greetings, general queries, out-of-scope, unclear)
             if agent_type == "coordinator":
@@ -1418,7 +1452,8 @@ Remember: Be friendly, not robotic. No emojis, no bullet points, no structured f
             response_text = await self.llm_client.generate(
                 prompt=prompt,
                 system_prompt=get_system_prompt("conversational_response"),
-                temperature=0.7
+                temperature=0.7,
+                stream_to_user=True
             )
 
             self.logger.info(f"Generated LLM greeting for user {user.id}")
@@ -1491,7 +1526,8 @@ Remember: Be friendly and helpful, not robotic. No emojis, no bullet points, no
             response_text = await self.llm_client.generate(
                 prompt=prompt,
                 system_prompt=get_system_prompt("conversational_response"),
-                temperature=0.7
+                temperature=0.7,
+                stream_to_user=True
             )
 
             self.logger.info(f"Generated LLM general query response for user {user.id}")
@@ -1554,7 +1590,8 @@ Remember: Be friendly, not robotic. No emojis, no bullet points, no structured f
             response_text = await self.llm_client.generate(
                 prompt=prompt,
                 system_prompt=get_system_prompt("conversational_response"),
-                temperature=0.7
+                temperature=0.7,
+                stream_to_user=True
             )
 
             self.logger.info(f"Handled out-of-scope query for user {user.id}: {message[:50]}...")
@@ -1615,7 +1652,8 @@ Remember: Be friendly and helpful, not robotic. No emojis, no bullet points, no
             response_text = await self.llm_client.generate(
                 prompt=prompt,
                 system_prompt=get_system_prompt("conversational_response"),
-                temperature=0.7
+                temperature=0.7,
+                stream_to_user=True
             )
 
             self.logger.info(f"Handled unclear intent for user {user.id}: {message[:50]}...")
@@ -1857,7 +1895,6 @@ Remember: Be friendly and helpful, not robotic. No emojis, no bullet points, no
                 message=user_message,
                 intent=intent
             )
-            self.db.add(user_conv)
 
             # Store assistant response
             assistant_conv = Conversation(
@@ -1868,9 +1905,27 @@ Remember: Be friendly and helpful, not robotic. No emojis, no bullet points, no
                 intent=intent,
                 agent_calls=[{"agent": agent_used}]  # Store which agent was used
             )
-            self.db.add(assistant_conv)
 
-            await self.db.commit()
+            # Ids always come from the allocator (see _store_message in chat_service);
+            # batched off the request path when write-behind is enabled
+            id_allocator = get_id_allocator()
+            user_conv.id = await id_allocator.allocate(Conversation)
+            assistant_conv.id = await id_allocator.allocate(Conversation)
+            queue = get_write_behind_queue()
+            if queue is not None:
+                queue.add(user_conv)
+                queue.add(assistant_conv)
+            else:
+                self.db.add(user_conv)
+                self.db.add(assistant_conv)
+                await self.db.commit()
+
+            cache = get_conversation_context_cache()
+            if cache is not None:
+                await cache.append(user_id, session_id, [
+                    {"id": user_conv.id, "role": MessageRole.USER.value, "content": user_message},
+                    {"id": assistant_conv.id, "role": MessageRole.ASSISTANT.value, "content": assistant_response}
+                ])
             self.logger.info(f"Conversation stored for user {user_id}, session {session_id} (user + assistant)")
         except Exception as e:
             self.logger.error(f"Error storing conversation: {e}", exc_info=True)
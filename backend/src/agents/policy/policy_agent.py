@@ -13,14 +13,11 @@ about company policies, terms, conditions, refunds, and cancellations by:
 import logging
 from typing import Dict, Any, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.prompts import ChatPromptTemplate
-from langchain.schema import HumanMessage, SystemMessage
 
 from src.core.models import User
-from src.rag.vector_store.pinecone_service import PineconeService
-from src.rag.embeddings.embedding_service import EmbeddingService
-from src.core.config.settings import settings
+from src.llm.gemini.client import get_shared_llm_client
+from src.rag.vector_store.pinecone_service import get_pinecone_service
+from src.rag.embeddings.embedding_service import get_embedding_service
 
 
 class PolicyAgent:
@@ -47,11 +44,11 @@ class PolicyAgent:
         
         # Initialize services
         try:
-            self.pinecone_service = PineconeService()
-            self.embedding_service = EmbeddingService()
-            self.llm = ChatGoogleGenerativeAI(
+            # Process-wide instances: the agent itself is built per request
+            self.pinecone_service = get_pinecone_service()
+            self.embedding_service = get_embedding_service()
+            self.llm_client = get_shared_llm_client(
                 model="gemini-2.0-flash-exp",
-                google_api_key=settings.GOOGLE_API_KEY,
                 temperature=0.1,  # Low temperature for factual responses
                 max_tokens=1024
             )
@@ -395,7 +392,7 @@ class PolicyAgent:
             self.logger.debug("Generating response with LLM")
             
             # Create prompt with conversational instructions
-            system_message = SystemMessage(content="""You are Lisa, a friendly AI assistant for ConvergeAI home services.
+            system_message = {"role": "system", "content": """You are Lisa, a friendly AI assistant for ConvergeAI home services.
 
 Your task is to answer the user's question using ONLY the information from the context below.
 
@@ -409,9 +406,9 @@ Guidelines:
 - NEVER use emojis
 - NEVER make up information not in the context
 
-Remember: You're having a conversation, not writing a policy document!""")
+Remember: You're having a conversation, not writing a policy document!"""}
 
-            human_message = HumanMessage(content=f"""CONTEXT (Copy information EXACTLY from here):
+            human_message = {"role": "user", "content": f"""CONTEXT (Copy information EXACTLY from here):
 {context}
 
 QUESTION: {query}
@@ -424,17 +421,19 @@ INSTRUCTIONS:
 5. Do NOT add any information not in the CONTEXT
 6. Do NOT paraphrase - use the exact wording from CONTEXT
 
-Answer the question now using ONLY the CONTEXT above:""")
+Answer the question now using ONLY the CONTEXT above:"""}
 
             # Generate response with retry logic
-            from src.nlp.llm.gemini_client import with_retry
+            from src.nlp.llm.retry import async_retry
 
-            @with_retry(max_retries=3, initial_delay=1.0, backoff_factor=2.0)
-            def invoke_with_retry():
-                return self.llm.invoke([system_message, human_message])
+            @async_retry(max_retries=3, initial_delay=1.0, backoff_factor=2.0)
+            async def invoke_with_retry():
+                return await self.llm_client.ainvoke_with_messages(
+                    [system_message, human_message],
+                    stream_to_user=True
+                )
 
-            response = invoke_with_retry()
-            response_text = response.content
+            response_text = await invoke_with_retry()
 
             self.logger.debug(f"Generated response: {response_text[:100]}...")
             return response_text
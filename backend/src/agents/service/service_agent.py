@@ -18,21 +18,38 @@ import asyncio
 
 # NLP imports
 try:
-    from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
+    import sentence_transformers  # noqa: F401 (semantic matching via the shared embedding service)
     from spellchecker import SpellChecker
-    import numpy as np
+    from src.services.catalog_embedding_index import CATEGORY, get_catalog_embedding_index
     NLP_AVAILABLE = True
 except ImportError:
     NLP_AVAILABLE = False
-    logging.warning("NLP packages not available. Install sentence-transformers, scikit-learn, pyspellchecker for enhanced functionality.")
+    logging.warning("NLP packages not available. Install sentence-transformers, pyspellchecker for enhanced functionality.")
 
 from src.core.models import User, Category, Subcategory, RateCard, Provider
+from src.services.catalog_snapshot import get_catalog_snapshot
 from src.services.category_service import CategoryService
+from src.services.service_search_index import search_services
 from src.services.response_generator import ResponseGenerator
 
 logger = logging.getLogger(__name__)
 
+# English word-frequency dictionary, loaded once and shared by every matcher
+_spell_checker = None
+
+
+def get_spell_checker():
+    """
+    Get the process-wide spell checker (singleton pattern)
+
+    Returns:
+        SpellChecker instance, or None if pyspellchecker is not installed
+    """
+    global _spell_checker
+    if _spell_checker is None and NLP_AVAILABLE:
+        _spell_checker = SpellChecker()
+    return _spell_checker
+
 
 class CategoryMatcher:
     """
@@ -47,19 +64,12 @@ class CategoryMatcher:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.spell_checker = SpellChecker() if NLP_AVAILABLE else None
-        self.semantic_model = None
+        self.spell_checker = get_spell_checker()
         self.categories_cache: List[Dict[str, Any]] = []
-        self.cache_timestamp = None
+        self.cache_snapshot = None
 
-        # Initialize semantic model if available
-        if NLP_AVAILABLE:
-            try:
-                self.semantic_model = SentenceTransformer('all-MiniLM-L6-v2')
-                logger.info("Semantic model loaded successfully")
-            except Exception as e:
-                logger.warning(f"Failed to load semantic model: {e}")
-                self.semantic_model = None
+        # Category embeddings are shared across matchers (model shared with RAG)
+        self.embedding_index = get_catalog_embedding_index() if NLP_AVAILABLE else None
 
     async def match_category(self, user_input: str) -> Optional[Dict]:
         """
@@ -118,7 +128,7 @@ class CategoryMatcher:
         results.extend(fuzzy_matches)
 
         # Level 4: Semantic similarity (if available)
-        if self.semantic_model:
+        if self.embedding_index:
             semantic_matches = await self._semantic_match(user_input)
             results.extend(semantic_matches)
 
@@ -130,21 +140,23 @@ class CategoryMatcher:
         return None
 
     async def _refresh_categories_cache(self) -> None:
-        """Refresh categories cache from database"""
+        """Refresh categories cache from the catalog snapshot"""
         try:
-            query = select(Category).where(Category.is_active == True)
-            result = await self.db.execute(query)
-            categories = result.scalars().all()
+            snapshot = await get_catalog_snapshot(self.db)
+            if self.cache_snapshot is snapshot:
+                return
 
             self.categories_cache = [
                 {"id": cat.id, "name": cat.name, "description": cat.description or ""}
-                for cat in categories
+                for cat in snapshot.categories
             ]
+            self.cache_snapshot = snapshot
             logger.info(f"Refreshed categories cache with {len(self.categories_cache)} categories")
 
         except Exception as e:
             logger.error(f"Failed to refresh categories cache: {e}")
             self.categories_cache = []
+            self.cache_snapshot = None
 
     async def _exact_match(self, input_text: str) -> Optional[Dict[str, Any]]:
         """Check for exact matches in category names"""
@@ -249,7 +261,7 @@ class CategoryMatcher:
 
     async def _semantic_match(self, input_text: str) -> List[Dict[str, Any]]:
         """Semantic similarity matching using sentence transformers"""
-        if not self.semantic_model or not self.categories_cache:
+        if not self.embedding_index or not self.categories_cache:
             return []
 
         try:
@@ -257,20 +269,17 @@ class CategoryMatcher:
             if len(input_text.strip()) <= 2:
                 return []
 
-            # Get embeddings
-            input_embedding = self.semantic_model.encode([input_text])
-            category_names = [cat["name"] for cat in self.categories_cache]
-            category_embeddings = self.semantic_model.encode(category_names)
-
-            # Calculate similarities
-            similarities = cosine_similarity(input_embedding, category_embeddings)[0]
+            # One matrix-vector product against the cached category matrix
+            similarities = await asyncio.to_thread(
+                self.embedding_index.similarities, CATEGORY, self.categories_cache, input_text
+            )
 
             results = []
-            for i, similarity in enumerate(similarities):
+            for category, similarity in similarities:
                 # Higher threshold for semantic matching to reduce false positives
                 if similarity >= 0.65:  # Increased from 0.5 to 0.65
                     results.append({
-                        "category": self.categories_cache[i],
+                        "category": category,
                         "confidence": min(0.85, float(similarity)),  # Cap at 0.85 for semantic matches
                         "method": "semantic",
                         "original_input": input_text
@@ -624,36 +633,20 @@ class ServiceAgent:
 
             logger.info(f"Searching services: query='{query}', user_id={user.id}")
 
-            # Build search query
-            search_query = select(RateCard).where(RateCard.is_active == True)
-
-            # Add text search (name or description)
-            search_pattern = f"%{query}%"
-            search_query = search_query.where(
-                or_(
-                    RateCard.name.ilike(search_pattern),
-                    RateCard.description.ilike(search_pattern)
-                )
-            )
-
-            # Add price filters if provided
+            # Ranked BM25 search over the in-memory catalog (name, description, subcategory, category)
             max_price = entities.get("max_price")
-            if max_price:
-                search_query = search_query.where(RateCard.price <= Decimal(str(max_price)))
-
             min_price = entities.get("min_price")
-            if min_price:
-                search_query = search_query.where(RateCard.price >= Decimal(str(min_price)))
-
-            # Add category filter if provided
             category_id = entities.get("category_id")
-            if category_id:
-                search_query = search_query.where(RateCard.category_id == int(category_id))
 
-            # Execute query
-            search_query = search_query.order_by(RateCard.price).limit(20)
-            result = await self.db.execute(search_query)
-            rate_cards = result.scalars().all()
+            hits = await search_services(
+                self.db,
+                query,
+                limit=20,
+                max_price=max_price,
+                min_price=min_price,
+                category_id=category_id
+            )
+            rate_cards = [hit.document for hit in hits]
 
             if not rate_cards:
                 filter_text = ""
@@ -1164,16 +1157,9 @@ class ServiceAgent:
             category_id = category["id"]
             category_name = category["name"]
 
-            # Get subcategories from database
-            query = select(Subcategory).where(
-                and_(
-                    Subcategory.category_id == category_id,
-                    Subcategory.is_active == True
-                )
-            ).order_by(Subcategory.name)
-
-            result = await self.db.execute(query)
-            subcategories = result.scalars().all()
+            # Get subcategories from the catalog snapshot
+            snapshot = await get_catalog_snapshot(self.db)
+            subcategories = sorted(snapshot.list_subcategories(category_id), key=lambda subcat: subcat.name)
 
             if not subcategories:
                 return {
@@ -1261,9 +1247,8 @@ class ServiceAgent:
         """Suggest multiple category options when confidence is low"""
         try:
             # Get all categories for suggestions
-            query = select(Category).where(Category.is_active == True).order_by(Category.name)
-            result = await self.db.execute(query)
-            categories = result.scalars().all()
+            snapshot = await get_catalog_snapshot(self.db)
+            categories = sorted(snapshot.categories, key=lambda cat: cat.name)
 
             response_lines = [
                 f"I couldn't find a clear match for '{service_keyword}'. Here are our available service categories:\n"
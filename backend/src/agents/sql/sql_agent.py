@@ -25,6 +25,7 @@ from sqlalchemy import text
 
 from src.core.models import User
 from src.llm.gemini.client import LLMClient
+from src.llm.scheduler import LLMTier
 
 logger = logging.getLogger(__name__)
 
@@ -98,19 +99,20 @@ class SQLAgent:
     - Use LIMIT to restrict result size
     """
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, llm_client: Optional[LLMClient] = None):
         """
         Initialize SQLAgent
         
         Args:
             db: Database session
+            llm_client: LLM client for SQL generation (default: new classification client)
         """
         self.db = db
         self.logger = logging.getLogger(__name__)
         
         # Initialize LLM client for SQL generation
         try:
-            self.llm_client = LLMClient.create_for_intent_classification()
+            self.llm_client = llm_client or LLMClient.create_for_intent_classification()
             self.logger.info("SQLAgent initialized successfully")
         except Exception as e:
             self.logger.error(f"Error initializing SQLAgent: {e}")
@@ -229,7 +231,7 @@ SQL: SELECT b.id, b.booking_number, b.status, b.total, b.created_at FROM booking
 
 Now generate SQL for the user's question:"""
 
-            response = await self.llm_client.generate_text(prompt)
+            response = await self.llm_client.ainvoke(prompt, tier=LLMTier.EXTRACTION)
             
             if not response:
                 return None
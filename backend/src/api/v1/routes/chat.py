@@ -4,6 +4,7 @@ Chat API endpoints for customer chatbot
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated, List
 import logging
@@ -19,7 +20,7 @@ from src.schemas.chat import (
     SessionResponse,
 )
 from src.schemas.auth import MessageResponse
-from src.services.chat_service import ChatService
+from src.services.chat_service import ChatService, stream_chat_message
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 logger = logging.getLogger(__name__)
@@ -73,6 +74,43 @@ async def send_message(
         )
 
 
+@router.post(
+    "/message/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Send chat message (streaming)"
+)
+async def stream_message(
+    request: ChatMessageRequest,
+    current_user: Annotated[User, Depends(get_current_user)]
+):
+    """
+    Send a chat message and stream the AI response as Server-Sent Events
+
+    Same request body and persisted messages as **POST /chat/message**, but
+    progress is streamed while the turn runs:
+
+    - **session**: session ID (sent immediately)
+    - **classified**: detected intent, confidence and classification method
+    - **agent_selected**: agent handling the request
+    - **token**: sentences of the response text, each checked by the output
+      guardrails before it is sent
+    - **replace**: final text, if it differs from the streamed tokens
+      (e.g. sanitized by output guardrails)
+    - **done**: the full ChatMessageResponse
+    - **error**: error detail and status code
+    """
+    logger.info(f"Streaming chat message request: user_id={current_user.id}, session_id={request.session_id}")
+
+    return StreamingResponse(
+        stream_chat_message(current_user.id, request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        }
+    )
+
+
 @router.get(
     "/history/{session_id}",
     response_model=ChatHistoryResponse,
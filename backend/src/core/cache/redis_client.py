@@ -274,6 +274,26 @@ class RedisClient:
             logger.error(f"Redis DECR error for key '{key}': {e}")
             return 0
 
+    async def eval(self, script: str, keys: list, args: list) -> Optional[Any]:
+        """
+        Run a Lua script atomically on the server
+
+        Args:
+            script: Lua script source
+            keys: Keys passed as KEYS[]
+            args: Arguments passed as ARGV[]
+
+        Returns:
+            Script result, or None if Redis is unavailable or the call fails
+        """
+        if not self._is_available():
+            return None
+        try:
+            return await self.client.eval(script, len(keys), *keys, *args)
+        except Exception as e:
+            logger.error(f"Redis EVAL error for keys {keys}: {e}")
+            return None
+
     async def keys(self, pattern: str = "*") -> list:
         """
         Get keys matching pattern
@@ -33,6 +33,47 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = Field(default=30, description="Pool timeout in seconds")
     DB_POOL_RECYCLE: int = Field(default=3600, description="Pool recycle time in seconds")
     DB_ECHO: bool = Field(default=False, description="Echo SQL queries")
+
+    # Write-Behind Persistence (batched inserts of chat messages and auto-committed audit logs)
+    WRITE_BEHIND_ENABLED: bool = Field(
+        default=True,
+        description=(
+            "Queue conversation rows and auto-committed audit-log rows for batched inserts "
+            "instead of committing them per request"
+        )
+    )
+    WRITE_BEHIND_FLUSH_INTERVAL_MS: int = Field(
+        default=50,
+        description="Max time a queued row waits before its batch is flushed"
+    )
+    WRITE_BEHIND_MAX_BATCH_ROWS: int = Field(
+        default=200,
+        description="Queued rows that trigger an immediate flush (and max rows per INSERT)"
+    )
+    WRITE_BEHIND_MAX_RETRIES: int = Field(
+        default=3,
+        description=(
+            "Flush attempts of a batch before its rows are spilled to WRITE_BEHIND_SPILL_PATH"
+        )
+    )
+    WRITE_BEHIND_SPILL_PATH: str = Field(
+        default="data/write_behind_spill.jsonl",
+        description=(
+            "JSONL file for rows not written while the database was failing (replayed once it "
+            "recovers)"
+        )
+    )
+    WRITE_BEHIND_DEAD_LETTER_PATH: str = Field(
+        default="data/write_behind_dead_letter.jsonl",
+        description="JSONL file for rows the database rejected (never replayed automatically)"
+    )
+    WRITE_BEHIND_ID_BLOCK_SIZE: int = Field(
+        default=100,
+        description=(
+            "Conversation ids a process reserves per round-trip (ids of queued rows are "
+            "allocated client-side)"
+        )
+    )
     
     # Redis
     REDIS_HOST: str = Field(default="localhost", description="Redis host")
@@ -79,6 +120,242 @@ class Settings(BaseSettings):
     GEMINI_TOP_P: float = Field(default=0.95, description="Top-p sampling")
     GEMINI_TOP_K: int = Field(default=40, description="Top-k sampling")
 
+    # LLM Resilience (retry/backoff and cross-worker throttling)
+    LLM_ATTEMPT_TIMEOUT_SECONDS: float = Field(
+        default=20.0,
+        description="Timeout for a single LLM call attempt"
+    )
+    LLM_RETRY_MAX_DELAY_SECONDS: float = Field(
+        default=8.0,
+        description="Upper bound for one backoff delay"
+    )
+    LLM_RETRY_BUDGET_PER_REQUEST: int = Field(
+        default=4,
+        description="Max LLM retries across one chat request"
+    )
+    LLM_MIN_CALL_INTERVAL_MS: int = Field(
+        default=0,
+        description="Min spacing between LLM calls across workers (0 disables)"
+    )
+    LLM_THROTTLE_MAX_WAIT_SECONDS: float = Field(
+        default=5.0,
+        description="Max time a call may wait for a throttle slot"
+    )
+
+    # LLM Response Cache (deterministic calls only)
+    LLM_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Enable the two-tier LLM response cache"
+    )
+    LLM_CACHE_MAX_ENTRIES: int = Field(
+        default=2048,
+        description="Max entries in the in-process LLM cache"
+    )
+    LLM_CACHE_MEMORY_TTL_SECONDS: int = Field(
+        default=3600,
+        description="TTL for the in-process LLM cache"
+    )
+    LLM_CACHE_REDIS_TTL_SECONDS: int = Field(
+        default=86400,
+        description="TTL for the Redis LLM cache (0 disables)"
+    )
+    LLM_SINGLE_FLIGHT_ENABLED: bool = Field(
+        default=True,
+        description="Coalesce identical concurrent LLM calls into one request"
+    )
+
+    # LLM Scheduler (per-tier concurrency and load shedding)
+    LLM_SCHEDULER_ENABLED: bool = Field(
+        default=True,
+        description="Limit concurrent LLM calls per tier"
+    )
+    LLM_CLASSIFICATION_CONCURRENCY: int = Field(
+        default=16,
+        description="Max concurrent intent classification calls"
+    )
+    LLM_EXTRACTION_CONCURRENCY: int = Field(
+        default=16,
+        description="Max concurrent entity extraction calls"
+    )
+    LLM_GENERATION_CONCURRENCY: int = Field(
+        default=8,
+        description="Max concurrent text generation calls"
+    )
+    LLM_SCHEDULER_MAX_QUEUE_DEPTH: int = Field(
+        default=64,
+        description="Max queued calls per tier before rejecting"
+    )
+    LLM_SCHEDULER_MAX_QUEUE_WAIT_SECONDS: float = Field(
+        default=10.0,
+        description="Max time a call may wait for a tier slot"
+    )
+
+    # Conversation History Compaction (context-aware intent prompts)
+    HISTORY_COMPACTION_ENABLED: bool = Field(
+        default=True,
+        description="Compact conversation history in context-aware prompts"
+    )
+    HISTORY_TOKEN_BUDGET: int = Field(
+        default=400,
+        description="Hard token budget for history (summary + recent messages) in a prompt"
+    )
+    HISTORY_KEEP_RECENT_MESSAGES: int = Field(
+        default=4,
+        description="Most recent messages kept verbatim (truncated)"
+    )
+    HISTORY_MAX_MESSAGE_TOKENS: int = Field(default=80, description="Max tokens per recent message")
+    HISTORY_SUMMARY_MAX_TOKENS: int = Field(
+        default=120,
+        description="Max tokens of the rolling summary of older messages"
+    )
+    HISTORY_SUMMARY_TTL_SECONDS: int = Field(
+        default=86400,
+        description="TTL of the per-session rolling summary in Redis"
+    )
+    HISTORY_TOKENIZER_ENCODING: str = Field(
+        default="cl100k_base",
+        description="Tiktoken encoding used to count history tokens"
+    )
+
+    # Conversation Context Cache (per-session ring buffer of recent messages)
+    CONVERSATION_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Serve recent session messages from a per-session ring buffer instead of MySQL"
+    )
+    CONVERSATION_CACHE_MAX_MESSAGES: int = Field(
+        default=10,
+        description="Messages kept per session in the conversation context cache"
+    )
+    CONVERSATION_CACHE_TOKEN_BUDGET: int = Field(
+        default=2000,
+        description="Max tokens of the cached messages returned for a turn"
+    )
+    CONVERSATION_CACHE_TTL_SECONDS: int = Field(
+        default=86400,
+        description="TTL of a session's cached messages after its last write"
+    )
+    CONVERSATION_CACHE_TRUST_LOCAL_BUFFERS: bool = Field(
+        default=False,
+        description=(
+            "Without Redis, serve in-process buffers without checking the newest message id "
+            "(single worker or sticky sessions only)"
+        )
+    )
+
+    # Intent Embedding Tier (kNN over intent examples, between patterns and the LLM)
+    INTENT_EMBEDDING_TIER_ENABLED: bool = Field(
+        default=True,
+        description="Classify with embedding kNN before falling back to the LLM"
+    )
+    INTENT_EMBEDDING_MODEL: str = Field(
+        default="all-MiniLM-L6-v2",
+        description="Sentence-transformers model for the intent embedding tier"
+    )
+    INTENT_EMBEDDING_TOP_K: int = Field(default=7, description="Nearest intent examples that vote")
+    INTENT_EMBEDDING_MIN_SIMILARITY: float = Field(
+        default=0.6,
+        description="Min cosine similarity of the nearest example to accept"
+    )
+    INTENT_EMBEDDING_MIN_MARGIN: float = Field(
+        default=0.5,
+        description="Min vote-share margin between the top two labels to accept"
+    )
+    INTENT_EMBEDDING_MIN_TOKENS: int = Field(
+        default=3,
+        description="Shorter messages are treated as follow-ups and skip the embedding tier"
+    )
+
+    # Intent Result Cache (memoised classify() for repeated follow-ups)
+    INTENT_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache intent classification results"
+    )
+    INTENT_CACHE_MAX_ENTRIES: int = Field(
+        default=4096,
+        description="Max entries in the intent result cache"
+    )
+    INTENT_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        description="TTL for cached intent classifications"
+    )
+    INTENT_CACHE_MAX_MESSAGE_LENGTH: int = Field(
+        default=200,
+        description="Longer messages are not cached"
+    )
+
+    # Service Catalog Index (process-wide service names for spell correction and fuzzy matching)
+    SERVICE_CATALOG_FUZZY_CANDIDATES: int = Field(
+        default=16,
+        description="Trigram shortlist size scored with SequenceMatcher per fuzzy match"
+    )
+    SERVICE_SPELLING_MAX_EDIT_DISTANCE: int = Field(
+        default=2,
+        description="Max edit distance of a service-name spelling correction"
+    )
+    SERVICE_SPELLING_PREFIX_LENGTH: int = Field(
+        default=7,
+        description="Word prefix length indexed by the SymSpell dictionary"
+    )
+    CATEGORY_EMBEDDING_MODEL: Optional[str] = Field(
+        default=None,
+        description=(
+            "Sentence-transformers model for semantic category matching (default: "
+            "EMBEDDING_MODEL, shared with RAG)"
+        )
+    )
+
+    # Catalog Snapshot (in-memory categories, subcategories and rate cards)
+    CATALOG_VERSION_CHECK_SECONDS: int = Field(
+        default=5,
+        description="Min interval between checks of the catalog version counter in Redis"
+    )
+    CATALOG_SNAPSHOT_MAX_AGE_SECONDS: int = Field(
+        default=3600,
+        description=(
+            "Age after which the catalog snapshot is reloaded (also picks up writes that did not "
+            "bump the version)"
+        )
+    )
+
+    # Pincode Coverage (in-memory pincodes and provider coverage bitmaps)
+    PINCODE_COVERAGE_VERSION_CHECK_SECONDS: int = Field(
+        default=5,
+        description="Min interval between checks of the coverage change log in Redis"
+    )
+    PINCODE_COVERAGE_MAX_AGE_SECONDS: int = Field(
+        default=3600,
+        description=(
+            "Age after which pincode coverage is fully reloaded (also picks up writes not "
+            "published to Redis)"
+        )
+    )
+
+    # Local Backends (offline benchmarks and tests)
+    LLM_BACKEND: str = Field(
+        default="gemini",
+        description="LLM backend (gemini, record, replay, fake)"
+    )
+    VECTOR_STORE_BACKEND: str = Field(
+        default="pinecone",
+        description="Vector store backend (pinecone, record, replay, fake)"
+    )
+    LOCAL_BACKEND_CASSETTE_DIR: str = Field(
+        default="tests/fixtures/cassettes",
+        description="Directory of record/replay cassettes"
+    )
+    LLM_LOCAL_LATENCY: str = Field(
+        default="recorded",
+        description=(
+            "Latency of local LLM responses (recorded, none, fixed:<ms>, uniform:<min>:<max>, "
+            "lognormal:<median>:<sigma>)"
+        )
+    )
+    VECTOR_STORE_LOCAL_LATENCY: str = Field(
+        default="recorded",
+        description="Latency of local vector store queries (same spec as LLM_LOCAL_LATENCY)"
+    )
+    LOCAL_BACKEND_SEED: int = Field(default=42, description="Seed for synthetic latencies")
+
     # Embedding Model (Sentence Transformers)
     # Using all-mpnet-base-v2 for better semantic understanding of policy documents
     EMBEDDING_MODEL: str = Field(
@@ -0,0 +1,165 @@
+"""
+Block Id Allocator
+
+Rows inserted write-behind (see write_behind.py) are returned to the client
+before they reach the database, so their primary key is allocated here
+instead of by AUTO_INCREMENT (hi/lo allocation). Conversation ids are
+allocated here whether or not write-behind is enabled:
+
+1. A process reserves block_size ids of a table at a time by advancing
+   id_blocks.next_id in its own short transaction (row locked FOR UPDATE)
+2. allocate() hands out ids of the reserved block without a round-trip
+3. Once half of the block is used the next one is reserved in the
+   background, so a request only waits for the database when a process
+   allocates its first id (or runs through a whole block at once)
+
+A reservation never starts below MAX(id) + 1 of the table, so rows inserted
+with AUTO_INCREMENT before it cannot collide with allocated ids. Once a
+table's ids are allocated here every insert must take its id from here:
+InnoDB continues AUTO_INCREMENT after the highest id inserted so far, which
+can be inside a block another process has reserved but not used yet.
+Ids of a block that a process did not use before it exited are skipped.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, inspect as sa_inspect, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.schema import Table
+
+from src.core.models.id_block import IdBlock
+
+logger = logging.getLogger(__name__)
+
+# Attempts at creating a table's id_blocks row when processes race to create it
+MAX_RESERVE_ATTEMPTS = 3
+
+
+class IdAllocator:
+    """
+    Hands out primary keys from blocks reserved in id_blocks
+    """
+
+    def __init__(self, session_factory=None, block_size: int = 100):
+        """
+        Initialize allocator
+
+        Args:
+            session_factory: Async session factory (default: AsyncSessionLocal)
+            block_size: Ids reserved per round-trip
+        """
+        self._session_factory = session_factory
+        self.block_size = block_size
+
+        # Per table: [next id, end of block) and the reservation of the next block
+        self._blocks: Dict[str, List[int]] = {}
+        self._next_blocks: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session_factory(self):
+        if self._session_factory is None:
+            from src.core.database.connection import AsyncSessionLocal
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    def _bind_loop(self) -> None:
+        """Forget reservations started on another event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._next_blocks = {}
+
+    async def allocate(self, model) -> int:
+        """
+        Allocate a primary key
+
+        Args:
+            model: Model class whose table's ids are allocated here
+
+        Returns:
+            Id no other process or call is given
+        """
+        self._bind_loop()
+        table = sa_inspect(model).local_table
+
+        while True:
+            block = self._blocks.get(table.name)
+            if block is not None and block[0] < block[1]:
+                allocated = block[0]
+                block[0] += 1
+                if block[1] - block[0] <= self.block_size // 2:
+                    self._reserve_next(table)
+                return allocated
+
+            task = self._reserve_next(table)
+            await asyncio.shield(task)
+            if self._next_blocks.get(table.name) is task:
+                # First caller back switches to the new block; the others take ids from it
+                del self._next_blocks[table.name]
+                self._blocks[table.name] = list(task.result())
+
+    def _reserve_next(self, table: Table) -> asyncio.Future:
+        """Reservation of the table's next block (started if none is pending)"""
+        task = self._next_blocks.get(table.name)
+        if task is None or (task.done() and task.exception() is not None):
+            task = asyncio.ensure_future(self._reserve(table))
+            task.add_done_callback(self._log_failed_reservation)
+            self._next_blocks[table.name] = task
+        return task
+
+    @staticmethod
+    def _log_failed_reservation(task: asyncio.Future) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"[IdAllocator] Could not reserve an id block: {task.exception()}")
+
+    async def _reserve(self, table: Table) -> Tuple[int, int]:
+        """
+        Reserve block_size ids of a table
+
+        Returns:
+            (first id, end of block) - end is not part of the block
+        """
+        id_column = table.primary_key.columns.values()[0]
+        for attempt in range(1, MAX_RESERVE_ATTEMPTS + 1):
+            try:
+                async with self._get_session_factory()() as session:
+                    block_row = await session.scalar(
+                        select(IdBlock).where(IdBlock.table_name == table.name).with_for_update()
+                    )
+                    max_id = await session.scalar(select(func.max(id_column)))
+                    start = (max_id or 0) + 1
+                    if block_row is None:
+                        block_row = IdBlock(table_name=table.name, next_id=start)
+                        session.add(block_row)
+                    start = max(start, block_row.next_id)
+                    block_row.next_id = start + self.block_size
+                    await session.commit()
+            except IntegrityError:
+                # Another process created the row first
+                if attempt == MAX_RESERVE_ATTEMPTS:
+                    raise
+                continue
+
+            logger.debug(f"[IdAllocator] Reserved {table.name} ids {start}..{start + self.block_size - 1}")
+            return start, start + self.block_size
+
+
+# Global allocator instance (singleton)
+_id_allocator: Optional[IdAllocator] = None
+
+
+def get_id_allocator() -> IdAllocator:
+    """
+    Get or create the global id allocator
+
+    Returns:
+        IdAllocator instance
+    """
+    global _id_allocator
+    if _id_allocator is None:
+        from src.core.config import settings
+
+        _id_allocator = IdAllocator(block_size=settings.WRITE_BEHIND_ID_BLOCK_SIZE)
+    return _id_allocator
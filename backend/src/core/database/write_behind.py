@@ -0,0 +1,527 @@
+"""
+Write-Behind Persistence Queue
+
+Append-only rows (chat messages, the coordinator's conversation log and
+auto-committed ops audit logs) are queued in memory and inserted in batches
+by a background task instead of being committed one by one inside the
+request. Conversation rows are returned to the client with their id, so
+their ids are allocated client-side first (see id_allocator.py).
+
+1. add() builds the row from a model instance, applies its Python-side
+   column defaults (created_at, ...) and returns immediately
+2. The flusher inserts queued rows as multi-row INSERTs in one transaction
+   every flush_interval_ms, or as soon as max_batch_rows are queued
+3. Readers that need their own writes call flush_if_pending() before
+   querying, which only costs a round-trip while matching rows are queued
+4. stop() (application shutdown) drains the queue before the engine is
+   disposed
+
+Instances passed to add() never join a session, so their primary key stays
+as given (None for AUTO_INCREMENT). Rows are never dropped:
+- A batch that fails because the database is unavailable is retried with
+  exponential backoff, and once it has failed max_retries times its rows are
+  appended to a JSONL spill file instead of being held in memory. The spill
+  file is replayed into the queue when the flusher starts and after the next
+  successful flush.
+- A batch the database rejects (IntegrityError, DataError) is written again
+  row by row, so one bad row does not hold back the others. Rows rejected on
+  their own are appended to a dead-letter file, which is never replayed
+  automatically.
+Rows that must commit with the request's own transaction (audit logs without
+auto_commit, dialog states the next turn updates in place) are never queued
+here.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import Counter, deque
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import DateTime, Float, Numeric, inspect as sa_inspect, insert
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.sql.schema import Table
+
+from src.monitoring.metrics import (
+    write_behind_flush_duration_seconds,
+    write_behind_queue_depth,
+    write_behind_rows_total,
+)
+
+logger = logging.getLogger(__name__)
+
+# Longest wait between flush attempts while the database keeps failing
+MAX_BACKOFF_SECONDS = 30.0
+
+# Errors caused by the rows of a batch rather than by the database being unavailable
+ROW_ERRORS = (IntegrityError, DataError)
+
+
+class _QueuedRow:
+    """A row waiting to be inserted, with the model instance it came from"""
+
+    __slots__ = ("table", "values", "instance", "attempts")
+
+    def __init__(self, table: Table, values: Dict[str, Any], instance: Any):
+        self.table = table
+        self.values = values
+        self.instance = instance
+        self.attempts = 0
+
+
+def _row_of(instance: Any) -> Tuple[Table, Dict[str, Any]]:
+    """
+    Column values of a model instance for an INSERT
+
+    Unset columns get their Python-side default, which is also set on the
+    instance (so e.g. created_at can be returned to the client). Columns that
+    are still None are left out, so they are inserted as SQL NULL rather than
+    e.g. a JSON 'null'.
+    """
+    mapper = sa_inspect(type(instance))
+    table = mapper.local_table
+    values = {}
+    for attr in mapper.column_attrs:
+        column = attr.columns[0]
+        if column.table is not table:
+            continue
+
+        value = getattr(instance, attr.key)
+        if value is None and column.primary_key:
+            continue
+        if value is None and column.default is not None:
+            if column.default.is_callable:
+                value = column.default.arg(None)
+            elif column.default.is_scalar:
+                value = column.default.arg
+            setattr(instance, attr.key, value)
+        if value is not None:
+            values[column.key] = value
+    return table, values
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON encoding of column values that json.dumps does not handle"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Cannot spill value of type {type(value).__name__}")
+
+
+def _decode_values(table: Table, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values read back from the spill file, converted by column type"""
+    decoded = {}
+    for key, value in values.items():
+        column_type = table.columns[key].type
+        enum_class = getattr(column_type, "enum_class", None)
+        if enum_class is not None:
+            value = enum_class(value)
+        elif isinstance(column_type, DateTime):
+            value = datetime.fromisoformat(value)
+        elif isinstance(column_type, Numeric) and not isinstance(column_type, Float):
+            value = Decimal(str(value))
+        decoded[key] = value
+    return decoded
+
+
+def _table_named(name: str) -> Table:
+    """Mapped table by name"""
+    import src.core.models  # noqa: F401 - registers every table on Base.metadata
+    from src.core.database.base import Base
+
+    return Base.metadata.tables[name]
+
+
+class WriteBehindQueue:
+    """
+    In-memory queue of rows inserted in batches by a background task
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        flush_interval_ms: int = 50,
+        max_batch_rows: int = 200,
+        max_retries: int = 3,
+        spill_path: str = "data/write_behind_spill.jsonl",
+        dead_letter_path: str = "data/write_behind_dead_letter.jsonl"
+    ):
+        """
+        Initialize queue
+
+        Args:
+            session_factory: Async session factory (default: AsyncSessionLocal)
+            flush_interval_ms: Max time a queued row waits before it is flushed
+            max_batch_rows: Queued rows that trigger an immediate flush (and max rows per batch)
+            max_retries: Flush attempts of a batch before its rows are spilled to spill_path
+            spill_path: JSONL file holding rows not written while the database was failing
+            dead_letter_path: JSONL file holding rows the database rejected (not replayed)
+        """
+        self._session_factory = session_factory
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch_rows = max_batch_rows
+        self.max_retries = max_retries
+        self.spill_path = Path(spill_path)
+        self.dead_letter_path = Path(dead_letter_path)
+
+        self._rows: Deque[_QueuedRow] = deque()
+        self._in_flight: List[_QueuedRow] = []
+        self._depth: Counter = Counter()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._has_rows: Optional[asyncio.Event] = None
+        self._batch_full: Optional[asyncio.Event] = None
+        self._failures = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _get_session_factory(self):
+        if self._session_factory is None:
+            from src.core.database.connection import AsyncSessionLocal
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    def _track(self, table: Table, delta: int) -> None:
+        self._depth[table.name] += delta
+        write_behind_queue_depth.labels(table=table.name).set(self._depth[table.name])
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Create the lock and events on the running event loop (once per loop)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._has_rows = asyncio.Event()
+            self._batch_full = asyncio.Event()
+            self._task = None
+            if self._rows:
+                self._has_rows.set()
+        return loop
+
+    def start(self) -> None:
+        """Start the flusher on the running event loop (if it is not running there yet)"""
+        loop = self._bind_loop()
+        if self._task is None or self._task.done():
+            self._replay_spilled()
+            self._task = loop.create_task(self._run())
+
+    def add(self, instance: Any) -> Any:
+        """
+        Queue a model instance for insertion
+
+        Args:
+            instance: New model instance (not added to any session)
+
+        Returns:
+            The instance, with its column defaults applied
+        """
+        table, values = _row_of(instance)
+        self._rows.append(_QueuedRow(table, values, instance))
+        self._track(table, 1)
+
+        self.start()
+        self._has_rows.set()
+        if len(self._rows) >= self.max_batch_rows:
+            self._batch_full.set()
+        return instance
+
+    def has_pending(self, model, **match: Any) -> bool:
+        """
+        Whether rows of a model matching the given column values are queued or being written
+
+        Args:
+            model: Model class
+            **match: Column values the row must have (e.g. session_id=...)
+
+        Returns:
+            True if a matching row is not committed yet
+        """
+        table = sa_inspect(model).local_table
+        for row in list(self._rows) + self._in_flight:
+            if row.table is table and all(row.values.get(key) == value for key, value in match.items()):
+                return True
+        return False
+
+    async def flush_if_pending(self, model, **match: Any) -> None:
+        """
+        Flush now if rows of a model matching the given column values are not committed yet
+
+        Args:
+            model: Model class
+            **match: Column values the row must have (e.g. session_id=...)
+        """
+        if self.has_pending(model, **match):
+            await self.flush()
+
+    async def _run(self) -> None:
+        """Flush a batch once it is full or its oldest row has waited flush_interval"""
+        while True:
+            await self._has_rows.wait()
+            if len(self._rows) < self.max_batch_rows:
+                self._batch_full.clear()
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"[WriteBehind] Flush failed: {e}", exc_info=True)
+
+            if not self._rows:
+                self._has_rows.clear()
+            elif self._failures:
+                # Rows left after a failed batch: back off while the database is failing
+                await asyncio.sleep(self._backoff())
+
+    def _backoff(self) -> float:
+        """Wait before the next attempt after consecutive failed flushes"""
+        return min(self.flush_interval * 2 ** self._failures, MAX_BACKOFF_SECONDS)
+
+    async def flush(self) -> int:
+        """
+        Insert every row queued so far (stops at the first failed batch)
+
+        Returns:
+            Number of rows written
+        """
+        self._bind_loop()
+        async with self._lock:
+            written = 0
+            while self._rows:
+                batch = [self._rows.popleft() for _ in range(min(self.max_batch_rows, len(self._rows)))]
+                batch_written, complete = await self._write(batch)
+                written += batch_written
+                if not complete:
+                    break
+                if self._failures:
+                    # The database is back: bring rows spilled during the outage back in
+                    self._failures = 0
+                    self._replay_spilled()
+            return written
+
+    async def _insert(self, rows: List[_QueuedRow]) -> None:
+        """Insert rows in a single transaction, one multi-row INSERT per table and column set"""
+        statements: Dict[Tuple[Table, Tuple[str, ...]], List[Dict[str, Any]]] = {}
+        for row in rows:
+            statements.setdefault((row.table, tuple(sorted(row.values))), []).append(row.values)
+
+        async with self._get_session_factory()() as session:
+            for (table, _), values in statements.items():
+                await session.execute(insert(table), values)
+            await session.commit()
+
+    async def _write(self, batch: List[_QueuedRow]) -> Tuple[int, bool]:
+        """
+        Insert one batch, setting aside rows the database rejects
+
+        Returns:
+            (rows written, False if rows were requeued because the database is failing)
+        """
+        self._in_flight = batch
+        start_time = time.time()
+        written: List[_QueuedRow] = []
+        rejected: List[_QueuedRow] = []
+        try:
+            try:
+                await self._insert(batch)
+                written = batch
+            except ROW_ERRORS as e:
+                if len(batch) == 1:
+                    rejected = batch
+                    self._dead_letter(batch, e)
+                else:
+                    # One bad row fails the whole batch: write its rows one by one
+                    logger.warning(
+                        f"[WriteBehind] Batch of {len(batch)} rows rejected, writing its rows one by one: {e}"
+                    )
+                    for index, row in enumerate(batch):
+                        try:
+                            await self._insert([row])
+                            written.append(row)
+                        except ROW_ERRORS as row_error:
+                            rejected.append(row)
+                            self._dead_letter([row], row_error)
+                        except Exception as row_error:
+                            self._requeue(batch[index:], row_error)
+                            break
+            except Exception as e:
+                self._requeue(batch, e)
+        finally:
+            self._in_flight = []
+
+        duration = time.time() - start_time
+        for table, count in Counter(row.table for row in written).items():
+            self._track(table, -count)
+            write_behind_flush_duration_seconds.labels(table=table.name).observe(duration)
+            write_behind_rows_total.labels(table=table.name, status="written").inc(count)
+        if written:
+            logger.debug(f"[WriteBehind] Flushed {len(written)} rows in {duration * 1000:.1f}ms")
+        return len(written), len(written) + len(rejected) == len(batch)
+
+    def _requeue(self, rows: List[_QueuedRow], error: Exception) -> None:
+        """Put rows back at the front of the queue, spilling those out of retries"""
+        self._failures += 1
+        for row in rows:
+            row.attempts += 1
+        retry = [row for row in rows if row.attempts < self.max_retries]
+        exhausted = [row for row in rows if row.attempts >= self.max_retries]
+        if exhausted and not self._spill(exhausted):
+            # Nowhere durable to put them: keep them queued
+            retry = rows
+            exhausted = []
+        self._rows.extendleft(reversed(retry))
+
+        logger.error(
+            f"[WriteBehind] Batch of {len(rows)} rows failed "
+            f"({len(retry)} requeued, {len(exhausted)} spilled to {self.spill_path}): {error}"
+        )
+
+    def _dead_letter(self, rows: List[_QueuedRow], error: Exception) -> None:
+        """Append rows the database rejected to the dead-letter file"""
+        for row in rows:
+            self._track(row.table, -1)
+            write_behind_rows_total.labels(table=row.table.name, status="rejected").inc()
+
+        lines = "".join(
+            json.dumps(
+                {"table": row.table.name, "values": row.values, "error": str(error)},
+                default=_encode_value
+            ) + "\n"
+            for row in rows
+        )
+        if not self._append(self.dead_letter_path, lines):
+            logger.critical(f"[WriteBehind] Rejected rows lost (dead-letter file not writable): {lines}")
+            return
+        logger.error(f"[WriteBehind] {len(rows)} rejected rows written to {self.dead_letter_path}: {error}")
+
+    @staticmethod
+    def _append(path: Path, lines: str) -> bool:
+        """Append lines to a file and fsync it (False if that failed)"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            logger.critical(f"[WriteBehind] Could not write to {path}: {e}")
+            return False
+        return True
+
+    def _spill(self, rows: List[_QueuedRow]) -> bool:
+        """
+        Append rows the database did not accept to the spill file
+
+        Returns:
+            True if the rows are on disk
+        """
+        try:
+            lines = "".join(
+                json.dumps({"table": row.table.name, "values": row.values}, default=_encode_value) + "\n"
+                for row in rows
+            )
+        except Exception as e:
+            logger.critical(f"[WriteBehind] Could not spill {len(rows)} rows to {self.spill_path}: {e}")
+            return False
+        if not self._append(self.spill_path, lines):
+            return False
+
+        for row in rows:
+            self._track(row.table, -1)
+            write_behind_rows_total.labels(table=row.table.name, status="spilled").inc()
+        return True
+
+    def _replay_spilled(self) -> int:
+        """
+        Queue the rows of the spill file ahead of newer rows (the file is removed)
+
+        Returns:
+            Number of rows replayed
+        """
+        if not self.spill_path.exists():
+            return 0
+
+        # Claim the file first, so rows spilled meanwhile land in a new one
+        claimed = self.spill_path.with_name(f"{self.spill_path.name}.{os.getpid()}.replay")
+        try:
+            os.replace(self.spill_path, claimed)
+            with open(claimed, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f if line.strip()]
+            rows = []
+            for record in records:
+                table = _table_named(record["table"])
+                rows.append(_QueuedRow(table, _decode_values(table, record["values"]), None))
+        except Exception as e:
+            logger.critical(f"[WriteBehind] Could not replay spilled rows from {claimed}: {e}")
+            return 0
+
+        self._rows.extendleft(reversed(rows))
+        for row in rows:
+            self._track(row.table, 1)
+            write_behind_rows_total.labels(table=row.table.name, status="replayed").inc()
+        if rows and self._has_rows is not None:
+            self._has_rows.set()
+        claimed.unlink()
+        logger.warning(f"[WriteBehind] Replaying {len(rows)} rows spilled while the database was failing")
+        return len(rows)
+
+    async def stop(self) -> None:
+        """Stop the flusher and drain the queue (rows the database keeps rejecting are spilled)"""
+        self._bind_loop()
+        if self._task is not None:
+            # Not while a batch is being written: its rows are off the queue
+            async with self._lock:
+                self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while self._rows:
+            if not await self.flush() and self._rows:
+                if all(row.attempts >= self.max_retries for row in self._rows):
+                    logger.critical(f"[WriteBehind] {len(self._rows)} rows neither written nor spilled at shutdown")
+                    return
+                await asyncio.sleep(self._backoff())
+
+
+# Global queue instance (singleton)
+_write_behind_queue: Optional[WriteBehindQueue] = None
+
+
+def get_write_behind_queue() -> Optional[WriteBehindQueue]:
+    """
+    Get or create the global write-behind queue
+
+    Returns:
+        WriteBehindQueue, or None if disabled via WRITE_BEHIND_ENABLED
+    """
+    global _write_behind_queue
+    if _write_behind_queue is None:
+        from src.core.config import settings
+
+        if not settings.WRITE_BEHIND_ENABLED:
+            return None
+
+        _write_behind_queue = WriteBehindQueue(
+            flush_interval_ms=settings.WRITE_BEHIND_FLUSH_INTERVAL_MS,
+            max_batch_rows=settings.WRITE_BEHIND_MAX_BATCH_ROWS,
+            max_retries=settings.WRITE_BEHIND_MAX_RETRIES,
+            spill_path=settings.WRITE_BEHIND_SPILL_PATH,
+            dead_letter_path=settings.WRITE_BEHIND_DEAD_LETTER_PATH
+        )
+    return _write_behind_queue
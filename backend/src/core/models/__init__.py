@@ -19,6 +19,7 @@ from src.core.models.staff import Staff, StaffSession, StaffActivityLog
 from src.core.models.ops_config import OpsConfig
 from src.core.models.ops_audit_log import OpsAuditLog
 from src.core.models.alert import Alert, AlertRule, AlertSubscription
+from src.core.models.id_block import IdBlock
 
 __all__ = [
     # Base
@@ -74,6 +75,9 @@ __all__ = [
     "AlertRule",
     "AlertSubscription",
 
+    # Id Allocation
+    "IdBlock",
+
     # Enums - Booking
     "PaymentStatus",
     "PaymentMethod",
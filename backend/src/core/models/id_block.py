@@ -0,0 +1,25 @@
+"""
+IdBlock model - Next unallocated primary key per table (hi/lo id allocation)
+"""
+
+from sqlalchemy import Column, BigInteger, String
+from src.core.database.base import Base
+
+
+class IdBlock(Base):
+    """
+    IdBlock model - Ids handed out in blocks for rows inserted write-behind
+
+    Processes reserve a block of ids at a time (next_id .. next_id + block - 1)
+    so rows can carry their primary key before they are inserted.
+    """
+    __tablename__ = "id_blocks"
+
+    # Primary Key (table the ids are for)
+    table_name = Column(String(64), primary_key=True, nullable=False)
+
+    # First id not reserved by any process yet
+    next_id = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f"<IdBlock(table={self.table_name}, next_id={self.next_id})>"
@@ -1,7 +1,12 @@
 """
 Core Services Module
 
-Provides singleton instances of heavy services that should be reused across requests.
+Provides process-wide instances of heavy, stateless services and builds the
+request-scoped agents that use them.
+
+Nothing cached here holds an AsyncSession: LLM clients, the intent classifier
+and compiled graphs are shared, while CoordinatorAgent and its sub-agents are
+cheap objects built per request around that request's session.
 """
 
 import logging
@@ -10,42 +15,75 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
-# Global cache for CoordinatorAgent (singleton per application instance)
-_coordinator_agent_cache: Optional[object] = None
-
 
-async def get_coordinator_agent(db: AsyncSession):
+class AgentResources:
+    """
+    Heavy, session-free dependencies shared by every CoordinatorAgent
     """
-    Get or create CoordinatorAgent instance (singleton pattern)
 
-    The CoordinatorAgent is expensive to initialize (loads LLM clients, etc.)
-    so we cache it at the application level and reuse it across requests.
+    def __init__(self, llm_client=None, intent_classifier=None):
+        """
+        Initialize resources
 
-    Note: The agent uses lazy initialization for sub-agents, so they're only
-    created when actually needed.
+        Args:
+            llm_client: LLM client for classification, extraction and SQL generation
+                (default: LLMClient.create_for_intent_classification())
+            intent_classifier: Intent classifier (default: cached IntentClassifier over llm_client)
+        """
+        if llm_client is None:
+            from src.llm.gemini.client import LLMClient
+            llm_client = LLMClient.create_for_intent_classification()
+        if intent_classifier is None:
+            from src.nlp.intent.classifier import IntentClassifier
+            from src.nlp.intent.result_cache import CachedIntentClassifier
+            intent_classifier = CachedIntentClassifier(IntentClassifier(llm_client=llm_client))
+
+        self.llm_client = llm_client
+        self.intent_classifier = intent_classifier
 
-    Args:
-        db: Database session (passed to agent for operations)
+
+# Global cache for agent resources (singleton per application instance)
+_agent_resources: Optional[AgentResources] = None
+
+
+def get_agent_resources() -> AgentResources:
+    """
+    Get the process-wide agent resources (singleton pattern)
 
     Returns:
-        CoordinatorAgent instance
+        AgentResources instance
     """
-    global _coordinator_agent_cache
+    global _agent_resources
 
-    if _coordinator_agent_cache is None:
-        logger.info("[ServiceCache] Initializing CoordinatorAgent (first time)")
-        from src.agents.coordinator.coordinator_agent import CoordinatorAgent
-        _coordinator_agent_cache = CoordinatorAgent(db=db)
-        logger.info("[ServiceCache] CoordinatorAgent cached successfully")
+    if _agent_resources is None:
+        logger.info("[ServiceCache] Initializing agent resources (first time)")
+        _agent_resources = AgentResources()
+        logger.info("[ServiceCache] Agent resources cached successfully")
 
-    # Update the db session for this request
-    _coordinator_agent_cache.db = db
+    return _agent_resources
 
-    return _coordinator_agent_cache
+
+async def get_coordinator_agent(db: AsyncSession):
+    """
+    Create a CoordinatorAgent for one request
+
+    The expensive parts (LLM clients, intent classifier, compiled graphs) are
+    process-wide; the agent itself and its lazily created sub-agents are
+    bound to this request's session only, so concurrent chats never share
+    an AsyncSession.
+
+    Args:
+        db: Database session of the request
+
+    Returns:
+        CoordinatorAgent instance
+    """
+    from src.agents.coordinator.coordinator_agent import CoordinatorAgent
+    return CoordinatorAgent(db=db, resources=get_agent_resources())
 
 
-def clear_coordinator_cache():
-    """Clear the coordinator agent cache (useful for testing or reloading)"""
-    global _coordinator_agent_cache
-    _coordinator_agent_cache = None
-    logger.info("[ServiceCache] CoordinatorAgent cache cleared")
+def clear_agent_resources():
+    """Clear the shared agent resources (useful for testing or reloading)"""
+    global _agent_resources
+    _agent_resources = None
+    logger.info("[ServiceCache] Agent resources cleared")
@@ -0,0 +1,211 @@
+"""
+Labelled Intent Corpus
+
+Utterances with their expected intents, used by the intent benchmark:
+- examples: the few-shot examples in src/nlp/intent/examples.py (gold labels)
+- conversations: user messages from production Conversation rows, PII-masked,
+  labelled with the intent stored at classification time (silver labels),
+  with the session's preceding turns the classifier saw at the time
+
+Corpora are stored as JSONL (one utterance per line) so a frozen corpus can
+be checked in and benchmarked unchanged across commits.
+"""
+
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.nlp.intent.examples import get_all_examples, get_multi_intent_examples
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# Long digit runs (order numbers, pincodes) left over after PII masking
+_DIGIT_RUN_PATTERN = re.compile(r"\d{5,}")
+
+# Preceding turns loaded per conversation row (ChatService's history limit)
+HISTORY_TURNS = 10
+
+
+@dataclass(frozen=True)
+class LabelledUtterance:
+    """User message with its expected intents (primary intent first) and preceding (role, content) turns"""
+
+    text: str
+    intents: Tuple[str, ...]
+    source: str
+    history: Tuple[Tuple[str, str], ...] = ()
+
+    @property
+    def primary_intent(self) -> str:
+        return self.intents[0]
+
+    @property
+    def conversation_history(self) -> Optional[List[Dict[str, str]]]:
+        """Preceding turns in the classifier's conversation_history format (None without context)"""
+        if not self.history:
+            return None
+        return [{"role": role, "content": content} for role, content in self.history]
+
+
+def _dedupe(utterances: List[LabelledUtterance]) -> List[LabelledUtterance]:
+    """Drop repeated texts with the same history (case- and whitespace-insensitive), keeping the first"""
+    seen = set()
+    unique = []
+    for utterance in utterances:
+        key = (_WHITESPACE_PATTERN.sub(" ", utterance.text.casefold()).strip(), utterance.history)
+        if key not in seen:
+            seen.add(key)
+            unique.append(utterance)
+    return unique
+
+
+def anonymise(text: str) -> str:
+    """
+    Mask PII and long digit runs in a user message
+
+    Args:
+        text: Raw message
+
+    Returns:
+        Message safe to store in a corpus file
+    """
+    from src.utils.pii_utils import mask_pii_in_text
+
+    masked, _ = mask_pii_in_text(text)
+    return _DIGIT_RUN_PATTERN.sub(lambda match: "0" * len(match.group(0)), masked)
+
+
+def load_example_corpus() -> List[LabelledUtterance]:
+    """
+    Build the corpus from the single- and multi-intent examples
+
+    Returns:
+        Labelled utterances
+    """
+    utterances = [
+        LabelledUtterance(text=example, intents=(intent.value,), source="examples")
+        for intent, examples in get_all_examples().items()
+        for example in examples
+    ]
+    utterances.extend(
+        LabelledUtterance(
+            text=example["query"],
+            intents=tuple(item["intent"].value for item in example["intents"]),
+            source="examples_multi"
+        )
+        for example in get_multi_intent_examples()
+    )
+    return _dedupe(utterances)
+
+
+async def load_conversation_corpus(
+    db,
+    limit: int = 1000,
+    min_confidence: float = 0.8
+) -> List[LabelledUtterance]:
+    """
+    Build a corpus from recent user messages in the Conversation table
+
+    Each message keeps the up to HISTORY_TURNS messages before it in its
+    session, so it is classified with the context it had in production.
+
+    Args:
+        db: Async database session
+        limit: Max rows to read (most recent first)
+        min_confidence: Min stored intent confidence for a row to be used as a label
+
+    Returns:
+        Anonymised labelled utterances
+    """
+    from sqlalchemy import select
+    from src.core.models import Conversation, MessageRole
+
+    result = await db.execute(
+        select(
+            Conversation.id,
+            Conversation.user_id,
+            Conversation.session_id,
+            Conversation.message,
+            Conversation.intent
+        )
+        .where(
+            Conversation.role == MessageRole.USER,
+            Conversation.intent.isnot(None),
+            Conversation.intent_confidence >= min_confidence
+        )
+        .order_by(Conversation.id.desc())
+        .limit(limit)
+    )
+
+    utterances = []
+    for message_id, user_id, session_id, message, intent in result.all():
+        if not message or not message.strip():
+            continue
+
+        preceding = await db.execute(
+            select(Conversation.role, Conversation.message)
+            .where(
+                Conversation.user_id == user_id,
+                Conversation.session_id == session_id,
+                Conversation.id < message_id
+            )
+            .order_by(Conversation.id.desc())
+            .limit(HISTORY_TURNS)
+        )
+        history = tuple(
+            (role.value, anonymise(content))
+            for role, content in reversed(preceding.all())
+            if content
+        )
+        utterances.append(
+            LabelledUtterance(text=anonymise(message), intents=(intent,), source="conversations", history=history)
+        )
+
+    logger.info(f"Loaded {len(utterances)} labelled utterances from conversations")
+    return _dedupe(utterances)
+
+
+def save_corpus(utterances: List[LabelledUtterance], path: str) -> None:
+    """
+    Write a corpus as JSONL
+
+    Args:
+        utterances: Labelled utterances
+        path: Output file
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for utterance in utterances:
+            f.write(json.dumps(asdict(utterance), ensure_ascii=False) + "\n")
+
+
+def load_corpus(path: str, source: Optional[str] = None) -> List[LabelledUtterance]:
+    """
+    Read a JSONL corpus
+
+    Args:
+        path: Corpus file
+        source: Optional source to keep (e.g. "conversations")
+
+    Returns:
+        Labelled utterances
+    """
+    utterances = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            utterance = LabelledUtterance(
+                text=entry["text"],
+                intents=tuple(entry["intents"]),
+                source=entry["source"],
+                history=tuple(tuple(turn) for turn in entry.get("history", ()))
+            )
+            if source is None or utterance.source == source:
+                utterances.append(utterance)
+    return utterances
@@ -0,0 +1,371 @@
+"""
+Intent Classification Benchmark
+
+Feeds a labelled corpus through IntentClassifier one message at a time and
+reports:
+- accuracy (primary intent, and exact intent-set match for multi-intent rows)
+- tier-hit ratios (share of messages resolved by each classification method)
+- p50/p95/p99 latency per tier
+- LLM tokens consumed (from llm_tokens_used_total)
+- accuracy and tier ratios of context-free and in-context messages separately
+
+Messages with preceding turns (conversation rows) are classified with them as
+conversation_history, as ChatService does; the rest without history.
+
+Results are written as JSON with sorted keys and per-utterance predictions
+(without timings) so two runs can be diffed between commits. compare_results
+flags regressions against a baseline file.
+
+Usage (offline, fake LLM backend):
+    python -m src.evaluation.intent_benchmark --backend fake --output results/intent.json
+
+Add --conversations 500 to include anonymised production messages and
+--baseline <file> to fail on regressions.
+
+The examples.py utterances are also the embedding kNN tier's index and would
+match themselves, so they are classified with that tier skipped; every other
+utterance (conversations, held-out corpus rows) goes through all tiers.
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import math
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.evaluation.datasets.intent_corpus import (
+    LabelledUtterance,
+    load_conversation_corpus,
+    load_corpus,
+    load_example_corpus,
+    save_corpus,
+)
+from src.monitoring.metrics import llm_tokens_used_total
+
+logger = logging.getLogger(__name__)
+
+# Methods that do not call the LLM
+LOCAL_METHODS = {"pattern_match", "embedding_knn", "cache"}
+
+# Corpus sources the kNN tier's index is built from
+KNN_INDEX_SOURCES = {"examples", "examples_multi"}
+
+# Default regression tolerances for compare_results
+MAX_ACCURACY_DROP = 0.01
+MAX_LLM_RATIO_INCREASE = 0.02
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values (0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _tokens_used() -> Dict[str, float]:
+    """Current llm_tokens_used_total values summed over models"""
+    totals: Dict[str, float] = defaultdict(float)
+    for metric in llm_tokens_used_total.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total"):
+                totals[sample.labels.get("token_type", "unknown")] += sample.value
+    return totals
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def _prediction_key(prediction: Dict[str, Any]) -> tuple:
+    """Identity of a prediction across runs (the same text may appear with different histories)"""
+    history = tuple(tuple(turn) for turn in prediction.get("history", ()))
+    return prediction["source"], prediction["text"], history
+
+
+def _without_knn_tier(classifier):
+    """Copy of a classifier that skips the embedding kNN tier (shares everything else)"""
+    if getattr(classifier, "embedding_index", None) is None:
+        return classifier
+    without_knn = copy.copy(classifier)
+    without_knn.embedding_index = None
+    return without_knn
+
+
+class IntentBenchmark:
+    """
+    Runs a labelled corpus through a classifier and summarizes the results
+    """
+
+    def __init__(self, classifier):
+        """
+        Initialize benchmark
+
+        Args:
+            classifier: IntentClassifier (or anything with the same classify())
+        """
+        self.classifier = classifier
+        self._classifier_without_knn = _without_knn_tier(classifier)
+        self.records: List[Dict[str, Any]] = []
+        self.input_tokens = 0.0
+        self.output_tokens = 0.0
+
+    async def run(self, corpus: List[LabelledUtterance]) -> Dict[str, Any]:
+        """
+        Classify every utterance sequentially
+
+        Args:
+            corpus: Labelled utterances
+
+        Returns:
+            Summary (see summarize)
+        """
+        tokens_before = _tokens_used()
+
+        for utterance in corpus:
+            classifier = self.classifier
+            if utterance.source in KNN_INDEX_SOURCES:
+                classifier = self._classifier_without_knn
+            start = time.perf_counter()
+            try:
+                result, method = await classifier.classify(
+                    utterance.text, conversation_history=utterance.conversation_history
+                )
+                predicted = [intent.intent for intent in result.intents]
+                primary = result.primary_intent
+            except Exception as e:
+                logger.error(f"Benchmark classification failed for {utterance.text[:50]!r}: {e}")
+                predicted, primary, method = [], None, "error"
+            latency_ms = (time.perf_counter() - start) * 1000
+
+            self.records.append({
+                "text": utterance.text,
+                "source": utterance.source,
+                "history": [list(turn) for turn in utterance.history],
+                "expected": list(utterance.intents),
+                "predicted": predicted,
+                "primary_correct": primary == utterance.primary_intent,
+                "exact_match": set(predicted) == set(utterance.intents),
+                "method": method,
+                "latency_ms": latency_ms,
+            })
+
+        tokens_after = _tokens_used()
+        self.input_tokens = tokens_after.get("input", 0.0) - tokens_before.get("input", 0.0)
+        self.output_tokens = tokens_after.get("output", 0.0) - tokens_before.get("output", 0.0)
+        return self.summarize()
+
+    def summarize(self) -> Dict[str, Any]:
+        """
+        Aggregate the collected records
+
+        Returns:
+            Dict with accuracy, tiers, tokens and per-utterance predictions
+        """
+        total = len(self.records)
+        by_method: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        by_source: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        by_context: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for record in self.records:
+            by_method[record["method"]].append(record)
+            by_source[record["source"]].append(record)
+            by_context["in_context" if record["history"] else "context_free"].append(record)
+
+        def accuracy(records: List[Dict[str, Any]]) -> Dict[str, float]:
+            count = len(records) or 1
+            return {
+                "primary": round(sum(r["primary_correct"] for r in records) / count, 4),
+                "exact": round(sum(r["exact_match"] for r in records) / count, 4),
+            }
+
+        tiers = {}
+        for method, records in by_method.items():
+            latencies = [r["latency_ms"] for r in records]
+            tiers[method] = {
+                "count": len(records),
+                "ratio": round(len(records) / total, 4) if total else 0.0,
+                "accuracy": accuracy(records),
+                "latency_ms": {
+                    "p50": round(percentile(latencies, 50), 2),
+                    "p95": round(percentile(latencies, 95), 2),
+                    "p99": round(percentile(latencies, 99), 2),
+                },
+            }
+
+        def llm_ratio(records: List[Dict[str, Any]]) -> float:
+            llm = sum(r["method"] not in LOCAL_METHODS for r in records)
+            return round(llm / len(records), 4) if records else 0.0
+
+        def tier_ratios(records: List[Dict[str, Any]]) -> Dict[str, float]:
+            counts: Dict[str, int] = defaultdict(int)
+            for record in records:
+                counts[record["method"]] += 1
+            return {method: round(count / len(records), 4) for method, count in counts.items()}
+
+        llm_calls = sum(len(records) for method, records in by_method.items() if method not in LOCAL_METHODS)
+        return {
+            "commit": _git_commit(),
+            "corpus_size": total,
+            "accuracy": accuracy(self.records),
+            "accuracy_by_source": {source: accuracy(records) for source, records in by_source.items()},
+            "llm_ratio": round(llm_calls / total, 4) if total else 0.0,
+            "tiers": tiers,
+            "by_context": {
+                context: {
+                    "count": len(records),
+                    "accuracy": accuracy(records),
+                    "llm_ratio": llm_ratio(records),
+                    "tier_ratios": tier_ratios(records),
+                }
+                for context, records in by_context.items()
+            },
+            "llm_tokens": {
+                "input": int(self.input_tokens),
+                "output": int(self.output_tokens),
+                "per_llm_call": round((self.input_tokens + self.output_tokens) / llm_calls, 1) if llm_calls else 0.0,
+            },
+            "predictions": sorted(
+                (
+                    {key: r[key] for key in ("text", "source", "history", "expected", "predicted", "method")}
+                    for r in self.records
+                ),
+                key=_prediction_key
+            ),
+        }
+
+
+def write_results(summary: Dict[str, Any], path: str) -> None:
+    """Write a summary as stable, diffable JSON"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    max_accuracy_drop: float = MAX_ACCURACY_DROP,
+    max_llm_ratio_increase: float = MAX_LLM_RATIO_INCREASE
+) -> List[str]:
+    """
+    Compare a run against a baseline
+
+    Args:
+        baseline: Baseline summary
+        current: Current summary
+        max_accuracy_drop: Allowed drop in primary / exact accuracy
+        max_llm_ratio_increase: Allowed increase in the share of messages sent to the LLM
+
+    Returns:
+        Human-readable regressions (empty if none)
+    """
+    regressions = []
+
+    for metric in ("primary", "exact"):
+        before = baseline["accuracy"][metric]
+        after = current["accuracy"][metric]
+        if before - after > max_accuracy_drop:
+            regressions.append(f"{metric} accuracy dropped {before:.2%} -> {after:.2%}")
+
+    if current["llm_ratio"] - baseline["llm_ratio"] > max_llm_ratio_increase:
+        regressions.append(f"LLM ratio rose {baseline['llm_ratio']:.2%} -> {current['llm_ratio']:.2%}")
+
+    previous = {_prediction_key(p): p for p in baseline.get("predictions", [])}
+    for prediction in current.get("predictions", []):
+        before = previous.get(_prediction_key(prediction))
+        if before is None:
+            continue
+        was_correct = before["predicted"][:1] == before["expected"][:1]
+        is_correct = prediction["predicted"][:1] == prediction["expected"][:1]
+        if was_correct and not is_correct:
+            regressions.append(
+                f"now misclassified: {prediction['text']!r} "
+                f"({before['predicted'][:1]} -> {prediction['predicted'][:1]})"
+            )
+
+    return regressions
+
+
+def _print_summary(summary: Dict[str, Any]) -> None:
+    print(f"\nIntent benchmark: {summary['corpus_size']} utterances (commit {summary['commit']})")
+    print(f"  accuracy: primary={summary['accuracy']['primary']:.2%} exact={summary['accuracy']['exact']:.2%}")
+    print(f"  LLM ratio: {summary['llm_ratio']:.2%}, tokens: {summary['llm_tokens']}")
+    for context, group in sorted(summary["by_context"].items()):
+        print(
+            f"  {context:<18} {group['count']} utterances  acc={group['accuracy']['primary']:.2%} "
+            f"LLM ratio={group['llm_ratio']:.2%}"
+        )
+    for method, tier in sorted(summary["tiers"].items(), key=lambda item: -item[1]["count"]):
+        latency = tier["latency_ms"]
+        print(
+            f"  {method:<18} {tier['ratio']:>7.2%}  p50={latency['p50']:.1f}ms "
+            f"p95={latency['p95']:.1f}ms p99={latency['p99']:.1f}ms  acc={tier['accuracy']['primary']:.2%}"
+        )
+
+
+async def _load_corpus(args) -> List[LabelledUtterance]:
+    corpus = load_corpus(args.corpus) if args.corpus else load_example_corpus()
+
+    if args.conversations:
+        from src.core.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            corpus.extend(await load_conversation_corpus(db, limit=args.conversations))
+
+    if args.save_corpus:
+        save_corpus(corpus, args.save_corpus)
+    return corpus
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline intent classification benchmark")
+    parser.add_argument("--corpus", help="JSONL corpus (default: examples.py)")
+    parser.add_argument("--conversations", type=int, default=0, help="Also load N anonymised Conversation rows")
+    parser.add_argument("--save-corpus", help="Write the assembled corpus to this JSONL file")
+    parser.add_argument("--backend", help="LLM_BACKEND override (gemini, record, replay, fake)")
+    parser.add_argument("--output", default="results/intent_benchmark.json", help="Results JSON file")
+    parser.add_argument("--baseline", help="Baseline results JSON; exit 1 on regressions")
+    args = parser.parse_args(argv)
+
+    from src.core.config import settings
+    from src.llm.gemini.client import LLMClient
+    from src.nlp.intent.classifier import IntentClassifier
+
+    if args.backend:
+        settings.LLM_BACKEND = args.backend
+    # Measure the classifier, not responses cached by an earlier run
+    settings.LLM_CACHE_ENABLED = False
+
+    corpus = await _load_corpus(args)
+    benchmark = IntentBenchmark(IntentClassifier(LLMClient.create_for_intent_classification()))
+    summary = await benchmark.run(corpus)
+
+    write_results(summary, args.output)
+    _print_summary(summary)
+    print(f"  results: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare_results(json.load(f), summary)
+        for regression in regressions:
+            print(f"  REGRESSION: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
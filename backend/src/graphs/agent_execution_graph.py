@@ -26,6 +26,7 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 
 from src.graphs.state import AgentExecutionState
@@ -512,9 +513,13 @@ async def merge_responses_node(
 # GRAPH CREATION
 # ============================================================
 
-def create_agent_execution_graph(coordinator_agent: Any) -> StateGraph:
+# Compiled once per process; requests bind their coordinator via config
+_agent_execution_graph = None
+
+
+def _build_agent_execution_graph():
     """
-    Create the Agent Execution Graph
+    Build and compile the Agent Execution Graph
 
     Flow:
     1. prepare_agent_execution → Analyze intents and plan execution
@@ -522,8 +527,8 @@ def create_agent_execution_graph(coordinator_agent: Any) -> StateGraph:
     3. execute_sequential_agents → Run dependent agents sequentially
     4. merge_responses → Combine all responses with provenance
 
-    Args:
-        coordinator_agent: CoordinatorAgent instance
+    Nodes read the request's CoordinatorAgent from
+    config["configurable"]["coordinator_agent"].
 
     Returns:
         Compiled StateGraph
@@ -533,15 +538,15 @@ def create_agent_execution_graph(coordinator_agent: Any) -> StateGraph:
     # Create graph
     graph = StateGraph(AgentExecutionState)
 
-    # Add nodes with dependency injection
+    # Add nodes (coordinator injected per invocation via config)
     async def _prepare(state):
         return await prepare_agent_execution_node(state)
 
-    async def _parallel(state):
-        return await execute_parallel_agents_node(state, coordinator_agent)
+    async def _parallel(state, config: RunnableConfig):
+        return await execute_parallel_agents_node(state, config["configurable"]["coordinator_agent"])
 
-    async def _sequential(state):
-        return await execute_sequential_agents_node(state, coordinator_agent)
+    async def _sequential(state, config: RunnableConfig):
+        return await execute_sequential_agents_node(state, config["configurable"]["coordinator_agent"])
 
     async def _merge(state):
         return await merge_responses_node(state)
@@ -565,3 +570,34 @@ def create_agent_execution_graph(coordinator_agent: Any) -> StateGraph:
     # Compile and return
     return graph.compile()
 
+
+def get_agent_execution_graph():
+    """
+    Get the process-wide compiled Agent Execution Graph (singleton pattern)
+
+    Returns:
+        Compiled StateGraph (pass the coordinator in config["configurable"])
+    """
+    global _agent_execution_graph
+    if _agent_execution_graph is None:
+        _agent_execution_graph = _build_agent_execution_graph()
+    return _agent_execution_graph
+
+
+def create_agent_execution_graph(coordinator_agent: Any):
+    """
+    Create the Agent Execution Graph for one CoordinatorAgent
+
+    Binds the shared compiled graph to the coordinator; nothing is compiled
+    per request.
+
+    Args:
+        coordinator_agent: CoordinatorAgent instance
+
+    Returns:
+        Runnable graph with ainvoke(state)
+    """
+    return get_agent_execution_graph().with_config(
+        configurable={"coordinator_agent": coordinator_agent}
+    )
+
@@ -22,6 +22,7 @@ import logging
 from typing import Dict, Any, Literal, Optional
 from datetime import datetime
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -1335,7 +1336,7 @@ async def generate_question_node(
                 context['available_subcategories'] = state.get('metadata', {}).get('available_subcategories', [])
                 context['service_type'] = state.get('metadata', {}).get('service_type', '')
 
-            original_question = question_generator.generate(
+            original_question = await question_generator.generate(
                 entity_type=EntityType(next_entity),
                 intent=intent_enum,
                 collected_entities=state.get('collected_entities', {}),
@@ -1362,7 +1363,7 @@ async def generate_question_node(
                 context['available_subcategories'] = state.get('metadata', {}).get('available_subcategories', [])
                 context['service_type'] = state.get('metadata', {}).get('service_type', '')
 
-            question = question_generator.generate(
+            question = await question_generator.generate(
                 entity_type=EntityType(next_entity),
                 intent=intent_enum,
                 collected_entities=state.get('collected_entities', {}),
@@ -1532,24 +1533,17 @@ def should_trigger_agent_execution(state: SlotFillingState) -> Literal["execute_
 # GRAPH BUILDER
 # ============================================================
 
-def create_slot_filling_graph(
-    db: AsyncSession,
-    classifier: IntentClassifier,
-    dialog_manager: DialogStateManager,
-    question_generator: QuestionGenerator,
-    entity_extractor: EntityExtractor,
-    entity_validator: EntityValidator
-):
+# Compiled once per process; requests bind their services via config
+_slot_filling_graph = None
+
+
+def _build_slot_filling_graph():
     """
-    Create the Slot-Filling Graph
+    Build and compile the Slot-Filling Graph
 
-    Args:
-        db: Database session
-        classifier: Intent classifier
-        dialog_manager: Dialog state manager
-        question_generator: Question generator
-        entity_extractor: Entity extractor
-        entity_validator: Entity validator
+    Nodes read the request's services (db, classifier, dialog_manager,
+    question_generator, entity_extractor, entity_validator) from
+    config["configurable"].
 
     Returns:
         Compiled StateGraph
@@ -1557,30 +1551,32 @@ def create_slot_filling_graph(
     # Create graph
     graph = StateGraph(SlotFillingState)
 
-    # Add nodes (with service dependencies injected via async wrappers)
-    async def _classify_intent(state):
-        return await classify_intent_node(state, classifier, dialog_manager)
+    # Add nodes (with service dependencies injected per invocation via config)
+    async def _classify_intent(state, config: RunnableConfig):
+        deps = config["configurable"]
+        return await classify_intent_node(state, deps["classifier"], deps["dialog_manager"])
 
-    async def _check_follow_up(state):
-        return await check_follow_up_node(state, dialog_manager)
+    async def _check_follow_up(state, config: RunnableConfig):
+        return await check_follow_up_node(state, config["configurable"]["dialog_manager"])
 
-    async def _extract_initial_entities(state):
-        return await extract_initial_entities_node(state, entity_extractor)
+    async def _extract_initial_entities(state, config: RunnableConfig):
+        return await extract_initial_entities_node(state, config["configurable"]["entity_extractor"])
 
-    async def _extract_entity(state):
-        return await extract_entity_node(state, entity_extractor)
+    async def _extract_entity(state, config: RunnableConfig):
+        return await extract_entity_node(state, config["configurable"]["entity_extractor"])
 
-    async def _validate_entity(state):
-        return await validate_entity_node(state, entity_validator)
+    async def _validate_entity(state, config: RunnableConfig):
+        return await validate_entity_node(state, config["configurable"]["entity_validator"])
 
-    async def _update_dialog_state(state):
-        return await update_dialog_state_node(state, dialog_manager)
+    async def _update_dialog_state(state, config: RunnableConfig):
+        return await update_dialog_state_node(state, config["configurable"]["dialog_manager"])
 
-    async def _determine_needed_entities(state):
-        return await determine_needed_entities_node(state, db)
+    async def _determine_needed_entities(state, config: RunnableConfig):
+        return await determine_needed_entities_node(state, config["configurable"]["db"])
 
-    async def _generate_question(state):
-        return await generate_question_node(state, question_generator, dialog_manager)
+    async def _generate_question(state, config: RunnableConfig):
+        deps = config["configurable"]
+        return await generate_question_node(state, deps["question_generator"], deps["dialog_manager"])
 
     async def _handle_error(state):
         return await handle_error_node(state)
@@ -1803,6 +1799,56 @@ def create_slot_filling_graph(
     return compiled_graph
 
 
+def get_slot_filling_graph():
+    """
+    Get the process-wide compiled Slot-Filling Graph (singleton pattern)
+
+    Returns:
+        Compiled StateGraph (pass the services in config["configurable"])
+    """
+    global _slot_filling_graph
+    if _slot_filling_graph is None:
+        _slot_filling_graph = _build_slot_filling_graph()
+    return _slot_filling_graph
+
+
+def create_slot_filling_graph(
+    db: AsyncSession,
+    classifier: IntentClassifier,
+    dialog_manager: DialogStateManager,
+    question_generator: QuestionGenerator,
+    entity_extractor: EntityExtractor,
+    entity_validator: EntityValidator
+):
+    """
+    Create the Slot-Filling Graph for one request
+
+    Binds the shared compiled graph to the request's services; nothing is
+    compiled per request.
+
+    Args:
+        db: Database session
+        classifier: Intent classifier
+        dialog_manager: Dialog state manager
+        question_generator: Question generator
+        entity_extractor: Entity extractor
+        entity_validator: Entity validator
+
+    Returns:
+        Runnable graph with ainvoke(state)
+    """
+    return get_slot_filling_graph().with_config(
+        configurable={
+            "db": db,
+            "classifier": classifier,
+            "dialog_manager": dialog_manager,
+            "question_generator": question_generator,
+            "entity_extractor": entity_extractor,
+            "entity_validator": entity_validator
+        }
+    )
+
+
 # ============================================================
 # GRAPH EXECUTION HELPER
 # ============================================================
@@ -75,7 +75,7 @@ class ConversationState(ConversationStateRequired, total=False):
     """Confidence score for primary intent (0.0 to 1.0)"""
     
     classification_method: Optional[str]
-    """Method used: 'pattern_match', 'llm', 'context_aware_llm', 'fallback'"""
+    """Method used: 'pattern_match', 'embedding_knn', 'llm', 'context_aware_llm', 'fallback'"""
 
     intent_changed: Optional[bool]
     """Whether the user's intent changed during slot-filling (e.g., asking a clarification question)"""
@@ -1 +1,13 @@
-"""Package initialization."""
+"""
+LLM Cache Package
+"""
+
+from src.llm.cache.response_cache import LLMResponseCache, get_llm_response_cache
+from src.llm.cache.single_flight import SingleFlight, get_llm_single_flight
+
+__all__ = [
+    "LLMResponseCache",
+    "get_llm_response_cache",
+    "SingleFlight",
+    "get_llm_single_flight",
+]
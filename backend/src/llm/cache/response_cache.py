@@ -0,0 +1,157 @@
+"""
+LLM Response Cache
+
+Two-tier cache for deterministic LLM calls:
+1. In-process LRU (bounded, TTL) - no network hop for hot prompts
+2. Shared Redis tier - survives restarts and is shared across workers
+
+Keys are a SHA-256 over model, system instruction, generation config
+(including any response schema) and prompt contents, so any change to the
+request produces a different key.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Optional
+
+from src.monitoring.metrics import llm_cache_hits_total, llm_cache_misses_total
+from src.utils.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    In-process LRU in front of the shared RedisClient for LLM response text
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        memory_ttl_seconds: int = 3600,
+        redis_ttl_seconds: int = 86400,
+        key_prefix: str = "llm:response:"
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Max entries in the in-process tier
+            memory_ttl_seconds: TTL for the in-process tier
+            redis_ttl_seconds: TTL for the Redis tier (0 disables the Redis tier)
+            key_prefix: Redis key prefix
+        """
+        self.memory = TTLLRUCache(max_entries=max_entries, ttl_seconds=memory_ttl_seconds)
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.key_prefix = key_prefix
+
+    @staticmethod
+    def build_key(
+        model: str,
+        contents: Any,
+        generation_config: dict,
+        system_instruction: Optional[str] = None
+    ) -> str:
+        """
+        Build a cache key for an LLM request
+
+        Args:
+            model: Model name
+            contents: Prompt string or list of contents
+            generation_config: Generation parameters (temperature, max tokens, schema, ...)
+            system_instruction: Optional system instruction
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "system_instruction": system_instruction,
+                "generation_config": generation_config,
+                "contents": contents,
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str, model: str, operation: str) -> Optional[str]:
+        """
+        Look up a cached response, memory first, then Redis
+
+        Args:
+            key: Cache key from build_key()
+            model: Model label for metrics
+            operation: Operation label for metrics
+
+        Returns:
+            Cached response text or None
+        """
+        value = self.memory.get(key)
+        if value is not None:
+            llm_cache_hits_total.labels(model=model, operation=operation, tier="memory").inc()
+            return value
+
+        if self.redis_ttl_seconds > 0:
+            from src.core.cache.redis_client import redis_client
+
+            value = await redis_client.get(self.key_prefix + key)
+            if isinstance(value, str):
+                # Promote to the in-process tier
+                self.memory.set(key, value)
+                llm_cache_hits_total.labels(model=model, operation=operation, tier="redis").inc()
+                return value
+
+        llm_cache_misses_total.labels(model=model, operation=operation).inc()
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        """
+        Store a response in both tiers
+
+        Args:
+            key: Cache key from build_key()
+            value: Response text
+        """
+        self.memory.set(key, value)
+
+        if self.redis_ttl_seconds > 0:
+            from src.core.cache.redis_client import redis_client
+
+            await redis_client.set(self.key_prefix + key, value, ttl=self.redis_ttl_seconds)
+
+    def clear(self) -> None:
+        """Clear the in-process tier"""
+        self.memory.clear()
+
+
+# Global cache instance (singleton)
+_llm_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """
+    Get or create the global LLM response cache
+
+    Returns:
+        LLMResponseCache, or None if caching is disabled via LLM_CACHE_ENABLED
+    """
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        from src.core.config import settings
+
+        if not settings.LLM_CACHE_ENABLED:
+            return None
+
+        _llm_response_cache = LLMResponseCache(
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            memory_ttl_seconds=settings.LLM_CACHE_MEMORY_TTL_SECONDS,
+            redis_ttl_seconds=settings.LLM_CACHE_REDIS_TTL_SECONDS
+        )
+        logger.info(
+            f"LLM response cache initialized (max_entries={settings.LLM_CACHE_MAX_ENTRIES}, "
+            f"redis_ttl={settings.LLM_CACHE_REDIS_TTL_SECONDS}s)"
+        )
+    return _llm_response_cache
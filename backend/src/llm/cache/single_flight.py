@@ -0,0 +1,99 @@
+"""
+Single-Flight Request Coalescing
+
+Concurrent LLM calls with the same request key share one in-flight call
+instead of each hitting Gemini. The first caller starts the call as a task;
+later callers with the same key await that task.
+
+Waiters await the shared task through asyncio.shield, so a cancelled waiter
+(client disconnect, per-attempt timeout) only stops waiting; the call keeps
+running for the remaining waiters and still populates the response cache.
+
+The shared task runs in an empty contextvars context rather than a copy of the
+first caller's: per-request state (stream channel, retry budget) belongs to
+one caller, so the shared call must not see it.
+"""
+
+import asyncio
+import contextvars
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.monitoring.metrics import llm_coalesced_requests_total
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight"""
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def run(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        model: str,
+        operation: str
+    ) -> Any:
+        """
+        Run call() once per key among concurrent callers
+
+        Args:
+            key: Request key (same key => same request)
+            call: Zero-argument coroutine function performing the request
+            model: Model label for metrics
+            operation: Operation label for metrics
+
+        Returns:
+            Result of the shared call (exceptions propagate to every waiter)
+        """
+        task = self._inflight.get(key)
+
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            llm_coalesced_requests_total.labels(model=model, operation=operation).inc()
+            logger.debug(f"Coalescing {operation} call onto in-flight request {key[:12]}")
+        else:
+            task = asyncio.get_running_loop().create_task(call(), context=contextvars.Context())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._on_done(key, done))
+
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished call"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+# Global single-flight instance (singleton)
+_llm_single_flight: Optional[SingleFlight] = None
+
+
+def get_llm_single_flight() -> Optional[SingleFlight]:
+    """
+    Get or create the global LLM single-flight group
+
+    Returns:
+        SingleFlight, or None if coalescing is disabled via LLM_SINGLE_FLIGHT_ENABLED
+    """
+    global _llm_single_flight
+    if _llm_single_flight is None:
+        from src.core.config import settings
+
+        if not settings.LLM_SINGLE_FLIGHT_ENABLED:
+            return None
+
+        _llm_single_flight = SingleFlight()
+    return _llm_single_flight
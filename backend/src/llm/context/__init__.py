@@ -0,0 +1,26 @@
+"""
+LLM Prompt Context Package
+"""
+
+from src.llm.context.conversation_cache import (
+    ConversationContextCache,
+    get_conversation_context_cache,
+)
+from src.llm.context.history_compactor import (
+    ConversationHistory,
+    HistoryCompactor,
+    get_history_compactor,
+    render_history,
+)
+from src.llm.context.tokens import count_tokens, truncate_to_tokens
+
+__all__ = [
+    "ConversationContextCache",
+    "get_conversation_context_cache",
+    "ConversationHistory",
+    "HistoryCompactor",
+    "get_history_compactor",
+    "render_history",
+    "count_tokens",
+    "truncate_to_tokens",
+]
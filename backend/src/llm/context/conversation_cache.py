@@ -0,0 +1,268 @@
+"""
+Conversation Context Cache
+
+Per-session ring buffer of the most recent chat messages, so a turn's history
+is read from memory instead of SELECTing the last messages from the
+conversations table:
+
+1. Writers append each stored message (with its row id) to the session's
+   buffer, which keeps the last max_messages entries
+2. Readers get the buffer, trimmed oldest-first to token_budget; a missing
+   buffer is a miss, loaded from MySQL once and seeded
+3. Appends only extend an existing buffer, so a buffer always holds the
+   session's full recent window and never just the messages written since
+   it expired
+
+Buffers live in Redis (a list per session) when it is available, and in an
+in-process TTL cache otherwise. A failed Redis append deletes the session's
+list, so a buffer never silently lacks a message. In-process buffers only
+see the turns handled by their own worker, so get() checks them against the
+session's newest message in the database (latest_id) and treats a buffer
+that does not hold it as a miss. Without Redis a cached turn therefore still
+costs one SELECT of the session's newest message id instead of the history
+query. When every session is served by one worker (a single worker, or
+sticky sessions) trust_local_buffers skips that check: a buffer this worker
+wrote within the TTL then holds every message of the session.
+"""
+
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.llm.context.tokens import count_tokens
+from src.utils.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+# Append to an existing buffer only, keep the last ARGV[1] entries, refresh TTL
+_APPEND_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 3, #ARGV do
+    redis.call('RPUSH', KEYS[1], ARGV[i])
+end
+redis.call('LTRIM', KEYS[1], -tonumber(ARGV[1]), -1)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return 1
+"""
+
+# Replace the buffer with ARGV[3..]
+_SEED_SCRIPT = """
+redis.call('DEL', KEYS[1])
+if #ARGV < 3 then
+    return 0
+end
+for i = 3, #ARGV do
+    redis.call('RPUSH', KEYS[1], ARGV[i])
+end
+redis.call('LTRIM', KEYS[1], -tonumber(ARGV[1]), -1)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return 1
+"""
+
+_READ_SCRIPT = """
+return redis.call('LRANGE', KEYS[1], 0, -1)
+"""
+
+
+def _entry(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Buffer entry of a message: id, role, content and its token count"""
+    content = message.get("content") or ""
+    return {
+        "id": message.get("id"),
+        "role": message.get("role", "user"),
+        "content": content,
+        "tokens": count_tokens(content)
+    }
+
+
+class ConversationContextCache:
+    """
+    Recent messages per chat session, capped by message count and token budget
+    """
+
+    def __init__(
+        self,
+        max_messages: int = 10,
+        token_budget: int = 2000,
+        ttl_seconds: int = 86400,
+        max_sessions: int = 10000,
+        key_prefix: str = "chat:context:",
+        trust_local_buffers: bool = False
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_messages: Messages kept per session
+            token_budget: Max tokens of the messages returned by get()
+            ttl_seconds: TTL of a session's buffer after its last write
+            max_sessions: Sessions kept by the in-process fallback
+            key_prefix: Redis key prefix for session buffers
+            trust_local_buffers: Serve in-process buffers without the latest_id
+                check (only when no other worker handles the same sessions)
+        """
+        self.max_messages = max_messages
+        self.token_budget = token_budget
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self.trust_local_buffers = trust_local_buffers
+        self._buffers = TTLLRUCache(max_entries=max_sessions, ttl_seconds=ttl_seconds)
+
+    def _key(self, user_id: int, session_id: str) -> str:
+        return f"{self.key_prefix}{user_id}:{session_id}"
+
+    @staticmethod
+    def _redis():
+        from src.core.cache.redis_client import redis_client
+
+        return redis_client if redis_client._is_available() else None
+
+    def _fit_budget(self, entries: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """Newest entries within the token budget (at least one), without token counts"""
+        kept = []
+        total = 0
+        for entry in reversed(entries[-self.max_messages:]):
+            total += entry["tokens"]
+            if kept and total > self.token_budget:
+                break
+            kept.append({"id": entry["id"], "role": entry["role"], "content": entry["content"]})
+        kept.reverse()
+        return kept
+
+    async def get(
+        self,
+        user_id: int,
+        session_id: str,
+        latest_id: Optional[Callable[[], Awaitable[Optional[int]]]] = None
+    ) -> Optional[List[Dict[str, str]]]:
+        """
+        Get a session's recent messages
+
+        Args:
+            user_id: User ID
+            session_id: Session ID
+            latest_id: Loads the id of the session's newest stored message; an
+                in-process buffer that does not hold it is stale (another worker
+                handled a later turn) and is dropped; not called when
+                trust_local_buffers is set
+
+        Returns:
+            Messages in chronological order ({"id", "role", "content"}), or None on a miss
+        """
+        key = self._key(user_id, session_id)
+        redis = self._redis()
+        if redis is None:
+            entries = self._buffers.get(key)
+            if entries and latest_id is not None and not self.trust_local_buffers:
+                newest = await latest_id()
+                if newest is None or newest not in {entry["id"] for entry in entries}:
+                    logger.debug(f"[ConversationCache] Stale in-process buffer for {key} (newest id {newest})")
+                    self._buffers.pop(key)
+                    return None
+        else:
+            raw = await redis.eval(_READ_SCRIPT, keys=[key], args=[])
+            entries = [json.loads(item) for item in raw] if raw else None
+
+        if not entries:
+            return None
+        return self._fit_budget(entries)
+
+    async def append(self, user_id: int, session_id: str, messages: List[Dict[str, Any]]) -> None:
+        """
+        Append stored messages to a session's buffer (no-op if it is not cached)
+
+        Args:
+            user_id: User ID
+            session_id: Session ID
+            messages: Messages in write order ({"id", "role", "content"})
+        """
+        key = self._key(user_id, session_id)
+        entries = [_entry(message) for message in messages]
+        redis = self._redis()
+        if redis is None:
+            buffer = self._buffers.get(key)
+            if buffer is not None:
+                self._buffers.set(key, (buffer + entries)[-self.max_messages:])
+            return
+
+        appended = await redis.eval(
+            _APPEND_SCRIPT,
+            keys=[key],
+            args=[self.max_messages, self.ttl_seconds] + [json.dumps(entry) for entry in entries]
+        )
+        if appended is None:
+            # The append failed: a buffer without these messages must not be read
+            logger.warning(f"[ConversationCache] Append failed, dropping buffer {key}")
+            await redis.delete(key)
+
+    async def seed(self, user_id: int, session_id: str, messages: List[Dict[str, Any]]) -> None:
+        """
+        Replace a session's buffer with messages loaded from the database
+
+        Args:
+            user_id: User ID
+            session_id: Session ID
+            messages: Recent messages in chronological order
+        """
+        key = self._key(user_id, session_id)
+        entries = [_entry(message) for message in messages][-self.max_messages:]
+        redis = self._redis()
+        if redis is None:
+            if entries:
+                self._buffers.set(key, entries)
+            else:
+                self._buffers.pop(key)
+            return
+
+        await redis.eval(
+            _SEED_SCRIPT,
+            keys=[key],
+            args=[self.max_messages, self.ttl_seconds] + [json.dumps(entry) for entry in entries]
+        )
+
+    async def invalidate(self, user_id: int, session_id: str) -> None:
+        """
+        Drop a session's buffer (e.g. after its messages were deleted)
+
+        Args:
+            user_id: User ID
+            session_id: Session ID
+        """
+        key = self._key(user_id, session_id)
+        self._buffers.pop(key)
+        redis = self._redis()
+        if redis is not None:
+            await redis.delete(key)
+
+    def clear(self) -> None:
+        """Clear in-process buffers"""
+        self._buffers.clear()
+
+
+# Global cache instance (singleton)
+_conversation_context_cache: Optional[ConversationContextCache] = None
+
+
+def get_conversation_context_cache() -> Optional[ConversationContextCache]:
+    """
+    Get or create the global conversation context cache
+
+    Returns:
+        ConversationContextCache, or None if disabled via CONVERSATION_CACHE_ENABLED
+    """
+    global _conversation_context_cache
+    if _conversation_context_cache is None:
+        from src.core.config import settings
+
+        if not settings.CONVERSATION_CACHE_ENABLED:
+            return None
+
+        _conversation_context_cache = ConversationContextCache(
+            max_messages=settings.CONVERSATION_CACHE_MAX_MESSAGES,
+            token_budget=settings.CONVERSATION_CACHE_TOKEN_BUDGET,
+            ttl_seconds=settings.CONVERSATION_CACHE_TTL_SECONDS,
+            trust_local_buffers=settings.CONVERSATION_CACHE_TRUST_LOCAL_BUFFERS
+        )
+    return _conversation_context_cache
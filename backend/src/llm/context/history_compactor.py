@@ -0,0 +1,384 @@
+"""
+Conversation History Compaction
+
+Keeps the conversation history that goes into context-aware intent prompts
+within a hard token budget:
+
+1. The most recent messages are kept verbatim, each truncated role-aware:
+   user messages keep their opening, assistant messages keep their opening
+   sentence and their closing question (what a follow-up like "yes" answers),
+   and long lists collapse to their first items.
+2. Older messages are folded into a rolling extractive summary that is
+   stored per session (in-process, and in Redis when available), so each
+   turn only summarizes the messages that newly left the recent window.
+3. The summary and recent messages are trimmed oldest-first until the
+   rendered history fits HISTORY_TOKEN_BUDGET.
+
+The compacted history is a ConversationHistory: a plain list of
+{"role", "content"} messages that also carries the summary, so it flows
+through every existing conversation_history parameter unchanged.
+"""
+
+import hashlib
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from src.llm.context.tokens import count_tokens, truncate_to_tokens
+from src.monitoring.metrics import llm_history_prompt_tokens, llm_history_tokens_saved
+from src.utils.ttl_lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+# Lines that are list items ("- AC repair", "1. Plumbing", "• Cleaning")
+_LIST_ITEM_PATTERN = re.compile(r"^\s*(?:[-*•🔹]|\d+[.)])\s+")
+_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+# Recent-window messages the legacy prompt inlined verbatim (baseline for savings)
+LEGACY_HISTORY_MESSAGES = 5
+
+# Tokens per summary line
+SUMMARY_LINE_TOKENS = 30
+
+# List items kept when collapsing a list
+LIST_ITEMS_KEPT = 3
+
+# Last folded messages remembered to find where the rolling summary left off
+FOLD_ANCHOR_MESSAGES = 3
+
+
+class ConversationHistory(list):
+    """
+    List of {"role", "content"} messages plus a summary of older messages
+    """
+
+    def __init__(self, messages: Optional[List[Dict[str, Any]]] = None, summary: Optional[str] = None):
+        super().__init__(messages or [])
+        self.summary = summary
+
+
+def _collapse_lists(content: str) -> List[str]:
+    """Split text into lines, keeping the first few items of each list and counting the rest"""
+    collapsed: List[str] = []
+    run: List[str] = []
+
+    def flush():
+        collapsed.extend(run[:LIST_ITEMS_KEPT])
+        if len(run) > LIST_ITEMS_KEPT:
+            collapsed.append(f"(+{len(run) - LIST_ITEMS_KEPT} more)")
+        run.clear()
+
+    for line in content.splitlines():
+        if _LIST_ITEM_PATTERN.match(line):
+            run.append(line.strip())
+            continue
+        flush()
+        if line.strip():
+            collapsed.append(line.strip())
+    flush()
+    return collapsed
+
+
+def _sentences(content: str) -> List[str]:
+    """Split text into sentences (list items count as sentences)"""
+    return [
+        sentence
+        for line in _collapse_lists(content)
+        for sentence in _SENTENCE_SPLIT_PATTERN.split(line)
+        if sentence
+    ]
+
+
+def truncate_message(role: str, content: str, max_tokens: int) -> str:
+    """
+    Truncate one message to max_tokens, keeping what matters for its role
+
+    Args:
+        role: "user" or "assistant"
+        content: Message text
+        max_tokens: Token limit
+
+    Returns:
+        Truncated message text
+    """
+    content = content or ""
+    if count_tokens(content) <= max_tokens:
+        return content
+
+    if role != "assistant":
+        return truncate_to_tokens(" ".join(content.split()), max_tokens)
+
+    text = " ".join(_collapse_lists(content))
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    # Opening sentence + closing question
+    sentences = _sentences(content)
+    closing = sentences[-1] if len(sentences) > 1 and sentences[-1].endswith("?") else ""
+    if closing:
+        closing_budget = min(count_tokens(closing), max_tokens // 2)
+        opening = truncate_to_tokens(sentences[0], max_tokens - closing_budget)
+        return f"{opening} … {truncate_to_tokens(closing, closing_budget)}"
+    return truncate_to_tokens(text, max_tokens)
+
+
+def summarize_messages(messages: List[Dict[str, Any]]) -> List[str]:
+    """
+    Summarize messages into one short line each
+
+    Args:
+        messages: Messages in chronological order
+
+    Returns:
+        Summary lines
+    """
+    lines = []
+    for msg in messages:
+        role = msg.get("role", "user")
+        content = " ".join((msg.get("content") or "").split())
+        if not content:
+            continue
+        if role == "assistant":
+            item_count = sum(1 for line in (msg.get("content") or "").splitlines() if _LIST_ITEM_PATTERN.match(line))
+            gist = truncate_to_tokens(_sentences(msg["content"])[0], SUMMARY_LINE_TOKENS)
+            if item_count >= LIST_ITEMS_KEPT:
+                gist = f"{gist} (listed {item_count} items)"
+            lines.append(f"Assistant: {gist}")
+        else:
+            lines.append(f"User: {truncate_to_tokens(content, SUMMARY_LINE_TOKENS)}")
+    return lines
+
+
+def _fingerprint(msg: Dict[str, Any]) -> str:
+    """Fingerprint of a message's role and content (stable with or without a database id)"""
+    text = f"{msg.get('role', 'user')}\x00{msg.get('content', '')}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _unfolded(older: List[Dict[str, Any]], folded: List[str]) -> List[Dict[str, Any]]:
+    """
+    Messages of older that come after the last folded ones
+
+    The latest position where the folded fingerprints end is the boundary; at
+    the start of the window only their tail has to match. If they are not in
+    older at all the window has moved past them and every message is new.
+    """
+    if not folded:
+        return list(older)
+    fingerprints = [_fingerprint(msg) for msg in older]
+    for end in range(len(fingerprints), 0, -1):
+        size = min(len(folded), end)
+        if fingerprints[end - size:end] == folded[-size:]:
+            return list(older[end:])
+    return list(older)
+
+
+def _trim_summary(lines: List[str], max_tokens: int) -> List[str]:
+    """Drop the oldest summary lines until the summary fits max_tokens"""
+    lines = list(lines)
+    while lines and count_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    return lines
+
+
+def render_history(history: List[Dict[str, Any]], summary: Optional[str] = None) -> str:
+    """
+    Render history as it appears in the context-aware intent prompt
+
+    Args:
+        history: Messages in chronological order
+        summary: Optional summary of older messages
+
+    Returns:
+        History section text
+    """
+    text = ""
+    if summary:
+        text += f"Summary of earlier conversation:\n{summary}\n"
+    for msg in history:
+        role = msg.get("role", "unknown").capitalize()
+        text += f"{role}: \"{msg.get('content', '')}\"\n"
+    return text
+
+
+class HistoryCompactor:
+    """
+    Compacts conversation history to a token budget with a rolling per-session summary
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 400,
+        keep_recent: int = 4,
+        max_message_tokens: int = 80,
+        summary_max_tokens: int = 120,
+        summary_ttl_seconds: int = 86400,
+        key_prefix: str = "chat:history_summary:"
+    ):
+        """
+        Initialize compactor
+
+        Args:
+            token_budget: Hard token budget for the rendered history
+            keep_recent: Most recent messages kept verbatim (truncated)
+            max_message_tokens: Token limit per recent message
+            summary_max_tokens: Token limit of the rolling summary
+            summary_ttl_seconds: TTL of stored summaries
+            key_prefix: Redis key prefix for stored summaries
+        """
+        self.token_budget = token_budget
+        self.keep_recent = keep_recent
+        self.max_message_tokens = max_message_tokens
+        self.summary_max_tokens = summary_max_tokens
+        self.summary_ttl_seconds = summary_ttl_seconds
+        self.key_prefix = key_prefix
+        self._summaries = TTLLRUCache(max_entries=10000, ttl_seconds=summary_ttl_seconds)
+
+    def compact(
+        self,
+        history: List[Dict[str, Any]],
+        summary_lines: Optional[List[str]] = None
+    ) -> ConversationHistory:
+        """
+        Compact history without session state
+
+        Messages beyond the recent window are summarized; summary_lines (from
+        an earlier rolling summary) are prepended to that summary.
+
+        Args:
+            history: Messages in chronological order
+            summary_lines: Existing summary lines for messages before history
+
+        Returns:
+            ConversationHistory within the token budget
+        """
+        if isinstance(history, ConversationHistory):
+            return history
+
+        older = history[:-self.keep_recent] if self.keep_recent else list(history)
+        recent = history[-self.keep_recent:] if self.keep_recent else []
+
+        lines = list(summary_lines or []) + summarize_messages(older)
+        return self._fit_budget(recent, _trim_summary(lines, self.summary_max_tokens))
+
+    def _fit_budget(self, recent: List[Dict[str, Any]], lines: List[str]) -> ConversationHistory:
+        """Truncate recent messages and trim oldest-first to the token budget"""
+        messages = [
+            {
+                "role": msg.get("role", "user"),
+                "content": truncate_message(msg.get("role", "user"), msg.get("content", ""), self.max_message_tokens)
+            }
+            for msg in recent
+        ]
+
+        def size() -> int:
+            return count_tokens(render_history(messages, "\n".join(lines) or None))
+
+        while size() > self.token_budget and lines:
+            lines.pop(0)
+        while size() > self.token_budget and len(messages) > 1:
+            messages.pop(0)
+        if messages and size() > self.token_budget:
+            overflow = size() - self.token_budget
+            last = messages[-1]
+            last["content"] = truncate_to_tokens(last["content"], max(count_tokens(last["content"]) - overflow - 1, 1))
+
+        return ConversationHistory(messages, "\n".join(lines) or None)
+
+    async def compact_session(
+        self,
+        session_id: str,
+        history: List[Dict[str, Any]]
+    ) -> ConversationHistory:
+        """
+        Compact a session's history, updating its rolling summary
+
+        Messages are folded into the stored summary once, when they leave
+        the recent window. The state remembers fingerprints of the last
+        folded messages and finds where it left off by position in the
+        given history, so it works for messages without a database id
+        (e.g. write-behind rows not flushed yet) as well.
+
+        Args:
+            session_id: Chat session ID
+            history: Recent messages in chronological order
+
+        Returns:
+            ConversationHistory within the token budget
+        """
+        older = history[:-self.keep_recent] if self.keep_recent else list(history)
+        recent = history[-self.keep_recent:] if self.keep_recent else []
+
+        lines: List[str] = []
+        if older:
+            state = await self._load_state(session_id)
+            if "folded" not in state:
+                state = {}  # Nothing folded yet (or state from an older format)
+            newly_older = _unfolded(older, state.get("folded", []))
+            lines = _trim_summary(state.get("lines", []) + summarize_messages(newly_older), self.summary_max_tokens)
+            if newly_older:
+                folded = [_fingerprint(msg) for msg in older[-FOLD_ANCHOR_MESSAGES:]]
+                await self._save_state(session_id, {"lines": lines, "folded": folded})
+
+        compacted = self._fit_budget(recent, lines)
+        self._record_savings(history, compacted)
+        return compacted
+
+    async def _load_state(self, session_id: str) -> Dict[str, Any]:
+        """Load the rolling summary state, memory first, then Redis"""
+        state = self._summaries.get(session_id)
+        if state is None:
+            from src.core.cache.redis_client import redis_client
+
+            state = await redis_client.get(self.key_prefix + session_id)
+            if isinstance(state, dict):
+                self._summaries.set(session_id, state)
+        return state if isinstance(state, dict) else {}
+
+    async def _save_state(self, session_id: str, state: Dict[str, Any]) -> None:
+        """Store the rolling summary state in both tiers"""
+        from src.core.cache.redis_client import redis_client
+
+        self._summaries.set(session_id, state)
+        await redis_client.set(self.key_prefix + session_id, state, ttl=self.summary_ttl_seconds)
+
+    @staticmethod
+    def _record_savings(history: List[Dict[str, Any]], compacted: ConversationHistory) -> None:
+        """Record compacted history tokens and tokens saved vs the verbatim prompt"""
+        before = count_tokens(render_history(history[-LEGACY_HISTORY_MESSAGES:]))
+        after = count_tokens(render_history(compacted, compacted.summary))
+        llm_history_prompt_tokens.observe(after)
+        llm_history_tokens_saved.observe(max(before - after, 0))
+        logger.debug(f"History compacted: {before} -> {after} tokens")
+
+    def clear(self) -> None:
+        """Clear in-process summaries"""
+        self._summaries.clear()
+
+
+# Global compactor instance (singleton)
+_history_compactor: Optional[HistoryCompactor] = None
+
+
+def get_history_compactor() -> Optional[HistoryCompactor]:
+    """
+    Get or create the global history compactor
+
+    Returns:
+        HistoryCompactor, or None if disabled via HISTORY_COMPACTION_ENABLED
+    """
+    global _history_compactor
+    if _history_compactor is None:
+        from src.core.config import settings
+
+        if not settings.HISTORY_COMPACTION_ENABLED:
+            return None
+
+        _history_compactor = HistoryCompactor(
+            token_budget=settings.HISTORY_TOKEN_BUDGET,
+            keep_recent=settings.HISTORY_KEEP_RECENT_MESSAGES,
+            max_message_tokens=settings.HISTORY_MAX_MESSAGE_TOKENS,
+            summary_max_tokens=settings.HISTORY_SUMMARY_MAX_TOKENS,
+            summary_ttl_seconds=settings.HISTORY_SUMMARY_TTL_SECONDS
+        )
+    return _history_compactor
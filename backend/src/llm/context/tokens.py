@@ -0,0 +1,84 @@
+"""
+Prompt Token Counting
+
+Token counts for prompt budgeting use a tiktoken BPE encoding (cl100k_base
+by default). Gemini's own tokenizer is only reachable through the API, but
+BPE counts track it closely enough for budgeting. If the encoding cannot be
+loaded (e.g. offline without a tiktoken cache), counts fall back to the
+1 token ≈ 4 characters approximation used by the chunking service.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4)
+def get_encoding(encoding_name: Optional[str] = None) -> Optional[Any]:
+    """
+    Load a tiktoken encoding once per process
+
+    Args:
+        encoding_name: Tiktoken encoding (default: HISTORY_TOKENIZER_ENCODING)
+
+    Returns:
+        tiktoken Encoding, or None if it could not be loaded
+    """
+    if encoding_name is None:
+        from src.core.config import settings
+        encoding_name = settings.HISTORY_TOKENIZER_ENCODING
+
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        logger.warning(f"Failed to load tiktoken encoding {encoding_name}, approximating token counts: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text
+
+    Args:
+        text: Input text
+
+    Returns:
+        Number of tokens
+    """
+    if not text:
+        return 0
+    encoding = get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return (len(text) + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int, suffix: str = "…") -> str:
+    """
+    Cut text to at most max_tokens tokens (suffix marks the cut)
+
+    Args:
+        text: Input text
+        max_tokens: Token limit
+        suffix: Appended when the text was cut
+
+    Returns:
+        Text within the limit
+    """
+    if max_tokens <= 0:
+        return ""
+    encoding = get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens]).rstrip() + suffix
+
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rstrip() + suffix
@@ -4,7 +4,7 @@ LLM Module - Model-Agnostic LLM Integration
 Uses LangChain's init_chat_model for provider-agnostic LLM access.
 """
 
-from .client import LLMClient, get_llm_client
+from .client import LLMClient, get_llm_client, get_shared_llm_client, get_generative_model
 from .prompts import (
     build_intent_classification_prompt,
     build_entity_extraction_prompt,
@@ -14,6 +14,8 @@ from .prompts import (
 __all__ = [
     "LLMClient",
     "get_llm_client",
+    "get_shared_llm_client",
+    "get_generative_model",
     "build_intent_classification_prompt",
     "build_entity_extraction_prompt",
     "get_system_prompt",
@@ -8,12 +8,18 @@ This uses the stable v1 API instead of the deprecated v1beta API.
 import os
 import json
 import time
-from typing import Optional, Dict, Any, List
+from contextlib import nullcontext
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable, AsyncContextManager
 import logging
 
 import google.generativeai as genai
 from pydantic import BaseModel
 
+from src.llm.cache.response_cache import LLMResponseCache, get_llm_response_cache
+from src.llm.cache.single_flight import get_llm_single_flight
+from src.llm.scheduler import LLMSchedulerRejected, LLMTier, get_llm_scheduler
+from src.utils.stream_events import TokenStream, get_stream_channel
+from src.utils.ttl_lru_cache import TTLLRUCache
 from src.monitoring.metrics import (
     llm_requests_total,
     llm_tokens_used_total,
@@ -24,6 +30,237 @@ from src.monitoring.metrics import (
 logger = logging.getLogger(__name__)
 
 
+def _track_token_usage(model_name: str, response: Any) -> None:
+    """
+    Record prompt/completion token counts from a Gemini response
+
+    Args:
+        model_name: Model label for metrics
+        response: Gemini GenerateContentResponse
+    """
+    if hasattr(response, 'usage_metadata') and response.usage_metadata:
+        if hasattr(response.usage_metadata, 'prompt_token_count'):
+            llm_tokens_used_total.labels(model=model_name, token_type="input").inc(response.usage_metadata.prompt_token_count)
+        if hasattr(response.usage_metadata, 'candidates_token_count'):
+            llm_tokens_used_total.labels(model=model_name, token_type="output").inc(response.usage_metadata.candidates_token_count)
+
+
+def _config_fingerprint(config: genai.GenerationConfig) -> Dict[str, Any]:
+    """
+    Extract the generation parameters that affect the response (for cache keys)
+
+    Args:
+        config: Generation configuration
+
+    Returns:
+        Dict of the relevant, JSON-serializable config fields
+    """
+    return {
+        "temperature": getattr(config, "temperature", None),
+        "max_output_tokens": getattr(config, "max_output_tokens", None),
+        "response_mime_type": getattr(config, "response_mime_type", None),
+        "response_schema": getattr(config, "response_schema", None),
+    }
+
+
+def _get_cache_for_call(
+    cache_responses: bool,
+    config: genai.GenerationConfig,
+    use_cache: Optional[bool]
+) -> Optional[LLMResponseCache]:
+    """
+    Decide whether a call may use the response cache
+
+    By default only deterministic calls (temperature 0) are cached; use_cache
+    overrides this per call and cache_responses=False opts a client out.
+
+    Args:
+        cache_responses: Client-level caching switch
+        config: Generation configuration of the call
+        use_cache: Per-call override
+
+    Returns:
+        The response cache, or None if this call should not be cached
+    """
+    if use_cache is None:
+        use_cache = cache_responses and getattr(config, "temperature", None) == 0
+    if not use_cache:
+        return None
+    return get_llm_response_cache()
+
+
+async def _coalesce(
+    key: str,
+    call: Callable[[], Awaitable[Any]],
+    model_name: str,
+    operation: str,
+    cache: Optional[LLMResponseCache]
+) -> Any:
+    """
+    Run an LLM call, sharing it with identical concurrent calls
+
+    Only cache-eligible calls are coalesced: a caller that would accept a
+    cached response equally accepts a concurrent caller's response. Sampled
+    calls (temperature > 0 by default) and use_cache=False calls each get
+    their own response.
+
+    Args:
+        key: Request key from LLMResponseCache.build_key()
+        call: Zero-argument coroutine function performing the request
+        model_name: Model label for metrics
+        operation: Operation label for metrics
+        cache: Response cache of the call (None if not cache-eligible)
+
+    Returns:
+        Result of the (possibly shared) call
+    """
+    single_flight = get_llm_single_flight()
+    if single_flight is None or cache is None:
+        return await call()
+    return await single_flight.run(key, call, model=model_name, operation=operation)
+
+
+def _tier_slot(tier: LLMTier) -> AsyncContextManager:
+    """
+    Get the scheduler slot to hold around one Gemini call
+
+    Args:
+        tier: Tier of the call
+
+    Returns:
+        Async context manager (no-op if the scheduler is disabled)
+    """
+    scheduler = get_llm_scheduler()
+    if scheduler is None:
+        return nullcontext()
+    return scheduler.slot(tier)
+
+
+# ============================================================
+# PROCESS-WIDE MODEL REGISTRY
+# ============================================================
+
+# genai.configure() is global SDK state; only redo it when the key changes
+_configured_api_key: Optional[str] = None
+
+# GenerativeModel instances keyed by (model_name, system_instruction)
+_model_pool = TTLLRUCache(max_entries=256, ttl_seconds=float("inf"))
+
+# Shared LLMClient instances keyed by constructor arguments
+_shared_clients: Dict[Tuple, "LLMClient"] = {}
+
+
+def _configure_genai(api_key: str) -> None:
+    """
+    Configure the Google GenAI SDK once per API key
+
+    Args:
+        api_key: Google API key
+    """
+    global _configured_api_key
+    if _configured_api_key != api_key:
+        genai.configure(api_key=api_key)
+        _configured_api_key = api_key
+
+
+def get_generative_model(
+    model_name: str,
+    system_instruction: Optional[str] = None
+) -> genai.GenerativeModel:
+    """
+    Get a pooled GenerativeModel for a model and system instruction
+
+    GenerativeModel holds no per-request state, so one instance per
+    (model, system_instruction) is reused across calls and clients.
+
+    Args:
+        model_name: Model name
+        system_instruction: Optional system instruction
+
+    Returns:
+        genai.GenerativeModel instance
+    """
+    key = (model_name, system_instruction or None)
+    model = _model_pool.get(key)
+    if model is None:
+        model = _create_model(model_name, system_instruction)
+        _model_pool.set(key, model)
+    return model
+
+
+def _create_model(model_name: str, system_instruction: Optional[str]) -> genai.GenerativeModel:
+    """
+    Create a GenerativeModel for the configured LLM_BACKEND
+
+    Args:
+        model_name: Model name
+        system_instruction: Optional system instruction
+
+    Returns:
+        genai.GenerativeModel, or a local stand-in for record/replay/fake backends
+    """
+    def real_model() -> genai.GenerativeModel:
+        if system_instruction:
+            return genai.GenerativeModel(model_name=model_name, system_instruction=system_instruction)
+        return genai.GenerativeModel(model_name=model_name)
+
+    backend = _llm_backend()
+    if backend == "gemini":
+        return real_model()
+
+    from src.llm.local import create_local_model
+    return create_local_model(model_name, system_instruction, backend, real_model_factory=real_model)
+
+
+def _llm_backend() -> str:
+    """Get the configured LLM backend (gemini, record, replay, fake)"""
+    from src.core.config import settings
+    return settings.LLM_BACKEND.lower()
+
+
+def get_shared_llm_client(
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    cache_responses: bool = True
+) -> "LLMClient":
+    """
+    Get a process-wide LLMClient for the given settings
+
+    LLMClient is stateless apart from its configuration, so services that
+    would otherwise build their own default client share one instead.
+
+    Args:
+        model: Model name
+        temperature: Temperature for generation
+        max_tokens: Maximum tokens to generate
+        cache_responses: Cache responses of deterministic (temperature 0) async calls
+
+    Returns:
+        Shared LLMClient instance
+    """
+    key = (model, temperature, max_tokens, cache_responses)
+    client = _shared_clients.get(key)
+    if client is None:
+        client = LLMClient(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            cache_responses=cache_responses
+        )
+        _shared_clients[key] = client
+    return client
+
+
+def reset_llm_registry() -> None:
+    """Drop pooled models, shared clients and cached schemas (tests, key rotation)"""
+    global _configured_api_key
+    _configured_api_key = None
+    _model_pool.clear()
+    _shared_clients.clear()
+    StructuredOutputModel._schema_cache.clear()
+
+
 class LLMClient:
     """
     Direct Google GenAI SDK client for Gemini models.
@@ -38,6 +275,7 @@ class LLMClient:
         model_provider: Optional[str] = None,  # Kept for compatibility, ignored
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        cache_responses: bool = True,
         **kwargs
     ):
         """
@@ -48,6 +286,7 @@ class LLMClient:
             model_provider: Ignored (kept for compatibility)
             temperature: Temperature for generation (0.0 to 2.0)
             max_tokens: Maximum tokens to generate
+            cache_responses: Cache responses of deterministic (temperature 0) async calls
             **kwargs: Additional model-specific parameters
         """
         # Get configuration from environment or use defaults
@@ -55,16 +294,19 @@ class LLMClient:
         self.model_name = model or os.getenv("LLM_MODEL", os.getenv("GEMINI_MODEL", "gemini-2.0-flash"))
         self.temperature = temperature if temperature is not None else float(os.getenv("LLM_TEMPERATURE", "0.7"))
         self.max_tokens = max_tokens or int(os.getenv("LLM_MAX_TOKENS", "8192"))
+        self.cache_responses = cache_responses
 
-        # Configure Google GenAI with API key
+        # Configure Google GenAI with API key (replay/fake backends never reach the API)
+        needs_api = _llm_backend() in ("gemini", "record")
         api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
+        if needs_api and not api_key:
             raise ValueError("GOOGLE_API_KEY environment variable not set")
 
         # Initialize the client
         try:
-            genai.configure(api_key=api_key)
-            self.client = genai.GenerativeModel(model_name=self.model_name)
+            if needs_api:
+                _configure_genai(api_key)
+            self.client = get_generative_model(self.model_name)
             self.generation_config = genai.GenerationConfig(
                 temperature=self.temperature,
                 max_output_tokens=self.max_tokens,
@@ -103,11 +345,7 @@ class LLMClient:
             llm_request_duration_seconds.labels(model=self.model_name, operation="invoke").observe(duration)
 
             # Track token usage if available
-            if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                if hasattr(response.usage_metadata, 'prompt_token_count'):
-                    llm_tokens_used_total.labels(model=self.model_name, token_type="input").inc(response.usage_metadata.prompt_token_count)
-                if hasattr(response.usage_metadata, 'candidates_token_count'):
-                    llm_tokens_used_total.labels(model=self.model_name, token_type="output").inc(response.usage_metadata.candidates_token_count)
+            _track_token_usage(self.model_name, response)
 
             return response.text
         except Exception as e:
@@ -137,37 +375,13 @@ class LLMClient:
             llm_requests_total.labels(model=self.model_name, operation="invoke_with_messages").inc()
 
             # Extract system instruction if present
-            system_instruction = None
-            contents = []
-
-            for msg in messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-
-                if role == "system":
-                    system_instruction = content
-                else:
-                    contents.append(content)
-
-            # Create config with system instruction if present
-            config = genai.GenerationConfig(
-                temperature=self.temperature,
-                max_output_tokens=self.max_tokens,
-            )
-
-            # Handle system instruction by creating a new model instance
-            if system_instruction:
-                client = genai.GenerativeModel(
-                    model_name=self.model_name,
-                    system_instruction=system_instruction
-                )
-            else:
-                client = self.client
+            system_instruction, contents = self._split_messages(messages)
+            client = self._get_model(system_instruction)
 
             # Generate content
             response = client.generate_content(
                 contents=contents,
-                generation_config=config
+                generation_config=self.generation_config
             )
 
             # Track success metrics
@@ -175,11 +389,7 @@ class LLMClient:
             llm_request_duration_seconds.labels(model=self.model_name, operation="invoke_with_messages").observe(duration)
 
             # Track token usage if available
-            if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                if hasattr(response.usage_metadata, 'prompt_token_count'):
-                    llm_tokens_used_total.labels(model=self.model_name, token_type="input").inc(response.usage_metadata.prompt_token_count)
-                if hasattr(response.usage_metadata, 'candidates_token_count'):
-                    llm_tokens_used_total.labels(model=self.model_name, token_type="output").inc(response.usage_metadata.candidates_token_count)
+            _track_token_usage(self.model_name, response)
 
             return response.text
         except Exception as e:
@@ -191,77 +401,275 @@ class LLMClient:
             logger.error(f"Error invoking Gemini with messages: {e}")
             raise
 
+    async def ainvoke(
+        self,
+        prompt: str,
+        use_cache: Optional[bool] = None,
+        tier: LLMTier = LLMTier.GENERATION
+    ) -> str:
+        """
+        Async variant of invoke() built on the SDK's native async API
+
+        Awaiting this yields the event loop while Gemini is working, so other
+        chat requests on the same worker keep making progress.
+
+        Args:
+            prompt: Text prompt
+            use_cache: Force caching on/off (default: cache only deterministic calls)
+            tier: Scheduler tier of the call
+
+        Returns:
+            Generated text response
+        """
+        return await self._agenerate(
+            self.client,
+            prompt,
+            self.generation_config,
+            operation="invoke",
+            use_cache=use_cache,
+            tier=tier
+        )
+
+    async def ainvoke_with_messages(
+        self,
+        messages: list,
+        use_cache: Optional[bool] = None,
+        tier: LLMTier = LLMTier.GENERATION,
+        stream_to_user: bool = False
+    ) -> str:
+        """
+        Async variant of invoke_with_messages()
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            use_cache: Force caching on/off (default: cache only deterministic calls)
+            tier: Scheduler tier of the call
+            stream_to_user: The response is the turn's answer; stream it during a streaming chat turn
+
+        Returns:
+            Generated text response
+        """
+        system_instruction, contents = self._split_messages(messages)
+
+        return await self._agenerate(
+            self._get_model(system_instruction),
+            contents,
+            self.generation_config,
+            operation="invoke_with_messages",
+            system_instruction=system_instruction,
+            use_cache=use_cache,
+            tier=tier,
+            stream_to_user=stream_to_user
+        )
+
     async def generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        use_cache: Optional[bool] = None,
+        tier: LLMTier = LLMTier.GENERATION,
+        stream_to_user: bool = False
     ) -> str:
         """
         Generate text with optional system prompt and temperature override
 
-        This is an async wrapper around invoke_with_messages for convenience.
+        Uses the SDK's async API, so the call never blocks the event loop.
 
         Args:
             prompt: User prompt
             system_prompt: Optional system instruction
             temperature: Optional temperature override
+            use_cache: Force caching on/off (default: cache only deterministic calls)
+            tier: Scheduler tier of the call
 
         Returns:
             Generated text response
         """
+        # Create config with temperature override if provided
+        if temperature is not None:
+            config = genai.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=self.max_tokens,
+            )
+        else:
+            config = self.generation_config
+
         try:
-            # Build messages list
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-
-            # Create config with temperature override if provided
-            if temperature is not None:
-                config = genai.GenerationConfig(
-                    temperature=temperature,
-                    max_output_tokens=self.max_tokens,
-                )
-            else:
-                config = genai.GenerationConfig(
-                    temperature=self.temperature,
-                    max_output_tokens=self.max_tokens,
-                )
+            return await self._agenerate(
+                self._get_model(system_prompt),
+                [prompt],
+                config,
+                operation="generate",
+                system_instruction=system_prompt,
+                use_cache=use_cache,
+                tier=tier,
+                stream_to_user=stream_to_user
+            )
+        except Exception as e:
+            logger.error(f"Error in generate method: {e}")
+            raise
 
-            # Extract system instruction if present
-            system_instruction = None
-            contents = []
-
-            for msg in messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-
-                if role == "system":
-                    system_instruction = content
-                else:
-                    contents.append(content)
-
-            # Handle system instruction by creating a new model instance
-            if system_instruction:
-                client = genai.GenerativeModel(
-                    model_name=self.model_name,
-                    system_instruction=system_instruction
-                )
+    async def _agenerate(
+        self,
+        client: genai.GenerativeModel,
+        contents: Any,
+        config: genai.GenerationConfig,
+        operation: str,
+        system_instruction: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        tier: LLMTier = LLMTier.GENERATION,
+        stream_to_user: bool = False
+    ) -> str:
+        """
+        Run one async generate_content call with caching, scheduling and metrics tracking
+
+        Args:
+            client: Model instance to call
+            contents: Prompt or list of contents
+            config: Generation configuration
+            operation: Operation label for metrics
+            system_instruction: System instruction the model was built with (part of the cache key)
+            use_cache: Force caching on/off (default: cache only deterministic calls)
+            tier: Scheduler tier of the call
+            stream_to_user: Stream the response's tokens if a streaming chat turn is active
+
+        Returns:
+            Generated text response
+        """
+        cache_key = LLMResponseCache.build_key(
+            model=self.model_name,
+            contents=contents,
+            generation_config=_config_fingerprint(config),
+            system_instruction=system_instruction
+        )
+        cache = _get_cache_for_call(self.cache_responses, config, use_cache)
+        if cache is not None:
+            cached = await cache.get(cache_key, model=self.model_name, operation=operation)
+            if cached is not None:
+                return cached
+
+        # The turn's answer streams its tokens (resolved here, in the caller's context)
+        channel = get_stream_channel() if stream_to_user else None
+        token_stream = channel.open_token_stream() if channel is not None else None
+
+        async def call() -> str:
+            start_time = time.time()
+
+            try:
+                llm_requests_total.labels(model=self.model_name, operation=operation).inc()
+
+                async with _tier_slot(tier):
+                    # Measure API latency only, not queue time
+                    start_time = time.time()
+                    if token_stream is not None:
+                        text, response = await self._astream(client, contents, config, token_stream)
+                    else:
+                        response = await client.generate_content_async(
+                            contents=contents,
+                            generation_config=config
+                        )
+                        text = response.text
+
+                duration = time.time() - start_time
+                llm_request_duration_seconds.labels(model=self.model_name, operation=operation).observe(duration)
+                _track_token_usage(self.model_name, response)
+
+                if cache is not None and text:
+                    await cache.set(cache_key, text)
+                return text
+            except LLMSchedulerRejected:
+                # Shed before reaching Gemini; not an API error
+                raise
+            except Exception as e:
+                duration = time.time() - start_time
+                llm_errors_total.labels(model=self.model_name, error_type="api_error").inc()
+                llm_request_duration_seconds.labels(model=self.model_name, operation=f"{operation}_error").observe(duration)
+
+                logger.error(f"Error invoking Gemini ({operation}): {e}")
+                raise
+
+        if token_stream is not None:
+            # A streamed call belongs to this caller's turn; never share it
+            return await call()
+        return await _coalesce(cache_key, call, self.model_name, operation, cache)
+
+    async def _astream(
+        self,
+        client: genai.GenerativeModel,
+        contents: Any,
+        config: genai.GenerationConfig,
+        token_stream: TokenStream
+    ) -> Tuple[str, Any]:
+        """
+        Run a streaming generate_content call, publishing its text as token events
+
+        Args:
+            client: Model instance to call
+            contents: Prompt or list of contents
+            config: Generation configuration
+            token_stream: Token stream of the current chat turn
+
+        Returns:
+            Tuple of (full response text, resolved streaming response)
+        """
+        response = await client.generate_content_async(
+            contents=contents,
+            generation_config=config,
+            stream=True
+        )
+
+        chunks = []
+        async for chunk in response:
+            try:
+                chunk_text = chunk.text
+            except ValueError:
+                # Chunk without text parts (e.g. only a finish reason)
+                continue
+            chunks.append(chunk_text)
+            await token_stream.feed(chunk_text)
+        await token_stream.close()
+
+        return "".join(chunks), response
+
+    def _split_messages(self, messages: list) -> Tuple[Optional[str], List[str]]:
+        """
+        Split chat-style messages into a system instruction and contents
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+
+        Returns:
+            Tuple of (system_instruction, contents)
+        """
+        system_instruction = None
+        contents = []
+
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+
+            if role == "system":
+                system_instruction = content
             else:
-                client = self.client
+                contents.append(content)
 
-            # Generate content
-            response = client.generate_content(
-                contents=contents,
-                generation_config=config
-            )
+        return system_instruction, contents
 
-            return response.text
+    def _get_model(self, system_instruction: Optional[str] = None) -> genai.GenerativeModel:
+        """
+        Get the model instance to use for a given system instruction
 
-        except Exception as e:
-            logger.error(f"Error in generate method: {e}")
-            raise
+        Args:
+            system_instruction: Optional system instruction
+
+        Returns:
+            genai.GenerativeModel instance
+        """
+        # Models with a system instruction come from the process-wide pool
+        if system_instruction:
+            return get_generative_model(self.model_name, system_instruction)
+        return self.client
 
     def with_structured_output(self, schema: BaseModel):
         """
@@ -273,7 +681,13 @@ class LLMClient:
         Returns:
             StructuredOutputModel instance
         """
-        return StructuredOutputModel(self.client, schema, self.model_name, self.generation_config)
+        return StructuredOutputModel(
+            self.client,
+            schema,
+            self.model_name,
+            self.generation_config,
+            cache_responses=self.cache_responses
+        )
 
     def get_client(self):
         """
@@ -325,7 +739,17 @@ class StructuredOutputModel:
     Wrapper for Gemini client that returns structured output matching a Pydantic schema.
     """
 
-    def __init__(self, client: genai.GenerativeModel, schema: BaseModel, model_name: str, generation_config: genai.GenerationConfig):
+    # Sanitized JSON schema per Pydantic class (schemas are static per class)
+    _schema_cache: Dict[type, dict] = {}
+
+    def __init__(
+        self,
+        client: genai.GenerativeModel,
+        schema: BaseModel,
+        model_name: str,
+        generation_config: genai.GenerationConfig,
+        cache_responses: bool = True
+    ):
         """
         Initialize structured output model
 
@@ -334,11 +758,14 @@ class StructuredOutputModel:
             schema: Pydantic model class defining the output structure
             model_name: Name of the model
             generation_config: Generation configuration
+            cache_responses: Cache responses of deterministic (temperature 0) async calls
         """
         self.client = client
         self.schema = schema
         self.model_name = model_name
         self.generation_config = generation_config
+        self.cache_responses = cache_responses
+        self._config: Optional[genai.GenerationConfig] = None
 
     def invoke(self, prompt: str):
         """
@@ -351,35 +778,133 @@ class StructuredOutputModel:
             Instance of the Pydantic schema with parsed data
         """
         try:
-            # Get JSON schema and remove additionalProperties
-            schema_dict = self.schema.model_json_schema()
-            schema_dict = self._remove_additional_properties(schema_dict)
+            response = self.client.generate_content(
+                contents=prompt,
+                generation_config=self._build_config()
+            )
+            return self._parse_response(response)
 
-            # Create config with JSON response schema
-            config = genai.GenerationConfig(
+        except Exception as e:
+            logger.error(f"Error in structured output: {e}")
+            raise
+
+    async def ainvoke(
+        self,
+        prompt: str,
+        use_cache: Optional[bool] = None,
+        tier: LLMTier = LLMTier.EXTRACTION
+    ):
+        """
+        Async variant of invoke() built on the SDK's native async API
+
+        Args:
+            prompt: Text prompt (should include JSON schema instructions)
+            use_cache: Force caching on/off (default: cache only deterministic calls)
+            tier: Scheduler tier of the call
+
+        Returns:
+            Instance of the Pydantic schema with parsed data
+        """
+        config = self._build_config()
+
+        cache_key = LLMResponseCache.build_key(
+            model=self.model_name,
+            contents=prompt,
+            generation_config=_config_fingerprint(config)
+        )
+        cache = _get_cache_for_call(self.cache_responses, config, use_cache)
+        if cache is not None:
+            cached = await cache.get(cache_key, model=self.model_name, operation="structured_output")
+            if cached is not None:
+                return self.schema.model_validate_json(cached)
+
+        async def call() -> str:
+            start_time = time.time()
+
+            try:
+                llm_requests_total.labels(model=self.model_name, operation="structured_output").inc()
+
+                async with _tier_slot(tier):
+                    # Measure API latency only, not queue time
+                    start_time = time.time()
+                    response = await self.client.generate_content_async(
+                        contents=prompt,
+                        generation_config=config
+                    )
+
+                duration = time.time() - start_time
+                llm_request_duration_seconds.labels(model=self.model_name, operation="structured_output").observe(duration)
+                _track_token_usage(self.model_name, response)
+
+                # Validate once in the shared call; only valid responses are cached
+                self._parse_response(response)
+                if cache is not None:
+                    await cache.set(cache_key, response.text)
+                return response.text
+
+            except LLMSchedulerRejected:
+                # Shed before reaching Gemini; not an API error
+                raise
+            except Exception as e:
+                llm_errors_total.labels(model=self.model_name, error_type="structured_output_error").inc()
+                logger.error(f"Error in structured output: {e}")
+                raise
+
+        # Coalesced callers share the validated JSON and each get their own model instance
+        text = await _coalesce(cache_key, call, self.model_name, "structured_output", cache)
+        return self.schema.model_validate_json(text)
+
+    def _build_config(self) -> genai.GenerationConfig:
+        """
+        Build generation config with the JSON response schema
+
+        The config is built once per instance from the per-class schema cache.
+
+        Returns:
+            genai.GenerationConfig instance
+        """
+        if self._config is None:
+            self._config = genai.GenerationConfig(
                 temperature=self.generation_config.temperature,
                 max_output_tokens=self.generation_config.max_output_tokens,
                 response_mime_type='application/json',
-                response_schema=schema_dict,
+                response_schema=self._get_sanitized_schema(),
             )
+        return self._config
 
-            # Generate response
-            response = self.client.generate_content(
-                contents=prompt,
-                generation_config=config
-            )
+    def _get_sanitized_schema(self) -> dict:
+        """
+        Get the Gemini-compatible JSON schema for the output class
 
-            # Parse JSON and validate with Pydantic
-            response_data = json.loads(response.text)
-            return self.schema.model_validate(response_data)
+        Returns:
+            JSON schema dict without unsupported fields (shared, do not mutate)
+        """
+        schema_dict = self._schema_cache.get(self.schema)
+        if schema_dict is None:
+            # Get JSON schema and remove additionalProperties
+            schema_dict = self.schema.model_json_schema()
+            schema_dict = self._remove_additional_properties(schema_dict)
+            self._schema_cache[self.schema] = schema_dict
+        return schema_dict
+
+    def _parse_response(self, response: Any):
+        """
+        Parse JSON response text and validate with the Pydantic schema
 
+        Args:
+            response: Gemini GenerateContentResponse
+
+        Returns:
+            Instance of the Pydantic schema with parsed data
+        """
+        try:
+            response_data = json.loads(response.text)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from Gemini response: {e}")
             logger.error(f"Response text: {response.text}")
             raise ValueError(f"Invalid JSON response from Gemini: {e}")
-        except Exception as e:
-            logger.error(f"Error in structured output: {e}")
-            raise
+
+        return self.schema.model_validate(response_data)
 
     def _remove_additional_properties(self, schema: dict) -> dict:
         """
@@ -6,6 +6,7 @@ Prompt templates for intent classification and entity extraction.
 
 import json
 from typing import Dict, List, Optional, Any
+from src.llm.context.history_compactor import get_history_compactor, render_history
 from src.nlp.intent.config import IntentType, INTENT_CONFIGS
 from src.nlp.intent.examples import get_all_examples
 
@@ -249,6 +250,8 @@ def build_context_aware_intent_prompt(
         user_message: Current user message to classify
         conversation_history: Previous messages in the conversation
             Format: [{"role": "user", "content": "..."}, {"role": "assistant", "content": "..."}]
+            A ConversationHistory from HistoryCompactor.compact_session() is used as-is;
+            plain lists are compacted to HISTORY_TOKEN_BUDGET here
         dialog_state: Active dialog state with collected entities and context
 
     Returns:
@@ -269,12 +272,15 @@ def build_context_aware_intent_prompt(
 
     if conversation_history:
         context_section += "\n**Conversation History:**\n"
-        # Show last 5 messages for context
-        recent_history = conversation_history[-5:] if len(conversation_history) > 5 else conversation_history
-        for msg in recent_history:
-            role = msg.get("role", "unknown").capitalize()
-            content = msg.get("content", "")
-            context_section += f"{role}: \"{content}\"\n"
+        compactor = get_history_compactor()
+        if compactor is not None:
+            # Summary of older turns + truncated recent messages, within the token budget
+            compacted = compactor.compact(conversation_history)
+            context_section += render_history(compacted, compacted.summary)
+        else:
+            # Show last 5 messages for context
+            recent_history = conversation_history[-5:] if len(conversation_history) > 5 else conversation_history
+            context_section += render_history(recent_history)
 
     if dialog_state:
         context_section += "\n**Active Dialog State:**\n"
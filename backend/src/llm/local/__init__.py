@@ -0,0 +1,23 @@
+"""
+Local LLM Backends Package
+
+Offline stand-ins for Gemini used for tests and load benchmarks.
+"""
+
+from src.llm.local.models import (
+    CassetteGenerativeModel,
+    FakeGenerativeModel,
+    LLM_BACKENDS,
+    create_local_model,
+    get_llm_cassette,
+    reset_llm_cassette,
+)
+
+__all__ = [
+    "CassetteGenerativeModel",
+    "FakeGenerativeModel",
+    "LLM_BACKENDS",
+    "create_local_model",
+    "get_llm_cassette",
+    "reset_llm_cassette",
+]
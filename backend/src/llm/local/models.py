@@ -0,0 +1,456 @@
+"""
+Local GenerativeModel Backends
+
+Drop-in stand-ins for genai.GenerativeModel used by LLMClient when
+LLM_BACKEND is not "gemini". Because they replace the model object rather
+than LLMClient, the full client path (response cache, single-flight,
+scheduler, metrics, structured-output parsing) still runs in benchmarks.
+
+- FakeGenerativeModel: deterministic, rule-based responses. Structured
+  intent classification uses the pattern matcher, entity extraction
+  EntityExtractor's pattern extractors; other schemas get a minimal valid object; free
+  text gets a short canned reply.
+- CassetteGenerativeModel: records real Gemini responses (record) or plays
+  them back (replay), falling back to the fake on a replay miss.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+from src.utils.cassette import Cassette, LatencyModel
+
+logger = logging.getLogger(__name__)
+
+# Quoted user message in the classification / extraction prompts, most specific first
+_USER_MESSAGE_PATTERNS = [
+    re.compile(rf'{label}[:*\s]*"(.*?)"', re.DOTALL)
+    for label in ("Current User Message", "User Message", "User Query", "User's Response")
+]
+
+# Requested entity types in the single- and multi-slot extraction prompts
+_EXTRACTION_ENTITY_PATTERNS = [
+    re.compile(r"Extract the \*\*(\w+)\*\*"),
+    re.compile(r"Extract each of these entities from the user's response: ([\w, ]+)"),
+]
+
+LLM_BACKENDS = ("gemini", "record", "replay", "fake")
+
+
+class LocalUsageMetadata:
+    """usage_metadata stand-in with estimated token counts"""
+
+    def __init__(self, prompt_token_count: int, candidates_token_count: int):
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+
+
+class LocalResponse:
+    """Minimal GenerateContentResponse stand-in"""
+
+    def __init__(self, text: str, contents: Any = None):
+        """
+        Args:
+            text: Response text
+            contents: Prompt contents; when given, usage_metadata carries
+                estimated token counts so token accounting works offline
+        """
+        self.text = text
+        self.usage_metadata = None
+        if contents is not None:
+            from src.llm.context.tokens import count_tokens
+
+            self.usage_metadata = LocalUsageMetadata(count_tokens(_contents_text(contents)), count_tokens(text))
+
+
+class LocalStreamResponse:
+    """Streaming GenerateContentResponse stand-in (async iterable of chunks)"""
+
+    def __init__(self, text: str, delay_seconds: float = 0.0, chunk_words: int = 4):
+        self.text = text
+        self.usage_metadata = None
+        self._delay_seconds = delay_seconds
+        self._chunk_words = chunk_words
+
+    def _chunks(self) -> List[str]:
+        words = re.findall(r"\S+\s*", self.text)
+        return [
+            "".join(words[i:i + self._chunk_words])
+            for i in range(0, len(words), self._chunk_words)
+        ] or [self.text]
+
+    async def __aiter__(self) -> AsyncIterator[LocalResponse]:
+        chunks = self._chunks()
+        # Spend ~1/3 of the delay before the first token, the rest spread over the stream
+        await asyncio.sleep(self._delay_seconds / 3)
+        per_chunk = (self._delay_seconds * 2 / 3) / len(chunks)
+        for chunk in chunks:
+            yield LocalResponse(chunk)
+            await asyncio.sleep(per_chunk)
+
+
+def _contents_text(contents: Any) -> str:
+    """Flatten prompt contents to one string"""
+    if isinstance(contents, str):
+        return contents
+    if isinstance(contents, (list, tuple)):
+        return "\n".join(_contents_text(c) for c in contents)
+    return str(contents)
+
+
+def _extract_user_message(prompt: str) -> str:
+    """Find the user message inside a prompt (falls back to the last prompt line)"""
+    for pattern in _USER_MESSAGE_PATTERNS:
+        match = pattern.search(prompt)
+        if match:
+            return match.group(1)
+    lines = prompt.strip().splitlines()
+    return lines[-1] if lines else ""
+
+
+def _placeholder_for_schema(schema: dict) -> Any:
+    """Build a minimal value that satisfies a sanitized JSON schema"""
+    schema_type = str(schema.get("type", "")).lower()
+    if schema_type == "object" or "properties" in schema:
+        required = schema.get("required", [])
+        return {
+            name: _placeholder_for_schema(prop)
+            for name, prop in schema.get("properties", {}).items()
+            if name in required
+        }
+    if schema_type == "array":
+        return []
+    if schema_type == "string":
+        return ""
+    if schema_type in ("number", "integer"):
+        return 0
+    if schema_type == "boolean":
+        return False
+    return None
+
+
+class FakeGenerativeModel:
+    """
+    Deterministic rule-based stand-in for genai.GenerativeModel
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        system_instruction: Optional[str] = None,
+        latency: Optional[LatencyModel] = None
+    ):
+        """
+        Initialize fake model
+
+        Args:
+            model_name: Model name (reported only)
+            system_instruction: System instruction (ignored)
+            latency: Synthetic latency per call
+        """
+        self.model_name = model_name
+        self.system_instruction = system_instruction
+        self.latency = latency or LatencyModel("none")
+        self._entity_extractor = None
+
+    def respond(self, contents: Any, generation_config: Any = None) -> str:
+        """
+        Produce the deterministic response text for a request
+
+        Args:
+            contents: Prompt contents
+            generation_config: Generation config (response_schema selects structured output)
+
+        Returns:
+            Response text (JSON for structured requests)
+        """
+        prompt = _contents_text(contents)
+        schema = getattr(generation_config, "response_schema", None)
+
+        if isinstance(schema, dict):
+            properties = schema.get("properties", {})
+            if "intents" in properties:
+                return json.dumps(self._classify(_extract_user_message(prompt)))
+            if "slots" in properties or "entity_value" in properties:
+                return json.dumps(self._extract(prompt, multi="slots" in properties))
+            return json.dumps(_placeholder_for_schema(schema))
+
+        user_message = _extract_user_message(prompt)
+        return (
+            "Thanks for reaching out! I can help you with home services like AC repair, "
+            f"plumbing, cleaning and electrical work. You asked: \"{user_message[:120]}\". "
+            "How would you like to proceed?"
+        )
+
+    def _classify(self, message: str) -> dict:
+        """Rule-based intent classification using the pattern matcher"""
+        from src.nlp.intent.patterns import IntentPatterns
+
+        matches = IntentPatterns.match_intent(message)
+        entities = IntentPatterns.extract_entities_from_patterns(message)
+
+        if not matches:
+            return {
+                "intents": [{"intent": "unclear_intent", "confidence": 0.5, "entities_json": None}],
+                "primary_intent": "unclear_intent",
+                "requires_clarification": True,
+                "clarification_reason": "No pattern matched"
+            }
+
+        intents = [
+            {
+                "intent": intent.value,
+                "confidence": round(min(confidence, 0.95), 2),
+                "entities_json": json.dumps(entities) if entities else None
+            }
+            for intent, confidence in matches[:3]
+        ]
+        return {
+            "intents": intents,
+            "primary_intent": intents[0]["intent"],
+            "requires_clarification": False
+        }
+
+    def _extract(self, prompt: str, multi: bool) -> dict:
+        """Rule-based entity extraction using EntityExtractor's pattern extractors"""
+        from src.nlp.intent.config import EntityType
+        from src.nlp.intent.patterns import IntentPatterns
+
+        if self._entity_extractor is None:
+            from src.services.entity_extractor import EntityExtractor
+            self._entity_extractor = EntityExtractor()
+
+        message = _extract_user_message(prompt)
+        entity_types = []
+        for pattern in _EXTRACTION_ENTITY_PATTERNS:
+            match = pattern.search(prompt)
+            if match:
+                entity_types = [name.strip() for name in match.group(1).split(",") if name.strip()]
+                break
+
+        pattern_entities = None
+        slots = []
+        for entity_type in entity_types:
+            value, confidence = None, 0.0
+            try:
+                result = self._entity_extractor.extract_with_patterns(message, EntityType(entity_type), {})
+            except ValueError:
+                result = None
+            if result is not None:
+                value, confidence = result.normalized_value or result.entity_value, result.confidence
+            else:
+                if pattern_entities is None:
+                    pattern_entities = IntentPatterns.extract_entities_from_patterns(message)
+                if entity_type in pattern_entities:
+                    value, confidence = pattern_entities[entity_type], 0.9
+
+            slots.append({
+                "entity_type": entity_type,
+                "entity_value": str(value) if value is not None else "NOT_FOUND",
+                "confidence": confidence,
+                "normalized_value": str(value) if value is not None else None
+            })
+
+        if multi:
+            return {"slots": slots}
+        if slots:
+            slots[0].pop("entity_type")
+            return slots[0]
+        return {"entity_value": "NOT_FOUND", "confidence": 0.0, "normalized_value": None}
+
+    def generate_content(self, contents: Any, generation_config: Any = None, stream: bool = False, **kwargs):
+        """Sync variant of generate_content_async (stream is not supported)"""
+        time.sleep(self.latency.sample())
+        return LocalResponse(self.respond(contents, generation_config), contents)
+
+    async def generate_content_async(self, contents: Any, generation_config: Any = None, stream: bool = False, **kwargs):
+        """Async generate_content with synthetic latency"""
+        text = self.respond(contents, generation_config)
+        delay = self.latency.sample()
+        if stream:
+            return LocalStreamResponse(text, delay_seconds=delay)
+        await asyncio.sleep(delay)
+        return LocalResponse(text, contents)
+
+
+class _RecordingStream:
+    """Wraps a real streaming response and records the full text once it completes"""
+
+    def __init__(self, inner: Any, on_complete):
+        self._inner = inner
+        self._on_complete = on_complete
+
+    @property
+    def usage_metadata(self):
+        return getattr(self._inner, "usage_metadata", None)
+
+    async def __aiter__(self):
+        chunks = []
+        async for chunk in self._inner:
+            try:
+                chunks.append(chunk.text)
+            except ValueError:
+                pass
+            yield chunk
+        self._on_complete("".join(chunks))
+
+
+class CassetteGenerativeModel:
+    """
+    Record/replay wrapper around a GenerativeModel
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        system_instruction: Optional[str],
+        cassette: Cassette,
+        mode: str,
+        inner: Any = None,
+        latency: Optional[LatencyModel] = None
+    ):
+        """
+        Initialize cassette model
+
+        Args:
+            model_name: Model name (part of the request key)
+            system_instruction: System instruction (part of the request key)
+            cassette: Cassette to record into / replay from
+            mode: "record" or "replay"
+            inner: Real model (required for record mode)
+            latency: Latency model applied on replay
+        """
+        if mode == "record" and inner is None:
+            raise ValueError("Record mode needs a real model to record from")
+
+        self.model_name = model_name
+        self.system_instruction = system_instruction
+        self.cassette = cassette
+        self.mode = mode
+        self.inner = inner
+        self.latency = latency or LatencyModel("recorded")
+        self.fallback = FakeGenerativeModel(model_name, system_instruction, latency=self.latency)
+
+    def _key(self, contents: Any, generation_config: Any) -> str:
+        from src.llm.cache.response_cache import LLMResponseCache
+        from src.llm.gemini.client import _config_fingerprint
+
+        return LLMResponseCache.build_key(
+            model=self.model_name,
+            contents=contents,
+            generation_config=_config_fingerprint(generation_config),
+            system_instruction=self.system_instruction
+        )
+
+    def _record(self, key: str, text: str, started_at: float) -> None:
+        self.cassette.record(key, {
+            "text": text,
+            "latency_ms": round((time.time() - started_at) * 1000, 1),
+            "model": self.model_name
+        })
+
+    def _replay(self, key: str, contents: Any, generation_config: Any) -> tuple:
+        """Get (text, delay_seconds) for a replayed request"""
+        entry = self.cassette.get(key)
+        if entry is None:
+            logger.warning(f"Cassette miss for {self.model_name} request {key[:12]}, using fake response")
+            return self.fallback.respond(contents, generation_config), self.latency.sample()
+        return entry["text"], self.latency.sample(entry.get("latency_ms"))
+
+    def generate_content(self, contents: Any, generation_config: Any = None, stream: bool = False, **kwargs):
+        """Sync generate_content (stream is not supported)"""
+        key = self._key(contents, generation_config)
+        if self.mode == "record":
+            started_at = time.time()
+            response = self.inner.generate_content(contents=contents, generation_config=generation_config, **kwargs)
+            self._record(key, response.text, started_at)
+            return response
+
+        text, delay = self._replay(key, contents, generation_config)
+        time.sleep(delay)
+        return LocalResponse(text, contents)
+
+    async def generate_content_async(self, contents: Any, generation_config: Any = None, stream: bool = False, **kwargs):
+        """Async generate_content, recorded or replayed"""
+        key = self._key(contents, generation_config)
+        if self.mode == "record":
+            started_at = time.time()
+            if stream:
+                response = await self.inner.generate_content_async(
+                    contents=contents, generation_config=generation_config, stream=True, **kwargs
+                )
+                return _RecordingStream(response, lambda text: self._record(key, text, started_at))
+            response = await self.inner.generate_content_async(
+                contents=contents, generation_config=generation_config, **kwargs
+            )
+            self._record(key, response.text, started_at)
+            return response
+
+        text, delay = self._replay(key, contents, generation_config)
+        if stream:
+            return LocalStreamResponse(text, delay_seconds=delay)
+        await asyncio.sleep(delay)
+        return LocalResponse(text, contents)
+
+
+_llm_cassette: Optional[Cassette] = None
+
+
+def get_llm_cassette() -> Cassette:
+    """Get the process-wide LLM cassette (LOCAL_BACKEND_CASSETTE_DIR/llm.jsonl)"""
+    global _llm_cassette
+    if _llm_cassette is None:
+        from src.core.config import settings
+
+        _llm_cassette = Cassette(os.path.join(settings.LOCAL_BACKEND_CASSETTE_DIR, "llm.jsonl"))
+    return _llm_cassette
+
+
+def create_local_model(
+    model_name: str,
+    system_instruction: Optional[str],
+    backend: str,
+    real_model_factory: Optional[Callable[[], Any]] = None
+) -> Any:
+    """
+    Build the GenerativeModel stand-in for a local LLM backend
+
+    Args:
+        model_name: Model name
+        system_instruction: Optional system instruction
+        backend: "record", "replay" or "fake"
+        real_model_factory: Builds the real model (record mode only)
+
+    Returns:
+        FakeGenerativeModel or CassetteGenerativeModel
+    """
+    from src.core.config import settings
+
+    if backend not in LLM_BACKENDS[1:]:
+        raise ValueError(f"Unknown local LLM backend '{backend}', expected one of {LLM_BACKENDS}")
+
+    latency = LatencyModel.from_spec(settings.LLM_LOCAL_LATENCY, seed=settings.LOCAL_BACKEND_SEED)
+    if backend == "fake":
+        # A fake has nothing recorded to replay
+        if latency.kind == "recorded":
+            latency = LatencyModel("none")
+        return FakeGenerativeModel(model_name, system_instruction, latency=latency)
+
+    return CassetteGenerativeModel(
+        model_name,
+        system_instruction,
+        cassette=get_llm_cassette(),
+        mode=backend,
+        inner=real_model_factory() if backend == "record" else None,
+        latency=latency
+    )
+
+
+def reset_llm_cassette() -> None:
+    """Drop the process-wide LLM cassette (reloaded from disk on next use)"""
+    global _llm_cassette
+    _llm_cassette = None
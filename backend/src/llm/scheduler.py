@@ -0,0 +1,173 @@
+"""
+LLM Concurrency Scheduler
+
+Separate concurrency pools per call tier so that long generations (RAG
+answers, greetings) cannot starve the short classification and extraction
+calls every chat turn needs first:
+
+- classification: intent classification
+- extraction: entity extraction and other short structured calls
+- generation: free-text responses
+
+Each tier has a bounded queue. When it is full, or a call waits longer than
+the allowed queue time, the call fails fast with LLMSchedulerRejected and the
+caller falls back (pattern classification, template response, ...) instead of
+piling up coroutines until the request times out.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import AsyncIterator, Dict, Optional
+
+from src.monitoring.metrics import (
+    llm_queue_depth,
+    llm_queue_wait_seconds,
+    llm_scheduler_rejections_total,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class LLMTier(str, Enum):
+    """Priority tiers for LLM calls"""
+    CLASSIFICATION = "classification"
+    EXTRACTION = "extraction"
+    GENERATION = "generation"
+
+
+class LLMSchedulerRejected(Exception):
+    """Raised when an LLM call is shed because its tier is saturated"""
+
+    def __init__(self, tier: LLMTier, reason: str):
+        self.tier = tier
+        self.reason = reason
+        super().__init__(f"LLM {tier.value} tier saturated ({reason}), call rejected")
+
+
+class _TierPool:
+    """
+    Concurrency limit and bounded wait queue for one tier
+    """
+
+    def __init__(self, tier: LLMTier, max_concurrency: int, max_queue_depth: int):
+        self.tier = tier
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.waiting = 0
+
+
+class LLMScheduler:
+    """
+    Per-tier concurrency pools with queue-time metrics and load shedding
+    """
+
+    def __init__(
+        self,
+        concurrency: Dict[LLMTier, int],
+        max_queue_depth: int,
+        max_queue_wait_seconds: float
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            concurrency: Max concurrent in-flight calls per tier
+            max_queue_depth: Max calls waiting per tier before new calls are rejected
+            max_queue_wait_seconds: Max time a call may wait for a slot
+        """
+        self.concurrency = concurrency
+        self.max_queue_depth = max_queue_depth
+        self.max_queue_wait_seconds = max_queue_wait_seconds
+        self._pools: Dict[LLMTier, _TierPool] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_pool(self, tier: LLMTier) -> _TierPool:
+        """Get the pool for a tier (pools are bound to the running event loop)"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._pools = {}
+
+        pool = self._pools.get(tier)
+        if pool is None:
+            pool = _TierPool(tier, self.concurrency[tier], self.max_queue_depth)
+            self._pools[tier] = pool
+        return pool
+
+    @asynccontextmanager
+    async def slot(self, tier: LLMTier) -> AsyncIterator[None]:
+        """
+        Hold a concurrency slot of a tier for the duration of one LLM call
+
+        Usage:
+            async with scheduler.slot(LLMTier.CLASSIFICATION):
+                response = await model.generate_content_async(...)
+
+        Args:
+            tier: Tier of the call
+
+        Raises:
+            LLMSchedulerRejected: If the tier queue is full or the wait times out
+        """
+        pool = self._get_pool(tier)
+
+        if pool.semaphore.locked() and pool.waiting >= pool.max_queue_depth:
+            llm_scheduler_rejections_total.labels(tier=tier.value, reason="queue_full").inc()
+            logger.warning(f"LLM {tier.value} queue full ({pool.waiting} waiting), rejecting call")
+            raise LLMSchedulerRejected(tier, "queue_full")
+
+        start_time = time.time()
+        pool.waiting += 1
+        llm_queue_depth.labels(tier=tier.value).set(pool.waiting)
+        try:
+            async with asyncio.timeout(self.max_queue_wait_seconds):
+                await pool.semaphore.acquire()
+        except TimeoutError:
+            llm_scheduler_rejections_total.labels(tier=tier.value, reason="queue_timeout").inc()
+            logger.warning(
+                f"LLM {tier.value} call waited {self.max_queue_wait_seconds}s for a slot, rejecting call"
+            )
+            raise LLMSchedulerRejected(tier, "queue_timeout")
+        finally:
+            pool.waiting -= 1
+            llm_queue_depth.labels(tier=tier.value).set(pool.waiting)
+            llm_queue_wait_seconds.labels(tier=tier.value).observe(time.time() - start_time)
+
+        try:
+            yield
+        finally:
+            pool.semaphore.release()
+
+
+# Global scheduler instance (singleton)
+_llm_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> Optional[LLMScheduler]:
+    """
+    Get or create the global LLM scheduler
+
+    Returns:
+        LLMScheduler, or None if scheduling is disabled via LLM_SCHEDULER_ENABLED
+    """
+    global _llm_scheduler
+    if _llm_scheduler is None:
+        from src.core.config import settings
+
+        if not settings.LLM_SCHEDULER_ENABLED:
+            return None
+
+        _llm_scheduler = LLMScheduler(
+            concurrency={
+                LLMTier.CLASSIFICATION: settings.LLM_CLASSIFICATION_CONCURRENCY,
+                LLMTier.EXTRACTION: settings.LLM_EXTRACTION_CONCURRENCY,
+                LLMTier.GENERATION: settings.LLM_GENERATION_CONCURRENCY,
+            },
+            max_queue_depth=settings.LLM_SCHEDULER_MAX_QUEUE_DEPTH,
+            max_queue_wait_seconds=settings.LLM_SCHEDULER_MAX_QUEUE_WAIT_SECONDS
+        )
+    return _llm_scheduler
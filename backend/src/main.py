@@ -96,25 +96,59 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     except Exception as e:
         logger.error(f"[ERROR] Database connection failed: {e}")
 
-    # Test Redis connection
-    try:
-        await redis_client.ping()
+    # Connect Redis (shared LLM throttle, caches); falls back to in-process state if unavailable
+    await redis_client.connect()
+    if await redis_client.ping():
         logger.info("[OK] Redis connection successful")
+    else:
+        logger.warning("[WARNING] Redis connection failed, running without Redis")
+
+    # Load the in-memory catalog snapshot and search index (otherwise built on first use)
+    try:
+        from src.services.catalog_snapshot import get_catalog_snapshot
+        snapshot = await get_catalog_snapshot()
+        logger.info(f"[OK] Catalog snapshot v{snapshot.version} loaded")
+
+        from src.services.service_search_index import sync_service_search_index
+        index = await sync_service_search_index()
+        logger.info(f"[OK] Service search index built: {len(index)} rate cards")
     except Exception as e:
-        logger.warning(f"[WARNING] Redis connection failed: {e}")
+        logger.warning(f"[WARNING] Catalog snapshot / search index not loaded at startup: {e}")
+
+    # Load pincodes and provider coverage (otherwise loaded on first lookup)
+    try:
+        from src.services.pincode_coverage import get_pincode_coverage
+        coverage = await get_pincode_coverage()
+        logger.info(f"[OK] Pincode coverage loaded: {len(coverage)} pincodes")
+    except Exception as e:
+        logger.warning(f"[WARNING] Pincode coverage not loaded at startup: {e}")
+
+    # Start the write-behind flusher for conversation and audit-log rows
+    from src.core.database.write_behind import get_write_behind_queue
+    write_behind_queue = get_write_behind_queue()
+    if write_behind_queue is not None:
+        write_behind_queue.start()
+        logger.info("[OK] Write-behind queue started")
 
     logger.info("All services initialized successfully")
     yield
     logger.info("Shutting down ConvergeAI backend...")
 
+    # Drain queued rows while the database is still reachable
+    if write_behind_queue is not None:
+        try:
+            await write_behind_queue.stop()
+            logger.info("[OK] Write-behind queue drained")
+        except Exception as e:
+            logger.error(f"[ERROR] Write-behind queue not drained: {e}")
+
     # Close database connections
     await engine.dispose()
     logger.info("[OK] Database connections closed")
 
-    # Close Redis connections (if method exists)
+    # Close Redis connections
     try:
-        if hasattr(redis_client, 'close'):
-            await redis_client.close()
+        await redis_client.disconnect()
         logger.info("[OK] Redis connections closed")
     except Exception as e:
         logger.warning(f"Redis close warning: {e}")
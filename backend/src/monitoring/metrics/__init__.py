@@ -11,13 +11,28 @@ from .prometheus_metrics import (
     agent_errors_total,
     agent_concurrent_executions,
     llm_requests_total,
+    llm_cache_hits_total,
+    llm_cache_misses_total,
+    llm_coalesced_requests_total,
     llm_tokens_used_total,
     llm_request_duration_seconds,
     llm_errors_total,
+    llm_retries_total,
+    llm_throttle_wait_seconds,
+    llm_queue_wait_seconds,
+    llm_queue_depth,
+    llm_scheduler_rejections_total,
+    llm_history_prompt_tokens,
+    llm_history_tokens_saved,
+    intent_classification_tier_total,
+    intent_classification_tier_duration_seconds,
     db_queries_total,
     db_query_duration_seconds,
     db_connections_active,
     db_connection_pool_size,
+    write_behind_queue_depth,
+    write_behind_flush_duration_seconds,
+    write_behind_rows_total,
     rag_retrievals_total,
     rag_retrieval_duration_seconds,
     rag_chunks_retrieved,
@@ -39,13 +54,28 @@ __all__ = [
     "agent_errors_total",
     "agent_concurrent_executions",
     "llm_requests_total",
+    "llm_cache_hits_total",
+    "llm_cache_misses_total",
+    "llm_coalesced_requests_total",
     "llm_tokens_used_total",
     "llm_request_duration_seconds",
     "llm_errors_total",
+    "llm_retries_total",
+    "llm_throttle_wait_seconds",
+    "llm_queue_wait_seconds",
+    "llm_queue_depth",
+    "llm_scheduler_rejections_total",
+    "llm_history_prompt_tokens",
+    "llm_history_tokens_saved",
+    "intent_classification_tier_total",
+    "intent_classification_tier_duration_seconds",
     "db_queries_total",
     "db_query_duration_seconds",
     "db_connections_active",
     "db_connection_pool_size",
+    "write_behind_queue_depth",
+    "write_behind_flush_duration_seconds",
+    "write_behind_rows_total",
     "rag_retrievals_total",
     "rag_retrieval_duration_seconds",
     "rag_chunks_retrieved",
@@ -95,6 +95,30 @@ llm_requests_total = Counter(
     registry=metrics_registry
 )
 
+# LLM response cache hits
+llm_cache_hits_total = Counter(
+    'llm_cache_hits_total',
+    'Total LLM response cache hits',
+    ['model', 'operation', 'tier'],
+    registry=metrics_registry
+)
+
+# LLM response cache misses
+llm_cache_misses_total = Counter(
+    'llm_cache_misses_total',
+    'Total LLM response cache misses',
+    ['model', 'operation'],
+    registry=metrics_registry
+)
+
+# LLM calls served by joining an identical in-flight call
+llm_coalesced_requests_total = Counter(
+    'llm_coalesced_requests_total',
+    'Total LLM calls coalesced onto an identical in-flight call',
+    ['model', 'operation'],
+    registry=metrics_registry
+)
+
 # LLM tokens used
 llm_tokens_used_total = Counter(
     'llm_tokens_used_total',
@@ -120,6 +144,80 @@ llm_errors_total = Counter(
     registry=metrics_registry
 )
 
+# LLM retries
+llm_retries_total = Counter(
+    'llm_retries_total',
+    'Total LLM call retries and retry give-ups',
+    ['reason'],
+    registry=metrics_registry
+)
+
+# LLM throttle wait
+llm_throttle_wait_seconds = Histogram(
+    'llm_throttle_wait_seconds',
+    'Time spent waiting for a cross-worker LLM call slot',
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0),
+    registry=metrics_registry
+)
+
+# LLM scheduler queue wait per tier
+llm_queue_wait_seconds = Histogram(
+    'llm_queue_wait_seconds',
+    'Time LLM calls spend queued for a tier concurrency slot',
+    ['tier'],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0),
+    registry=metrics_registry
+)
+
+# LLM scheduler queue depth per tier
+llm_queue_depth = Gauge(
+    'llm_queue_depth',
+    'Number of LLM calls waiting for a tier concurrency slot',
+    ['tier'],
+    registry=metrics_registry
+)
+
+# LLM calls shed by the scheduler
+llm_scheduler_rejections_total = Counter(
+    'llm_scheduler_rejections_total',
+    'Total LLM calls rejected because their tier was saturated',
+    ['tier', 'reason'],
+    registry=metrics_registry
+)
+
+# Conversation-history tokens in context-aware prompts after compaction
+llm_history_prompt_tokens = Histogram(
+    'llm_history_prompt_tokens',
+    'Tokens of conversation history included in a prompt after compaction',
+    buckets=(25, 50, 100, 200, 400, 800, 1600, 3200),
+    registry=metrics_registry
+)
+
+# Conversation-history tokens saved per turn by compaction
+llm_history_tokens_saved = Histogram(
+    'llm_history_tokens_saved',
+    'Prompt tokens saved per turn by conversation-history compaction',
+    buckets=(0, 25, 50, 100, 200, 400, 800, 1600, 3200),
+    registry=metrics_registry
+)
+
+# Intent classifications resolved per tier
+intent_classification_tier_total = Counter(
+    'intent_classification_tier_total',
+    'Total intent classifications by the tier that resolved them',
+    ['tier'],
+    registry=metrics_registry
+)
+
+# Time spent in each intent classification tier
+intent_classification_tier_duration_seconds = Histogram(
+    'intent_classification_tier_duration_seconds',
+    'Time spent in each intent classification tier (including tiers that deferred)',
+    ['tier'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0),
+    registry=metrics_registry
+)
+
 # ============================================
 # DATABASE METRICS
 # ============================================
@@ -155,6 +253,31 @@ db_connection_pool_size = Gauge(
     registry=metrics_registry
 )
 
+# Rows waiting in the write-behind queue
+write_behind_queue_depth = Gauge(
+    'write_behind_queue_depth',
+    'Rows queued for a batched write-behind insert',
+    ['table'],
+    registry=metrics_registry
+)
+
+# Write-behind batch flush latency
+write_behind_flush_duration_seconds = Histogram(
+    'write_behind_flush_duration_seconds',
+    'Time to insert and commit one write-behind batch',
+    ['table'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    registry=metrics_registry
+)
+
+# Rows written (or dropped) by the write-behind queue
+write_behind_rows_total = Counter(
+    'write_behind_rows_total',
+    'Total rows flushed by the write-behind queue',
+    ['table', 'status'],
+    registry=metrics_registry
+)
+
 # ============================================
 # RAG/PINECONE METRICS
 # ============================================
@@ -3,6 +3,8 @@ Intent Classification Module
 
 Multi-intent classification system with hybrid approach:
 - Pattern matching for quick classification
+- Embedding kNN over intent examples for confident single intents
+- Result caching for repeated follow-ups
 - LLM-based classification for ambiguous cases
 - Entity extraction
 """
@@ -10,6 +12,8 @@ Multi-intent classification system with hybrid approach:
 from .classifier import IntentClassifier
 from .config import IntentType, EntityType, INTENT_CONFIGS
 from .patterns import IntentPatterns
+from .embedding_tier import EmbeddingIntentIndex, get_embedding_intent_index
+from .result_cache import CachedIntentClassifier, IntentResultCache, get_intent_result_cache
 from .examples import get_examples_for_intent, get_all_examples
 
 __all__ = [
@@ -18,6 +22,11 @@ __all__ = [
     "EntityType",
     "INTENT_CONFIGS",
     "IntentPatterns",
+    "EmbeddingIntentIndex",
+    "get_embedding_intent_index",
+    "CachedIntentClassifier",
+    "IntentResultCache",
+    "get_intent_result_cache",
     "get_examples_for_intent",
     "get_all_examples",
 ]
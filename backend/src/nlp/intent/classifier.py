@@ -3,13 +3,15 @@ Multi-Intent Classifier
 
 Hybrid approach for intent classification:
 1. Quick pattern matching (regex/keywords) for high-confidence cases
-2. LLM-based classification for ambiguous cases
-3. Fallback handling for unclear intents
+2. Embedding kNN voting over intent examples for confident single intents
+3. LLM-based classification for ambiguous cases
+4. Fallback handling for unclear intents
 """
 
 import json
 import logging
 import re
+import time
 from typing import List, Dict, Tuple, Optional, TYPE_CHECKING
 from datetime import datetime, timezone
 
@@ -19,7 +21,14 @@ from .config import (
     INTENT_CONFIGS
 )
 from .patterns import IntentPatterns
+from .embedding_tier import EmbeddingIntentIndex, get_embedding_intent_index
+from src.core.config.settings import settings
 from src.llm.gemini.client import LLMClient
+from src.llm.scheduler import LLMTier
+from src.monitoring.metrics import (
+    intent_classification_tier_total,
+    intent_classification_tier_duration_seconds,
+)
 
 if TYPE_CHECKING:
     from src.schemas.intent import IntentResult, IntentClassificationResult
@@ -27,6 +36,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Words that only make sense against the previous turn ("yes", "cancel it",
+# "the second one"); messages with any of them skip the embedding tier
+_FOLLOW_UP_REPLIES = frozenset({
+    "yes", "yeah", "yep", "yup", "no", "nope", "nah", "ok", "okay", "sure", "confirm", "correct"
+})
+_ANAPHORA = frozenset({
+    "it", "its", "that", "this", "these", "those", "them", "same",
+    "first", "second", "third", "last", "previous", "above", "earlier"
+})
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
 
 class IntentClassifier:
     """
@@ -36,16 +56,25 @@ class IntentClassifier:
     not just the primary intent.
     """
     
-    def __init__(self, llm_client: Optional[LLMClient] = None):
+    def __init__(
+        self,
+        llm_client: Optional[LLMClient] = None,
+        embedding_index: Optional[EmbeddingIntentIndex] = None
+    ):
         """
         Initialize intent classifier
         
         Args:
             llm_client: LLM client for classification (if None, will create one)
+            embedding_index: kNN index for the embedding tier (if None, uses the shared
+                index when INTENT_EMBEDDING_TIER_ENABLED)
         """
         self.llm_client = llm_client or LLMClient.create_for_intent_classification()
         self.pattern_matcher = IntentPatterns()
         self.thresholds = ClassificationThresholds()
+        if embedding_index is None and settings.INTENT_EMBEDDING_TIER_ENABLED:
+            embedding_index = get_embedding_intent_index()
+        self.embedding_index = embedding_index
     
     async def classify(
         self,
@@ -64,7 +93,7 @@ class IntentClassifier:
 
         Returns:
             Tuple of (IntentClassificationResult, classification_method)
-            classification_method: "pattern_match", "llm", "context_aware_llm", or "fallback"
+            classification_method: "pattern_match", "embedding_knn", "llm", "context_aware_llm", or "fallback"
         """
         from src.schemas.intent import IntentClassificationResult
 
@@ -76,7 +105,9 @@ class IntentClassifier:
             logger.info(f"Context available - History: {len(conversation_history) if conversation_history else 0} messages, Dialog State: {dialog_state.state.value if dialog_state else None}")
         
         # Step 1: Try pattern matching (fast path)
+        tier_start = time.perf_counter()
         pattern_results = self.pattern_matcher.match_intent(message)
+        self._observe_tier("pattern_match", tier_start)
 
         if pattern_results:
             # Check if we have high-confidence pattern matches
@@ -110,19 +141,39 @@ class IntentClassifier:
                     if dialog_state is not None and dialog_state.intent is not None and str(dialog_state.intent) != high_confidence_intents[0][0].value:
                         logger.info(f"Pattern match overriding dialog state intent: {dialog_state.intent} → {high_confidence_intents[0][0].value}")
 
+                    intent_classification_tier_total.labels(tier="pattern_match").inc()
                     return result, "pattern_match"
 
-        # Step 2: Use LLM for classification (ambiguous cases)
+        # Step 2: Embedding kNN over intent examples (single, self-contained intents)
+        # Slot-filling replies and follow-ups ("yes", "the second one") only make
+        # sense with the dialog state or history, so those go to the context-aware LLM.
+        # The history alone does not gate the tier: chat turns always carry it.
+        if self.embedding_index is not None and dialog_state is None and self._is_self_contained(message):
+            tier_start = time.perf_counter()
+            embedding_match = await self.embedding_index.aclassify(message)
+            self._observe_tier("embedding_knn", tier_start)
+
+            if embedding_match is not None:
+                result = self._build_result_from_patterns(message, [embedding_match])
+                intent_classification_tier_total.labels(tier="embedding_knn").inc()
+                return result, "embedding_knn"
+
+        # Step 3: Use LLM for classification (ambiguous cases)
         # Use context-aware classification if context is available
         classification_method = "context_aware_llm" if has_context else "llm"
         logger.info(f"Using LLM for classification (method: {classification_method})")
 
         try:
-            llm_result = await self._classify_with_llm(
-                message,
-                conversation_history=conversation_history,
-                dialog_state=dialog_state
-            )
+            tier_start = time.perf_counter()
+            try:
+                llm_result = await self._classify_with_llm(
+                    message,
+                    conversation_history=conversation_history,
+                    dialog_state=dialog_state
+                )
+            finally:
+                self._observe_tier("llm", tier_start)
+            intent_classification_tier_total.labels(tier="llm").inc()
 
             # Check if LLM classification has sufficient confidence
             if llm_result.intents and llm_result.intents[0].confidence >= self.thresholds.LLM_CLASSIFICATION_THRESHOLD:
@@ -141,10 +192,35 @@ class IntentClassifier:
             logger.error(f"LLM classification failed: {e}")
             # Fall through to fallback
         
-        # Step 3: Fallback - mark as unclear
+        # Step 4: Fallback - mark as unclear
         logger.warning("Falling back to unclear_intent")
+        intent_classification_tier_total.labels(tier="fallback").inc()
         fallback_result = self._build_fallback_result(message)
         return fallback_result, "fallback"
+
+    @staticmethod
+    def _is_self_contained(message: str) -> bool:
+        """
+        Whether a message can be classified without the previous turns
+
+        Args:
+            message: User message
+
+        Returns:
+            False for short replies, yes/no answers and messages referring back
+            to earlier turns ("reschedule it", "the second one")
+        """
+        tokens = _TOKEN_PATTERN.findall(message.lower())
+        if len(tokens) < settings.INTENT_EMBEDDING_MIN_TOKENS:
+            return False
+        if tokens[0] in _FOLLOW_UP_REPLIES:
+            return False
+        return not any(token in _ANAPHORA for token in tokens)
+
+    @staticmethod
+    def _observe_tier(tier: str, start: float) -> None:
+        """Record time spent in a classification tier"""
+        intent_classification_tier_duration_seconds.labels(tier=tier).observe(time.perf_counter() - start)
     
     def _build_result_from_patterns(
         self,
@@ -232,13 +308,13 @@ class IntentClassifier:
         structured_llm = self.llm_client.with_structured_output(IntentClassificationResult)  # type: ignore
 
         # Invoke LLM with retry logic
-        from src.nlp.llm.gemini_client import with_retry
+        from src.nlp.llm.retry import async_retry
 
-        @with_retry(max_retries=3, initial_delay=1.0, backoff_factor=2.0)
-        def invoke_with_retry():
-            return structured_llm.invoke(prompt)
+        @async_retry(max_retries=3, initial_delay=1.0, backoff_factor=2.0)
+        async def invoke_with_retry():
+            return await structured_llm.ainvoke(prompt, tier=LLMTier.CLASSIFICATION)
 
-        result = invoke_with_retry()
+        result = await invoke_with_retry()
 
         # Normalize entities extracted by LLM (pass original message for fallback extraction)
         result = self._normalize_llm_entities(result, original_message=message)
@@ -0,0 +1,204 @@
+"""
+Embedding kNN Intent Tier
+
+Middle tier between pattern matching and the LLM:
+
+1. The few-shot examples in examples.py are embedded once with the MiniLM
+   model into a normalized matrix (one row per example, labelled with its
+   intent). Multi-intent examples are indexed too, under a "multi" label, so
+   compound messages vote for handing off to the LLM.
+2. A message is embedded and the TOP_K most similar examples vote, each
+   weighted by its cosine similarity.
+3. The winning intent is accepted only if the nearest example is similar
+   enough and the winner's vote share beats the runner-up by MIN_MARGIN;
+   otherwise (or if the "multi" label wins) the message goes to the LLM.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from src.core.config.settings import settings
+from .config import IntentType
+from .examples import get_all_examples, get_multi_intent_examples
+
+logger = logging.getLogger(__name__)
+
+# Label for multi-intent examples (a win defers to the LLM)
+MULTI_INTENT_LABEL = "multi"
+
+
+class EmbeddingIntentIndex:
+    """
+    Nearest-neighbour intent voting over embedded intent examples
+    """
+
+    def __init__(
+        self,
+        embedding_service=None,
+        top_k: Optional[int] = None,
+        min_similarity: Optional[float] = None,
+        min_margin: Optional[float] = None
+    ):
+        """
+        Initialize the index (examples are embedded lazily on first use)
+
+        Args:
+            embedding_service: EmbeddingService-like object with embed_text/embed_texts
+                (default: shared service for INTENT_EMBEDDING_MODEL)
+            top_k: Nearest examples that vote (default: from settings)
+            min_similarity: Min cosine similarity of the nearest example (default: from settings)
+            min_margin: Min vote-share margin between the top two labels (default: from settings)
+        """
+        self._embedding_service = embedding_service
+        self.top_k = top_k or settings.INTENT_EMBEDDING_TOP_K
+        self.min_similarity = min_similarity if min_similarity is not None else settings.INTENT_EMBEDDING_MIN_SIMILARITY
+        self.min_margin = min_margin if min_margin is not None else settings.INTENT_EMBEDDING_MIN_MARGIN
+
+        self._labels: List[str] = []
+        self._matrix = None
+        self._build_lock = asyncio.Lock()
+        self._disabled = False
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the example matrix has been embedded"""
+        return self._matrix is not None
+
+    def _get_embedding_service(self):
+        if self._embedding_service is None:
+            from src.rag.embeddings import get_embedding_service_for_model
+            self._embedding_service = get_embedding_service_for_model(settings.INTENT_EMBEDDING_MODEL)
+        return self._embedding_service
+
+    def build(self) -> None:
+        """Embed all intent examples into the normalized example matrix"""
+        import numpy as np
+
+        texts: List[str] = []
+        labels: List[str] = []
+        for intent, examples in get_all_examples().items():
+            if intent == IntentType.UNCLEAR_INTENT:
+                continue
+            texts.extend(examples)
+            labels.extend([intent.value] * len(examples))
+        for example in get_multi_intent_examples():
+            texts.append(example["query"])
+            labels.append(MULTI_INTENT_LABEL)
+
+        matrix = np.asarray(self._get_embedding_service().embed_texts(texts), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self._matrix = matrix / np.maximum(norms, 1e-12)
+        self._labels = labels
+        logger.info(f"Intent embedding index built: {len(labels)} examples")
+
+    def vote(self, message: str) -> Tuple[Optional[str], float, float, float]:
+        """
+        Run kNN voting for a message
+
+        Args:
+            message: User message
+
+        Returns:
+            Tuple of (winning label, vote share, margin over runner-up, nearest similarity)
+        """
+        import numpy as np
+
+        if self._matrix is None:
+            self.build()
+
+        query = np.asarray(self._get_embedding_service().embed_text(message), dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        similarities = self._matrix @ query
+
+        k = min(self.top_k, len(self._labels))
+        nearest = np.argpartition(-similarities, k - 1)[:k]
+
+        votes: Dict[str, float] = defaultdict(float)
+        for idx in nearest:
+            votes[self._labels[idx]] += max(float(similarities[idx]), 0.0)
+
+        total = sum(votes.values())
+        if total <= 0:
+            return None, 0.0, 0.0, 0.0
+
+        ranked = sorted(votes.items(), key=lambda item: item[1], reverse=True)
+        share = ranked[0][1] / total
+        runner_up = ranked[1][1] / total if len(ranked) > 1 else 0.0
+        return ranked[0][0], share, share - runner_up, float(similarities[nearest].max())
+
+    def classify(self, message: str) -> Optional[Tuple[IntentType, float]]:
+        """
+        Classify a message if the neighbours agree confidently
+
+        Args:
+            message: User message
+
+        Returns:
+            (intent, confidence) when accepted, None to defer to the LLM
+        """
+        label, share, margin, nearest_similarity = self.vote(message)
+
+        if label is None or label == MULTI_INTENT_LABEL:
+            return None
+        if nearest_similarity < self.min_similarity or margin < self.min_margin:
+            logger.info(
+                f"Embedding tier deferred: {label} (share={share:.2f}, margin={margin:.2f}, "
+                f"nearest={nearest_similarity:.2f})"
+            )
+            return None
+
+        logger.info(f"Embedding tier match: {label} (share={share:.2f}, margin={margin:.2f}, nearest={nearest_similarity:.2f})")
+        return IntentType(label), round(share, 2)
+
+    async def aclassify(self, message: str) -> Optional[Tuple[IntentType, float]]:
+        """
+        Classify off the event loop (builds the index on first call)
+
+        If loading the model or building the index fails, the tier is
+        disabled for the process so the classifier goes straight to the LLM.
+        A failure embedding one message only defers that message.
+
+        Args:
+            message: User message
+
+        Returns:
+            (intent, confidence) when accepted, None to defer to the LLM
+        """
+        if self._disabled:
+            return None
+
+        if self._matrix is None:
+            async with self._build_lock:
+                if self._disabled:
+                    return None
+                if self._matrix is None:
+                    try:
+                        await asyncio.to_thread(self.build)
+                    except Exception as e:
+                        logger.warning(f"Embedding intent tier disabled: {e}")
+                        self._disabled = True
+                        return None
+
+        try:
+            return await asyncio.to_thread(self.classify, message)
+        except Exception as e:
+            logger.warning(f"Embedding intent tier skipped message: {e}")
+            return None
+
+
+_intent_index: Optional[EmbeddingIntentIndex] = None
+
+
+def get_embedding_intent_index() -> EmbeddingIntentIndex:
+    """
+    Get the process-wide embedding intent index (singleton pattern)
+
+    Returns:
+        EmbeddingIntentIndex instance
+    """
+    global _intent_index
+    if _intent_index is None:
+        _intent_index = EmbeddingIntentIndex()
+    return _intent_index
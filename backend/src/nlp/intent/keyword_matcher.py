@@ -0,0 +1,143 @@
+"""
+Compiled Multi-Keyword Matcher
+
+Finds every occurrence of every keyword in a text in one pass, like an
+Aho-Corasick automaton, but executed by the C regex engine:
+
+- All keywords are merged into a trie and rendered as one regex whose
+  alternations follow the trie (at most one branch can continue at each
+  character), wrapped in a lookahead so matches at every start position
+  are reported, including overlapping ones.
+- At each start position the regex reports the longest keyword; every
+  other keyword starting there is a prefix of it, so those are expanded
+  from a table precomputed at build time.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Tuple
+
+_END = ""
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordHit(NamedTuple):
+    """One keyword occurrence"""
+    keyword: str
+    start: int
+    end: int
+
+
+class KeywordScan(NamedTuple):
+    """
+    All keyword occurrences in a text
+
+    Attributes:
+        found: Keywords occurring anywhere (substring semantics, like `kw in text`)
+        space_bounded: Keywords with an occurrence delimited by spaces or text edges
+            (like f" {kw} " in f" {text} ")
+        word_bounded: Keywords with an occurrence delimited by regex word boundaries
+            (like re.search(rf"\\b{kw}\\b", text))
+    """
+    found: FrozenSet[str]
+    space_bounded: FrozenSet[str]
+    word_bounded: FrozenSet[str]
+
+
+class KeywordMatcher:
+    """
+    Trie-compiled matcher reporting all (overlapping) keyword occurrences
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile the matcher
+
+        Args:
+            keywords: Keywords to match (matched case-sensitively; lowercase both sides)
+        """
+        self.keywords: FrozenSet[str] = frozenset(k for k in keywords if k)
+
+        trie: Dict[str, dict] = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+
+        # Keywords that are prefixes of each keyword (the keyword included)
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        for keyword in self.keywords:
+            node = trie
+            prefixes = []
+            for i, char in enumerate(keyword, start=1):
+                node = node[char]
+                if _END in node:
+                    prefixes.append(keyword[:i])
+            self._prefixes[keyword] = tuple(prefixes)
+
+        self._pattern = re.compile(f"(?=({self._trie_pattern(trie)}))", re.DOTALL) if self.keywords else None
+
+    @classmethod
+    def _trie_pattern(cls, node: Dict[str, dict]) -> str:
+        """Render a trie node as a regex that matches its longest keyword"""
+        branches = [re.escape(char) + cls._trie_pattern(child) for char, child in sorted(node.items()) if char != _END]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if _END in node:
+            # A keyword ends here; greedily prefer the longer continuation
+            return f"(?:{body})?"
+        return body
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """
+        Find every keyword occurrence
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Hits in order of start position (shorter keywords first at the same start)
+        """
+        if self._pattern is None:
+            return []
+        hits = []
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for keyword in self._prefixes[match.group(1)]:
+                hits.append(KeywordHit(keyword, start, start + len(keyword)))
+        return hits
+
+    def scan(self, text: str) -> KeywordScan:
+        """
+        Scan text and classify occurrences by their boundaries
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            KeywordScan with found / space-bounded / word-bounded keyword sets
+        """
+        found = set()
+        space_bounded = set()
+        word_bounded = set()
+        length = len(text)
+
+        for keyword, start, end in self.find_all(text):
+            found.add(keyword)
+            before = text[start - 1] if start > 0 else None
+            after = text[end] if end < length else None
+
+            if (before is None or before == " ") and (after is None or after == " "):
+                space_bounded.add(keyword)
+
+            # \b holds where word-ness changes between neighbouring characters
+            starts_on_boundary = (before is not None and _is_word_char(before)) != _is_word_char(keyword[0])
+            ends_on_boundary = _is_word_char(keyword[-1]) != (after is not None and _is_word_char(after))
+            if starts_on_boundary and ends_on_boundary:
+                word_bounded.add(keyword)
+
+        return KeywordScan(frozenset(found), frozenset(space_bounded), frozenset(word_bounded))
@@ -3,12 +3,19 @@ Intent Pattern Matching
 
 Quick pattern-based intent classification using keywords and regex.
 This is the first step in the hybrid classification approach.
+
+All keyword vocabularies are compiled once into a single KeywordMatcher, so
+a message is scanned in one pass for both intent scoring and entity
+extraction; regex families are precompiled into one alternation each.
 Updated: Added status keywords to booking management regex patterns
 """
 
 import re
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Pattern, Tuple
+
 from .config import IntentType, EntityType
+from .keyword_matcher import KeywordMatcher, KeywordScan
 
 
 class IntentPatterns:
@@ -177,6 +184,148 @@ class IntentPatterns:
         ],
     }
     
+    # Policy timeframe questions outrank action intents ("can I cancel if ...")
+    POLICY_TIMEFRAME_PATTERNS: List[str] = [
+        r"\b(how\s+many|how\s+much|what)\s+(hours|days|time)\s+(before|after|in\s+advance)\s+.*(cancel|refund|reschedule)",
+        r"\b(when|what\s+time)\s+can\s+i\s+(cancel|get\s+refund|reschedule)",
+        r"\b(what|how)\s+(is|are)\s+the\s+(rules|conditions|requirements)\s+(for|to)\s+(cancel|refund|reschedule)",
+        r"\bcan\s+i\s+(cancel|get\s+refund|reschedule)\s+(if|when|before|after)",
+        r"\b(am\s+i|is\s+it)\s+(eligible|allowed)\s+(for|to)\s+(cancel|refund|reschedule)",
+    ]
+
+    # Entity vocabularies (lowercase). Dict order is priority order.
+    # NOTE: More specific service patterns come first (e.g., "tv repair" before "appliance")
+    # IMPORTANT: "salon for men" is checked before "salon for women" to avoid mismatches
+    SERVICE_KEYWORDS: Dict[str, List[str]] = {
+        # Specific appliance repairs (check these first)
+        "tv_repair": ["tv repair", "television repair", "tv service", "television service"],
+        "ac_repair": ["ac repair", "air conditioning repair", "hvac repair", "air conditioner repair"],
+        "microwave_repair": ["microwave repair", "microwave service"],
+        "geyser_repair": ["geyser repair", "water heater repair", "geyser service"],
+
+        # Salon services (check specific ones first)
+        "salon_for_men": ["salon for men", "men salon", "barber", "gents salon", "male grooming", "men's salon"],
+        "salon_for_women": ["salon for women", "women salon", "ladies salon", "beauty parlor", "beauty salon", "women's salon"],
+
+        # General services
+        "ac": ["ac", "air conditioning", "hvac", "air conditioner"],
+        "plumbing": ["plumbing", "plumber", "pipe", "leak", "tap", "faucet"],
+        "cleaning": ["cleaning", "clean", "house cleaning", "deep cleaning"],
+        "electrical": ["electrical", "electrician", "wiring", "switch", "light"],
+        "painting": ["painting", "paint", "painter"],
+        "appliance_repair": ["washing machine", "refrigerator", "fridge", "appliance"],
+        "pest_control": ["pest control", "pest", "pest service", "general pest control", "pest control service", "exterminator", "fumigation"],
+        "carpentry": ["carpentry", "carpenter", "furniture", "wood work", "cabinet", "door repair"],
+        "water_purifier": ["water purifier", "ro", "water filter", "purifier", "water treatment"],
+        "car_care": ["car care", "car wash", "car cleaning", "car service", "vehicle cleaning"],
+        "packers_and_movers": ["packers", "movers", "packing", "moving", "relocation", "shifting"]
+    }
+
+    # Service mentions that turn "I want/need ..." into a booking action
+    BOOKING_SERVICE_KEYWORDS: List[str] = [
+        "ac", "air conditioning", "hvac",
+        "plumbing", "plumber",
+        "cleaning", "clean",
+        "electrical", "electrician",
+        "painting", "paint",
+        "appliance", "washing machine", "refrigerator",
+        "pest control", "pest", "pest service", "exterminator",
+        "carpentry", "carpenter", "furniture",
+        "water purifier", "ro", "water filter",
+        "car care", "car wash", "car cleaning",
+        "salon", "beauty salon", "barber",
+        "packers", "movers", "packing", "moving", "relocation"
+    ]
+
+    # Exact single-word actions (highest priority for action switching)
+    SINGLE_WORD_ACTIONS: List[str] = ["cancel", "reschedule", "book", "list"]
+
+    # Action keywords, matched on word boundaries
+    ACTION_KEYWORDS: Dict[str, List[str]] = {
+        "cancel": ["cancel", "remove", "delete"],
+        "reschedule": ["reschedule", "change date", "move booking", "move appointment"],
+        "modify": ["modify", "update", "edit"],
+        "book": ["book", "schedule", "arrange", "set up"],
+    }
+
+    # List patterns should ONLY match when there's an explicit list/show/view action word
+    LIST_ACTION_PATTERNS: List[str] = [
+        r'\b(list|show|view|display)\s+(my|all|them)?\s*(bookings?|appointments?)?',  # "list my bookings", "show bookings"
+        r'\b(check|see|get)\s+my\s+(bookings?|appointments?)',  # "check my bookings"
+        r'(bookings?|appointments?).*\b(list|show|view|display)',  # "bookings and list them"
+        r'\bfilter\s+by\s+\w+',  # "filter by pending", "filter by status"
+    ]
+
+    STATUS_KEYWORDS: Dict[str, List[str]] = {
+        "pending": ["pending", "upcoming", "scheduled", "active"],
+        "confirmed": ["confirmed", "approved"],
+        "completed": ["completed", "finished", "done", "past"],
+        "cancelled": ["cancelled", "canceled", "deleted", "removed"]
+    }
+
+    # Relative dates, checked in order
+    RELATIVE_DATE_KEYWORDS: List[Tuple[str, List[str]]] = [
+        ("today", ["today", " now"]),
+        ("tomorrow", ["tomorrow", "tmrw", "tmr"]),
+        ("day after tomorrow", ["day after tomorrow"]),
+        ("next week", ["next week"]),
+    ]
+
+    # Natural date formats like "31st October", "October 31st", "31 Oct", "November 5th"
+    NATURAL_DATE_PATTERNS: List[str] = [
+        r'(\d{1,2})(st|nd|rd|th)?\s+(january|february|march|april|may|june|july|august|september|october|november|december)',
+        r'(\d{1,2})(st|nd|rd|th)?\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',
+        r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{1,2})(st|nd|rd|th)?',
+        r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{1,2})(st|nd|rd|th)?'
+    ]
+
+    TIME_OF_DAY_KEYWORDS: List[str] = ["morning", "afternoon", "evening", "night"]
+
+    CITIES: List[str] = [
+        "mumbai", "delhi", "bangalore", "bengaluru", "hyderabad", "chennai",
+        "kolkata", "pune", "ahmedabad", "jaipur", "surat", "lucknow",
+        "kanpur", "nagpur", "indore", "thane", "bhopal", "visakhapatnam",
+        "pimpri", "patna", "vadodara", "ghaziabad", "ludhiana", "agra"
+    ]
+
+    ISSUE_KEYWORDS: Dict[str, List[str]] = {
+        "quality": ["poor quality", "bad service", "not satisfied"],
+        "behavior": ["rude", "unprofessional", "behavior"],
+        "damage": ["damage", "broken", "damaged"],
+        "late": ["late", "delayed", "not on time"],
+        "no_show": ["no show", "didn't come", "missed"],
+    }
+
+    PAYMENT_KEYWORDS: Dict[str, List[str]] = {
+        "failed": ["failed", "declined", "not working"],
+        "double_charged": ["double charged", "charged twice"],
+        "wrong_amount": ["wrong amount", "overcharged", "incorrect"],
+    }
+
+    # Support order ID format:
+    # - ORD12345678 (ORD + 8 alphanumeric characters) - PRIMARY FORMAT
+    # - ORD123456, ORD-123456, ORD_123456 (ORD + 6+ digits)
+    # - ORDER12345, ORDER-12345, ORDER_12345
+    # - #123456
+    BOOKING_ID_PATTERNS: List[str] = [
+        r"\bORD[A-Z0-9]{8}\b",  # ORD12345678 (ORD + 8 alphanumeric) - PRIMARY FORMAT
+        r"\b(ORD)[-_]?([A-Z0-9]{6,8})\b",  # ORD123456, ORD-123456, ORD_123456
+        r"\b(ORDER)[-_]?([A-Z0-9]{4,8})\b",  # ORDER12345, ORDER-12345
+        r"#([A-Z0-9]{6,8})\b",  # #123456, #12345678
+    ]
+
+    # Booking filter (latest, recent, last): (pattern, group index of the filter word)
+    BOOKING_FILTER_PATTERNS: List[Tuple[str, int]] = [
+        (r"\b(my|the)\s+(latest|recent|last|most recent)\s+(booking|appointment)", 2),
+        (r"\b(latest|recent|last|most recent)\s+(booking|appointment|order)", 1),
+        (r"\bcancel\s+(my\s+)?(latest|recent|last)\b", 2)
+    ]
+
+    @classmethod
+    def _scan(cls, message_lower: str) -> KeywordScan:
+        """Scan a lowercased message for every keyword of every vocabulary (memoised)"""
+        return _scan_keywords(message_lower)
+
     @classmethod
     def match_intent(cls, message: str) -> List[Tuple[IntentType, float]]:
         """
@@ -189,55 +338,37 @@ class IntentPatterns:
             List of (intent, confidence) tuples sorted by confidence
         """
         message_lower = message.lower()
+        scan = cls._scan(message_lower)
         intent_scores: Dict[IntentType, float] = {}
         
-        # 1. Keyword matching
+        # 1. Keyword matching (one pass over the compiled keyword matcher)
         for intent, keywords in cls.INTENT_KEYWORDS.items():
             score = 0.0
             matched_keywords = 0
             
             for keyword in keywords:
-                if keyword in message_lower:
+                if keyword in scan.found:
                     matched_keywords += 1
                     # Exact phrase match gets higher score
-                    if f" {keyword} " in f" {message_lower} ":
-                        score += 0.3
-                    else:
-                        score += 0.2
+                    score += 0.3 if keyword in scan.space_bounded else 0.2
             
             if matched_keywords > 0:
                 # Normalize score (cap at 0.95 for pattern matching)
                 intent_scores[intent] = min(0.95, score)
         
         # 2. Regex matching (higher confidence)
-        # Special handling for POLICY_INQUIRY timeframe questions to prioritize over action intents
-        policy_timeframe_patterns = [
-            r"\b(how\s+many|how\s+much|what)\s+(hours|days|time)\s+(before|after|in\s+advance)\s+.*(cancel|refund|reschedule)",
-            r"\b(when|what\s+time)\s+can\s+i\s+(cancel|get\s+refund|reschedule)",
-            r"\b(what|how)\s+(is|are)\s+the\s+(rules|conditions|requirements)\s+(for|to)\s+(cancel|refund|reschedule)",
-            r"\bcan\s+i\s+(cancel|get\s+refund|reschedule)\s+(if|when|before|after)",
-            r"\b(am\s+i|is\s+it)\s+(eligible|allowed)\s+(for|to)\s+(cancel|refund|reschedule)",
-        ]
-
-        # Check policy timeframe patterns first with higher priority
-        for pattern in policy_timeframe_patterns:
-            match = re.search(pattern, message_lower)
-            if match:
-                # Policy timeframe questions get highest priority (0.97) to override action intents
-                intent_scores[IntentType.POLICY_INQUIRY] = 0.97
-                break
-
-        # Then check all other regex patterns
-        for intent, patterns in cls.REGEX_PATTERNS.items():
-            for pattern in patterns:
-                match = re.search(pattern, message_lower)
-                if match:
-                    # Regex match gets higher confidence (0.95)
-                    # Don't override if already set to higher value (e.g., policy timeframe = 0.97)
-                    current_score = intent_scores.get(intent, 0.0)
-                    if current_score < 0.97:  # Don't override policy timeframe priority
-                        intent_scores[intent] = max(current_score, 0.95)
-                    break
+        # Policy timeframe questions get highest priority (0.97) to override action intents
+        if _COMPILED.policy_timeframe.search(message_lower):
+            intent_scores[IntentType.POLICY_INQUIRY] = 0.97
+
+        # Then check all other regex patterns (one combined regex per intent)
+        for intent, pattern in _COMPILED.intent_regexes.items():
+            if pattern.search(message_lower):
+                # Regex match gets higher confidence (0.95)
+                # Don't override if already set to higher value (e.g., policy timeframe = 0.97)
+                current_score = intent_scores.get(intent, 0.0)
+                if current_score < 0.97:  # Don't override policy timeframe priority
+                    intent_scores[intent] = max(current_score, 0.95)
         
         # 3. Sort by confidence and return
         sorted_intents = sorted(
@@ -265,64 +396,22 @@ class IntentPatterns:
         )
 
         message_lower = message.lower()
+        scan = cls._scan(message_lower)
+        found = scan.found
         raw_entities: Dict[str, str] = {}
 
-        # Extract service types (raw extraction)
-        # NOTE: More specific patterns should come first (e.g., "tv repair" before "appliance")
-        # IMPORTANT: Check "salon for men" before "salon for women" to avoid mismatches
-        service_keywords = {
-            # Specific appliance repairs (check these first)
-            "tv_repair": ["tv repair", "television repair", "tv service", "television service"],
-            "ac_repair": ["ac repair", "air conditioning repair", "hvac repair", "air conditioner repair"],
-            "microwave_repair": ["microwave repair", "microwave service"],
-            "geyser_repair": ["geyser repair", "water heater repair", "geyser service"],
-
-            # Salon services (check specific ones first)
-            "salon_for_men": ["salon for men", "men salon", "barber", "gents salon", "male grooming", "men's salon"],
-            "salon_for_women": ["salon for women", "women salon", "ladies salon", "beauty parlor", "beauty salon", "women's salon"],
-
-            # General services
-            "ac": ["ac", "air conditioning", "hvac", "air conditioner"],
-            "plumbing": ["plumbing", "plumber", "pipe", "leak", "tap", "faucet"],
-            "cleaning": ["cleaning", "clean", "house cleaning", "deep cleaning"],
-            "electrical": ["electrical", "electrician", "wiring", "switch", "light"],
-            "painting": ["painting", "paint", "painter"],
-            "appliance_repair": ["washing machine", "refrigerator", "fridge", "appliance"],
-            "pest_control": ["pest control", "pest", "pest service", "general pest control", "pest control service", "exterminator", "fumigation"],
-            "carpentry": ["carpentry", "carpenter", "furniture", "wood work", "cabinet", "door repair"],
-            "water_purifier": ["water purifier", "ro", "water filter", "purifier", "water treatment"],
-            "car_care": ["car care", "car wash", "car cleaning", "car service", "vehicle cleaning"],
-            "packers_and_movers": ["packers", "movers", "packing", "moving", "relocation", "shifting"]
-        }
-
-        for service_type, keywords in service_keywords.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    raw_entities[EntityType.SERVICE_TYPE.value] = service_type
-                    break
-            if EntityType.SERVICE_TYPE.value in raw_entities:
-                break
+        # Extract service types (raw extraction, first service in priority order)
+        service_type = _first_label(cls.SERVICE_KEYWORDS, found)
+        if service_type:
+            raw_entities[EntityType.SERVICE_TYPE.value] = service_type
 
         # Extract actions (raw extraction)
         # Check for intent phrases first (higher priority)
-        if re.search(r'\b(i want to|i need to|i would like to|i\'d like to)\s+(book|schedule|arrange)', message_lower):
+        if _COMPILED.booking_phrase.search(message_lower):
             raw_entities[EntityType.ACTION.value] = "book"
-        elif re.search(r'\b(i want|i need|i would like|i\'d like)\b', message_lower):
+        elif _COMPILED.want_phrase.search(message_lower):
             # If followed by service type, assume booking intent
-            if any(keyword in message_lower for keywords in [
-                ["ac", "air conditioning", "hvac"],
-                ["plumbing", "plumber"],
-                ["cleaning", "clean"],
-                ["electrical", "electrician"],
-                ["painting", "paint"],
-                ["appliance", "washing machine", "refrigerator"],
-                ["pest control", "pest", "pest service", "exterminator"],
-                ["carpentry", "carpenter", "furniture"],
-                ["water purifier", "ro", "water filter"],
-                ["car care", "car wash", "car cleaning"],
-                ["salon", "beauty salon", "barber"],
-                ["packers", "movers", "packing", "moving", "relocation"]
-            ] for keyword in keywords):
+            if any(keyword in found for keyword in cls.BOOKING_SERVICE_KEYWORDS):
                 raw_entities[EntityType.ACTION.value] = "book"
 
         # If not found, check action keywords
@@ -330,57 +419,25 @@ class IntentPatterns:
         # before checking "list" patterns to avoid false matches
         if EntityType.ACTION.value not in raw_entities:
             # First check for exact single-word actions (highest priority for action switching)
-            single_word_actions = ["cancel", "reschedule", "book", "list"]
-            if message_lower.strip() in single_word_actions:
+            if message_lower.strip() in cls.SINGLE_WORD_ACTIONS:
                 raw_entities[EntityType.ACTION.value] = message_lower.strip()
             else:
-                action_keywords = {
-                    "cancel": ["cancel", "remove", "delete"],
-                    "reschedule": ["reschedule", "change date", "move booking", "move appointment"],
-                    "modify": ["modify", "update", "edit"],
-                    "book": ["book", "schedule", "arrange", "set up"],
-                }
-
-                for action, keywords in action_keywords.items():
-                    for keyword in keywords:
-                        pattern = r'\b' + re.escape(keyword) + r'\b'
-                        if re.search(pattern, message_lower):
-                            raw_entities[EntityType.ACTION.value] = action
-                            break
-                    if EntityType.ACTION.value in raw_entities:
-                        break
+                action = _first_label(cls.ACTION_KEYWORDS, scan.word_bounded)
+                if action:
+                    raw_entities[EntityType.ACTION.value] = action
 
             # Only check for "list" action if no other action was found
-            # List patterns should ONLY match when there's an explicit list/show/view action word
             if EntityType.ACTION.value not in raw_entities:
-                list_patterns = [
-                    r'\b(list|show|view|display)\s+(my|all|them)?\s*(bookings?|appointments?)?',  # "list my bookings", "show bookings"
-                    r'\b(check|see|get)\s+my\s+(bookings?|appointments?)',  # "check my bookings"
-                    r'(bookings?|appointments?).*\b(list|show|view|display)',  # "bookings and list them"
-                    r'\bfilter\s+by\s+\w+',  # "filter by pending", "filter by status"
-                ]
-
-                for pattern in list_patterns:
-                    if re.search(pattern, message_lower):
-                        raw_entities[EntityType.ACTION.value] = "list"
-                        break
+                if _COMPILED.list_action.search(message_lower):
+                    raw_entities[EntityType.ACTION.value] = "list"
 
         # Extract STATUS_FILTER (for list action)
-        # Check for status keywords in queries like "show my pending bookings" or "filter by pending"
-        status_keywords = {
-            "pending": ["pending", "upcoming", "scheduled", "active"],
-            "confirmed": ["confirmed", "approved"],
-            "completed": ["completed", "finished", "done", "past"],
-            "cancelled": ["cancelled", "canceled", "deleted", "removed"]
-        }
-
         # Check for "filter by [status]" patterns first (highest priority)
-        filter_by_pattern = r'\bfilter\s+by\s+(\w+)'
-        filter_match = re.search(filter_by_pattern, message_lower)
+        filter_match = _COMPILED.filter_by.search(message_lower)
         if filter_match:
             status_word = filter_match.group(1)
             # Find which status this keyword belongs to
-            for status, keywords in status_keywords.items():
+            for status, keywords in cls.STATUS_KEYWORDS.items():
                 if status_word in keywords or status_word == status:
                     raw_entities[EntityType.STATUS_FILTER.value] = status
                     # Also set action to "list" if not already set
@@ -391,173 +448,83 @@ class IntentPatterns:
         # Check for status keywords appearing before "bookings" or "appointments" (if list action detected)
         elif raw_entities.get(EntityType.ACTION.value) == "list":
             # Pattern: "show my [status] bookings"
-            status_pattern = r'\b(' + '|'.join([kw for keywords in status_keywords.values() for kw in keywords]) + r')\s+(bookings?|appointments?)'
-            status_match = re.search(status_pattern, message_lower)
-
+            status_match = _COMPILED.status_before_bookings.search(message_lower)
             if status_match:
-                status_word = status_match.group(1)
-                # Find which status this keyword belongs to
-                for status, keywords in status_keywords.items():
-                    if status_word in keywords:
-                        raw_entities[EntityType.STATUS_FILTER.value] = status
-                        break
+                status = _STATUS_BY_KEYWORD.get(status_match.group(1))
             else:
                 # Fallback: check for status keywords anywhere in the message
-                for status, keywords in status_keywords.items():
-                    for keyword in keywords:
-                        if keyword in message_lower:
-                            raw_entities[EntityType.STATUS_FILTER.value] = status
-                            break
-                    if EntityType.STATUS_FILTER.value in raw_entities:
-                        break
+                status = _first_label(cls.STATUS_KEYWORDS, found)
+            if status:
+                raw_entities[EntityType.STATUS_FILTER.value] = status
 
         # Extract DATE (raw extraction - will be normalized)
-        if "today" in message_lower or " now" in message_lower:
-            raw_entities[EntityType.DATE.value] = "today"
-        elif "tomorrow" in message_lower or "tmrw" in message_lower or "tmr" in message_lower:
-            raw_entities[EntityType.DATE.value] = "tomorrow"
-        elif "day after tomorrow" in message_lower:
-            raw_entities[EntityType.DATE.value] = "day after tomorrow"
-        elif "next week" in message_lower:
-            raw_entities[EntityType.DATE.value] = "next week"
+        relative_date = next(
+            (date for date, keywords in cls.RELATIVE_DATE_KEYWORDS if any(k in found for k in keywords)),
+            None
+        )
+        if relative_date:
+            raw_entities[EntityType.DATE.value] = relative_date
         else:
-            # Natural date formats like "31st October", "October 31st", "31 Oct", "November 5th"
-            natural_date_patterns = [
-                r'(\d{1,2})(st|nd|rd|th)?\s+(january|february|march|april|may|june|july|august|september|october|november|december)',
-                r'(\d{1,2})(st|nd|rd|th)?\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',
-                r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{1,2})(st|nd|rd|th)?',
-                r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{1,2})(st|nd|rd|th)?'
-            ]
-
-            date_found = False
-            for pattern in natural_date_patterns:
-                date_match = re.search(pattern, message_lower)
-                if date_match:
-                    raw_entities[EntityType.DATE.value] = date_match.group(0)
-                    date_found = True
-                    break
-
-            if not date_found:
+            date_match = next(
+                (m for m in (p.search(message_lower) for p in _COMPILED.natural_dates) if m),
+                None
+            )
+            if date_match is None:
                 # ISO or DD/MM/YYYY format
-                date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', message)
-                if date_match:
-                    raw_entities[EntityType.DATE.value] = date_match.group(0)
-                else:
-                    date_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', message)
-                    if date_match:
-                        raw_entities[EntityType.DATE.value] = date_match.group(0)
+                date_match = _COMPILED.iso_date.search(message) or _COMPILED.dmy_date.search(message)
+            if date_match:
+                raw_entities[EntityType.DATE.value] = date_match.group(0)
 
         # Extract TIME (raw extraction - will be normalized)
-        time_match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)', message_lower)
+        time_match = _COMPILED.clock_time_ampm.search(message_lower) or _COMPILED.clock_time.search(message)
         if time_match:
             raw_entities[EntityType.TIME.value] = time_match.group(0)
         else:
-            time_match = re.search(r'(\d{1,2}):(\d{2})', message)
-            if time_match:
-                raw_entities[EntityType.TIME.value] = time_match.group(0)
-            elif "morning" in message_lower:
-                raw_entities[EntityType.TIME.value] = "morning"
-            elif "afternoon" in message_lower:
-                raw_entities[EntityType.TIME.value] = "afternoon"
-            elif "evening" in message_lower:
-                raw_entities[EntityType.TIME.value] = "evening"
-            elif "night" in message_lower:
-                raw_entities[EntityType.TIME.value] = "night"
+            time_of_day = next((k for k in cls.TIME_OF_DAY_KEYWORDS if k in found), None)
+            if time_of_day:
+                raw_entities[EntityType.TIME.value] = time_of_day
 
         # Extract LOCATION (raw extraction - will be normalized)
         if ',' in message:
-            full_address_pattern = r'.+,\s*.+,\s*.+,?\s*\d{6}'
-            if re.search(full_address_pattern, message):
+            if _COMPILED.full_address.search(message):
                 raw_entities[EntityType.LOCATION.value] = message.strip()
             else:
-                city_pincode_pattern = r'[a-zA-Z\s]+,\s*\d{6}'
-                city_pincode_match = re.search(city_pincode_pattern, message)
+                city_pincode_match = _COMPILED.city_pincode.search(message)
                 if city_pincode_match:
                     raw_entities[EntityType.LOCATION.value] = city_pincode_match.group(0).strip()
 
         if EntityType.LOCATION.value not in raw_entities:
-            pincode_match = re.search(r'\b(\d{6})\b', message)
+            pincode_match = _COMPILED.pincode.search(message)
             if pincode_match:
                 raw_entities[EntityType.LOCATION.value] = pincode_match.group(1)
 
         if EntityType.LOCATION.value not in raw_entities:
-            cities = [
-                "mumbai", "delhi", "bangalore", "bengaluru", "hyderabad", "chennai",
-                "kolkata", "pune", "ahmedabad", "jaipur", "surat", "lucknow",
-                "kanpur", "nagpur", "indore", "thane", "bhopal", "visakhapatnam",
-                "pimpri", "patna", "vadodara", "ghaziabad", "ludhiana", "agra"
-            ]
-            for city in cities:
-                if city in message_lower:
-                    raw_entities[EntityType.LOCATION.value] = city.title()
-                    break
+            city = next((c for c in cls.CITIES if c in found), None)
+            if city:
+                raw_entities[EntityType.LOCATION.value] = city.title()
 
         # Extract issue types (no normalization needed)
-        issue_keywords = {
-            "quality": ["poor quality", "bad service", "not satisfied"],
-            "behavior": ["rude", "unprofessional", "behavior"],
-            "damage": ["damage", "broken", "damaged"],
-            "late": ["late", "delayed", "not on time"],
-            "no_show": ["no show", "didn't come", "missed"],
-        }
-
-        for issue_type, keywords in issue_keywords.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    raw_entities[EntityType.ISSUE_TYPE.value] = issue_type
-                    break
-            if EntityType.ISSUE_TYPE.value in raw_entities:
-                break
+        issue_type = _first_label(cls.ISSUE_KEYWORDS, found)
+        if issue_type:
+            raw_entities[EntityType.ISSUE_TYPE.value] = issue_type
 
         # Extract payment issues (no normalization needed)
-        payment_keywords = {
-            "failed": ["failed", "declined", "not working"],
-            "double_charged": ["double charged", "charged twice"],
-            "wrong_amount": ["wrong amount", "overcharged", "incorrect"],
-        }
-
-        for payment_type, keywords in payment_keywords.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    raw_entities[EntityType.PAYMENT_TYPE.value] = payment_type
-                    break
-            if EntityType.PAYMENT_TYPE.value in raw_entities:
-                break
+        payment_type = _first_label(cls.PAYMENT_KEYWORDS, found)
+        if payment_type:
+            raw_entities[EntityType.PAYMENT_TYPE.value] = payment_type
 
         # Extract order ID (no normalization needed)
-        # Support order ID format:
-        # - ORD12345678 (ORD + 8 alphanumeric characters) - PRIMARY FORMAT
-        # - ORD123456, ORD-123456, ORD_123456 (ORD + 6+ digits)
-        # - ORDER12345, ORDER-12345, ORDER_12345
-        # - #123456
-        booking_id_patterns = [
-            r"\bORD[A-Z0-9]{8}\b",  # ORD12345678 (ORD + 8 alphanumeric) - PRIMARY FORMAT
-            r"\b(ORD)[-_]?([A-Z0-9]{6,8})\b",  # ORD123456, ORD-123456, ORD_123456
-            r"\b(ORDER)[-_]?([A-Z0-9]{4,8})\b",  # ORDER12345, ORDER-12345
-            r"#([A-Z0-9]{6,8})\b",  # #123456, #12345678
-        ]
-
-        for pattern in booking_id_patterns:
-            booking_match = re.search(pattern, message, re.IGNORECASE)
+        for pattern in _COMPILED.booking_ids:
+            booking_match = pattern.search(message)
             if booking_match:
-                extracted_id = booking_match.group(0).upper()
-                raw_entities[EntityType.BOOKING_ID.value] = extracted_id
+                raw_entities[EntityType.BOOKING_ID.value] = booking_match.group(0).upper()
                 break
 
         # Extract booking filter (latest, recent, last)
-        # Pattern format: (filter_word, context) - we want the filter_word
-        booking_filter_patterns = [
-            (r"\b(my|the)\s+(latest|recent|last|most recent)\s+(booking|appointment)", 2),  # group 2 is the filter word
-            (r"\b(latest|recent|last|most recent)\s+(booking|appointment|order)", 1),  # group 1 is the filter word
-            (r"\bcancel\s+(my\s+)?(latest|recent|last)\b", 2)  # group 2 is the filter word
-        ]
-
-        for pattern, filter_group_index in booking_filter_patterns:
-            filter_match = re.search(pattern, message, re.IGNORECASE)
+        for pattern, filter_group_index in _COMPILED.booking_filters:
+            filter_match = pattern.search(message)
             if filter_match:
-                # Extract the filter word using the specified group index
-                filter_word = filter_match.group(filter_group_index)
-                raw_entities["booking_filter"] = filter_word.lower()
+                raw_entities["booking_filter"] = filter_match.group(filter_group_index).lower()
                 break
 
         # Normalize all extracted entities using centralized normalizer
@@ -590,3 +557,76 @@ class IntentPatterns:
 
         return normalized_entities
 
+
+def _first_label(vocabulary: Dict[str, List[str]], found: FrozenSet[str]) -> Optional[str]:
+    """First label (in priority order) with any keyword in found"""
+    for label, keywords in vocabulary.items():
+        if any(keyword in found for keyword in keywords):
+            return label
+    return None
+
+
+def _combine(patterns: List[str], flags: int = 0) -> Pattern:
+    """Compile patterns into one alternation (matches iff any pattern matches)"""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+class _CompiledPatterns:
+    """Regexes and the keyword matcher, compiled once at import"""
+
+    def __init__(self):
+        cls = IntentPatterns
+        self.keyword_matcher = KeywordMatcher(
+            [k for keywords in cls.INTENT_KEYWORDS.values() for k in keywords]
+            + [k for keywords in cls.SERVICE_KEYWORDS.values() for k in keywords]
+            + cls.BOOKING_SERVICE_KEYWORDS
+            + [k for keywords in cls.ACTION_KEYWORDS.values() for k in keywords]
+            + [k for keywords in cls.STATUS_KEYWORDS.values() for k in keywords]
+            + [k for _, keywords in cls.RELATIVE_DATE_KEYWORDS for k in keywords]
+            + cls.TIME_OF_DAY_KEYWORDS
+            + cls.CITIES
+            + [k for keywords in cls.ISSUE_KEYWORDS.values() for k in keywords]
+            + [k for keywords in cls.PAYMENT_KEYWORDS.values() for k in keywords]
+        )
+
+        self.policy_timeframe = _combine(cls.POLICY_TIMEFRAME_PATTERNS)
+        self.intent_regexes: Dict[IntentType, Pattern] = {
+            intent: _combine(patterns) for intent, patterns in cls.REGEX_PATTERNS.items()
+        }
+
+        self.booking_phrase = re.compile(r'\b(i want to|i need to|i would like to|i\'d like to)\s+(book|schedule|arrange)')
+        self.want_phrase = re.compile(r'\b(i want|i need|i would like|i\'d like)\b')
+        self.list_action = _combine(cls.LIST_ACTION_PATTERNS)
+        self.filter_by = re.compile(r'\bfilter\s+by\s+(\w+)')
+        self.status_before_bookings = re.compile(
+            r'\b(' + '|'.join(k for keywords in cls.STATUS_KEYWORDS.values() for k in keywords) + r')\s+(bookings?|appointments?)'
+        )
+
+        self.natural_dates = [re.compile(p) for p in cls.NATURAL_DATE_PATTERNS]
+        self.iso_date = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+        self.dmy_date = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})')
+        self.clock_time_ampm = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)')
+        self.clock_time = re.compile(r'(\d{1,2}):(\d{2})')
+
+        self.full_address = re.compile(r'.+,\s*.+,\s*.+,?\s*\d{6}')
+        self.city_pincode = re.compile(r'[a-zA-Z\s]+,\s*\d{6}')
+        self.pincode = re.compile(r'\b(\d{6})\b')
+
+        self.booking_ids = [re.compile(p, re.IGNORECASE) for p in cls.BOOKING_ID_PATTERNS]
+        self.booking_filters = [(re.compile(p, re.IGNORECASE), group) for p, group in cls.BOOKING_FILTER_PATTERNS]
+
+
+_COMPILED = _CompiledPatterns()
+
+# Status keyword -> status
+_STATUS_BY_KEYWORD: Dict[str, str] = {
+    keyword: status
+    for status, keywords in IntentPatterns.STATUS_KEYWORDS.items()
+    for keyword in keywords
+}
+
+
+@lru_cache(maxsize=2048)
+def _scan_keywords(message_lower: str) -> KeywordScan:
+    """Keyword scan shared by match_intent and extract_entities_from_patterns"""
+    return _COMPILED.keyword_matcher.scan(message_lower)
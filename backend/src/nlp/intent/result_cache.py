@@ -0,0 +1,228 @@
+"""
+Intent Classification Result Cache
+
+Memoises IntentClassifier.classify for the short follow-ups that are
+classified over and over ("yes", "tomorrow", "cancel it", "show my bookings").
+
+Keys combine:
+- the normalized message (casefolded, whitespace collapsed, trailing "." / "!" dropped)
+- a compact dialog fingerprint: intent, state type and needed entities
+- the last assistant message, when history is passed without a dialog state
+  (a bare "yes" answers whatever was asked last)
+- today's date, since entities such as "tomorrow" are normalized to dates
+
+Messages that carry PII (emails, phone numbers, card / Aadhaar / PAN
+numbers, addresses, long digit runs) or are long are never cached, and
+fallback results are not cached either.
+"""
+
+import hashlib
+import logging
+import re
+from datetime import date
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from src.guardrails.config.patterns import ADDRESS_PATTERNS
+from src.monitoring.metrics import intent_classification_tier_total
+from src.utils.pii_utils import has_pii
+from src.utils.ttl_lru_cache import TTLLRUCache
+
+if TYPE_CHECKING:
+    from src.schemas.intent import IntentClassificationResult
+    from src.core.models import DialogState
+    from .classifier import IntentClassifier
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_TRAILING_PUNCTUATION_PATTERN = re.compile(r"[.!]+$")
+# Pincodes, order / account numbers and unformatted phone numbers
+_DIGIT_RUN_PATTERN = re.compile(r"\d{6,}")
+
+# Methods whose results are not worth keeping
+UNCACHEABLE_METHODS = {"fallback"}
+
+
+def normalize_message(message: str) -> str:
+    """Normalize a message for use in a cache key"""
+    normalized = _WHITESPACE_PATTERN.sub(" ", message.casefold()).strip()
+    return _TRAILING_PUNCTUATION_PATTERN.sub("", normalized)
+
+
+def dialog_fingerprint(dialog_state: Optional["DialogState"]) -> Optional[Tuple[str, str, Tuple[str, ...]]]:
+    """
+    Compact fingerprint of the dialog state fields that affect classification
+
+    Args:
+        dialog_state: Active dialog state (or None)
+
+    Returns:
+        (intent, state type, needed entities) or None
+    """
+    if dialog_state is None:
+        return None
+
+    state = getattr(dialog_state.state, "value", dialog_state.state)
+    needed = tuple(sorted(str(entity) for entity in (dialog_state.needed_entities or [])))
+    return str(dialog_state.intent), str(state), needed
+
+
+def _last_assistant_message(conversation_history: Optional[List[Dict[str, str]]]) -> Optional[str]:
+    for message in reversed(conversation_history or []):
+        if message.get("role") == "assistant":
+            return message.get("content") or ""
+    return None
+
+
+class IntentResultCache:
+    """
+    Bounded in-process cache of (IntentClassificationResult, classification_method)
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: int = 3600, max_message_length: int = 200):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Max cached classifications
+            ttl_seconds: TTL per entry
+            max_message_length: Longer messages are not cached
+        """
+        self.memory = TTLLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.max_message_length = max_message_length
+
+    def is_cacheable(self, message: str) -> bool:
+        """Whether a message may be stored (short and free of PII)"""
+        if not message or len(message) > self.max_message_length:
+            return False
+        if _DIGIT_RUN_PATTERN.search(message) or has_pii(message):
+            return False
+        return not any(pattern.search(message) for pattern in ADDRESS_PATTERNS)
+
+    @staticmethod
+    def build_key(
+        message: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        dialog_state: Optional["DialogState"] = None
+    ) -> str:
+        """
+        Build the cache key for a classify() call
+
+        Args:
+            message: User message
+            conversation_history: Optional conversation history
+            dialog_state: Optional active dialog state
+
+        Returns:
+            Hex digest identifying the call
+        """
+        last_assistant = None
+        if dialog_state is None and conversation_history:
+            last_assistant = _last_assistant_message(conversation_history)
+
+        payload = repr((
+            normalize_message(message),
+            dialog_fingerprint(dialog_state),
+            bool(conversation_history),
+            last_assistant,
+            date.today().isoformat(),
+        ))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple["IntentClassificationResult", str]]:
+        """Get a copy of a cached classification"""
+        entry = self.memory.get(key)
+        if entry is None:
+            return None
+        result, method = entry
+        return result.model_copy(deep=True), method
+
+    def set(self, key: str, result: "IntentClassificationResult", method: str) -> None:
+        """Store a copy of a classification"""
+        self.memory.set(key, (result.model_copy(deep=True), method))
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self.memory.clear()
+
+
+class CachedIntentClassifier:
+    """
+    Drop-in wrapper that memoises IntentClassifier.classify
+
+    Everything other than classify() is delegated to the wrapped classifier.
+    """
+
+    def __init__(self, classifier: "IntentClassifier", cache: Optional[IntentResultCache] = None):
+        """
+        Initialize wrapper
+
+        Args:
+            classifier: Classifier to memoise
+            cache: Result cache (default: the process-wide cache)
+        """
+        self.classifier = classifier
+        self.cache = cache or get_intent_result_cache()
+
+    def __getattr__(self, name):
+        if name == "classifier":
+            raise AttributeError(name)
+        return getattr(self.classifier, name)
+
+    async def classify(
+        self,
+        message: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        dialog_state: Optional["DialogState"] = None
+    ) -> Tuple["IntentClassificationResult", str]:
+        """
+        Classify user message, serving repeated calls from the cache
+
+        Args:
+            message: User message to classify
+            conversation_history: Optional list of previous messages
+            dialog_state: Optional active dialog state
+
+        Returns:
+            Tuple of (IntentClassificationResult, classification_method)
+        """
+        if self.cache is None or not self.cache.is_cacheable(message):
+            return await self.classifier.classify(message, conversation_history, dialog_state)
+
+        key = self.cache.build_key(message, conversation_history, dialog_state)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info(f"Intent cache hit: {cached[0].primary_intent} (method: {cached[1]})")
+            intent_classification_tier_total.labels(tier="cache").inc()
+            return cached
+
+        result, method = await self.classifier.classify(message, conversation_history, dialog_state)
+        if method not in UNCACHEABLE_METHODS:
+            self.cache.set(key, result, method)
+        return result, method
+
+
+_intent_result_cache: Optional[IntentResultCache] = None
+
+
+def get_intent_result_cache() -> Optional[IntentResultCache]:
+    """
+    Get or create the global intent result cache
+
+    Returns:
+        IntentResultCache, or None if caching is disabled via INTENT_CACHE_ENABLED
+    """
+    global _intent_result_cache
+    if _intent_result_cache is None:
+        from src.core.config import settings
+
+        if not settings.INTENT_CACHE_ENABLED:
+            return None
+
+        _intent_result_cache = IntentResultCache(
+            max_entries=settings.INTENT_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.INTENT_CACHE_TTL_SECONDS,
+            max_message_length=settings.INTENT_CACHE_MAX_MESSAGE_LENGTH
+        )
+        logger.info(f"Intent result cache initialized (max_entries={settings.INTENT_CACHE_MAX_ENTRIES})")
+    return _intent_result_cache
@@ -4,6 +4,7 @@ Initialization for LLM clients and utilities
 """
 
 from src.nlp.llm.gemini_client import get_gemini_client
+from src.nlp.llm.retry import async_retry, llm_retry_budget, get_llm_throttle
 
-__all__ = ["get_gemini_client"]
+__all__ = ["get_gemini_client", "async_retry", "llm_retry_budget", "get_llm_throttle"]
 
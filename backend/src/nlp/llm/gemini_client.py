@@ -13,18 +13,22 @@ from functools import wraps
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from src.core.config import settings
+from src.nlp.llm.retry import async_retry, is_retryable_error
 
 logger = logging.getLogger(__name__)
 
-# Rate limiting: Track last API call time to avoid hitting rate limits
-_last_api_call_time = 0
-_min_delay_between_calls = 0.5  # 500ms between calls = max 120 RPM (well under 15 RPM limit)
+# Rate limiting across workers lives in src.nlp.llm.retry.LLMThrottle
+# (configured via LLM_MIN_CALL_INTERVAL_MS)
 
 
 def with_retry(max_retries: int = 3, initial_delay: float = 1.0, backoff_factor: float = 2.0):
     """
     Decorator to add exponential backoff retry logic to LLM calls
 
+    Works on both sync functions and coroutine functions. Coroutine functions
+    are delegated to async_retry (jittered backoff with asyncio.sleep, a
+    per-attempt timeout and the per-request retry budget).
+
     Args:
         max_retries: Maximum number of retry attempts
         initial_delay: Initial delay in seconds before first retry
@@ -34,6 +38,13 @@ def with_retry(max_retries: int = 3, initial_delay: float = 1.0, backoff_factor:
         Decorated function with retry logic
     """
     def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            return async_retry(
+                max_retries=max_retries,
+                initial_delay=initial_delay,
+                backoff_factor=backoff_factor
+            )(func)
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             delay = initial_delay
@@ -46,16 +57,7 @@ def with_retry(max_retries: int = 3, initial_delay: float = 1.0, backoff_factor:
                     last_exception = e
                     error_msg = str(e)
 
-                    # Check if it's a retryable error (503, 429, or rate limit)
-                    is_retryable = (
-                        "503" in error_msg or
-                        "429" in error_msg or
-                        "overloaded" in error_msg.lower() or
-                        "rate limit" in error_msg.lower() or
-                        "quota" in error_msg.lower()
-                    )
-
-                    if not is_retryable or attempt == max_retries:
+                    if not is_retryable_error(e) or attempt == max_retries:
                         # Not retryable or max retries reached
                         logger.error(f"LLM call failed after {attempt + 1} attempts: {error_msg}")
                         raise
@@ -0,0 +1,345 @@
+"""
+Async Retry and Throttling for LLM Calls
+
+Event-loop friendly resilience helpers for Gemini calls:
+- async_retry: exponential backoff with full jitter and a per-attempt timeout
+- llm_retry_budget: per-request cap on the total number of retries
+- LLMThrottle: cross-worker minimum spacing between calls (Redis, with an
+  in-process fallback) that waits with asyncio.sleep instead of blocking
+
+All waiting happens with asyncio.sleep, so a rate-limit storm only delays the
+requests that are actually waiting on the LLM.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Iterator, Optional
+
+from src.core.config import settings
+from src.llm.scheduler import LLMSchedulerRejected
+from src.monitoring.metrics import llm_retries_total, llm_throttle_wait_seconds
+
+logger = logging.getLogger(__name__)
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Check if an LLM error is worth retrying
+
+    Retryable: attempt timeouts, 503/429 responses, overload and quota errors.
+    Calls shed by the LLM scheduler are never retried.
+
+    Args:
+        error: Exception raised by the LLM call
+
+    Returns:
+        True if the call should be retried
+    """
+    if isinstance(error, LLMSchedulerRejected):
+        # Load shedding: fail fast so the caller can fall back
+        return False
+
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+
+    error_msg = str(error).lower()
+    return (
+        "503" in error_msg or
+        "429" in error_msg or
+        "overloaded" in error_msg or
+        "rate limit" in error_msg or
+        "quota" in error_msg
+    )
+
+
+# ============================================================
+# PER-REQUEST RETRY BUDGET
+# ============================================================
+
+class RetryBudget:
+    """
+    Caps the total number of LLM retries spent on one request
+
+    A single chat turn can make several LLM calls (classification, extraction,
+    generation). Without a shared cap each one retries independently and a
+    rate-limit storm multiplies the latency of the turn.
+    """
+
+    def __init__(self, max_retries: int):
+        self.max_retries = max_retries
+        self.used = 0
+
+    @property
+    def remaining(self) -> int:
+        """Retries still available for this request"""
+        return max(self.max_retries - self.used, 0)
+
+    def try_consume(self) -> bool:
+        """
+        Consume one retry from the budget
+
+        Returns:
+            True if a retry was available
+        """
+        if self.used >= self.max_retries:
+            return False
+        self.used += 1
+        return True
+
+
+_current_retry_budget: ContextVar[Optional[RetryBudget]] = ContextVar(
+    "llm_retry_budget",
+    default=None
+)
+
+
+@contextmanager
+def llm_retry_budget(max_retries: Optional[int] = None) -> Iterator[RetryBudget]:
+    """
+    Scope a retry budget to the current request
+
+    Every async_retry call made inside the block (including from child tasks,
+    which inherit the context) draws from the same budget.
+
+    Usage:
+        with llm_retry_budget(4):
+            await coordinator.execute(...)
+
+    Args:
+        max_retries: Total retries allowed (defaults to LLM_RETRY_BUDGET_PER_REQUEST)
+
+    Yields:
+        The active RetryBudget
+    """
+    budget = RetryBudget(
+        max_retries if max_retries is not None else settings.LLM_RETRY_BUDGET_PER_REQUEST
+    )
+    token = _current_retry_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_retry_budget.reset(token)
+
+
+def get_current_retry_budget() -> Optional[RetryBudget]:
+    """Get the retry budget of the current request, if one is active"""
+    return _current_retry_budget.get()
+
+
+# ============================================================
+# CROSS-WORKER THROTTLE
+# ============================================================
+
+# Reserve the next free call slot atomically: returns the slot start (ms),
+# or -1 if the slot is further away than the allowed wait.
+_RESERVE_SLOT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local next_free = tonumber(redis.call('GET', KEYS[1]) or '0')
+local slot = math.max(now, next_free)
+if slot - now > max_wait then
+    return -1
+end
+redis.call('SET', KEYS[1], slot + interval, 'PX', interval + max_wait + 1000)
+return slot
+"""
+
+
+class LLMThrottleTimeout(Exception):
+    """Raised when no LLM call slot is available within the allowed wait (rate limit)"""
+
+
+class LLMThrottle:
+    """
+    Minimum spacing between LLM calls, shared across uvicorn workers
+
+    Each call reserves the next free slot with one atomic Redis script and then
+    awaits its slot. When Redis is unavailable the same reservation runs on
+    process-local state. Calls that would wait longer than max_wait fail fast
+    with LLMThrottleTimeout, which async_retry treats as a rate-limit error.
+    """
+
+    def __init__(
+        self,
+        min_interval_ms: int,
+        max_wait_seconds: float,
+        key: str = "llm:throttle:next_slot"
+    ):
+        self.min_interval_ms = min_interval_ms
+        self.max_wait_ms = int(max_wait_seconds * 1000)
+        self.key = key
+        self._local_next_slot_ms = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether throttling is active"""
+        return self.min_interval_ms > 0
+
+    async def acquire(self) -> float:
+        """
+        Wait (without blocking the event loop) for the next call slot
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            LLMThrottleTimeout: If the next slot is beyond max_wait
+        """
+        if not self.enabled:
+            return 0.0
+
+        now_ms = int(time.time() * 1000)
+        slot_ms = await self._reserve_slot(now_ms)
+
+        if slot_ms < 0:
+            llm_retries_total.labels(reason="throttle_timeout").inc()
+            raise LLMThrottleTimeout(
+                f"LLM rate limit: no call slot within {self.max_wait_ms}ms"
+            )
+
+        wait_seconds = max(slot_ms - now_ms, 0) / 1000
+        llm_throttle_wait_seconds.observe(wait_seconds)
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+        return wait_seconds
+
+    async def _reserve_slot(self, now_ms: int) -> int:
+        """Reserve a slot in Redis, falling back to process-local state"""
+        from src.core.cache.redis_client import redis_client
+
+        result = await redis_client.eval(
+            _RESERVE_SLOT_SCRIPT,
+            keys=[self.key],
+            args=[now_ms, self.min_interval_ms, self.max_wait_ms]
+        )
+        if result is not None:
+            return int(result)
+
+        # In-process fallback (no await between read and write, so it is atomic)
+        slot_ms = max(now_ms, self._local_next_slot_ms)
+        if slot_ms - now_ms > self.max_wait_ms:
+            return -1
+        self._local_next_slot_ms = slot_ms + self.min_interval_ms
+        return slot_ms
+
+
+# Global throttle instance (singleton)
+_llm_throttle: Optional[LLMThrottle] = None
+
+
+def get_llm_throttle() -> LLMThrottle:
+    """Get or create the global LLM throttle"""
+    global _llm_throttle
+    if _llm_throttle is None:
+        _llm_throttle = LLMThrottle(
+            min_interval_ms=settings.LLM_MIN_CALL_INTERVAL_MS,
+            max_wait_seconds=settings.LLM_THROTTLE_MAX_WAIT_SECONDS
+        )
+    return _llm_throttle
+
+
+# ============================================================
+# RETRY DECORATOR
+# ============================================================
+
+def compute_backoff_delay(
+    attempt: int,
+    initial_delay: float,
+    backoff_factor: float,
+    max_delay: float
+) -> float:
+    """
+    Exponential backoff with full jitter
+
+    Args:
+        attempt: Zero-based attempt number that just failed
+        initial_delay: Base delay in seconds
+        backoff_factor: Multiplier per attempt
+        max_delay: Upper bound for the delay
+
+    Returns:
+        Delay in seconds, uniformly drawn from [0, capped exponential delay]
+    """
+    capped = min(max_delay, initial_delay * (backoff_factor ** attempt))
+    return random.uniform(0, capped)
+
+
+def async_retry(
+    max_retries: int = 3,
+    initial_delay: float = 1.0,
+    backoff_factor: float = 2.0,
+    max_delay: Optional[float] = None,
+    attempt_timeout: Optional[float] = None,
+    use_throttle: bool = True
+):
+    """
+    Decorator adding jittered exponential backoff to async LLM calls
+
+    Each attempt waits for a throttle slot, then runs under a timeout.
+    Retries stop at max_retries or when the request's retry budget runs out,
+    whichever comes first.
+
+    Usage:
+        @async_retry(max_retries=3, initial_delay=1.0, backoff_factor=2.0)
+        async def classify():
+            return await structured_llm.ainvoke(prompt)
+
+    Args:
+        max_retries: Maximum number of retry attempts for this call
+        initial_delay: Base delay in seconds before the first retry
+        backoff_factor: Multiplier for the delay after each retry
+        max_delay: Upper bound for one delay (defaults to LLM_RETRY_MAX_DELAY_SECONDS)
+        attempt_timeout: Timeout per attempt (defaults to LLM_ATTEMPT_TIMEOUT_SECONDS)
+        use_throttle: Whether to wait for a cross-worker call slot before each attempt
+
+    Returns:
+        Decorated coroutine function
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            delay_cap = max_delay if max_delay is not None else settings.LLM_RETRY_MAX_DELAY_SECONDS
+            timeout = attempt_timeout if attempt_timeout is not None else settings.LLM_ATTEMPT_TIMEOUT_SECONDS
+
+            for attempt in range(max_retries + 1):
+                try:
+                    if use_throttle:
+                        await get_llm_throttle().acquire()
+                    return await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
+                except Exception as e:
+                    error_msg = str(e) or type(e).__name__
+
+                    if not is_retryable_error(e) or attempt == max_retries:
+                        # Not retryable or max retries reached
+                        logger.error(f"LLM call failed after {attempt + 1} attempts: {error_msg}")
+                        raise
+
+                    budget = get_current_retry_budget()
+                    if budget is not None and not budget.try_consume():
+                        llm_retries_total.labels(reason="budget_exhausted").inc()
+                        logger.error(
+                            f"LLM call failed (attempt {attempt + 1}): {error_msg}. "
+                            f"Request retry budget of {budget.max_retries} exhausted, giving up"
+                        )
+                        raise
+
+                    reason = "timeout" if isinstance(e, asyncio.TimeoutError) else "retryable_error"
+                    llm_retries_total.labels(reason=reason).inc()
+
+                    delay = compute_backoff_delay(attempt, initial_delay, backoff_factor, delay_cap)
+                    logger.warning(
+                        f"LLM call failed (attempt {attempt + 1}/{max_retries + 1}): {error_msg}. "
+                        f"Retrying in {delay:.2f}s..."
+                    )
+
+                    # Wait before retry without blocking the event loop
+                    await asyncio.sleep(delay)
+
+        return wrapper
+    return decorator
@@ -2,6 +2,6 @@
 Embeddings module for RAG system
 """
 
-from .embedding_service import EmbeddingService, get_embedding_service
+from .embedding_service import EmbeddingService, get_embedding_service, get_embedding_service_for_model
 
-__all__ = ["EmbeddingService", "get_embedding_service"]
+__all__ = ["EmbeddingService", "get_embedding_service", "get_embedding_service_for_model"]
@@ -249,6 +249,25 @@ def get_embedding_service() -> EmbeddingService:
     return EmbeddingService()
 
 
+@lru_cache()
+def get_embedding_service_for_model(model_name: str) -> EmbeddingService:
+    """
+    Get cached embedding service for a specific model (one instance per model)
+
+    Lets components that use a smaller model than EMBEDDING_MODEL (e.g. the
+    MiniLM intent tier) share a single loaded copy of it.
+
+    Args:
+        model_name: Name of the sentence-transformers model
+
+    Returns:
+        EmbeddingService instance
+    """
+    if model_name == settings.EMBEDDING_MODEL:
+        return get_embedding_service()
+    return EmbeddingService(model_name=model_name)
+
+
 # Export for easy imports
-__all__ = ["EmbeddingService", "get_embedding_service"]
+__all__ = ["EmbeddingService", "get_embedding_service", "get_embedding_service_for_model"]
 
@@ -0,0 +1,306 @@
+"""
+Local Vector Index Backends
+
+Stand-ins for the Pinecone Index used by PineconeService when
+VECTOR_STORE_BACKEND is not "pinecone":
+
+- InMemoryVectorIndex: exact cosine search over numpy arrays with simple
+  metadata filters ($eq, $ne, $in, $nin and plain equality)
+- CassetteVectorIndex: records real Pinecone query results (record) or plays
+  them back (replay), falling back to the in-memory index on a replay miss
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.utils.cassette import Cassette, LatencyModel
+
+logger = logging.getLogger(__name__)
+
+VECTOR_STORE_BACKENDS = ("pinecone", "record", "replay", "fake")
+
+
+def _normalize_vector_item(item: Any) -> tuple:
+    """Accept (id, values, metadata) tuples or Pinecone-style dicts"""
+    if isinstance(item, dict):
+        return item["id"], item["values"], item.get("metadata") or {}
+    vector_id, values, *rest = item
+    return vector_id, values, (rest[0] if rest else {}) or {}
+
+
+def _matches_filter(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+    """Evaluate a Pinecone metadata filter (subset) against one vector's metadata"""
+    if not filter:
+        return True
+    for field, condition in filter.items():
+        if field == "$and":
+            if not all(_matches_filter(metadata, sub) for sub in condition):
+                return False
+            continue
+        if field == "$or":
+            if not any(_matches_filter(metadata, sub) for sub in condition):
+                return False
+            continue
+
+        value = metadata.get(field)
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        for op, expected in condition.items():
+            if op == "$eq" and value != expected:
+                return False
+            if op == "$ne" and value == expected:
+                return False
+            if op == "$in" and value not in expected:
+                return False
+            if op == "$nin" and value in expected:
+                return False
+    return True
+
+
+class InMemoryVectorIndex:
+    """
+    Exact cosine-similarity index with the Pinecone Index interface used by PineconeService
+    """
+
+    def __init__(self, dimension: int, latency: Optional[LatencyModel] = None):
+        """
+        Initialize in-memory index
+
+        Args:
+            dimension: Vector dimension
+            latency: Synthetic latency per query
+        """
+        self.dimension = dimension
+        self.latency = latency or LatencyModel("none")
+        # namespace -> id -> (unit vector, raw values, metadata)
+        self._namespaces: Dict[str, Dict[str, tuple]] = {}
+
+    def upsert(self, vectors: List[Any], namespace: str = "", **kwargs) -> SimpleNamespace:
+        """Insert or replace vectors"""
+        store = self._namespaces.setdefault(namespace, {})
+        for item in vectors:
+            vector_id, values, metadata = _normalize_vector_item(item)
+            array = np.asarray(values, dtype=np.float32)
+            norm = np.linalg.norm(array)
+            store[vector_id] = (array / norm if norm else array, list(values), dict(metadata))
+        return SimpleNamespace(upserted_count=len(vectors))
+
+    def query(
+        self,
+        vector: List[float],
+        top_k: int = 10,
+        namespace: str = "",
+        filter: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = True,
+        include_values: bool = False,
+        **kwargs
+    ) -> SimpleNamespace:
+        """Return the top_k most similar vectors"""
+        time.sleep(self.latency.sample())
+
+        store = self._namespaces.get(namespace, {})
+        candidates = [
+            (vector_id, entry) for vector_id, entry in store.items()
+            if _matches_filter(entry[2], filter)
+        ]
+        if not candidates:
+            return SimpleNamespace(matches=[])
+
+        query = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        scores = np.stack([entry[0] for _, entry in candidates]) @ query
+        order = np.argsort(-scores)[:top_k]
+
+        matches = []
+        for i in order:
+            vector_id, (_, values, metadata) = candidates[i]
+            matches.append(SimpleNamespace(
+                id=vector_id,
+                score=float(scores[i]),
+                metadata=metadata if include_metadata else None,
+                values=values if include_values else None
+            ))
+        return SimpleNamespace(matches=matches)
+
+    def delete(
+        self,
+        ids: Optional[List[str]] = None,
+        delete_all: bool = False,
+        namespace: str = "",
+        filter: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> dict:
+        """Delete vectors by id, filter or all"""
+        store = self._namespaces.get(namespace, {})
+        if delete_all:
+            store.clear()
+        elif ids:
+            for vector_id in ids:
+                store.pop(vector_id, None)
+        elif filter:
+            for vector_id in [k for k, entry in store.items() if _matches_filter(entry[2], filter)]:
+                del store[vector_id]
+        return {}
+
+    def describe_index_stats(self, **kwargs) -> SimpleNamespace:
+        """Index statistics in Pinecone's shape"""
+        namespaces = {
+            name: {"vector_count": len(store)} for name, store in self._namespaces.items()
+        }
+        return SimpleNamespace(
+            total_vector_count=sum(len(store) for store in self._namespaces.values()),
+            dimension=self.dimension,
+            index_fullness=0.0,
+            namespaces=namespaces
+        )
+
+
+class CassetteVectorIndex:
+    """
+    Record/replay wrapper around a vector index
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        mode: str,
+        fallback: InMemoryVectorIndex,
+        inner: Any = None,
+        latency: Optional[LatencyModel] = None
+    ):
+        """
+        Initialize cassette index
+
+        Args:
+            cassette: Cassette to record into / replay from
+            mode: "record" or "replay"
+            fallback: Index used for writes and replay misses in replay mode
+            inner: Real Pinecone index (required for record mode)
+            latency: Latency model applied on replay
+        """
+        if mode == "record" and inner is None:
+            raise ValueError("Record mode needs a real index to record from")
+
+        self.cassette = cassette
+        self.mode = mode
+        self.fallback = fallback
+        self.inner = inner
+        self.latency = latency or LatencyModel("recorded")
+
+    @property
+    def _target(self) -> Any:
+        return self.inner if self.mode == "record" else self.fallback
+
+    @staticmethod
+    def _key(vector: List[float], **params: Any) -> str:
+        """Request key; vectors are rounded so float noise between runs still hits"""
+        payload = json.dumps(
+            {"vector": [round(float(v), 4) for v in vector], **params},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def upsert(self, vectors: List[Any], namespace: str = "", **kwargs) -> Any:
+        return self._target.upsert(vectors=vectors, namespace=namespace, **kwargs)
+
+    def delete(self, **kwargs) -> Any:
+        return self._target.delete(**kwargs)
+
+    def describe_index_stats(self, **kwargs) -> Any:
+        return self._target.describe_index_stats(**kwargs)
+
+    def query(
+        self,
+        vector: List[float],
+        top_k: int = 10,
+        namespace: str = "",
+        filter: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = True,
+        include_values: bool = False,
+        **kwargs
+    ) -> SimpleNamespace:
+        """Query the real index (record) or the cassette (replay)"""
+        key = self._key(
+            vector,
+            top_k=top_k,
+            namespace=namespace,
+            filter=filter,
+            include_metadata=include_metadata,
+            include_values=include_values
+        )
+        params = dict(
+            vector=vector,
+            top_k=top_k,
+            namespace=namespace,
+            filter=filter,
+            include_metadata=include_metadata,
+            include_values=include_values
+        )
+
+        if self.mode == "record":
+            started_at = time.time()
+            results = self.inner.query(**params)
+            self.cassette.record(key, {
+                "matches": [
+                    {
+                        "id": match.id,
+                        "score": match.score,
+                        "metadata": getattr(match, "metadata", None),
+                        "values": getattr(match, "values", None) or None
+                    }
+                    for match in results.matches
+                ],
+                "latency_ms": round((time.time() - started_at) * 1000, 1)
+            })
+            return results
+
+        entry = self.cassette.get(key)
+        if entry is None:
+            logger.warning(f"Cassette miss for vector query {key[:12]}, using in-memory index")
+            return self.fallback.query(**params)
+
+        time.sleep(self.latency.sample(entry.get("latency_ms")))
+        return SimpleNamespace(matches=[SimpleNamespace(**match) for match in entry["matches"]])
+
+
+def create_local_index(backend: str, dimension: int, real_index_factory=None) -> Any:
+    """
+    Build the index stand-in for a local vector store backend
+
+    Args:
+        backend: "record", "replay" or "fake"
+        dimension: Vector dimension
+        real_index_factory: Builds the real Pinecone index (record mode only)
+
+    Returns:
+        InMemoryVectorIndex or CassetteVectorIndex
+    """
+    from src.core.config.settings import settings
+
+    if backend not in VECTOR_STORE_BACKENDS[1:]:
+        raise ValueError(f"Unknown local vector store backend '{backend}', expected one of {VECTOR_STORE_BACKENDS}")
+
+    latency = LatencyModel.from_spec(settings.VECTOR_STORE_LOCAL_LATENCY, seed=settings.LOCAL_BACKEND_SEED)
+    fake_latency = LatencyModel("none") if latency.kind == "recorded" else latency
+    memory_index = InMemoryVectorIndex(dimension, latency=fake_latency)
+    if backend == "fake":
+        return memory_index
+
+    cassette = Cassette(os.path.join(settings.LOCAL_BACKEND_CASSETTE_DIR, "vector_store.jsonl"))
+    return CassetteVectorIndex(
+        cassette,
+        mode=backend,
+        fallback=memory_index,
+        inner=real_index_factory() if backend == "record" else None,
+        latency=latency
+    )
@@ -11,6 +11,7 @@ import time
 
 from src.core.config.settings import settings
 from src.rag.embeddings import get_embedding_service
+from src.rag.vector_store.local_index import create_local_index
 
 logger = logging.getLogger(__name__)
 
@@ -53,16 +54,26 @@ class PineconeService:
         self.cloud = cloud or settings.PINECONE_CLOUD
         self.region = region or settings.PINECONE_REGION
         
-        # Initialize Pinecone client
-        logger.info(f"Initializing Pinecone client for index: {self.index_name}")
-        self.pc = Pinecone(api_key=self.api_key)
-        
-        # Get or create index
-        self._ensure_index_exists()
-        
-        # Connect to index
-        self.index = self.pc.Index(self.index_name)
-        logger.info(f"Connected to Pinecone index: {self.index_name}")
+        backend = settings.VECTOR_STORE_BACKEND.lower()
+        if backend in ("replay", "fake"):
+            # Offline backends never reach Pinecone
+            self.pc = None
+            self.index = create_local_index(backend, self.dimension)
+            logger.info(f"Using local '{backend}' vector index for: {self.index_name}")
+        else:
+            # Initialize Pinecone client
+            logger.info(f"Initializing Pinecone client for index: {self.index_name}")
+            self.pc = Pinecone(api_key=self.api_key)
+            
+            # Get or create index
+            self._ensure_index_exists()
+            
+            # Connect to index
+            self.index = self.pc.Index(self.index_name)
+            if backend == "record":
+                real_index = self.index
+                self.index = create_local_index(backend, self.dimension, real_index_factory=lambda: real_index)
+            logger.info(f"Connected to Pinecone index: {self.index_name}")
         
         # Get embedding service
         self.embedding_service = get_embedding_service()
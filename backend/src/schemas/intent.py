@@ -185,7 +185,7 @@ class IntentClassificationResponse(BaseModel):
     primary_intent: str = Field(..., description="Primary intent")
     requires_clarification: bool = Field(..., description="Whether clarification is needed")
     clarification_reason: Optional[str] = Field(default=None, description="Reason for clarification")
-    classification_method: str = Field(..., description="Method used (pattern_match, llm, context_aware_llm, fallback)")
+    classification_method: str = Field(..., description="Method used (pattern_match, embedding_knn, llm, context_aware_llm, fallback)")
     processing_time_ms: int = Field(..., description="Processing time in milliseconds")
     context_used: bool = Field(default=False, description="Whether conversation context was used")
     context_summary: Optional[str] = Field(default=None, description="Summary of context used")
@@ -6,6 +6,7 @@ import logging
 from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database.write_behind import get_write_behind_queue
 from src.core.models import OpsAuditLog
 
 
@@ -54,7 +55,9 @@ class AuditService:
             pii_accessed: Whether PII was accessed (critical for compliance)
             metadata: Additional metadata (filters, params, etc.)
             request_metadata: Request metadata (IP, user agent, etc.)
-            auto_commit: Whether to commit immediately (default: False, let caller handle)
+            auto_commit: Whether to commit immediately (default: False, let caller handle);
+                with write-behind the entry is queued for a batched insert instead of
+                committing the caller's session
 
         Returns:
             Created OpsAuditLog instance
@@ -72,12 +75,18 @@ class AuditService:
                 user_agent=request_metadata.get("user_agent") if request_metadata else None
             )
 
-            self.db.add(audit_log)
+            # Standalone audit calls are batched off the request path when write-behind
+            # is enabled; otherwise the entry commits with the caller's transaction
+            queue = get_write_behind_queue() if auto_commit else None
+            if queue is not None:
+                queue.add(audit_log)
+            else:
+                self.db.add(audit_log)
 
-            # Only commit if explicitly requested (for standalone audit calls)
-            if auto_commit:
-                await self.db.commit()
-                await self.db.refresh(audit_log)
+                # Only commit if explicitly requested (for standalone audit calls)
+                if auto_commit:
+                    await self.db.commit()
+                    await self.db.refresh(audit_log)
             
             # Also log to application logs for immediate visibility
             log_message = (
@@ -14,8 +14,7 @@ import uuid
 
 from src.core.models import (
     User, Booking, BookingItem, Cart, CartItem, Address,
-    RateCard, Subcategory, Category, BookingStatus, PaymentStatus, PaymentMethod,
-    Provider, Pincode, ProviderPincode
+    RateCard, Subcategory, Category, BookingStatus, PaymentStatus, PaymentMethod
 )
 from src.schemas.customer import (
     CreateBookingRequest,
@@ -28,6 +27,7 @@ from src.schemas.customer import (
     CategoryResponse,
 )
 from src.monitoring.metrics import bookings_created_total
+from src.services.pincode_coverage import confirm_coverage, get_pincode_coverage
 
 logger = logging.getLogger(__name__)
 
@@ -877,12 +877,14 @@ class BookingService:
         Raises:
             ValueError: If validation fails
         """
-        # Step 1: Check if pincode exists and is serviceable
-        pincode_result = await self.db.execute(
-            select(Pincode).where(Pincode.pincode == pincode)
+        # Read from the database: the coverage index can miss provider and
+        # pincode changes for up to PINCODE_COVERAGE_MAX_AGE_SECONDS
+        coverage = await get_pincode_coverage(self.db)
+        pincode_obj, uncovered = await confirm_coverage(
+            self.db, coverage, pincode, [rate_card for _, rate_card, _ in cart_items]
         )
-        pincode_obj = pincode_result.scalar_one_or_none()
 
+        # Step 1: Check if pincode exists and is serviceable
         if not pincode_obj:
             logger.warning(f"Pincode not found: {pincode}")
             raise ValueError(f"Sorry, pincode {pincode} is not in our service area yet.")
@@ -892,29 +894,16 @@ class BookingService:
             raise ValueError(f"Sorry, we don't service pincode {pincode} at the moment.")
 
         # Step 2: Validate each rate card's provider services this pincode
-        for cart_item, rate_card, subcategory in cart_items:
-            # Check if rate card's provider services this pincode
-            provider_check = await self.db.execute(
-                select(ProviderPincode)
-                .join(Provider, ProviderPincode.provider_id == Provider.id)
-                .where(
-                    ProviderPincode.provider_id == rate_card.provider_id,
-                    ProviderPincode.pincode_id == pincode_obj.id,
-                    Provider.is_active == True,
-                    Provider.is_verified == True
-                )
+        if uncovered:
+            rate_card = uncovered[0]
+            logger.warning(
+                f"Provider {rate_card.provider_id} does not service pincode {pincode} "
+                f"for rate_card {rate_card.id} ({rate_card.name})"
+            )
+            raise ValueError(
+                f"Sorry, the service '{rate_card.name}' is not available in pincode {pincode}. "
+                f"Please remove it from your cart or choose a different location."
             )
-            provider_association = provider_check.scalar_one_or_none()
-
-            if not provider_association:
-                logger.warning(
-                    f"Provider {rate_card.provider_id} does not service pincode {pincode} "
-                    f"for rate_card {rate_card.id} ({rate_card.name})"
-                )
-                raise ValueError(
-                    f"Sorry, the service '{rate_card.name}' is not available in pincode {pincode}. "
-                    f"Please remove it from your cart or choose a different location."
-                )
 
         logger.debug(f"Provider validation passed for pincode {pincode}")
 
@@ -0,0 +1,146 @@
+"""
+Catalog Embedding Index - Cached embedding matrices of category and subcategory names
+
+CategoryMatcher used to load its own SentenceTransformer per instance and to
+re-encode every category name on each semantic match. This index keeps one
+L2-normalized matrix per catalog kind ("category", "subcategory"), embedded
+with the RAG embedding service (EMBEDDING_MODEL) unless CATEGORY_EMBEDDING_MODEL
+names another model:
+
+- A matrix is rebuilt only when the catalog version changes, i.e. when the
+  (id, name) rows it was built from change
+- Matching a query is one query embedding plus one matrix-vector product
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CATEGORY = "category"
+SUBCATEGORY = "subcategory"
+
+
+def catalog_version(entries: Sequence[Dict[str, Any]]) -> Tuple[Tuple[Any, str], ...]:
+    """Version key of catalog rows: their (id, name) pairs in order"""
+    return tuple((entry["id"], entry["name"]) for entry in entries)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize the rows of a matrix (zero rows stay zero)"""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+@dataclass(frozen=True)
+class EmbeddingMatrix:
+    """Immutable embedding matrix of one catalog kind"""
+    version: Tuple[Tuple[Any, str], ...]
+    entries: Tuple[Dict[str, Any], ...]
+    matrix: np.ndarray
+
+
+class CatalogEmbeddingIndex:
+    """
+    Process-wide embedding matrices of catalog names
+    """
+
+    def __init__(self, embedding_service=None, model_name: Optional[str] = None):
+        """
+        Initialize index (matrices are embedded lazily per kind)
+
+        Args:
+            embedding_service: EmbeddingService-like object with embed_text/embed_texts
+                (default: shared service for model_name)
+            model_name: Sentence-transformers model (default: CATEGORY_EMBEDDING_MODEL,
+                else the RAG EMBEDDING_MODEL)
+        """
+        self._embedding_service = embedding_service
+        self.model_name = model_name
+        self._matrices: Dict[str, EmbeddingMatrix] = {}
+        self._lock = threading.Lock()
+
+    def _get_embedding_service(self):
+        if self._embedding_service is None:
+            from src.core.config import settings
+            from src.rag.embeddings import get_embedding_service, get_embedding_service_for_model
+
+            model_name = self.model_name or settings.CATEGORY_EMBEDDING_MODEL
+            # No model configured: the same EmbeddingService instance RAG uses
+            self._embedding_service = (
+                get_embedding_service_for_model(model_name) if model_name else get_embedding_service()
+            )
+        return self._embedding_service
+
+    def get_matrix(self, kind: str, entries: Sequence[Dict[str, Any]]) -> EmbeddingMatrix:
+        """
+        Get the embedding matrix of catalog rows, embedding them on a version change
+
+        Args:
+            kind: Catalog kind (CATEGORY or SUBCATEGORY)
+            entries: Rows with "id" and "name"
+
+        Returns:
+            EmbeddingMatrix with one normalized row per entry
+        """
+        version = catalog_version(entries)
+        current = self._matrices.get(kind)
+        if current is not None and current.version == version:
+            return current
+
+        with self._lock:
+            current = self._matrices.get(kind)
+            if current is not None and current.version == version:
+                return current
+
+            names = [entry["name"] for entry in entries]
+            if names:
+                matrix = np.asarray(self._get_embedding_service().embed_texts(names), dtype=np.float32)
+                matrix = normalize_rows(matrix)
+            else:
+                matrix = np.zeros((0, 0), dtype=np.float32)
+
+            current = EmbeddingMatrix(version=version, entries=tuple(entries), matrix=matrix)
+            self._matrices[kind] = current
+            logger.info(f"[CatalogEmbeddingIndex] Embedded {len(names)} {kind} names")
+            return current
+
+    def similarities(self, kind: str, entries: Sequence[Dict[str, Any]], text: str) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Cosine similarity of a text to every catalog row
+
+        Args:
+            kind: Catalog kind (CATEGORY or SUBCATEGORY)
+            entries: Rows with "id" and "name"
+            text: Query text
+
+        Returns:
+            (entry, similarity) pairs in entry order
+        """
+        embedded = self.get_matrix(kind, entries)
+        if not embedded.entries:
+            return []
+
+        query = np.asarray(self._get_embedding_service().embed_text(text), dtype=np.float32)
+        scores = embedded.matrix @ normalize_rows(query)
+        return [(entry, float(score)) for entry, score in zip(embedded.entries, scores)]
+
+
+_catalog_embedding_index: Optional[CatalogEmbeddingIndex] = None
+
+
+def get_catalog_embedding_index() -> CatalogEmbeddingIndex:
+    """
+    Get the process-wide catalog embedding index (singleton pattern)
+
+    Returns:
+        CatalogEmbeddingIndex instance
+    """
+    global _catalog_embedding_index
+    if _catalog_embedding_index is None:
+        _catalog_embedding_index = CatalogEmbeddingIndex()
+    return _catalog_embedding_index
@@ -0,0 +1,434 @@
+"""
+Catalog Snapshot - Immutable, versioned in-memory copy of the service catalog
+
+Categories, subcategories and rate cards are read on almost every chat turn
+and change rarely. Instead of querying MySQL per request, readers take the
+current CatalogSnapshot:
+
+- One snapshot holds every active category, subcategory and rate card with
+  id, slug and name indexes; it is never mutated after it is built
+- Writers bump a version counter in Redis (bump_catalog_version); the store
+  checks the counter at most every CATALOG_VERSION_CHECK_SECONDS and reloads
+  in the background when it changed, then swaps the new snapshot in with a
+  single assignment (readers keep the snapshot they already hold)
+- Writes that never bump the counter (seed scripts, manual SQL) and Redis
+  outages are covered by a reload once the snapshot is
+  CATALOG_SNAPSHOT_MAX_AGE_SECONDS old
+
+The app itself never writes catalog rows, so today every change arrives
+through that reload. The snapshot only serves browsing, search and entity
+validation: CartService.add_to_cart reads the rate card (and its is_active
+flag) from the database, so a stale snapshot can show a deactivated service
+but cannot put it in a cart.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Redis key of the catalog version counter
+CATALOG_VERSION_KEY = "catalog:version"
+
+
+@dataclass(frozen=True)
+class CategoryEntry:
+    """Active category"""
+    id: int
+    name: str
+    slug: str
+    description: Optional[str]
+    image: Optional[str]
+    display_order: int
+    is_active: bool
+    subcategory_count: int = 0
+
+
+@dataclass(frozen=True)
+class SubcategoryEntry:
+    """Active subcategory"""
+    id: int
+    category_id: int
+    name: str
+    slug: str
+    description: Optional[str]
+    image: Optional[str]
+    display_order: int
+    is_active: bool
+    rate_card_count: int = 0
+
+
+@dataclass(frozen=True)
+class RateCardEntry:
+    """Active rate card"""
+    id: int
+    category_id: int
+    subcategory_id: int
+    provider_id: int
+    name: str
+    description: Optional[str]
+    price: Decimal
+    strike_price: Optional[Decimal]
+    is_active: bool
+
+
+def _display_key(entry) -> Tuple[int, str]:
+    return (entry.display_order, entry.name)
+
+
+class CatalogSnapshot:
+    """
+    Immutable catalog with id, slug and name indexes
+
+    Lists keep the orders the database queries used: categories and
+    subcategories by (display_order, name), rate cards by name.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        categories: Iterable[CategoryEntry],
+        subcategories: Iterable[SubcategoryEntry],
+        rate_cards: Iterable[RateCardEntry]
+    ):
+        """
+        Build indexes
+
+        Args:
+            version: Catalog version counter the snapshot was loaded at
+            categories: Active categories
+            subcategories: Active subcategories
+            rate_cards: Active rate cards
+        """
+        self.version = version
+        self.loaded_at = time.monotonic()
+
+        self.categories: Tuple[CategoryEntry, ...] = tuple(sorted(categories, key=_display_key))
+        self.subcategories: Tuple[SubcategoryEntry, ...] = tuple(sorted(subcategories, key=_display_key))
+        self.rate_cards: Tuple[RateCardEntry, ...] = tuple(sorted(rate_cards, key=lambda rc: rc.name))
+
+        self._categories_by_id: Dict[int, CategoryEntry] = {cat.id: cat for cat in self.categories}
+        self._categories_by_slug: Dict[str, CategoryEntry] = {cat.slug: cat for cat in self.categories}
+        self._categories_by_name: Dict[str, CategoryEntry] = {}
+        for cat in self.categories:
+            self._categories_by_name.setdefault(cat.name.lower(), cat)
+
+        self._subcategories_by_id: Dict[int, SubcategoryEntry] = {sub.id: sub for sub in self.subcategories}
+        by_category = defaultdict(list)
+        by_slug = defaultdict(list)
+        by_name = defaultdict(list)
+        for sub in self.subcategories:
+            by_category[sub.category_id].append(sub)
+            by_slug[sub.slug].append(sub)
+            by_name[sub.name.lower()].append(sub)
+        self._subcategories_by_category = {key: tuple(value) for key, value in by_category.items()}
+        self._subcategories_by_slug = {key: tuple(value) for key, value in by_slug.items()}
+        self._subcategories_by_name = {key: tuple(value) for key, value in by_name.items()}
+
+        self._rate_cards_by_id: Dict[int, RateCardEntry] = {rc.id: rc for rc in self.rate_cards}
+        by_subcategory = defaultdict(list)
+        for rc in self.rate_cards:
+            by_subcategory[rc.subcategory_id].append(rc)
+        self._rate_cards_by_subcategory = {key: tuple(value) for key, value in by_subcategory.items()}
+
+    # ---------------- Categories ----------------
+
+    def get_category(self, category_id: int) -> Optional[CategoryEntry]:
+        """Active category by id"""
+        return self._categories_by_id.get(category_id)
+
+    def get_category_by_slug(self, slug: str) -> Optional[CategoryEntry]:
+        """Active category by slug"""
+        return self._categories_by_slug.get(slug)
+
+    def get_category_by_name(self, name: str) -> Optional[CategoryEntry]:
+        """Active category by case-insensitive name"""
+        return self._categories_by_name.get(name.lower().strip())
+
+    def search_categories(self, term: str) -> List[CategoryEntry]:
+        """Active categories whose lowercased name contains term (SQL LIKE '%term%')"""
+        term = term.lower()
+        return [cat for cat in self.categories if term in cat.name.lower()]
+
+    # ---------------- Subcategories ----------------
+
+    def get_subcategory(self, subcategory_id: int) -> Optional[SubcategoryEntry]:
+        """Active subcategory by id"""
+        return self._subcategories_by_id.get(subcategory_id)
+
+    def get_subcategories_by_slug(self, slug: str) -> Tuple[SubcategoryEntry, ...]:
+        """Active subcategories with a slug (slugs are unique per category only)"""
+        return self._subcategories_by_slug.get(slug, ())
+
+    def get_subcategories_by_name(self, name: str) -> Tuple[SubcategoryEntry, ...]:
+        """Active subcategories with a case-insensitive name"""
+        return self._subcategories_by_name.get(name.lower().strip(), ())
+
+    def list_subcategories(self, category_id: int) -> Tuple[SubcategoryEntry, ...]:
+        """Active subcategories of a category by (display_order, name)"""
+        return self._subcategories_by_category.get(category_id, ())
+
+    def search_subcategories(self, term: str) -> List[SubcategoryEntry]:
+        """Active subcategories whose lowercased name contains term (SQL LIKE '%term%')"""
+        term = term.lower()
+        return [sub for sub in self.subcategories if term in sub.name.lower()]
+
+    # ---------------- Rate cards ----------------
+
+    def get_rate_card(self, rate_card_id: int) -> Optional[RateCardEntry]:
+        """Active rate card by id"""
+        return self._rate_cards_by_id.get(rate_card_id)
+
+    def list_rate_cards(self, subcategory_id: int) -> Tuple[RateCardEntry, ...]:
+        """Active rate cards of a subcategory by name"""
+        return self._rate_cards_by_subcategory.get(subcategory_id, ())
+
+    def rate_cards_by_price(self, subcategory_id: int) -> List[RateCardEntry]:
+        """Active rate cards of a subcategory, cheapest first"""
+        return sorted(self.list_rate_cards(subcategory_id), key=lambda rc: rc.price)
+
+
+async def load_catalog_snapshot(db, version: int = 0) -> CatalogSnapshot:
+    """
+    Load active catalog rows into a snapshot
+
+    Subcategory and rate card counts include inactive rows, as the
+    outer-join counts in CategoryService did.
+
+    Args:
+        db: Async database session
+        version: Catalog version counter read before loading
+
+    Returns:
+        CatalogSnapshot
+    """
+    from sqlalchemy import select, func
+    from src.core.models import Category, Subcategory, RateCard
+
+    categories = (await db.execute(select(Category).where(Category.is_active == True))).scalars().all()
+    subcategories = (await db.execute(select(Subcategory).where(Subcategory.is_active == True))).scalars().all()
+    rate_cards = (await db.execute(select(RateCard).where(RateCard.is_active == True))).scalars().all()
+    subcategory_counts: Mapping[int, int] = dict((await db.execute(
+        select(Subcategory.category_id, func.count(Subcategory.id)).group_by(Subcategory.category_id)
+    )).all())
+    rate_card_counts: Mapping[int, int] = dict((await db.execute(
+        select(RateCard.subcategory_id, func.count(RateCard.id)).group_by(RateCard.subcategory_id)
+    )).all())
+
+    return CatalogSnapshot(
+        version=version,
+        categories=[
+            CategoryEntry(
+                id=cat.id,
+                name=cat.name,
+                slug=cat.slug,
+                description=cat.description,
+                image=cat.image,
+                display_order=cat.display_order or 0,
+                is_active=cat.is_active,
+                subcategory_count=subcategory_counts.get(cat.id, 0)
+            )
+            for cat in categories
+        ],
+        subcategories=[
+            SubcategoryEntry(
+                id=sub.id,
+                category_id=sub.category_id,
+                name=sub.name,
+                slug=sub.slug,
+                description=sub.description,
+                image=sub.image,
+                display_order=sub.display_order or 0,
+                is_active=sub.is_active,
+                rate_card_count=rate_card_counts.get(sub.id, 0)
+            )
+            for sub in subcategories
+        ],
+        rate_cards=[
+            RateCardEntry(
+                id=rc.id,
+                category_id=rc.category_id,
+                subcategory_id=rc.subcategory_id,
+                provider_id=rc.provider_id,
+                name=rc.name,
+                description=rc.description,
+                price=rc.price,
+                strike_price=rc.strike_price,
+                is_active=rc.is_active
+            )
+            for rc in rate_cards
+        ]
+    )
+
+
+async def read_catalog_version() -> Optional[int]:
+    """
+    Read the shared catalog version counter
+
+    Returns:
+        Counter value (0 if never bumped), or None if Redis is unavailable
+    """
+    from src.core.cache.redis_client import redis_client
+
+    if not redis_client._is_available():
+        return None
+    value = await redis_client.get(CATALOG_VERSION_KEY)
+    return int(value) if value is not None else 0
+
+
+async def bump_catalog_version() -> int:
+    """
+    Signal that catalog rows changed (call after committing catalog writes)
+
+    Every process reloads its snapshot on its next version check.
+
+    Returns:
+        New counter value (0 if Redis is unavailable)
+    """
+    from src.core.cache.redis_client import redis_client
+
+    return await redis_client.incr(CATALOG_VERSION_KEY)
+
+
+class CatalogSnapshotStore:
+    """
+    Holder of the current CatalogSnapshot
+    """
+
+    def __init__(self, version_check_seconds: float = 5, max_age_seconds: float = 3600, session_factory=None):
+        """
+        Initialize store (empty until the first load)
+
+        Args:
+            version_check_seconds: Min interval between reads of the Redis version counter
+            max_age_seconds: Age after which the snapshot is reloaded
+            session_factory: Async session factory for reloads (default: AsyncSessionLocal)
+        """
+        self.version_check_seconds = version_check_seconds
+        self.max_age_seconds = max_age_seconds
+        self._session_factory = session_factory
+        self.snapshot: Optional[CatalogSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def swap(self, snapshot: CatalogSnapshot) -> CatalogSnapshot:
+        """
+        Replace the current snapshot
+
+        Args:
+            snapshot: New snapshot
+
+        Returns:
+            The new snapshot
+        """
+        self.snapshot = snapshot
+        self._checked_at = time.monotonic()
+        logger.info(
+            f"[CatalogSnapshot] v{snapshot.version} loaded: {len(snapshot.categories)} categories, "
+            f"{len(snapshot.subcategories)} subcategories, {len(snapshot.rate_cards)} rate cards"
+        )
+        return snapshot
+
+    async def refresh(self, db=None) -> CatalogSnapshot:
+        """
+        Reload the catalog from the database and swap it in
+
+        Args:
+            db: Async database session (default: a new session)
+
+        Returns:
+            The new snapshot
+        """
+        version = await read_catalog_version() or 0
+        if db is not None:
+            snapshot = await load_catalog_snapshot(db, version)
+        else:
+            if self._session_factory is None:
+                from src.core.database.connection import AsyncSessionLocal
+                self._session_factory = AsyncSessionLocal
+
+            async with self._session_factory() as session:
+                snapshot = await load_catalog_snapshot(session, version)
+        return self.swap(snapshot)
+
+    async def get(self, db=None) -> CatalogSnapshot:
+        """
+        Get the current snapshot, loading it on first use
+
+        When the Redis version counter moved (or the snapshot is older than
+        max_age_seconds) the current snapshot is returned while a background
+        task reloads it.
+
+        Args:
+            db: Async database session used for the first load
+
+        Returns:
+            Current CatalogSnapshot
+        """
+        if self.snapshot is None:
+            async with self._lock:
+                if self.snapshot is None:
+                    await self.refresh(db)
+        elif time.monotonic() - self._checked_at >= self.version_check_seconds:
+            self._checked_at = time.monotonic()
+            if await self._is_outdated():
+                self._schedule_refresh()
+        return self.snapshot
+
+    async def _is_outdated(self) -> bool:
+        # Writes that did not bump the version are picked up by age, with or without Redis
+        if time.monotonic() - self.snapshot.loaded_at >= self.max_age_seconds:
+            return True
+        version = await read_catalog_version()
+        return version is not None and version != self.snapshot.version
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_in_background())
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.error(f"[CatalogSnapshot] Background refresh failed, keeping v{self.snapshot.version}: {e}")
+
+
+_catalog_snapshot_store: Optional[CatalogSnapshotStore] = None
+
+
+def get_catalog_snapshot_store() -> CatalogSnapshotStore:
+    """
+    Get the process-wide catalog snapshot store (singleton pattern)
+
+    Returns:
+        CatalogSnapshotStore instance
+    """
+    global _catalog_snapshot_store
+    if _catalog_snapshot_store is None:
+        from src.core.config import settings
+
+        _catalog_snapshot_store = CatalogSnapshotStore(
+            version_check_seconds=settings.CATALOG_VERSION_CHECK_SECONDS,
+            max_age_seconds=settings.CATALOG_SNAPSHOT_MAX_AGE_SECONDS
+        )
+    return _catalog_snapshot_store
+
+
+async def get_catalog_snapshot(db=None) -> CatalogSnapshot:
+    """
+    Get the current catalog snapshot
+
+    Args:
+        db: Async database session used if the catalog was never loaded
+
+    Returns:
+        CatalogSnapshot
+    """
+    return await get_catalog_snapshot_store().get(db)
@@ -1,19 +1,20 @@
 """
 Category Service
 Business logic for category and subcategory management
+
+Reads come from the shared in-memory CatalogSnapshot instead of per-request queries.
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
 from typing import List
 import logging
 
-from src.core.models import Category, Subcategory, RateCard
 from src.schemas.customer import (
     CategoryResponse,
     SubcategoryResponse,
     RateCardResponse,
 )
+from src.services.catalog_snapshot import CatalogSnapshot, get_catalog_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,9 @@ class CategoryService:
     
     def __init__(self, db: AsyncSession):
         self.db = db
+
+    async def _snapshot(self) -> CatalogSnapshot:
+        return await get_catalog_snapshot(self.db)
     
     async def list_categories(
         self, 
@@ -39,32 +43,19 @@ class CategoryService:
         Returns:
             List of CategoryResponse
         """
-        # Get categories with subcategory count
-        result = await self.db.execute(
-            select(
-                Category,
-                func.count(Subcategory.id).label('subcategory_count')
-            )
-            .outerjoin(Subcategory, Category.id == Subcategory.category_id)
-            .where(Category.is_active == True)
-            .group_by(Category.id)
-            .order_by(Category.display_order, Category.name)
-            .offset(skip)
-            .limit(limit)
-        )
-        categories = result.all()
+        snapshot = await self._snapshot()
         
         return [
             CategoryResponse(
-                id=cat[0].id,
-                name=cat[0].name,
-                slug=cat[0].slug,
-                description=cat[0].description,
-                image=cat[0].image,
-                is_active=cat[0].is_active,
-                subcategory_count=cat[1]
+                id=cat.id,
+                name=cat.name,
+                slug=cat.slug,
+                description=cat.description,
+                image=cat.image,
+                is_active=cat.is_active,
+                subcategory_count=cat.subcategory_count
             )
-            for cat in categories
+            for cat in snapshot.categories[skip:skip + limit]
         ]
     
     async def get_category(self, category_id: int) -> CategoryResponse:
@@ -80,23 +71,11 @@ class CategoryService:
         Raises:
             ValueError: If category not found
         """
-        # Get category with subcategory count
-        result = await self.db.execute(
-            select(
-                Category,
-                func.count(Subcategory.id).label('subcategory_count')
-            )
-            .outerjoin(Subcategory, Category.id == Subcategory.category_id)
-            .where(Category.id == category_id, Category.is_active == True)
-            .group_by(Category.id)
-        )
-        category_data = result.one_or_none()
+        cat = (await self._snapshot()).get_category(category_id)
         
-        if not category_data:
+        if not cat:
             raise ValueError("Category not found")
         
-        cat, count = category_data
-        
         return CategoryResponse(
             id=cat.id,
             name=cat.name,
@@ -104,7 +83,7 @@ class CategoryService:
             description=cat.description,
             image=cat.image,
             is_active=cat.is_active,
-            subcategory_count=count
+            subcategory_count=cat.subcategory_count
         )
     
     async def list_subcategories(
@@ -127,48 +106,24 @@ class CategoryService:
         Raises:
             ValueError: If category not found
         """
-        # Verify category exists
-        category_result = await self.db.execute(
-            select(Category).where(
-                Category.id == category_id,
-                Category.is_active == True
-            )
-        )
-        category = category_result.scalar_one_or_none()
+        snapshot = await self._snapshot()
+        category = snapshot.get_category(category_id)
         
         if not category:
             raise ValueError("Category not found")
         
-        # Get subcategories with rate card count
-        result = await self.db.execute(
-            select(
-                Subcategory,
-                func.count(RateCard.id).label('rate_card_count')
-            )
-            .outerjoin(RateCard, Subcategory.id == RateCard.subcategory_id)
-            .where(
-                Subcategory.category_id == category_id,
-                Subcategory.is_active == True
-            )
-            .group_by(Subcategory.id)
-            .order_by(Subcategory.display_order, Subcategory.name)
-            .offset(skip)
-            .limit(limit)
-        )
-        subcategories = result.all()
-        
         return [
             SubcategoryResponse(
-                id=subcat[0].id,
-                name=subcat[0].name,
-                slug=subcat[0].slug,
-                description=subcat[0].description,
-                category_id=subcat[0].category_id,
+                id=subcat.id,
+                name=subcat.name,
+                slug=subcat.slug,
+                description=subcat.description,
+                category_id=subcat.category_id,
                 category_name=category.name,
-                is_active=subcat[0].is_active,
-                rate_card_count=subcat[1]
+                is_active=subcat.is_active,
+                rate_card_count=subcat.rate_card_count
             )
-            for subcat in subcategories
+            for subcat in snapshot.list_subcategories(category_id)[skip:skip + limit]
         ]
     
     async def list_rate_cards(
@@ -191,31 +146,11 @@ class CategoryService:
         Raises:
             ValueError: If subcategory not found
         """
-        # Verify subcategory exists
-        subcategory_result = await self.db.execute(
-            select(Subcategory).where(
-                Subcategory.id == subcategory_id,
-                Subcategory.is_active == True
-            )
-        )
-        subcategory = subcategory_result.scalar_one_or_none()
+        snapshot = await self._snapshot()
         
-        if not subcategory:
+        if not snapshot.get_subcategory(subcategory_id):
             raise ValueError("Subcategory not found")
         
-        # Get rate cards
-        result = await self.db.execute(
-            select(RateCard)
-            .where(
-                RateCard.subcategory_id == subcategory_id,
-                RateCard.is_active == True
-            )
-            .order_by(RateCard.name)
-            .offset(skip)
-            .limit(limit)
-        )
-        rate_cards = result.scalars().all()
-        
         return [
             RateCardResponse(
                 id=rc.id,
@@ -226,7 +161,7 @@ class CategoryService:
                 subcategory_id=rc.subcategory_id,
                 is_active=rc.is_active
             )
-            for rc in rate_cards
+            for rc in snapshot.list_rate_cards(subcategory_id)[skip:skip + limit]
         ]
 
 
@@ -6,10 +6,13 @@ Business logic for chat operations
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
 from datetime import datetime, timezone
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, AsyncIterator, Set
+import asyncio
 import uuid
 import logging
 
+from src.core.database.id_allocator import get_id_allocator
+from src.core.database.write_behind import get_write_behind_queue
 from src.core.models import Conversation, User
 from src.core.models.conversation import MessageRole, Channel
 from src.schemas.chat import (
@@ -23,9 +26,18 @@ from src.schemas.chat import (
 # Import guardrails
 from src.guardrails.core.guardrail_factory import create_guardrail_manager
 from src.guardrails.core.guardrail_result import Action
+from src.llm.context.conversation_cache import get_conversation_context_cache
+from src.llm.context.history_compactor import get_history_compactor
+from src.nlp.llm.retry import llm_retry_budget
+from src.services.dialog_state_manager import DIALOG_STATE_NOT_LOADED, DialogStateManager
+from src.utils.stage_graph import StageGraph
+from src.utils.stream_events import StreamEventChannel, format_sse, stream_events
 
 logger = logging.getLogger(__name__)
 
+# Streaming turns that outlive a disconnected client (kept referenced until done)
+_background_turns: Set[asyncio.Task] = set()
+
 # Global guardrail manager (singleton)
 _guardrail_manager = None
 
@@ -39,6 +51,79 @@ def get_guardrail_manager():
     return _guardrail_manager
 
 
+async def stream_chat_message(user_id: int, request: ChatMessageRequest) -> AsyncIterator[str]:
+    """
+    Run a chat turn and stream its progress as Server-Sent Events
+
+    The turn runs ChatService.send_message unchanged in its own task and
+    database session, so guardrails and the persisted Conversation rows are
+    identical to the non-streaming endpoint. Tokens of the answer are sent a
+    sentence at a time, each only after the output guardrails passed it
+    unchanged; streaming stops at the first sentence they would block or
+    sanitize. If the client disconnects the turn still completes and is
+    persisted.
+
+    Events:
+        session: {"session_id"} - sent immediately
+        classified: {"intent", "confidence", "method", "all_intents"}
+        agent_selected: {"agent", "intent"}
+        token: {"text"} - sentences of the answer that passed the output guardrails
+        replace: {"text"} - final text differs from the streamed tokens
+            (output guardrails changed it or the agent post-processed it)
+        done: ChatMessageResponse
+        error: {"detail", "status_code"}
+
+    Args:
+        user_id: Current user ID
+        request: Chat message request
+
+    Yields:
+        SSE frames
+    """
+    from src.core.database.connection import AsyncSessionLocal
+
+    # Fix the session ID up front so the client gets it before any work is done
+    request = request.model_copy(update={"session_id": request.session_id or f"session_{uuid.uuid4().hex[:16]}"})
+
+    async def passes_output_guardrails(text: str) -> bool:
+        report = await get_guardrail_manager().check_output(
+            text=text,
+            user_id=user_id,
+            context={"session_id": request.session_id, "channel": request.channel}
+        )
+        return not report.is_blocked and report.final_action != Action.SANITIZE
+
+    channel = StreamEventChannel(output_check=passes_output_guardrails)
+
+    async def run_turn() -> None:
+        with stream_events(channel):
+            try:
+                async with AsyncSessionLocal() as db:
+                    user = await db.get(User, user_id)
+                    result = await ChatService(db).send_message(user, request)
+
+                final_text = result.assistant_message.message
+                if channel.streamed_text and channel.streamed_text != final_text:
+                    channel.emit("replace", {"text": final_text})
+                channel.emit("done", result.model_dump(mode="json"))
+            except ValueError as e:
+                logger.warning(f"[ChatService] Streaming chat turn rejected: {e}")
+                channel.emit("error", {"detail": str(e), "status_code": 400})
+            except Exception as e:
+                logger.error(f"[ChatService] Streaming chat turn failed: {e}", exc_info=True)
+                channel.emit("error", {"detail": "Failed to process message", "status_code": 500})
+            finally:
+                channel.close()
+
+    task = asyncio.create_task(run_turn())
+    _background_turns.add(task)
+    task.add_done_callback(_background_turns.discard)
+
+    yield format_sse("session", {"session_id": request.session_id})
+    async for event, data in channel:
+        yield format_sse(event, data)
+
+
 class ChatService:
     """Service class for chat business logic"""
     
@@ -76,63 +161,75 @@ class ChatService:
         # 1. Get or create session
         session_id = request.session_id or self._generate_session_id()
 
-        # 2. Run input guardrails
+        # 2. Start the turn's stages: input guardrails, loading the session's
+        # context and building the coordinator run concurrently. History and
+        # dialog state both read through self.db, so they run one after the
+        # other; the user message is stored once both are loaded.
+        #
+        #   input_guardrails ─────────────────────────┐
+        #   history ──> dialog_state ──> user_message ─┼─> AI response
+        #   coordinator ───────────────────────────────┘
+        #
+        # (all LLM retries in this turn share one retry budget)
         guardrail_manager = get_guardrail_manager()
-        input_report = await guardrail_manager.check_input(
-            text=request.message,
-            user_id=user.id,
-            context={"session_id": session_id, "channel": request.channel}
-        )
-
-        # 3. Handle input guardrail violations
-        if input_report.is_blocked:
-            # Store user message (original)
-            user_message = await self._store_message(
-                user_id=user.id,
-                session_id=session_id,
-                role=MessageRole.USER,
-                message=request.message,
-                channel=Channel(request.channel)
-            )
-
-            # Store blocked response
-            ai_message = await self._store_message(
-                user_id=user.id,
-                session_id=session_id,
-                role=MessageRole.ASSISTANT,
-                message=input_report.final_text or "I'm sorry, but I can't process that message.",
-                channel=Channel(request.channel),
-                response_time_ms=int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000),
-                agent_calls={"guardrail_blocked": True, "violations": [r.message for r in input_report.results if not r.passed]}
-            )
-
-            return ChatMessageResponse(
-                session_id=session_id,
-                user_message=self._to_message_response(user_message),
-                assistant_message=self._to_message_response(ai_message),
-                response_time_ms=int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000),
-                metadata={"guardrail_blocked": True, "input_violations": [r.message for r in input_report.results if not r.passed]}
-            )
-
-        # 4. Use sanitized text if available
-        processed_message = input_report.final_text or request.message
-
-        # 5. Store user message (sanitized if needed)
-        user_message = await self._store_message(
-            user_id=user.id,
-            session_id=session_id,
-            role=MessageRole.USER,
-            message=processed_message,
-            channel=Channel(request.channel)
-        )
-
-        # 6. Get AI response with metadata from slot-filling system
-        ai_response_text, metadata = await self._get_ai_response(
-            user_message=processed_message,
-            session_id=session_id,
-            user=user,
-            channel=request.channel
-        )
+        with llm_retry_budget():
+            stages = self._build_turn_stages(user, request, session_id, guardrail_manager)
+            stages.start()
+
+            try:
+                input_report = await stages.result("input_guardrails")
+
+                # 3. Handle input guardrail violations
+                if input_report.is_blocked:
+                    # The context was loaded speculatively; a blocked message never needs it
+                    await self._cancel_turn_stages(stages)
+
+                    # Store user message (original)
+                    user_message = await self._store_message(
+                        user_id=user.id,
+                        session_id=session_id,
+                        role=MessageRole.USER,
+                        message=request.message,
+                        channel=Channel(request.channel)
+                    )
+
+                    # Store blocked response
+                    ai_message = await self._store_message(
+                        user_id=user.id,
+                        session_id=session_id,
+                        role=MessageRole.ASSISTANT,
+                        message=input_report.final_text or "I'm sorry, but I can't process that message.",
+                        channel=Channel(request.channel),
+                        response_time_ms=int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000),
+                        agent_calls={"guardrail_blocked": True, "violations": [r.message for r in input_report.results if not r.passed]}
+                    )
+
+                    return ChatMessageResponse(
+                        session_id=session_id,
+                        user_message=self._to_message_response(user_message),
+                        assistant_message=self._to_message_response(ai_message),
+                        response_time_ms=int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000),
+                        metadata={"guardrail_blocked": True, "input_violations": [r.message for r in input_report.results if not r.passed]}
+                    )
+
+                # 4. Use sanitized text if available
+                processed_message = input_report.final_text or request.message
+
+                # 5. User message (sanitized if needed) is stored by its stage
+                user_message = await stages.result("user_message")
+
+                # 6. Get AI response with metadata from slot-filling system
+                ai_response_text, metadata = await self._get_ai_response(
+                    user_message=processed_message,
+                    session_id=session_id,
+                    user=user,
+                    stages=stages,
+                    channel=request.channel
+                )
+            except BaseException:
+                # Don't leave stages running (or holding self.db) after a failed turn
+                await self._cancel_turn_stages(stages)
+                raise
 
         # 7. Run output guardrails
         output_report = await guardrail_manager.check_output(
@@ -154,6 +251,7 @@ class ChatService:
 
         # 9. Calculate response time
         response_time_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
+        metadata["stage_timings_ms"] = dict(stages.timings_ms)
 
         # 10. Store AI response with metadata
         ai_message = await self._store_message(
@@ -172,6 +270,7 @@ class ChatService:
         logger.info(f"[ChatService] Message processed successfully: session={session_id}, response_time={response_time_ms}ms")
         logger.info(f"[ChatService] Input guardrails latency: {input_report.total_latency_ms:.2f}ms")
         logger.info(f"[ChatService] Output guardrails latency: {output_report.total_latency_ms:.2f}ms")
+        logger.debug(f"[ChatService] Stage timings: {stages.timings_ms}")
 
         return ChatMessageResponse(
             session_id=session_id,
@@ -180,12 +279,100 @@ class ChatService:
             response_time_ms=response_time_ms,
             metadata=metadata  # Include full metadata in response
         )
-    
+
+    def _build_turn_stages(
+        self,
+        user: User,
+        request: ChatMessageRequest,
+        session_id: str,
+        guardrail_manager
+    ) -> StageGraph:
+        """
+        Build the stage DAG of a chat turn (see send_message)
+
+        The context stages never raise: a failed history load yields no history
+        and a failed dialog-state load leaves it to the coordinator, so the user
+        message is always stored.
+
+        Args:
+            user: Current user
+            request: Chat message request
+            session_id: Session ID
+            guardrail_manager: Guardrail manager for the input checks
+
+        Returns:
+            StageGraph with stages input_guardrails, history, dialog_state,
+            user_message and coordinator (not started)
+        """
+        user_id = user.id
+
+        async def input_guardrails():
+            return await guardrail_manager.check_input(
+                text=request.message,
+                user_id=user_id,
+                context={"session_id": session_id, "channel": request.channel}
+            )
+
+        async def history():
+            conversation_history = await self._get_conversation_history(user_id, session_id)
+            logger.debug(f"[ChatService] Retrieved {len(conversation_history)} previous messages")
+
+            # Fold older turns into the session's rolling summary and cap history tokens
+            compactor = get_history_compactor()
+            if compactor is not None and conversation_history:
+                try:
+                    conversation_history = await compactor.compact_session(session_id, conversation_history)
+                except Exception as e:
+                    logger.error(f"[ChatService] History compaction failed, using recent messages: {e}")
+            return conversation_history
+
+        async def dialog_state(history):
+            try:
+                return await DialogStateManager(self.db).get_active_state(session_id)
+            except Exception as e:
+                logger.error(f"[ChatService] Error prefetching dialog state: {e}")
+                await self.db.rollback()
+                return DIALOG_STATE_NOT_LOADED
+
+        async def user_message(input_guardrails, history, dialog_state):
+            if input_guardrails.is_blocked:
+                return None  # the blocked path stores the original message itself
+
+            return await self._store_message(
+                user_id=user_id,
+                session_id=session_id,
+                role=MessageRole.USER,
+                message=input_guardrails.final_text or request.message,
+                channel=Channel(request.channel)
+            )
+
+        async def coordinator():
+            from src.core.services import get_coordinator_agent
+            return await get_coordinator_agent(db=self.db)
+
+        stages = StageGraph()
+        stages.add("input_guardrails", input_guardrails)
+        stages.add("history", history)
+        stages.add("dialog_state", dialog_state, after=["history"])
+        stages.add("user_message", user_message, after=["input_guardrails", "history", "dialog_state"])
+        stages.add("coordinator", coordinator)
+        return stages
+
+    async def _cancel_turn_stages(self, stages: StageGraph) -> None:
+        """Cancel the speculative stages of a blocked or failed turn"""
+        cancelled = await stages.cancel(["history", "dialog_state", "user_message", "coordinator"])
+        if cancelled:
+            logger.debug(f"[ChatService] Cancelled speculative stages: {cancelled}")
+        if "history" in cancelled or "dialog_state" in cancelled:
+            # A query may have been interrupted mid-flight
+            await self.db.rollback()
+
     async def _get_ai_response(
         self,
         user_message: str,
         session_id: str,
         user: User,
+        stages: StageGraph,
         channel: str = "web"
     ) -> tuple[str, dict]:
         """
@@ -202,6 +389,8 @@ class ChatService:
             user_message: User's message
             session_id: Session ID
             user: User object
+            stages: The turn's started stages (see _build_turn_stages), whose history,
+                dialog state, user message and coordinator are used
             channel: Communication channel (web, mobile, whatsapp)
 
         Returns:
@@ -219,27 +408,29 @@ class ChatService:
         logger.debug(f"[ChatService] Message: {user_message[:100]}...")
 
         try:
-            # Import cached coordinator getter
-            from src.core.services import get_coordinator_agent
-
-            # 1. Get conversation history for context
-            conversation_history = await self._get_conversation_history(user.id, session_id)
-            logger.debug(f"[ChatService] Retrieved {len(conversation_history)} previous messages")
-
-            # 2. Get cached CoordinatorAgent (singleton)
-            logger.debug("[ChatService] Getting CoordinatorAgent from cache...")
-            coordinator = await get_coordinator_agent(db=self.db)
-
-            # 3. Execute coordinator with message and context
+            # 1. Conversation history, dialog state and the CoordinatorAgent
+            # (loaded concurrently with the input guardrails)
+            conversation_history = await stages.result("history")
+            dialog_state = await stages.result("dialog_state")
+            coordinator = await stages.result("coordinator")
+
+            # The history was loaded before the current message was stored
+            stored = await stages.result("user_message")
+            conversation_history = conversation_history + [
+                {"id": stored.id, "role": MessageRole.USER.value, "content": stored.message}
+            ]
+
+            # 2. Execute coordinator with message and context
             logger.debug("[ChatService] Executing CoordinatorAgent...")
             result = await coordinator.execute(
                 message=user_message,
                 user=user,
                 session_id=session_id,
-                conversation_history=conversation_history
+                conversation_history=conversation_history,
+                dialog_state=dialog_state
             )
 
-            # 4. Extract metadata
+            # 3. Extract metadata
             metadata = {
                 "intent": result.get("intent"),
                 "intent_confidence": result.get("confidence"),
@@ -292,7 +483,24 @@ class ChatService:
             List of conversation messages in format [{"role": "user", "content": "..."}, ...]
         """
         try:
-            # Get recent messages from this session
+            # Recent messages are cached per session; the history query runs only on a miss
+            # (in-process buffers still read the newest message id, see ConversationContextCache)
+            cache = get_conversation_context_cache()
+            if cache is not None:
+                history = await cache.get(
+                    user_id,
+                    session_id,
+                    latest_id=lambda: self._get_latest_message_id(user_id, session_id)
+                )
+                if history is not None:
+                    logger.debug(f"[ChatService] Retrieved {len(history)} cached messages for context")
+                    return history[-limit:]
+
+            # Get recent messages from this session (including not yet flushed ones)
+            queue = get_write_behind_queue()
+            if queue is not None:
+                await queue.flush_if_pending(Conversation, session_id=session_id)
+
             query = (
                 select(Conversation)
                 .where(
@@ -309,10 +517,14 @@ class ChatService:
             history = []
             for msg in reversed(messages):
                 history.append({
+                    "id": msg.id,  # lets the history compactor fold each message once
                     "role": msg.role.value,  # "user" or "assistant"
                     "content": msg.message
                 })
 
+            if cache is not None:
+                await cache.seed(user_id, session_id, history)
+
             logger.debug(f"[ChatService] Retrieved {len(history)} messages for context")
             return history
 
@@ -320,6 +532,28 @@ class ChatService:
             logger.error(f"[ChatService] Error retrieving conversation history: {e}")
             return []  # Return empty list on error
 
+    async def _get_latest_message_id(self, user_id: int, session_id: str) -> Optional[int]:
+        """
+        Get the id of a session's newest stored message
+
+        Args:
+            user_id: User ID
+            session_id: Session ID
+
+        Returns:
+            Message ID, or None if the session has no stored messages
+        """
+        query = (
+            select(Conversation.id)
+            .where(
+                Conversation.user_id == user_id,
+                Conversation.session_id == session_id
+            )
+            .order_by(Conversation.created_at.desc(), Conversation.id.desc())
+            .limit(1)
+        )
+        return await self.db.scalar(query)
+
     def _get_fallback_response(self, user: User, user_message: str) -> str:
         """
         Get fallback response when CoordinatorAgent fails
@@ -400,9 +634,22 @@ class ChatService:
             relevancy_score=relevancy_score
         )
         
-        self.db.add(conversation)
-        await self.db.commit()
-        await self.db.refresh(conversation)
+        # Conversation ids always come from the allocator, so no AUTO_INCREMENT id
+        # lands in a block another process reserved; inserted write-behind when enabled
+        conversation.id = await get_id_allocator().allocate(Conversation)
+        queue = get_write_behind_queue()
+        if queue is not None:
+            queue.add(conversation)
+        else:
+            self.db.add(conversation)
+            await self.db.commit()
+            await self.db.refresh(conversation)
+
+        cache = get_conversation_context_cache()
+        if cache is not None:
+            await cache.append(user_id, session_id, [
+                {"id": conversation.id, "role": role.value, "content": message}
+            ])
         
         logger.info(f"Stored message: session={session_id}, role={role.value}, id={conversation.id}")
         return conversation
@@ -426,6 +673,10 @@ class ChatService:
         Returns:
             ChatHistoryResponse with messages
         """
+        queue = get_write_behind_queue()
+        if queue is not None:
+            await queue.flush_if_pending(Conversation, session_id=session_id)
+
         # Get messages
         query = (
             select(Conversation)
@@ -465,6 +716,10 @@ class ChatService:
         Returns:
             List of SessionResponse objects
         """
+        queue = get_write_behind_queue()
+        if queue is not None:
+            await queue.flush_if_pending(Conversation, user_id=user.id)
+
         query = (
             select(
                 Conversation.session_id,
@@ -505,6 +760,11 @@ class ChatService:
         """
         from sqlalchemy import delete as sql_delete
 
+        # Queued messages would otherwise be inserted after the delete
+        queue = get_write_behind_queue()
+        if queue is not None:
+            await queue.flush_if_pending(Conversation, session_id=session_id)
+
         # Check if session exists and belongs to user
         check_query = select(func.count(Conversation.id)).where(
             Conversation.user_id == user.id,
@@ -523,6 +783,10 @@ class ChatService:
         await self.db.execute(delete_query)
         await self.db.commit()
 
+        cache = get_conversation_context_cache()
+        if cache is not None:
+            await cache.invalidate(user.id, session_id)
+
         logger.info(f"Deleted session {session_id} for user {user.id} ({count} messages)")
 
     
@@ -24,6 +24,9 @@ from src.schemas.dialog_state import (
 
 logger = logging.getLogger(__name__)
 
+# Passed instead of a dialog state that the caller has not loaded (None means "no active state")
+DIALOG_STATE_NOT_LOADED = object()
+
 
 class DialogStateManager:
     """
@@ -6,6 +6,7 @@ Extracts entity values from follow-up responses using pattern matching + LLM fal
 Approach:
 - Pattern matching (regex/rule-based) first for common cases (fast path)
 - LLM fallback when confidence is low or patterns fail
+- Multi-entity messages: all pattern misses share a single LLM call
 - Context-aware extraction using conversation history
 - Service name resolution for booking intents
 
@@ -39,6 +40,48 @@ class EntityExtractionResult(BaseModel):
     metadata: Optional[Dict[str, Any]] = None  # Additional metadata (e.g., resolved service info)
 
 
+class ExtractionOutput(BaseModel):
+    """Structured LLM output for single-entity extraction"""
+    entity_value: str
+    confidence: float
+    normalized_value: Optional[str] = None
+
+
+class SlotExtractionOutput(BaseModel):
+    """One slot in a multi-slot extraction"""
+    entity_type: str
+    entity_value: str
+    confidence: float
+    normalized_value: Optional[str] = None
+
+
+class MultiExtractionOutput(BaseModel):
+    """Structured LLM output for multi-slot extraction (one entry per requested slot)"""
+    slots: List[SlotExtractionOutput]
+
+
+# Extra prompt rules when a location is being extracted
+LOCATION_INSTRUCTIONS = """
+**IMPORTANT for Location Extraction:**
+- ONLY extract if the message contains a CLEAR location indicator:
+  * A 6-digit pincode (e.g., "400001", "110001")
+  * A city name (e.g., "Mumbai", "Delhi", "Bangalore")
+  * A specific area/locality name
+- DO NOT extract if the message:
+  * Is a general statement (e.g., "I want to book a service")
+  * Contains service types or actions (e.g., "AC repair service")
+  * Is asking a question
+  * Does not mention any location
+- If NO clear location is found, set confidence to 0.0 and entity_value to "NOT_FOUND"
+"""
+
+# Minimum pattern confidence accepted without asking the LLM
+PATTERN_CONFIDENCE_THRESHOLD = 0.7
+
+# Minimum LLM confidence for an extracted value to be used
+LLM_CONFIDENCE_THRESHOLD = 0.5
+
+
 class EntityExtractor:
     """
     Extracts entity values from follow-up responses
@@ -73,15 +116,21 @@ class EntityExtractor:
         self,
         message: str,
         expected_entities: List[EntityType],
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        batched: bool = True
     ) -> Dict[str, EntityExtractionResult]:
         """
         Extract multiple entities from a single message
 
+        In batched mode every pattern extractor runs first and all slots they
+        miss are extracted with at most one LLM call; otherwise each entity
+        goes through extract_from_follow_up (one LLM call per miss).
+
         Args:
             message: User's message
             expected_entities: List of entity types we're expecting
             context: Conversation context
+            batched: Extract all pattern misses in a single LLM call
 
         Returns:
             Dict mapping entity type to EntityExtractionResult
@@ -101,15 +150,58 @@ class EntityExtractor:
                 # Remove date and time from expected entities since we found them
                 expected_entities = [e for e in expected_entities if e not in [EntityType.DATE, EntityType.TIME]]
 
-        # Try to extract remaining entity types
+        if not batched:
+            # Try to extract remaining entity types
+            for entity_type in expected_entities:
+                if entity_type.value not in results:  # Don't re-extract already found entities
+                    result = await self.extract_from_follow_up(message, entity_type, context)
+                    if result:
+                        results[entity_type.value] = result
+                        logger.info(f"[EntityExtractor] Successfully extracted {entity_type.value}: {result.entity_value}")
+            return results
+
+        # Pattern pass over every remaining entity type
+        low_confidence: Dict[str, EntityExtractionResult] = {}
+        missing: List[EntityType] = []
         for entity_type in expected_entities:
-            if entity_type.value not in results:  # Don't re-extract already found entities
-                result = await self.extract_from_follow_up(message, entity_type, context)
-                if result:
-                    results[entity_type.value] = result
-                    logger.info(f"[EntityExtractor] Successfully extracted {entity_type.value}: {result.entity_value}")
+            if entity_type.value in results:  # Don't re-extract already found entities
+                continue
+            pattern_result = await self._extract_with_patterns(message, entity_type, context)
+            if pattern_result and pattern_result.confidence >= PATTERN_CONFIDENCE_THRESHOLD:
+                results[entity_type.value] = pattern_result
+                logger.info(f"[EntityExtractor] Pattern match successful: {entity_type.value}={pattern_result.entity_value}")
+                continue
+            if pattern_result:
+                low_confidence[entity_type.value] = pattern_result
+            missing.append(entity_type)
+
+        # One LLM call for everything the patterns missed
+        llm_results: Dict[str, EntityExtractionResult] = {}
+        if missing and self.llm_client:
+            if len(missing) == 1:
+                llm_result = await self._extract_with_llm(message, missing[0], context)
+                if llm_result:
+                    llm_results[missing[0].value] = llm_result
+            else:
+                llm_results = await self._extract_many_with_llm(message, missing, context)
 
-        return results
+        for entity_type in missing:
+            llm_result = llm_results.get(entity_type.value)
+            if llm_result:
+                # Same as extract_from_follow_up: an LLM miss overrides the pattern guess
+                if llm_result.entity_value == "NOT_FOUND" or llm_result.confidence < LLM_CONFIDENCE_THRESHOLD:
+                    logger.info(f"[EntityExtractor] LLM could not extract {entity_type.value} (confidence: {llm_result.confidence})")
+                    continue
+                results[entity_type.value] = llm_result
+                logger.info(f"[EntityExtractor] LLM extraction successful: {entity_type.value}={llm_result.entity_value} (confidence: {llm_result.confidence})")
+            elif entity_type.value in low_confidence:
+                # No LLM answer for this slot: return pattern result even if low confidence
+                results[entity_type.value] = low_confidence[entity_type.value]
+                logger.warning(f"[EntityExtractor] Returning low-confidence pattern result for {entity_type.value}")
+
+        # Keep the order callers expect: combined date/time first, then expected order
+        order = [entity_type.value for entity_type in expected_entities]
+        return dict(sorted(results.items(), key=lambda item: order.index(item[0]) if item[0] in order else -1))
 
     async def extract_from_follow_up(
         self,
@@ -132,7 +224,7 @@ class EntityExtractor:
 
         # Try pattern-based extraction first (fast path)
         pattern_result = await self._extract_with_patterns(message, expected_entity, context)
-        if pattern_result and pattern_result.confidence >= 0.7:
+        if pattern_result and pattern_result.confidence >= PATTERN_CONFIDENCE_THRESHOLD:
             logger.info(f"[EntityExtractor] Pattern match successful: {pattern_result.entity_value} (confidence: {pattern_result.confidence})")
             return pattern_result
         
@@ -141,7 +233,7 @@ class EntityExtractor:
             llm_result = await self._extract_with_llm(message, expected_entity, context)
             if llm_result:
                 # Check if LLM returned "NOT_FOUND" or very low confidence
-                if llm_result.entity_value == "NOT_FOUND" or llm_result.confidence < 0.5:
+                if llm_result.entity_value == "NOT_FOUND" or llm_result.confidence < LLM_CONFIDENCE_THRESHOLD:
                     logger.info(f"[EntityExtractor] LLM could not extract {expected_entity.value} (confidence: {llm_result.confidence})")
                     return None
                 logger.info(f"[EntityExtractor] LLM extraction successful: {llm_result.entity_value} (confidence: {llm_result.confidence})")
@@ -199,6 +291,44 @@ class EntityExtractor:
         """
         Try to extract entity using regex patterns (fast path)
         """
+        # Service type - try service name resolution first (handles specific service names + typos)
+        if expected_entity == EntityType.SERVICE_TYPE:
+            logger.info(f"[EntityExtractor] SERVICE_TYPE extraction - service_resolver: {self.service_resolver is not None}")
+            if self.service_resolver:
+                cleaned_message = self._clean_conversational_prefixes(message)
+                logger.info(f"[EntityExtractor] Attempting service name resolution for: '{cleaned_message}'")
+                service_name_result = await self._extract_service_name(cleaned_message, context)
+                logger.info(f"[EntityExtractor] Service name resolution result: {service_name_result}")
+                if service_name_result and service_name_result.confidence >= 0.7:
+                    logger.info(f"[EntityExtractor] Service name resolved: {service_name_result.entity_value}")
+                    return service_name_result
+                else:
+                    logger.info(f"[EntityExtractor] Service name resolution failed or low confidence")
+            else:
+                logger.warning(f"[EntityExtractor] service_resolver is None, skipping service name resolution")
+
+            # Fall back to traditional service_type extraction
+            logger.info(f"[EntityExtractor] Falling back to traditional service_type extraction")
+
+        return self.extract_with_patterns(message, expected_entity, context)
+
+    def extract_with_patterns(
+        self,
+        message: str,
+        expected_entity: EntityType,
+        context: Dict[str, Any]
+    ) -> Optional[EntityExtractionResult]:
+        """
+        Extract entity using regex patterns only (no service name resolution)
+
+        Args:
+            message: User's message
+            expected_entity: Entity type to extract
+            context: Conversation context
+
+        Returns:
+            EntityExtractionResult or None if no pattern matched
+        """
         message_lower = message.lower().strip()
 
         # Clean conversational prefixes for better entity extraction
@@ -226,22 +356,6 @@ class EntityExtractor:
 
         # Service type patterns - use cleaned message for better extraction
         if expected_entity == EntityType.SERVICE_TYPE:
-            # NEW: Try service name resolution first (handles specific service names + typos)
-            logger.info(f"[EntityExtractor] SERVICE_TYPE extraction - service_resolver: {self.service_resolver is not None}")
-            if self.service_resolver:
-                logger.info(f"[EntityExtractor] Attempting service name resolution for: '{cleaned_message}'")
-                service_name_result = await self._extract_service_name(cleaned_message, context)
-                logger.info(f"[EntityExtractor] Service name resolution result: {service_name_result}")
-                if service_name_result and service_name_result.confidence >= 0.7:
-                    logger.info(f"[EntityExtractor] Service name resolved: {service_name_result.entity_value}")
-                    return service_name_result
-                else:
-                    logger.info(f"[EntityExtractor] Service name resolution failed or low confidence")
-            else:
-                logger.warning(f"[EntityExtractor] service_resolver is None, skipping service name resolution")
-
-            # Fall back to traditional service_type extraction
-            logger.info(f"[EntityExtractor] Falling back to traditional service_type extraction")
             return self._extract_service_type(cleaned_message)
 
         # Service subcategory patterns - use cleaned message for better extraction
@@ -428,92 +542,11 @@ class EntityExtractor:
 
     def _extract_date(self, message: str, message_lower: str) -> Optional[EntityExtractionResult]:
         """Extract date using centralized normalizer"""
-        from src.utils.entity_normalizer import normalize_date
-
-        # Try to extract raw date value
-        raw_value = None
-        confidence = 0.0
-
-        # Relative dates - word boundary matches
-        if re.search(r'\b(today|now)\b', message_lower):
-            match = re.search(r'\b(today|now)\b', message_lower)
-            raw_value = match.group(0)
-            confidence = 0.95
-        elif re.search(r'\b(tomorrow|tmrw|tmr)\b', message_lower):
-            match = re.search(r'\b(tomorrow|tmrw|tmr)\b', message_lower)
-            raw_value = match.group(0)
-            confidence = 0.95
-        elif "day after tomorrow" in message_lower or "overmorrow" in message_lower:
-            if "day after tomorrow" in message_lower:
-                raw_value = "day after tomorrow"
-            else:
-                raw_value = "overmorrow"
-            confidence = 0.9
-        elif "next week" in message_lower:
-            raw_value = "next week"
-            confidence = 0.8
-        elif "next month" in message_lower:
-            raw_value = "next month"
-            confidence = 0.8
-        # "in X days" or "after X days" patterns
-        elif re.search(r'(?:in|after)\s+\d+\s+days?', message_lower):
-            match = re.search(r'(?:in|after)\s+\d+\s+days?', message_lower)
-            raw_value = match.group(0)
-            confidence = 0.9
-        # "in X weeks" or "after X weeks" patterns
-        elif re.search(r'(?:in|after)\s+\d+\s+weeks?', message_lower):
-            match = re.search(r'(?:in|after)\s+\d+\s+weeks?', message_lower)
-            raw_value = match.group(0)
-            confidence = 0.9
-        # Weekday names: "monday", "next monday", "this friday"
-        elif re.search(r'\b(?:next\s+|this\s+)?(monday|tuesday|wednesday|thursday|friday|saturday|sunday|mon|tue|wed|thu|fri|sat|sun)\b', message_lower):
-            match = re.search(r'\b(?:next\s+|this\s+)?(monday|tuesday|wednesday|thursday|friday|saturday|sunday|mon|tue|wed|thu|fri|sat|sun)\b', message_lower)
-            raw_value = match.group(0)
-            confidence = 0.9
-        else:
-            # Natural date formats with year: "December 15th, 2025", "15th Dec, 2025"
-            natural_date_with_year_patterns = [
-                r'(\d{1,2})(st|nd|rd|th)?\s+(january|february|march|april|may|june|july|august|september|october|november|december),?\s+\d{4}',
-                r'(\d{1,2})(st|nd|rd|th)?\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),?\s+\d{4}',
-                r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{1,2})(st|nd|rd|th)?,?\s+\d{4}',
-                r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{1,2})(st|nd|rd|th)?,?\s+\d{4}'
-            ]
-
-            for pattern in natural_date_with_year_patterns:
-                date_match = re.search(pattern, message_lower)
-                if date_match:
-                    raw_value = date_match.group(0)
-                    confidence = 0.95
-                    break
-
-            if not raw_value:
-                # Natural date formats without year: "31st October", "October 31st", "31 Oct"
-                natural_date_patterns = [
-                    r'(\d{1,2})(st|nd|rd|th)?\s+(january|february|march|april|may|june|july|august|september|october|november|december)',
-                    r'(\d{1,2})(st|nd|rd|th)?\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',
-                    r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{1,2})(st|nd|rd|th)?',
-                    r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{1,2})(st|nd|rd|th)?'
-                ]
-
-                for pattern in natural_date_patterns:
-                    date_match = re.search(pattern, message_lower)
-                    if date_match:
-                        raw_value = date_match.group(0)
-                        confidence = 0.9
-                        break
-
-            if not raw_value:
-                # ISO format (YYYY-MM-DD)
-                date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', message)
-                if date_match:
-                    raw_value = date_match.group(0)
-                    confidence = 0.95
-                # DD/MM/YYYY or MM/DD/YYYY or DD-MM-YYYY or MM-DD-YYYY format
-                else:
-                    date_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', message)
-                    if date_match:
-                        raw_value = date_match.group(0)
-                        confidence = 0.9
+        from src.utils.entity_normalizer import normalize_date, scan_date_time
+
+        # Raw date span from the shared date/time scan
+        scan = scan_date_time(message)
+        raw_value = scan.date
 
         if raw_value:
             # Use centralized normalizer
@@ -523,7 +556,7 @@ class EntityExtractor:
                 return EntityExtractionResult(
                     entity_type=EntityType.DATE.value,
                     entity_value=raw_value,
-                    confidence=confidence,
+                    confidence=scan.date_confidence,
                     normalized_value=normalized,
                     extraction_method="pattern"
                 )
@@ -540,98 +573,51 @@ class EntityExtractor:
         Returns:
             Dict with 'date' and 'time' EntityExtractionResult or None
         """
-        from src.utils.entity_normalizer import normalize_date, normalize_time
+        from src.utils.entity_normalizer import normalize_date, normalize_time, scan_date_time
 
-        message_lower = message.lower().strip()
         logger.info(f"[EntityExtractor] Trying to extract combined date-time from: '{message}'")
 
-        # Combined patterns for date + time
-        combined_patterns = [
-            # "tomorrow 4pm", "today 3pm"
-            r'(today|tomorrow|tmrw|tmr)\s+(\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.))',
-            # "tomorrow at 4pm", "today at 3:30pm"
-            r'(today|tomorrow|tmrw|tmr)\s+at\s+(\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.))',
-            # "in 3 days at 2pm", "after 5 days at 3pm"
-            r'((?:in|after)\s+\d+\s+days?)\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.))',
-            # "December 15th, 2025 at 2pm", "15th Dec, 2025 at 3pm"
-            r'(\d{1,2}(?:st|nd|rd|th)?\s+(?:january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec),?\s+\d{4})\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.))',
-            # "31st October 4pm", "December 25th at 2pm"
-            r'(\d{1,2}(?:st|nd|rd|th)?\s+(?:january|february|march|april|may|june|july|august|september|october|november|december|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec))\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.))',
-            # "Monday 4pm", "next Friday at 3pm"
-            r'(?:next\s+)?(monday|tuesday|wednesday|thursday|friday|saturday|sunday|mon|tue|wed|thu|fri|sat|sun)\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.))',
-            # "2025-12-15 at 3pm", "15/12/2025 at 2pm"
-            r'(\d{4}-\d{2}-\d{2}|\d{1,2}[/-]\d{1,2}[/-]\d{4})\s+(?:at\s+)?(\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.))',
-        ]
+        combined = scan_date_time(message).combined
+        if combined:
+            date_part, time_part = combined
 
-        for pattern in combined_patterns:
-            match = re.search(pattern, message_lower)
-            if match:
-                date_part = match.group(1).strip()
-                time_part = match.group(2).strip()
+            logger.info(f"[EntityExtractor] Found combined pattern - Date: '{date_part}', Time: '{time_part}'")
 
-                logger.info(f"[EntityExtractor] Found combined pattern - Date: '{date_part}', Time: '{time_part}'")
+            # Normalize date and time
+            normalized_date = normalize_date(date_part)
+            normalized_time = normalize_time(time_part)
 
-                # Normalize date and time
-                normalized_date = normalize_date(date_part)
-                normalized_time = normalize_time(time_part)
+            if normalized_date and normalized_time:
+                results = {}
 
-                if normalized_date and normalized_time:
-                    results = {}
-
-                    results['date'] = EntityExtractionResult(
-                        entity_type=EntityType.DATE.value,
-                        entity_value=date_part,
-                        confidence=0.9,
-                        normalized_value=normalized_date,
-                        extraction_method="combined_pattern"
-                    )
+                results['date'] = EntityExtractionResult(
+                    entity_type=EntityType.DATE.value,
+                    entity_value=date_part,
+                    confidence=0.9,
+                    normalized_value=normalized_date,
+                    extraction_method="combined_pattern"
+                )
 
-                    results['time'] = EntityExtractionResult(
-                        entity_type=EntityType.TIME.value,
-                        entity_value=time_part,
-                        confidence=0.9,
-                        normalized_value=normalized_time,
-                        extraction_method="combined_pattern"
-                    )
+                results['time'] = EntityExtractionResult(
+                    entity_type=EntityType.TIME.value,
+                    entity_value=time_part,
+                    confidence=0.9,
+                    normalized_value=normalized_time,
+                    extraction_method="combined_pattern"
+                )
 
-                    logger.info(f"[EntityExtractor] Successfully extracted combined date-time: {normalized_date} at {normalized_time}")
-                    return results
+                logger.info(f"[EntityExtractor] Successfully extracted combined date-time: {normalized_date} at {normalized_time}")
+                return results
 
         return None
 
     def _extract_time(self, message: str, message_lower: str) -> Optional[EntityExtractionResult]:
         """Extract time using centralized normalizer"""
-        from src.utils.entity_normalizer import normalize_time
+        from src.utils.entity_normalizer import normalize_time, scan_date_time
 
-        # Try to extract raw time value
-        raw_value = None
-        confidence = 0.0
-
-        # 12-hour format
-        time_match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)', message_lower)
-        if time_match:
-            raw_value = time_match.group(0)
-            confidence = 0.95
-        else:
-            # 24-hour format
-            time_match = re.search(r'(\d{1,2}):(\d{2})', message)
-            if time_match:
-                raw_value = time_match.group(0)
-                confidence = 0.95
-            else:
-                # Time of day keywords
-                if "morning" in message_lower:
-                    raw_value = "morning"
-                    confidence = 0.7
-                elif "afternoon" in message_lower:
-                    raw_value = "afternoon"
-                    confidence = 0.7
-                elif "evening" in message_lower:
-                    raw_value = "evening"
-                    confidence = 0.7
-                elif "night" in message_lower:
-                    raw_value = "night"
-                    confidence = 0.6
+        # Raw time span from the shared date/time scan
+        scan = scan_date_time(message)
+        raw_value = scan.time
 
         if raw_value:
             # Use centralized normalizer
@@ -640,7 +626,7 @@ class EntityExtractor:
                 return EntityExtractionResult(
                     entity_type=EntityType.TIME.value,
                     entity_value=raw_value,
-                    confidence=confidence,
+                    confidence=scan.time_confidence,
                     normalized_value=normalized,
                     extraction_method="pattern"
                 )
@@ -1233,23 +1219,17 @@ class EntityExtractor:
 
         prompt = self._build_extraction_prompt(message, expected_entity, context)
 
-        # Define output schema
-        class ExtractionOutput(BaseModel):
-            entity_value: str
-            confidence: float
-            normalized_value: Optional[str] = None
-
         try:
             structured_llm = self.llm_client.with_structured_output(ExtractionOutput)
 
             # Invoke LLM with retry logic
-            from src.nlp.llm.gemini_client import with_retry
+            from src.nlp.llm.retry import async_retry
 
-            @with_retry(max_retries=3, initial_delay=1.0, backoff_factor=2.0)
-            def invoke_with_retry():
-                return structured_llm.invoke(prompt)
+            @async_retry(max_retries=3, initial_delay=1.0, backoff_factor=2.0)
+            async def invoke_with_retry():
+                return await structured_llm.ainvoke(prompt)
 
-            result = invoke_with_retry()
+            result = await invoke_with_retry()
 
             return EntityExtractionResult(
                 entity_type=expected_entity.value,
@@ -1262,6 +1242,111 @@ class EntityExtractor:
             logger.error(f"[EntityExtractor] LLM extraction failed: {e}")
             return None
 
+    async def _extract_many_with_llm(
+        self,
+        message: str,
+        expected_entities: List[EntityType],
+        context: Dict[str, Any]
+    ) -> Dict[str, EntityExtractionResult]:
+        """
+        Extract several entities with a single LLM call
+
+        Args:
+            message: User's message
+            expected_entities: Entity types the patterns could not extract
+            context: Conversation context
+
+        Returns:
+            Dict mapping entity type to EntityExtractionResult (requested types only)
+        """
+        if not self.llm_client:
+            return {}
+
+        prompt = self._build_multi_extraction_prompt(message, expected_entities, context)
+        requested = {entity_type.value for entity_type in expected_entities}
+
+        try:
+            structured_llm = self.llm_client.with_structured_output(MultiExtractionOutput)
+
+            # Invoke LLM with retry logic
+            from src.nlp.llm.retry import async_retry
+
+            @async_retry(max_retries=3, initial_delay=1.0, backoff_factor=2.0)
+            async def invoke_with_retry():
+                return await structured_llm.ainvoke(prompt)
+
+            result = await invoke_with_retry()
+        except Exception as e:
+            logger.error(f"[EntityExtractor] Multi-slot LLM extraction failed: {e}")
+            return {}
+
+        extracted = {}
+        for slot in result.slots:
+            if slot.entity_type not in requested or slot.entity_type in extracted:
+                continue
+            extracted[slot.entity_type] = EntityExtractionResult(
+                entity_type=slot.entity_type,
+                entity_value=slot.entity_value,
+                confidence=slot.confidence,
+                normalized_value=slot.normalized_value or slot.entity_value,
+                extraction_method="llm"
+            )
+        logger.info(f"[EntityExtractor] Multi-slot LLM extraction returned {list(extracted.keys())} for {sorted(requested)}")
+        return extracted
+
+    def _build_multi_extraction_prompt(
+        self,
+        message: str,
+        expected_entities: List[EntityType],
+        context: Dict[str, Any]
+    ) -> str:
+        """
+        Build prompt for multi-slot LLM entity extraction
+        """
+        today = datetime.now().date().isoformat()
+        current_time = datetime.now().strftime("%H:%M")
+
+        collected_entities = context.get("collected_entities", {})
+        last_question = context.get("last_question", "")
+        entity_names = [entity_type.value for entity_type in expected_entities]
+
+        location_instructions = LOCATION_INSTRUCTIONS if EntityType.LOCATION in expected_entities else ""
+
+        prompt = f"""You are an expert entity extractor for a home services platform.
+
+**Context:**
+- Today's date: {today}
+- Current time: {current_time}
+- Last question asked: "{last_question}"
+- Already collected: {collected_entities}
+
+**Task:**
+Extract each of these entities from the user's response: {", ".join(entity_names)}
+
+**User's Response:** "{message}"
+
+**Instructions:**
+1. Return exactly one slot per entity listed above, with entity_type set to the entity name
+2. Normalize each value to a standard format:
+   - Dates: YYYY-MM-DD format
+   - Times: HH:MM format (24-hour)
+   - Locations: City name or 6-digit pincode ONLY
+   - Service types: Lowercase (e.g., "ac", "plumbing")
+3. Provide a confidence score (0.0 to 1.0) for each slot independently
+4. If the message does not contain an entity, set its confidence to 0.0 and entity_value to "NOT_FOUND"
+{location_instructions}
+**Example:**
+"AC repair tomorrow at 2 PM" (expecting service_type, date, time, location) →
+- service_type: "ac", confidence: 0.9
+- date: {(datetime.now().date() + timedelta(days=1)).isoformat()}, confidence: 0.9
+- time: "14:00", confidence: 0.9
+- location: "NOT_FOUND", confidence: 0.0
+
+Return the slots with extracted value, normalized value, and confidence score.
+"""
+
+        return prompt
+
     def _build_extraction_prompt(
         self,
         message: str,
@@ -1280,19 +1365,7 @@ class EntityExtractor:
         # Special instructions for location extraction
         location_instructions = ""
         if expected_entity == EntityType.LOCATION:
-            location_instructions = """
-**IMPORTANT for Location Extraction:**
-- ONLY extract if the message contains a CLEAR location indicator:
-  * A 6-digit pincode (e.g., "400001", "110001")
-  * A city name (e.g., "Mumbai", "Delhi", "Bangalore")
-  * A specific area/locality name
-- DO NOT extract if the message:
-  * Is a general statement (e.g., "I want to book a service")
-  * Contains service types or actions (e.g., "AC repair service")
-  * Is asking a question
-  * Does not mention any location
-- If NO clear location is found, set confidence to 0.0 and entity_value to "NOT_FOUND"
-"""
+            location_instructions = LOCATION_INSTRUCTIONS
 
         prompt = f"""You are an expert entity extractor for a home services platform.
 
@@ -19,6 +19,7 @@ Design Principles:
 import asyncio
 import logging
 import re
+from functools import lru_cache
 from typing import Any, Optional, Dict, List
 from datetime import datetime, date, timedelta
 from pydantic import BaseModel
@@ -26,6 +27,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from src.nlp.intent.config import EntityType
+from src.services.catalog_snapshot import CatalogSnapshot, get_catalog_snapshot
+from src.services.pincode_coverage import get_pincode_coverage
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +57,112 @@ VALIDATION_CONFIG = {
 }
 
 
+# Common service variations -> services_with_subcategories keys
+SERVICE_NORMALIZATIONS = {
+    # Home Cleaning variations
+    "cleaning": "home_cleaning",
+    "house cleaning": "home_cleaning",
+    "home cleaning": "home_cleaning",
+    "cleaning service": "home_cleaning",
+
+    # Appliance Repair variations
+    "appliance": "appliance_repair",
+    "appliance repair": "appliance_repair",
+    "appliance service": "appliance_repair",
+
+    # Plumbing variations
+    "plumbing": "plumbing",
+    "plumbing service": "plumbing",
+    "plumber": "plumbing",
+
+    # Electrical variations
+    "electrical": "electrical",
+    "electrical service": "electrical",
+    "electrician": "electrical",
+
+    # Carpentry variations
+    "carpentry": "carpentry",
+    "carpentry service": "carpentry",
+    "carpenter": "carpentry",
+    "furniture": "carpentry",
+
+    # Painting variations
+    "painting": "painting",
+    "painting service": "painting",
+    "paint": "painting",
+    "interior painting": "painting",
+    "exterior painting": "painting",
+    "wall painting": "painting",
+
+    # Pest Control variations
+    "pest": "pest_control",
+    "pest control": "pest_control",
+    "pest control service": "pest_control",
+    "general pest control": "pest_control",
+
+    # Water Purifier variations
+    "water purifier": "water_purifier",
+    "water purifier service": "water_purifier",
+    "ro": "water_purifier",
+    "ro service": "water_purifier",
+
+    # Car Care variations
+    "car": "car_care",
+    "car care": "car_care",
+    "car service": "car_care",
+    "car wash": "car_care",
+    "car cleaning": "car_care",
+
+    # Salon variations
+    "salon": "salon_for_women",  # Default to women
+    "salon for women": "salon_for_women",
+    "women salon": "salon_for_women",
+    "salon for men": "salon_for_men",
+    "men salon": "salon_for_men",
+    "beauty": "salon_for_women",
+    "grooming": "salon_for_men",
+
+    # Packers and Movers variations
+    "packers": "packers_and_movers",
+    "movers": "packers_and_movers",
+    "packers and movers": "packers_and_movers",
+    "packing": "packers_and_movers",
+    "moving": "packers_and_movers",
+    "relocation": "packers_and_movers",
+
+    # AC Service (single-option) - keep as is for now
+    "ac": "ac",
+    "ac service": "ac",
+    "ac repair": "ac",
+    "air conditioning": "ac",
+    "test ac services": "ac"  # Test AC Services category name
+}
+
+
+@lru_cache(maxsize=4)
+def _services_with_subcategories(snapshot: CatalogSnapshot) -> Dict[str, Dict[str, Any]]:
+    """
+    Categories with more than one active subcategory, keyed by service name
+
+    Args:
+        snapshot: Catalog snapshot (results are cached per snapshot)
+
+    Returns:
+        {service: {"subcategories": [{"id", "name"}], "suggestions": [...]}}
+    """
+    services = {}
+    for category in snapshot.categories:
+        subcategories = snapshot.list_subcategories(category.id)
+        if len(subcategories) < 2:
+            continue
+        name = category.name.lower()
+        services[SERVICE_NORMALIZATIONS.get(name, name.replace(" ", "_"))] = {
+            "subcategories": [{"id": sub.id, "name": sub.name} for sub in subcategories],
+            "suggestions": [sub.name.lower().replace("/", " ") for sub in subcategories]
+        }
+    return services
+
+
 class ValidationResult(BaseModel):
     """Result of entity validation"""
     is_valid: bool
@@ -77,6 +186,14 @@ class EntityValidator:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.config = VALIDATION_CONFIG
+
+    async def _get_catalog_snapshot(self) -> Optional[CatalogSnapshot]:
+        """Current catalog snapshot, or None if it cannot be loaded"""
+        try:
+            return await get_catalog_snapshot(self.db)
+        except Exception as e:
+            logger.error(f"[EntityValidator] Catalog snapshot unavailable: {e}")
+            return None
     
     async def validate(
         self,
@@ -233,13 +350,10 @@ class EntityValidator:
                 # Validate pincode if required
                 if config["require_pincode_validation"]:
                     try:
-                        from src.core.models import Pincode
-                        result = await self.db.execute(
-                            select(Pincode).where(Pincode.pincode == pincode)
-                        )
-                        pincode_obj = result.scalar_one_or_none()
+                        coverage = await get_pincode_coverage(self.db)
+                        pincode_obj = coverage.get_pincode(pincode)
 
-                        if pincode_obj is not None and bool(pincode_obj.is_serviceable):
+                        if pincode_obj is not None and pincode_obj.is_serviceable:
                             logger.info(f"[EntityValidator] Full address validated: {value_str} (pincode {pincode} is serviceable)")
                             return ValidationResult(
                                 is_valid=True,
@@ -285,13 +399,10 @@ class EntityValidator:
             if config["require_pincode_validation"]:
                 # Query database to check if pincode is serviceable
                 try:
-                    from src.core.models import Pincode
-                    result = await self.db.execute(
-                        select(Pincode).where(Pincode.pincode == value_str)
-                    )
-                    pincode_obj = result.scalar_one_or_none()
+                    coverage = await get_pincode_coverage(self.db)
+                    pincode_obj = coverage.get_pincode(value_str)
 
-                    if pincode_obj is not None and bool(pincode_obj.is_serviceable):
+                    if pincode_obj is not None and pincode_obj.is_serviceable:
                         logger.info(f"[EntityValidator] Pincode {value_str} validated and is serviceable")
                         return ValidationResult(
                             is_valid=True,
@@ -340,252 +451,21 @@ class EntityValidator:
         normalized_value = str(value).lower().strip()
         logger.info(f"[ENTITY_VALIDATOR] Normalized value: '{normalized_value}'")
 
-        # Map category IDs to service names
-        # Based on actual database IDs from service categories
-        category_id_to_service = {
-            "1": "home_cleaning",
-            "13": "ac",  # Test AC Services
-            "2": "appliance_repair",
-            "3": "plumbing",
-            "4": "electrical",
-            "5": "carpentry",
-            "6": "painting",
-            "7": "pest_control",
-            "8": "water_purifier",
-            "9": "car_care",
-            "10": "salon_for_women",
-            "11": "salon_for_men",
-            "12": "packers_and_movers"
-        }
+        snapshot = await self._get_catalog_snapshot()
 
-        # If value is a category ID, convert to service name
-        if normalized_value in category_id_to_service:
-            logger.info(f"[ENTITY_VALIDATOR] Converting category ID '{normalized_value}' to service name")
-            normalized_value = category_id_to_service[normalized_value]
-            logger.info(f"[ENTITY_VALIDATOR] Converted to: '{normalized_value}'")
+        # If value is a category ID, convert to the category's service name
+        if normalized_value.isdigit() and snapshot:
+            category = snapshot.get_category(int(normalized_value))
+            if category:
+                logger.info(f"[ENTITY_VALIDATOR] Converting category ID '{normalized_value}' to service name")
+                normalized_value = category.name.lower()
+                logger.info(f"[ENTITY_VALIDATOR] Converted to: '{normalized_value}'")
 
         # Normalize common service variations to match services_with_subcategories keys
-        service_normalizations = {
-            # Home Cleaning variations
-            "cleaning": "home_cleaning",
-            "house cleaning": "home_cleaning",
-            "home cleaning": "home_cleaning",
-            "cleaning service": "home_cleaning",
-
-            # Appliance Repair variations
-            "appliance": "appliance_repair",
-            "appliance repair": "appliance_repair",
-            "appliance service": "appliance_repair",
-
-            # Plumbing variations
-            "plumbing": "plumbing",
-            "plumbing service": "plumbing",
-            "plumber": "plumbing",
-
-            # Electrical variations
-            "electrical": "electrical",
-            "electrical service": "electrical",
-            "electrician": "electrical",
-
-            # Carpentry variations
-            "carpentry": "carpentry",
-            "carpentry service": "carpentry",
-            "carpenter": "carpentry",
-            "furniture": "carpentry",
-
-            # Painting variations
-            "painting": "painting",
-            "painting service": "painting",
-            "paint": "painting",
-            "interior painting": "painting",
-            "exterior painting": "painting",
-            "wall painting": "painting",
-
-            # Pest Control variations
-            "pest": "pest_control",
-            "pest control": "pest_control",
-            "pest control service": "pest_control",
-            "general pest control": "pest_control",
-
-            # Water Purifier variations
-            "water purifier": "water_purifier",
-            "water purifier service": "water_purifier",
-            "ro": "water_purifier",
-            "ro service": "water_purifier",
-
-            # Car Care variations
-            "car": "car_care",
-            "car care": "car_care",
-            "car service": "car_care",
-            "car wash": "car_care",
-            "car cleaning": "car_care",
-
-            # Salon variations
-            "salon": "salon_for_women",  # Default to women
-            "salon for women": "salon_for_women",
-            "women salon": "salon_for_women",
-            "salon for men": "salon_for_men",
-            "men salon": "salon_for_men",
-            "beauty": "salon_for_women",
-            "grooming": "salon_for_men",
-
-            # Packers and Movers variations
-            "packers": "packers_and_movers",
-            "movers": "packers_and_movers",
-            "packers and movers": "packers_and_movers",
-            "packing": "packers_and_movers",
-            "moving": "packers_and_movers",
-            "relocation": "packers_and_movers",
-
-            # AC Service (single-option) - keep as is for now
-            "ac": "ac",
-            "ac service": "ac",
-            "ac repair": "ac",
-            "air conditioning": "ac"
-        }
+        normalized_service = SERVICE_NORMALIZATIONS.get(normalized_value, normalized_value)
 
-        # Apply normalization
-        normalized_service = service_normalizations.get(normalized_value, normalized_value)
-
-        # Define services that require subcategory selection with database-accurate data
-        services_with_subcategories = {
-            "home_cleaning": {
-                "subcategories": [
-                    {"id": 1, "name": "Deep Cleaning"},
-                    {"id": 2, "name": "Regular Cleaning"},
-                    {"id": 3, "name": "Kitchen Cleaning"},
-                    {"id": 4, "name": "Bathroom Cleaning"},
-                    {"id": 5, "name": "Sofa Cleaning"},
-                    {"id": 6, "name": "Carpet Cleaning"},
-                    {"id": 7, "name": "Window Cleaning"},
-                    {"id": 8, "name": "Move-in/Move-out Cleaning"}
-                ],
-                "suggestions": ["deep cleaning", "regular cleaning", "kitchen cleaning", "bathroom cleaning", "sofa cleaning", "carpet cleaning", "window cleaning", "move-in move-out cleaning"]
-            },
-            "appliance_repair": {
-                "subcategories": [
-                    {"id": 9, "name": "AC Repair"},
-                    {"id": 10, "name": "AC Installation"},
-                    {"id": 11, "name": "AC Gas Refilling"},
-                    {"id": 12, "name": "Refrigerator Repair"},
-                    {"id": 13, "name": "Washing Machine Repair"},
-                    {"id": 14, "name": "Microwave Repair"},
-                    {"id": 15, "name": "TV Repair"},
-                    {"id": 16, "name": "Geyser Repair"}
-                ],
-                "suggestions": ["ac repair", "ac installation", "ac gas refilling", "refrigerator repair", "washing machine repair", "microwave repair", "tv repair", "geyser repair"]
-            },
-            "plumbing": {
-                "subcategories": [
-                    {"id": 17, "name": "Tap Repair"},
-                    {"id": 18, "name": "Pipe Repair"},
-                    {"id": 19, "name": "Toilet Repair"},
-                    {"id": 20, "name": "Drain Cleaning"},
-                    {"id": 21, "name": "Water Tank Cleaning"},
-                    {"id": 22, "name": "Bathroom Fitting"},
-                    {"id": 23, "name": "Kitchen Sink Installation"}
-                ],
-                "suggestions": ["tap repair", "pipe repair", "toilet repair", "drain cleaning", "water tank cleaning", "bathroom fitting", "kitchen sink installation"]
-            },
-            "electrical": {
-                "subcategories": [
-                    {"id": 24, "name": "Switch/Socket Repair"},
-                    {"id": 25, "name": "Fan Installation"},
-                    {"id": 26, "name": "Light Fitting"},
-                    {"id": 27, "name": "Wiring"},
-                    {"id": 28, "name": "MCB/Fuse Repair"},
-                    {"id": 29, "name": "Inverter Installation"},
-                    {"id": 30, "name": "Doorbell Installation"}
-                ],
-                "suggestions": ["switch socket repair", "fan installation", "light fitting", "wiring", "mcb fuse repair", "inverter installation", "doorbell installation"]
-            },
-            "carpentry": {
-                "subcategories": [
-                    {"id": 31, "name": "Furniture Assembly"},
-                    {"id": 32, "name": "Furniture Repair"},
-                    {"id": 33, "name": "Door Repair"},
-                    {"id": 34, "name": "Window Repair"},
-                    {"id": 35, "name": "Cabinet Installation"},
-                    {"id": 36, "name": "Bed Repair"},
-                    {"id": 37, "name": "Custom Furniture"}
-                ],
-                "suggestions": ["furniture assembly", "furniture repair", "door repair", "window repair", "cabinet installation", "bed repair", "custom furniture"]
-            },
-            "painting": {
-                "subcategories": [
-                    {"id": 38, "name": "Interior Painting"},
-                    {"id": 39, "name": "Exterior Painting"},
-                    {"id": 40, "name": "Waterproofing"},
-                    {"id": 41, "name": "Texture Painting"},
-                    {"id": 42, "name": "Wood Polishing"}
-                ],
-                "suggestions": ["interior painting", "exterior painting", "waterproofing", "texture painting", "wood polishing"]
-            },
-            "pest_control": {
-                "subcategories": [
-                    {"id": 43, "name": "General Pest Control"},
-                    {"id": 44, "name": "Cockroach Control"},
-                    {"id": 45, "name": "Termite Control"},
-                    {"id": 46, "name": "Bed Bug Control"},
-                    {"id": 47, "name": "Mosquito Control"},
-                    {"id": 48, "name": "Rodent Control"}
-                ],
-                "suggestions": ["general pest control", "cockroach control", "termite control", "bed bug control", "mosquito control", "rodent control"]
-            },
-            "water_purifier": {
-                "subcategories": [
-                    {"id": 49, "name": "RO Installation"},
-                    {"id": 50, "name": "RO Repair"},
-                    {"id": 51, "name": "Filter Replacement"},
-                    {"id": 52, "name": "RO Service"}
-                ],
-                "suggestions": ["ro installation", "ro repair", "filter replacement", "ro service"]
-            },
-            "car_care": {
-                "subcategories": [
-                    {"id": 53, "name": "Car Washing"},
-                    {"id": 54, "name": "Car Detailing"},
-                    {"id": 55, "name": "Car Interior Cleaning"},
-                    {"id": 56, "name": "Car Polish"},
-                    {"id": 57, "name": "Bike Washing"}
-                ],
-                "suggestions": ["car washing", "car detailing", "car interior cleaning", "car polish", "bike washing"]
-            },
-            "salon_for_women": {
-                "subcategories": [
-                    {"id": 58, "name": "Hair Cut"},
-                    {"id": 59, "name": "Hair Color"},
-                    {"id": 60, "name": "Facial"},
-                    {"id": 61, "name": "Waxing"},
-                    {"id": 62, "name": "Manicure"},
-                    {"id": 63, "name": "Pedicure"},
-                    {"id": 64, "name": "Makeup"},
-                    {"id": 65, "name": "Hair Spa"}
-                ],
-                "suggestions": ["hair cut", "hair color", "facial", "waxing", "manicure", "pedicure", "makeup", "hair spa"]
-            },
-            "salon_for_men": {
-                "subcategories": [
-                    {"id": 66, "name": "Hair Cut"},
-                    {"id": 67, "name": "Shaving"},
-                    {"id": 68, "name": "Beard Trimming"},
-                    {"id": 69, "name": "Facial"},
-                    {"id": 70, "name": "Hair Color"},
-                    {"id": 71, "name": "Massage"}
-                ],
-                "suggestions": ["hair cut", "shaving", "beard trimming", "facial", "hair color", "massage"]
-            },
-            "packers_and_movers": {
-                "subcategories": [
-                    {"id": 72, "name": "Local Shifting"},
-                    {"id": 73, "name": "Intercity Moving"},
-                    {"id": 74, "name": "Office Relocation"},
-                    {"id": 75, "name": "Vehicle Transportation"},
-                    {"id": 76, "name": "Packing Services"}
-                ],
-                "suggestions": ["local shifting", "intercity moving", "office relocation", "vehicle transportation", "packing services"]
-            }
-        }
+        # Services that require subcategory selection, from the catalog snapshot
+        services_with_subcategories = _services_with_subcategories(snapshot) if snapshot else {}
 
         # Check if service requires subcategory selection
         logger.info(f"[ENTITY_VALIDATOR] Checking if '{normalized_service}' requires subcategory selection...")
@@ -11,6 +11,7 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.nlp.intent.classifier import IntentClassifier
+from src.nlp.intent.result_cache import CachedIntentClassifier
 from src.llm.gemini.client import LLMClient
 from src.schemas.intent import (
     IntentClassificationRequest,
@@ -28,7 +29,7 @@ class IntentService:
     Provides:
     - Multi-intent classification
     - Entity extraction
-    - Caching (future)
+    - Result caching (CachedIntentClassifier)
     - Logging and metrics
     """
     
@@ -46,7 +47,7 @@ class IntentService:
         """
         self.db = db
         self.llm_client = llm_client or LLMClient.create_for_intent_classification()
-        self.classifier = IntentClassifier(llm_client=self.llm_client)
+        self.classifier = CachedIntentClassifier(IntentClassifier(llm_client=self.llm_client))
     
     async def classify_intent(
         self,
@@ -92,7 +93,6 @@ class IntentService:
             )
             
             # TODO: Store classification in database for analytics
-            # TODO: Cache result for similar queries
             
             return response
             
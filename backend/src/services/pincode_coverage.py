@@ -0,0 +1,531 @@
+"""
+Pincode Coverage - In-memory pincode table and provider coverage bitmaps
+
+Location validation and booking used to query Pincode and ProviderPincode on
+every request (BookingService once per cart item). This index keeps both in
+memory:
+
+- Every pincode row, keyed by its 6-digit code
+- One coverage bitmap per active, verified provider (bit i set = the provider
+  services the pincode in slot i); a rate card is serviceable where its
+  provider's bitmap has the pincode's bit set
+- Active provider counts per pincode
+
+Coverage changes are published (publish_coverage_change) to Redis: a version
+counter plus a short log of changed provider ids. The store checks the counter
+at most every PINCODE_COVERAGE_VERSION_CHECK_SECONDS and reloads only the
+changed providers' rows; an unknown or truncated change log, or a change not
+tied to one provider (e.g. the pincode table), triggers a full reload.
+
+The application has no coverage writers: pincodes and provider coverage
+change through seed scripts, migrations and manual SQL. Operators run
+scripts/refresh_pincode_coverage.py afterwards; otherwise (and during Redis
+outages) the chat-side checks in EntityValidator and BookingAgent see the
+change only once the index is PINCODE_COVERAGE_MAX_AGE_SECONDS old.
+
+Booking cannot act on an index that may be that old (a deactivated provider
+would keep getting bookings), so confirm_coverage reads the pincode and the
+cart's providers from the database and publishes any disagreement with the
+index, which brings every worker up to date.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Redis keys of the coverage version counter and change log
+COVERAGE_VERSION_KEY = "pincode_coverage:version"
+COVERAGE_CHANGES_KEY = "pincode_coverage:changes"
+
+# Change log entries kept in Redis (older changes force a full reload)
+MAX_LOGGED_CHANGES = 1000
+
+# Change log marker for changes not tied to one provider
+FULL_RELOAD = "*"
+
+_PUBLISH_CHANGE_SCRIPT = """
+local version = redis.call('INCR', KEYS[1])
+redis.call('RPUSH', KEYS[2], version .. ':' .. ARGV[1])
+redis.call('LTRIM', KEYS[2], -tonumber(ARGV[2]), -1)
+return version
+"""
+
+_READ_CHANGES_SCRIPT = """
+return {redis.call('GET', KEYS[1]) or '0', redis.call('LRANGE', KEYS[2], 0, -1)}
+"""
+
+
+@dataclass(frozen=True)
+class PincodeEntry:
+    """Pincode row"""
+    id: int
+    pincode: str
+    city: str
+    state: str
+    is_serviceable: bool
+
+
+class PincodeCoverageIndex:
+    """
+    Pincodes and per-provider coverage bitmaps
+
+    Coverage is updated per provider with set_provider_coverage; a single
+    update never awaits, so readers on the event loop see it whole.
+    """
+
+    def __init__(
+        self,
+        pincodes: Iterable[PincodeEntry],
+        coverage: Mapping[int, Iterable[int]],
+        version: int = 0
+    ):
+        """
+        Build the index
+
+        Args:
+            pincodes: Pincode rows
+            coverage: Pincode ids by provider id (active, verified providers only)
+            version: Coverage version the rows were loaded at
+        """
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self._pincodes: Dict[str, PincodeEntry] = {}
+        self._slots: Dict[int, int] = {}  # pincode id -> bit
+        for entry in pincodes:
+            self._pincodes[entry.pincode] = entry
+            self._slots[entry.id] = len(self._slots)
+
+        self._coverage: Dict[int, int] = {}  # provider id -> bitmap
+        self._provider_counts: List[int] = [0] * len(self._slots)
+        for provider_id, pincode_ids in coverage.items():
+            self.set_provider_coverage(provider_id, pincode_ids)
+
+    def __len__(self) -> int:
+        return len(self._pincodes)
+
+    @property
+    def provider_count(self) -> int:
+        """Number of providers with any coverage"""
+        return len(self._coverage)
+
+    def get_pincode(self, pincode: str) -> Optional[PincodeEntry]:
+        """Pincode row by its 6-digit code"""
+        return self._pincodes.get(pincode)
+
+    def _bitmap(self, pincode_ids: Iterable[int]) -> int:
+        bitmap = 0
+        for pincode_id in pincode_ids:
+            slot = self._slots.get(pincode_id)
+            if slot is not None:
+                bitmap |= 1 << slot
+        return bitmap
+
+    def set_provider_coverage(self, provider_id: int, pincode_ids: Iterable[int]) -> None:
+        """
+        Replace one provider's coverage
+
+        Args:
+            provider_id: Provider id
+            pincode_ids: Pincode ids the provider services (empty if the provider
+                is inactive, unverified or gone)
+        """
+        new = self._bitmap(pincode_ids)
+        old = self._coverage.get(provider_id, 0)
+        if new == old:
+            return
+
+        for bitmap, delta in ((old & ~new, -1), (new & ~old, 1)):
+            while bitmap:
+                lowest = bitmap & -bitmap
+                self._provider_counts[lowest.bit_length() - 1] += delta
+                bitmap ^= lowest
+
+        if new:
+            self._coverage[provider_id] = new
+        else:
+            self._coverage.pop(provider_id, None)
+
+    def available_providers(self, pincode_id: int) -> int:
+        """Number of active, verified providers servicing a pincode"""
+        slot = self._slots.get(pincode_id)
+        return self._provider_counts[slot] if slot is not None else 0
+
+    def covers(self, provider_id: int, pincode_id: int) -> bool:
+        """Whether a provider services a pincode"""
+        slot = self._slots.get(pincode_id)
+        return slot is not None and bool(self._coverage.get(provider_id, 0) >> slot & 1)
+
+    def uncovered_rate_cards(self, pincode_id: int, rate_cards: Sequence) -> list:
+        """
+        Rate cards whose provider does not service a pincode
+
+        Args:
+            pincode_id: Pincode id
+            rate_cards: Objects with a provider_id attribute (RateCard, RateCardEntry)
+
+        Returns:
+            The unserviceable rate cards, in input order
+        """
+        slot = self._slots.get(pincode_id)
+        if slot is None:
+            return list(rate_cards)
+        bit = 1 << slot
+        return [rc for rc in rate_cards if not self._coverage.get(rc.provider_id, 0) & bit]
+
+
+async def load_provider_coverage(db, provider_ids: Optional[Iterable[int]] = None) -> Dict[int, List[int]]:
+    """
+    Load pincode ids per active, verified provider
+
+    Args:
+        db: Async database session
+        provider_ids: Only these providers (default: all); requested providers
+            without coverage map to an empty list
+
+    Returns:
+        Pincode ids by provider id
+    """
+    from sqlalchemy import select
+    from src.core.models import Provider, ProviderPincode
+
+    query = (
+        select(ProviderPincode.provider_id, ProviderPincode.pincode_id)
+        .join(Provider, ProviderPincode.provider_id == Provider.id)
+        .where(Provider.is_active == True, Provider.is_verified == True)
+    )
+    coverage: Dict[int, List[int]] = {}
+    if provider_ids is not None:
+        provider_ids = list(provider_ids)
+        query = query.where(ProviderPincode.provider_id.in_(provider_ids))
+        coverage = {provider_id: [] for provider_id in provider_ids}
+
+    for provider_id, pincode_id in (await db.execute(query)).all():
+        coverage.setdefault(provider_id, []).append(pincode_id)
+    return coverage
+
+
+async def load_pincode_coverage(db, version: int = 0) -> PincodeCoverageIndex:
+    """
+    Load the pincode table and all provider coverage
+
+    Args:
+        db: Async database session
+        version: Coverage version to stamp on the index
+
+    Returns:
+        PincodeCoverageIndex
+    """
+    from sqlalchemy import select
+    from src.core.models import Pincode
+
+    pincodes = (await db.execute(select(Pincode))).scalars().all()
+    return PincodeCoverageIndex(
+        pincodes=[
+            PincodeEntry(
+                id=p.id,
+                pincode=p.pincode,
+                city=p.city,
+                state=p.state,
+                is_serviceable=bool(p.is_serviceable)
+            )
+            for p in pincodes
+        ],
+        coverage=await load_provider_coverage(db),
+        version=version
+    )
+
+
+async def load_pincode_entry(db, pincode: str) -> Optional[PincodeEntry]:
+    """
+    Load one pincode row
+
+    Args:
+        db: Async database session
+        pincode: 6-digit pincode
+
+    Returns:
+        PincodeEntry, or None if the pincode does not exist
+    """
+    from sqlalchemy import select
+    from src.core.models import Pincode
+
+    row = (await db.execute(select(Pincode).where(Pincode.pincode == pincode))).scalar_one_or_none()
+    if row is None:
+        return None
+    return PincodeEntry(
+        id=row.id,
+        pincode=row.pincode,
+        city=row.city,
+        state=row.state,
+        is_serviceable=bool(row.is_serviceable)
+    )
+
+
+async def confirm_coverage(
+    db,
+    index: PincodeCoverageIndex,
+    pincode: str,
+    rate_cards: Sequence
+) -> Tuple[Optional[PincodeEntry], list]:
+    """
+    Check a pincode and rate cards against the database, not the index
+
+    For booking-critical checks: two queries for the whole cart. Where the
+    database disagrees with the index, the change is published so the index
+    (on every worker) reloads it.
+
+    Args:
+        db: Async database session
+        index: Current coverage index
+        pincode: 6-digit pincode
+        rate_cards: Rate cards (with provider_id) to check
+
+    Returns:
+        (pincode entry or None, rate cards whose provider does not service it)
+    """
+    entry = await load_pincode_entry(db, pincode)
+    if entry != index.get_pincode(pincode):
+        logger.info(f"[PincodeCoverage] Pincode {pincode} changed since the index was loaded")
+        await publish_coverage_change()
+    if entry is None:
+        return None, list(rate_cards)
+
+    coverage = await load_provider_coverage(db, {rc.provider_id for rc in rate_cards})
+    stale = {
+        provider_id for provider_id, pincode_ids in coverage.items()
+        if (entry.id in pincode_ids) != index.covers(provider_id, entry.id)
+    }
+    for provider_id in stale:
+        logger.info(f"[PincodeCoverage] Coverage of provider {provider_id} changed since the index was loaded")
+        await publish_coverage_change(provider_id)
+
+    return entry, [rc for rc in rate_cards if entry.id not in coverage[rc.provider_id]]
+
+
+def _decode(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+async def read_coverage_changes(since: int) -> Optional[Tuple[int, Optional[Set[int]]]]:
+    """
+    Read the coverage version and the providers changed after a version
+
+    Args:
+        since: Version the caller is at
+
+    Returns:
+        (version, changed provider ids) - provider ids are None when a full
+        reload is needed - or None if Redis is unavailable
+    """
+    from src.core.cache.redis_client import redis_client
+
+    result = await redis_client.eval(
+        _READ_CHANGES_SCRIPT,
+        keys=[COVERAGE_VERSION_KEY, COVERAGE_CHANGES_KEY],
+        args=[]
+    )
+    if result is None:
+        return None
+
+    version = int(_decode(result[0]))
+    if version <= since:
+        return version, set()
+
+    changed: Set[int] = set()
+    versions = []
+    for item in result[1]:
+        change_version, member = _decode(item).split(":", 1)
+        versions.append(int(change_version))
+        if int(change_version) <= since:
+            continue
+        if member == FULL_RELOAD:
+            return version, None
+        changed.add(int(member))
+
+    # Changes between `since` and the oldest logged entry were trimmed away
+    if not versions or versions[0] > since + 1:
+        return version, None
+    return version, changed
+
+
+async def publish_coverage_change(provider_id: Optional[int] = None) -> int:
+    """
+    Signal that coverage changed (call after committing ProviderPincode,
+    Provider status or Pincode writes; scripts/refresh_pincode_coverage.py
+    calls it for out-of-band writes)
+
+    Args:
+        provider_id: Provider whose coverage or status changed (None: reload everything)
+
+    Returns:
+        New version (0 if Redis is unavailable)
+    """
+    from src.core.cache.redis_client import redis_client
+
+    result = await redis_client.eval(
+        _PUBLISH_CHANGE_SCRIPT,
+        keys=[COVERAGE_VERSION_KEY, COVERAGE_CHANGES_KEY],
+        args=[FULL_RELOAD if provider_id is None else provider_id, MAX_LOGGED_CHANGES]
+    )
+    return int(result) if result is not None else 0
+
+
+class PincodeCoverageStore:
+    """
+    Holder of the current PincodeCoverageIndex
+    """
+
+    def __init__(self, version_check_seconds: float = 5, max_age_seconds: float = 3600, session_factory=None):
+        """
+        Initialize store (empty until the first load)
+
+        Args:
+            version_check_seconds: Min interval between reads of the Redis change log
+            max_age_seconds: Age after which the index is fully reloaded
+            session_factory: Async session factory for reloads (default: AsyncSessionLocal)
+        """
+        self.version_check_seconds = version_check_seconds
+        self.max_age_seconds = max_age_seconds
+        self._session_factory = session_factory
+        self.index: Optional[PincodeCoverageIndex] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _session(self):
+        if self._session_factory is None:
+            from src.core.database.connection import AsyncSessionLocal
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory()
+
+    async def refresh(self, db=None) -> PincodeCoverageIndex:
+        """
+        Reload all pincodes and coverage and swap the new index in
+
+        Args:
+            db: Async database session (default: a new session)
+
+        Returns:
+            The new index
+        """
+        changes = await read_coverage_changes(0)
+        version = changes[0] if changes is not None else 0
+        if db is not None:
+            index = await load_pincode_coverage(db, version)
+        else:
+            async with self._session() as session:
+                index = await load_pincode_coverage(session, version)
+
+        self.index = index
+        self._checked_at = time.monotonic()
+        logger.info(
+            f"[PincodeCoverage] v{version} loaded: {len(index)} pincodes, "
+            f"{index.provider_count} providers with coverage"
+        )
+        return index
+
+    async def apply_changes(self, version: int, provider_ids: Set[int]) -> None:
+        """
+        Reload the coverage of changed providers into the current index
+
+        Args:
+            version: Coverage version after the changes
+            provider_ids: Providers whose coverage or status changed
+        """
+        if provider_ids:
+            async with self._session() as session:
+                coverage = await load_provider_coverage(session, provider_ids)
+            for provider_id, pincode_ids in coverage.items():
+                self.index.set_provider_coverage(provider_id, pincode_ids)
+        self.index.version = version
+        logger.info(f"[PincodeCoverage] v{version}: reloaded coverage of {len(provider_ids)} providers")
+
+    async def get(self, db=None) -> PincodeCoverageIndex:
+        """
+        Get the current index, loading it on first use
+
+        When coverage changed (or the index is older than max_age_seconds)
+        the current index is returned while a background
+        task brings it up to date.
+
+        Args:
+            db: Async database session used for the first load
+
+        Returns:
+            Current PincodeCoverageIndex
+        """
+        if self.index is None:
+            async with self._lock:
+                if self.index is None:
+                    await self.refresh(db)
+        elif time.monotonic() - self._checked_at >= self.version_check_seconds:
+            self._checked_at = time.monotonic()
+            await self._check_for_changes()
+        return self.index
+
+    async def _check_for_changes(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        # Unpublished writes are picked up by a full reload, with or without Redis
+        if time.monotonic() - self.index.loaded_at >= self.max_age_seconds:
+            self._refresh_task = asyncio.create_task(self._update_in_background(None, None))
+            return
+
+        changes = await read_coverage_changes(self.index.version)
+        if changes is None:
+            return
+
+        version, provider_ids = changes
+        if version == self.index.version:
+            return
+        if version < self.index.version:
+            provider_ids = None  # Counter was reset
+        self._refresh_task = asyncio.create_task(self._update_in_background(version, provider_ids))
+
+    async def _update_in_background(self, version: Optional[int], provider_ids: Optional[Set[int]]) -> None:
+        try:
+            if provider_ids is None:
+                await self.refresh()
+            else:
+                await self.apply_changes(version, provider_ids)
+        except Exception as e:
+            logger.error(f"[PincodeCoverage] Background refresh failed, keeping v{self.index.version}: {e}")
+
+
+_pincode_coverage_store: Optional[PincodeCoverageStore] = None
+
+
+def get_pincode_coverage_store() -> PincodeCoverageStore:
+    """
+    Get the process-wide pincode coverage store (singleton pattern)
+
+    Returns:
+        PincodeCoverageStore instance
+    """
+    global _pincode_coverage_store
+    if _pincode_coverage_store is None:
+        from src.core.config import settings
+
+        _pincode_coverage_store = PincodeCoverageStore(
+            version_check_seconds=settings.PINCODE_COVERAGE_VERSION_CHECK_SECONDS,
+            max_age_seconds=settings.PINCODE_COVERAGE_MAX_AGE_SECONDS
+        )
+    return _pincode_coverage_store
+
+
+async def get_pincode_coverage(db=None) -> PincodeCoverageIndex:
+    """
+    Get the current pincode coverage index
+
+    Args:
+        db: Async database session used if coverage was never loaded
+
+    Returns:
+        PincodeCoverageIndex
+    """
+    return await get_pincode_coverage_store().get(db)
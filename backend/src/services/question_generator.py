@@ -18,7 +18,7 @@ Design Principles:
 import logging
 from typing import Dict, Any, Optional, List
 from src.nlp.intent.config import EntityType, IntentType
-from src.llm.gemini.client import LLMClient
+from src.llm.gemini.client import LLMClient, get_shared_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -148,12 +148,12 @@ class QuestionGenerator:
     """
 
     def __init__(self, llm_client: Optional[LLMClient] = None):
-        self.llm_client = llm_client or LLMClient()
+        self.llm_client = llm_client or get_shared_llm_client()
         self.templates = ENTITY_QUESTION_TEMPLATES  # Fallback templates
         self.confirmation_templates = CONFIRMATION_TEMPLATES
         self.question_count = {}  # Track question attempts per session
     
-    def generate(
+    async def generate(
         self,
         entity_type: EntityType,
         intent: IntentType,
@@ -185,7 +185,7 @@ class QuestionGenerator:
 
         # Try LLM-generated question for other cases
         try:
-            question = self._generate_llm_question(
+            question = await self._generate_llm_question(
                 entity_type,
                 intent,
                 collected_entities,
@@ -240,7 +240,7 @@ class QuestionGenerator:
             logger.info(f"[QuestionGenerator] Template Generated: {question[:100]}...")
             return question
     
-    def _generate_llm_question(
+    async def _generate_llm_question(
         self,
         entity_type: EntityType,
         intent: IntentType,
@@ -294,7 +294,7 @@ class QuestionGenerator:
                         options_list.append(name)
 
                 # Use LLM to generate conversational subcategory selection question
-                return self._generate_llm_subcategory_question(service_type, options_list, context_str)
+                return await self._generate_llm_subcategory_question(service_type, options_list, context_str)
 
         # Build prompt
         # Special handling for booking_id: use "Order ID" instead of "booking id"
@@ -333,7 +333,7 @@ Examples of good questions:
 Generate the question:"""
 
         # Call LLM
-        response = self.llm_client.invoke(prompt)
+        response = await self.llm_client.ainvoke(prompt)
         question = response.strip()
 
         # Validate response
@@ -563,7 +563,7 @@ Generate the question:"""
             "3. Speak with a human agent"
         )
 
-    def _generate_llm_subcategory_question(self, service_type: str, options_list: List[str], context_str: str = "") -> str:
+    async def _generate_llm_subcategory_question(self, service_type: str, options_list: List[str], context_str: str = "") -> str:
         """Generate conversational subcategory selection question using LLM"""
         try:
             # Create a conversational prompt for subcategory selection
@@ -580,9 +580,8 @@ Keep it concise but warm and professional. End with asking them to let you know
 
 {context_str}"""
 
-            response = self.llm_client.generate_response(
+            response = await self.llm_client.generate(
                 prompt=prompt,
-                max_tokens=150,
                 temperature=0.7
             )
 
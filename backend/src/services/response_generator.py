@@ -16,7 +16,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from src.llm.gemini.client import LLMClient
+from src.llm.gemini.client import LLMClient, get_shared_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -54,9 +54,9 @@ class ResponseGenerator:
         Initialize ResponseGenerator
         
         Args:
-            llm_client: LLM client for generation (if None, will create one)
+            llm_client: LLM client for generation (if None, uses the shared default client)
         """
-        self.llm_client = llm_client or LLMClient()
+        self.llm_client = llm_client or get_shared_llm_client()
         self.logger = logging.getLogger(__name__)
     
     async def generate_booking_confirmation(
@@ -103,7 +103,7 @@ INSTRUCTIONS:
 Generate the response:"""
 
             # Call LLM
-            response = self.llm_client.generate(prompt)
+            response = await self.llm_client.generate(prompt)
             response_text = response.strip()
 
             self.logger.info(f"[ResponseGenerator] Generated booking confirmation: {response_text[:100]}...")
@@ -158,7 +158,7 @@ INSTRUCTIONS:
 
 Generate the response:"""
 
-            response = self.llm_client.generate(prompt)
+            response = await self.llm_client.generate(prompt)
             response_text = response.strip()
             
             self.logger.info(f"[ResponseGenerator] Generated cancellation response: {response_text[:100]}...")
@@ -215,7 +215,7 @@ INSTRUCTIONS:
 
 Generate the response:"""
 
-            response = self.llm_client.generate(prompt)
+            response = await self.llm_client.generate(prompt)
             response_text = response.strip()
             
             self.logger.info(f"[ResponseGenerator] Generated service list response: {response_text[:100]}...")
@@ -269,7 +269,7 @@ INSTRUCTIONS:
 
 Generate the response:"""
 
-            response = self.llm_client.generate(prompt)
+            response = await self.llm_client.generate(prompt)
             response_text = response.strip()
             
             self.logger.info(f"[ResponseGenerator] Generated complaint response: {response_text[:100]}...")
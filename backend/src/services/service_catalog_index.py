@@ -0,0 +1,357 @@
+"""
+Service Catalog Index - Process-wide index of service names for fuzzy lookup
+
+ServiceDictionary used to be built per request, so every service-name
+resolution reloaded all RateCards, Subcategories and Categories and then ran
+difflib.SequenceMatcher against every name. This index is built once per
+catalog version and shared:
+
+- Names and metadata come from the CatalogSnapshot, so service-name
+  resolution and the snapshot-backed validators always see the same catalog
+- When a new snapshot is swapped in (catalog:version moved), the index is
+  rebuilt from it and swapped in atomically as one CatalogIndexData, so
+  readers never see a half-built catalog
+- Fuzzy matching looks up trigram postings to shortlist candidates and only
+  scores the shortlist with SequenceMatcher (confidences keep their old meaning)
+- Spelling correction uses a symmetric-delete (SymSpell) dictionary of the
+  words in the catalog names, precomputed at build time
+"""
+
+import asyncio
+import heapq
+import logging
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.symspell import SymSpellDictionary
+
+logger = logging.getLogger(__name__)
+
+# Trigrams in more than this share of names (and MIN_COMMON_POSTINGS names)
+# are skipped when shortlisting, e.g. " - " in "texture painting - basic"
+COMMON_TRIGRAM_RATIO = 0.2
+MIN_COMMON_POSTINGS = 64
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct character trigrams of a lowercased, space-padded string"""
+    padded = f"  {text} "
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+class TrigramIndex:
+    """
+    Trigram postings over a fixed list of names
+    """
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Build postings
+
+        Args:
+            names: Lowercased names (positions are used as ids)
+        """
+        self.names: List[str] = list(names)
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._sizes: List[int] = []
+        for name_id, name in enumerate(self.names):
+            grams = trigrams(name)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(name_id)
+        self._postings = dict(self._postings)
+
+        common_size = max(COMMON_TRIGRAM_RATIO * len(self.names), MIN_COMMON_POSTINGS)
+        self._common = {gram for gram, ids in self._postings.items() if len(ids) > common_size}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def candidates(self, query: str, limit: int) -> List[Tuple[int, float]]:
+        """
+        Names sharing the most trigrams with a query
+
+        Args:
+            query: Lowercased query
+            limit: Max candidates
+
+        Returns:
+            (name id, Dice coefficient over the non-common trigrams) pairs, best first
+        """
+        query_grams = trigrams(query)
+        lookup_grams = [gram for gram in query_grams if gram not in self._common] or query_grams
+        shared = Counter(chain.from_iterable(self._postings.get(gram, ()) for gram in lookup_grams))
+
+        query_size = len(query_grams)
+        sizes = self._sizes
+        return [
+            (name_id, 2 * count / (query_size + sizes[name_id]))
+            for name_id, count in heapq.nlargest(
+                limit, shared.items(), key=lambda item: item[1] / (query_size + sizes[item[0]])
+            )
+        ]
+
+    def fuzzy_match(self, query: str, threshold: float = 0.6, max_candidates: int = 16) -> List[Tuple[str, float]]:
+        """
+        Fuzzy match a query against the indexed names
+
+        Args:
+            query: Lowercased query
+            threshold: Min SequenceMatcher ratio
+            max_candidates: Trigram shortlist size scored with SequenceMatcher
+
+        Returns:
+            (name, ratio) pairs at or above threshold, best first
+        """
+        matches = []
+        for name_id, _ in self.candidates(query, max_candidates):
+            name = self.names[name_id]
+            # Upper bound of the ratio from the lengths alone
+            total_length = len(query) + len(name)
+            if not total_length or 2 * min(len(query), len(name)) / total_length < threshold:
+                continue
+            ratio = SequenceMatcher(None, query, name).ratio()
+            if ratio >= threshold:
+                matches.append((name, ratio))
+        matches.sort(key=lambda item: item[1], reverse=True)
+        return matches
+
+
+@dataclass(frozen=True)
+class CatalogIndexData:
+    """Immutable catalog contents for one catalog version"""
+    version: int
+    service_names: Tuple[str, ...]
+    service_metadata: Dict[str, Dict[str, Any]]
+    trigram_index: TrigramIndex
+    spelling: SymSpellDictionary
+
+
+def build_catalog_entries(rate_cards, subcategories, categories) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """
+    Build lowercased service names and their metadata from catalog rows
+
+    RateCards come first; a Subcategory or Category with the same name
+    replaces the metadata but keeps the name's position.
+
+    Args:
+        rate_cards: Active rate cards (snapshot entries or RateCard rows)
+        subcategories: Active subcategories
+        categories: Active categories
+
+    Returns:
+        Tuple of (service names, metadata by name)
+    """
+    service_names: List[str] = []
+    service_metadata: Dict[str, Dict[str, Any]] = {}
+
+    for rc in rate_cards:
+        name_lower = rc.name.lower()
+        service_names.append(name_lower)
+        service_metadata[name_lower] = {
+            "type": "rate_card",
+            "id": rc.id,
+            "name": rc.name,
+            "category_id": rc.category_id,
+            "subcategory_id": rc.subcategory_id,
+            "price": float(rc.price) if rc.price else None
+        }
+
+    for sub in subcategories:
+        name_lower = sub.name.lower()
+        if name_lower not in service_metadata:
+            service_names.append(name_lower)
+        service_metadata[name_lower] = {
+            "type": "subcategory",
+            "id": sub.id,
+            "name": sub.name,
+            "category_id": sub.category_id,
+            "subcategory_id": sub.id
+        }
+
+    for cat in categories:
+        name_lower = cat.name.lower()
+        if name_lower not in service_metadata:
+            service_names.append(name_lower)
+        service_metadata[name_lower] = {
+            "type": "category",
+            "id": cat.id,
+            "name": cat.name,
+            "category_id": cat.id,
+            "subcategory_id": None
+        }
+
+    return service_names, service_metadata
+
+
+def catalog_entries_from_snapshot(snapshot) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """
+    Build lowercased service names and their metadata from a catalog snapshot
+
+    Args:
+        snapshot: CatalogSnapshot
+
+    Returns:
+        Tuple of (service names, metadata by name)
+    """
+    return build_catalog_entries(snapshot.rate_cards, snapshot.subcategories, snapshot.categories)
+
+
+class ServiceCatalogIndex:
+    """
+    Shared index of catalog service names, following the catalog snapshot
+    """
+
+    def __init__(
+        self,
+        max_candidates: int = 16,
+        max_edit_distance: int = 2,
+        prefix_length: int = 7
+    ):
+        """
+        Initialize index (empty until the first build)
+
+        Args:
+            max_candidates: Trigram shortlist size for fuzzy matching
+            max_edit_distance: Max edit distance of a spelling correction
+            prefix_length: Word prefix length indexed by the spelling dictionary
+        """
+        self.max_candidates = max_candidates
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.data: Optional[CatalogIndexData] = None
+        # Snapshot the data was built from
+        self.source = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        """Catalog version of the built index (0 before the first build)"""
+        return self.data.version if self.data else 0
+
+    def load(
+        self,
+        service_names: List[str],
+        service_metadata: Dict[str, Dict[str, Any]],
+        version: int = 0
+    ) -> CatalogIndexData:
+        """
+        Build index data from catalog entries and swap it in
+
+        Args:
+            service_names: Lowercased service names
+            service_metadata: Metadata by name
+            version: Catalog version the entries belong to
+
+        Returns:
+            The new CatalogIndexData
+        """
+        data = CatalogIndexData(
+            version=version,
+            service_names=tuple(service_names),
+            service_metadata=service_metadata,
+            trigram_index=TrigramIndex(service_names),
+            spelling=SymSpellDictionary.from_texts(
+                service_names, max_edit_distance=self.max_edit_distance, prefix_length=self.prefix_length
+            )
+        )
+        self.data = data
+        logger.info(f"[ServiceCatalogIndex] Catalog v{data.version} indexed: {len(service_names)} service names")
+        return data
+
+    async def _sync_locked(self, snapshot) -> None:
+        # Also skip a snapshot older than the one a concurrent caller already indexed
+        if self.source is snapshot or (self.source is not None and self.source.loaded_at > snapshot.loaded_at):
+            return
+        await asyncio.to_thread(
+            lambda: self.load(*catalog_entries_from_snapshot(snapshot), version=snapshot.version)
+        )
+        self.source = snapshot
+
+    async def ensure_loaded(self, db=None) -> CatalogIndexData:
+        """
+        Get the index for the current catalog snapshot, rebuilding it if the snapshot changed
+
+        Lookups wait for a rebuild rather than read names of an older catalog
+        than the validators.
+
+        Args:
+            db: Async database session (used if the catalog was never loaded)
+
+        Returns:
+            Current CatalogIndexData
+        """
+        from src.services.catalog_snapshot import get_catalog_snapshot
+
+        if self.data is not None and self.source is None:
+            # Loaded from fixed entries with load(), not from the catalog
+            return self.data
+
+        snapshot = await get_catalog_snapshot(db)
+        if self.source is not snapshot:
+            async with self._lock:
+                await self._sync_locked(snapshot)
+        return self.data
+
+    async def refresh(self, db=None) -> CatalogIndexData:
+        """
+        Reload the catalog snapshot from the database and rebuild the index from it
+
+        Args:
+            db: Async database session (default: a new session)
+
+        Returns:
+            The new CatalogIndexData
+        """
+        from src.services.catalog_snapshot import get_catalog_snapshot_store
+
+        snapshot = await get_catalog_snapshot_store().refresh(db)
+        async with self._lock:
+            await self._sync_locked(snapshot)
+        return self.data
+
+    def fuzzy_match(self, query: str, threshold: float = 0.6) -> List[Dict[str, Any]]:
+        """
+        Find fuzzy matches for a query in the loaded catalog
+
+        Args:
+            query: Search query
+            threshold: Minimum similarity score (0.0 to 1.0)
+
+        Returns:
+            Matches with metadata and confidence scores, best first
+        """
+        data = self.data
+        if data is None:
+            return []
+
+        matches = data.trigram_index.fuzzy_match(query.lower().strip(), threshold, self.max_candidates)
+        return [
+            {"name": name, "confidence": ratio, "metadata": data.service_metadata[name]}
+            for name, ratio in matches
+        ]
+
+
+_service_catalog_index: Optional[ServiceCatalogIndex] = None
+
+
+def get_service_catalog_index() -> ServiceCatalogIndex:
+    """
+    Get the process-wide service catalog index (singleton pattern)
+
+    Returns:
+        ServiceCatalogIndex instance
+    """
+    global _service_catalog_index
+    if _service_catalog_index is None:
+        from src.core.config import settings
+
+        _service_catalog_index = ServiceCatalogIndex(
+            max_candidates=settings.SERVICE_CATALOG_FUZZY_CANDIDATES,
+            max_edit_distance=settings.SERVICE_SPELLING_MAX_EDIT_DISTANCE,
+            prefix_length=settings.SERVICE_SPELLING_PREFIX_LENGTH
+        )
+    return _service_catalog_index
@@ -5,13 +5,10 @@ Handles validation of service types and determines when subcategory selection is
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
 
-from src.core.models.category import Category, Subcategory
-from src.core.models.rate_card import RateCard
+from src.services.catalog_snapshot import get_catalog_snapshot
 from src.utils.entity_normalizer import normalize_service_type
 
 logger = logging.getLogger(__name__)
@@ -37,6 +34,13 @@ class ServiceCategoryValidationResult:
         self.normalized_service_type = normalized_service_type
 
 
+def _one_or_none(matches: Sequence[Any], kind: str, term: str) -> Optional[Any]:
+    """Single match, None, or ValueError when the term is ambiguous"""
+    if len(matches) > 1:
+        raise ValueError(f"Multiple {kind} rows match '{term}'")
+    return matches[0] if matches else None
+
+
 class ServiceCategoryValidator:
     """
     Validates service types and determines subcategory requirements
@@ -78,28 +82,14 @@ class ServiceCategoryValidator:
             # e.g., "appliance_repair" → "appliance repair", "tv_repair" → "tv repair"
             search_term = normalized.replace('_', ' ')
 
+            snapshot = await get_catalog_snapshot(self.db)
+
             # First, check if this is a specific subcategory (e.g., "tv repair", "ac repair")
-            subcategory_result = await self.db.execute(
-                select(Subcategory)
-                .where(
-                    func.lower(Subcategory.name).like(f"%{search_term}%"),
-                    Subcategory.is_active == True
-                )
-                .options(selectinload(Subcategory.category))
-            )
-            subcategory = subcategory_result.scalar_one_or_none()
+            subcategory = _one_or_none(snapshot.search_subcategories(search_term), "subcategory", search_term)
 
             if subcategory:
                 # Found a specific subcategory - check if it has rate cards
-                rate_cards_result = await self.db.execute(
-                    select(RateCard)
-                    .where(
-                        RateCard.subcategory_id == subcategory.id,
-                        RateCard.is_active == True
-                    )
-                    .order_by(RateCard.price)
-                )
-                rate_cards = rate_cards_result.scalars().all()
+                rate_cards = snapshot.rate_cards_by_price(subcategory.id)
 
                 if rate_cards:
                     logger.info(f"[ServiceCategoryValidator] Found specific subcategory: {subcategory.name} with {len(rate_cards)} rate cards")
@@ -113,15 +103,7 @@ class ServiceCategoryValidator:
                     )
 
             # Not a specific subcategory, search for category
-            category_result = await self.db.execute(
-                select(Category)
-                .where(
-                    func.lower(Category.name).like(f"%{search_term}%"),
-                    Category.is_active == True
-                )
-                .options(selectinload(Category.subcategories))
-            )
-            category = category_result.scalar_one_or_none()
+            category = _one_or_none(snapshot.search_categories(search_term), "category", search_term)
 
             if not category:
                 return ServiceCategoryValidationResult(
@@ -131,18 +113,8 @@ class ServiceCategoryValidator:
             
             logger.info(f"[ServiceCategoryValidator] Found category: {category.name} (ID: {category.id})")
             
-            # Get active subcategories with rate cards
-            subcategories_result = await self.db.execute(
-                select(Subcategory, func.count(RateCard.id).label('rate_card_count'))
-                .outerjoin(RateCard, Subcategory.id == RateCard.subcategory_id)
-                .where(
-                    Subcategory.category_id == category.id,
-                    Subcategory.is_active == True
-                )
-                .group_by(Subcategory.id)
-                .order_by(Subcategory.display_order, Subcategory.name)
-            )
-            subcategories_data = subcategories_result.all()
+            # Active subcategories (rate card counts include inactive rate cards)
+            subcategories_data = snapshot.list_subcategories(category.id)
             
             if not subcategories_data:
                 return ServiceCategoryValidationResult(
@@ -151,7 +123,7 @@ class ServiceCategoryValidator:
                 )
             
             # Filter subcategories that have rate cards
-            valid_subcategories = [(subcat, count) for subcat, count in subcategories_data if count > 0]
+            valid_subcategories = [subcat for subcat in subcategories_data if subcat.rate_card_count > 0]
             
             if not valid_subcategories:
                 return ServiceCategoryValidationResult(
@@ -163,19 +135,9 @@ class ServiceCategoryValidator:
             
             # If only one subcategory, get the default rate card
             if len(valid_subcategories) == 1:
-                subcategory = valid_subcategories[0][0]
-                
-                # Get the first active rate card for this subcategory
-                rate_card_result = await self.db.execute(
-                    select(RateCard)
-                    .where(
-                        RateCard.subcategory_id == subcategory.id,
-                        RateCard.is_active == True
-                    )
-                    .order_by(RateCard.price)  # Get cheapest option as default
-                    .limit(1)
-                )
-                default_rate_card = rate_card_result.scalar_one_or_none()
+                # Cheapest active rate card as default
+                rate_cards = snapshot.rate_cards_by_price(valid_subcategories[0].id)
+                default_rate_card = rate_cards[0] if rate_cards else None
                 
                 return ServiceCategoryValidationResult(
                     is_valid=True,
@@ -186,17 +148,8 @@ class ServiceCategoryValidator:
             
             # Multiple subcategories - need user selection
             available_subcategories = []
-            for subcategory, rate_card_count in valid_subcategories:
-                # Get rate cards for this subcategory
-                rate_cards_result = await self.db.execute(
-                    select(RateCard)
-                    .where(
-                        RateCard.subcategory_id == subcategory.id,
-                        RateCard.is_active == True
-                    )
-                    .order_by(RateCard.price)
-                )
-                rate_cards = rate_cards_result.scalars().all()
+            for subcategory in valid_subcategories:
+                rate_cards = snapshot.rate_cards_by_price(subcategory.id)
                 
                 subcategory_info = {
                     "id": subcategory.id,
@@ -1,145 +1,76 @@
 """
 Service Dictionary - Database-backed dictionary for spell correction
 
-This service maintains a cached dictionary of all service names from the database
+This service reads service names from the process-wide ServiceCatalogIndex
 for fast spell correction and fuzzy matching.
 
 Features:
-- Loads all RateCard names, Subcategory names, and Category names
-- Builds a spell-checker dictionary
-- Provides fuzzy matching with confidence scores
-- Auto-refreshes cache periodically
+- Reads all RateCard names, Subcategory names, and Category names from the catalog snapshot
+- Corrects typos word by word with a precomputed SymSpell dictionary
+- Provides fuzzy matching with confidence scores (trigram shortlist + SequenceMatcher)
+- Follows catalog version changes together with the rest of the snapshot readers
 """
 
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from datetime import datetime, timedelta
-import re
-from difflib import SequenceMatcher
 
-# NLP imports
-try:
-    from spellchecker import SpellChecker
-    NLP_AVAILABLE = True
-except ImportError:
-    NLP_AVAILABLE = False
-    logging.warning("SpellChecker not available. Install pyspellchecker for spell correction.")
-
-from src.core.models import RateCard, Subcategory, Category
+from src.services.service_catalog_index import ServiceCatalogIndex, get_service_catalog_index
+from src.utils.symspell import SymSpellDictionary
 
 logger = logging.getLogger(__name__)
 
+# Words up to this length are corrected by at most one edit
+SHORT_WORD_LENGTH = 4
+
 
 class ServiceDictionary:
     """
     Database-backed dictionary for service name spell correction
     
-    Maintains a cached dictionary of all service names and provides
+    Reads the shared, versioned service catalog index and provides
     spell correction and fuzzy matching capabilities.
     """
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, index: Optional[ServiceCatalogIndex] = None):
         """
         Initialize ServiceDictionary
         
         Args:
-            db: Database session
+            db: Database session (used only if the shared index is not loaded yet)
+            index: Catalog index (default: the process-wide index)
         """
         self.db = db
-        self.spell_checker = SpellChecker() if NLP_AVAILABLE else None
-        
-        # Cache
-        self.service_names: List[str] = []
-        self.service_metadata: Dict[str, Dict[str, Any]] = {}
-        self.cache_timestamp: Optional[datetime] = None
-        self.cache_ttl = timedelta(hours=1)  # Refresh cache every hour
+        self.index = index or get_service_catalog_index()
+
+    @property
+    def service_names(self) -> List[str]:
+        """Lowercased service names in the loaded catalog"""
+        return list(self.index.data.service_names) if self.index.data else []
+
+    @property
+    def service_metadata(self) -> Dict[str, Dict[str, Any]]:
+        """Metadata by lowercased service name"""
+        return self.index.data.service_metadata if self.index.data else {}
+
+    @property
+    def spelling(self) -> Optional[SymSpellDictionary]:
+        """Spelling dictionary of the words in the catalog's service names"""
+        return self.index.data.spelling if self.index.data else None
         
     async def refresh_cache(self, force: bool = False) -> None:
         """
-        Refresh the service dictionary cache from database
+        Make sure the shared service catalog is loaded
         
         Args:
-            force: Force refresh even if cache is still valid
+            force: Reload the catalog snapshot from the database even if it is current
         """
-        # Check if cache is still valid
-        if not force and self.cache_timestamp:
-            if datetime.now() - self.cache_timestamp < self.cache_ttl:
-                logger.debug("[ServiceDictionary] Cache still valid, skipping refresh")
-                return
-        
-        logger.info("[ServiceDictionary] Refreshing service dictionary cache...")
-        
-        try:
-            # Load all RateCards
-            rate_cards_query = select(RateCard).where(RateCard.is_active == True)
-            rate_cards_result = await self.db.execute(rate_cards_query)
-            rate_cards = rate_cards_result.scalars().all()
-            
-            # Load all Subcategories
-            subcategories_query = select(Subcategory).where(Subcategory.is_active == True)
-            subcategories_result = await self.db.execute(subcategories_query)
-            subcategories = subcategories_result.scalars().all()
-            
-            # Load all Categories
-            categories_query = select(Category).where(Category.is_active == True)
-            categories_result = await self.db.execute(categories_query)
-            categories = categories_result.scalars().all()
-            
-            # Build dictionary
-            self.service_names = []
-            self.service_metadata = {}
-            
-            # Add RateCards
-            for rc in rate_cards:
-                name_lower = rc.name.lower()
-                self.service_names.append(name_lower)
-                self.service_metadata[name_lower] = {
-                    "type": "rate_card",
-                    "id": rc.id,
-                    "name": rc.name,
-                    "category_id": rc.category_id,
-                    "subcategory_id": rc.subcategory_id,
-                    "price": float(rc.price) if rc.price else None
-                }
-            
-            # Add Subcategories
-            for sub in subcategories:
-                name_lower = sub.name.lower()
-                if name_lower not in self.service_metadata:
-                    self.service_names.append(name_lower)
-                self.service_metadata[name_lower] = {
-                    "type": "subcategory",
-                    "id": sub.id,
-                    "name": sub.name,
-                    "category_id": sub.category_id,
-                    "subcategory_id": sub.id
-                }
-            
-            # Add Categories
-            for cat in categories:
-                name_lower = cat.name.lower()
-                if name_lower not in self.service_metadata:
-                    self.service_names.append(name_lower)
-                self.service_metadata[name_lower] = {
-                    "type": "category",
-                    "id": cat.id,
-                    "name": cat.name,
-                    "category_id": cat.id,
-                    "subcategory_id": None
-                }
-            
-            # Update spell checker dictionary
-            if self.spell_checker:
-                self.spell_checker.word_frequency.load_words(self.service_names)
-            
-            self.cache_timestamp = datetime.now()
-            logger.info(f"[ServiceDictionary] Cache refreshed: {len(self.service_names)} service names loaded")
-            
-        except Exception as e:
-            logger.error(f"[ServiceDictionary] Failed to refresh cache: {e}")
-            raise
+        if force:
+            logger.info("[ServiceDictionary] Refreshing service dictionary cache...")
+            await self.index.refresh(self.db)
+            return
+
+        await self.index.ensure_loaded(self.db)
     
     async def correct_spelling(self, text: str) -> Tuple[str, float]:
         """
@@ -154,13 +85,13 @@ class ServiceDictionary:
         """
         await self.refresh_cache()
         
-        if not self.spell_checker:
+        if not self.spelling:
             return text, 1.0
         
         text_lower = text.lower().strip()
         
         # Check if exact match exists
-        if text_lower in self.service_names:
+        if text_lower in self.service_metadata:
             return text_lower, 1.0
         
         # Try spell correction on individual words
@@ -169,11 +100,13 @@ class ServiceDictionary:
         was_corrected = False
         
         for word in words:
-            if word in self.service_names:
+            # Known words, separators ("-") and numbers are kept as is
+            if word in self.service_metadata or not word.isalpha():
                 corrected_words.append(word)
             else:
                 # Try to correct this word
-                corrected = self.spell_checker.correction(word)
+                max_distance = 1 if len(word) <= SHORT_WORD_LENGTH else None
+                corrected = self.spelling.correction(word, max_distance)
                 if corrected and corrected != word:
                     corrected_words.append(corrected)
                     was_corrected = True
@@ -205,25 +138,7 @@ class ServiceDictionary:
             ]
         """
         await self.refresh_cache()
-        
-        query_lower = query.lower().strip()
-        matches = []
-        
-        for service_name in self.service_names:
-            # Calculate similarity
-            similarity = SequenceMatcher(None, query_lower, service_name).ratio()
-            
-            if similarity >= threshold:
-                matches.append({
-                    "name": service_name,
-                    "confidence": similarity,
-                    "metadata": self.service_metadata[service_name]
-                })
-        
-        # Sort by confidence (descending)
-        matches.sort(key=lambda x: x["confidence"], reverse=True)
-        
-        return matches
+        return self.index.fuzzy_match(query, threshold=threshold)
     
     async def search(self, query: str) -> List[Dict[str, Any]]:
         """
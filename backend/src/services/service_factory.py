@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.services.slot_filling_service import SlotFillingService
 from src.nlp.intent.classifier import IntentClassifier
+from src.nlp.intent.result_cache import CachedIntentClassifier
 from src.services.dialog_state_manager import DialogStateManager
 from src.services.question_generator import QuestionGenerator
 from src.services.entity_extractor import EntityExtractor
@@ -54,7 +55,7 @@ class SlotFillingServiceFactory:
             logger.debug("[ServiceFactory] ✅ LLM clients initialized")
             
             # 2. Initialize intent classifier
-            classifier = IntentClassifier(llm_client=classification_llm)
+            classifier = CachedIntentClassifier(IntentClassifier(llm_client=classification_llm))
             logger.debug("[ServiceFactory] ✅ Intent classifier initialized")
             
             # 3. Initialize dialog state manager
@@ -0,0 +1,387 @@
+"""
+Service Search Index - In-process BM25 inverted index over rate cards
+
+ServiceAgent._search_services used to run RateCard.name/description
+ILIKE '%q%' (a full table scan) and sort the hits by price. This index ranks
+active rate cards by relevance instead:
+
+- Each rate card is one document made of its name, description, subcategory
+  name and category name; fields are weighted (a name hit counts more than a
+  description hit) and scored with BM25 over the weighted term frequencies
+- Query words also match vocabulary words they prefix ("clean" -> "cleaning"),
+  at a lower weight, keeping ILIKE's partial-word recall
+- The index follows the CatalogSnapshot: when a new snapshot is swapped in,
+  only added, removed and changed rate cards are re-indexed
+- max_price / min_price / category_id filters are applied to scored hits
+"""
+
+import asyncio
+import bisect
+import logging
+import math
+from collections import Counter
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.symspell import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of a term occurrence per field
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "subcategory": 2.0,
+    "category": 1.5,
+    "description": 1.0,
+}
+
+# Max vocabulary words a query word expands to, and the weight of such prefix matches
+MAX_PREFIX_EXPANSIONS = 8
+PREFIX_MATCH_WEIGHT = 0.5
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    """Indexed rate card with the fields it is searched and filtered by"""
+    id: int
+    name: str
+    description: Optional[str]
+    subcategory: str
+    category: str
+    category_id: int
+    price: Decimal
+    strike_price: Optional[Decimal]
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """Scored search result"""
+    document: SearchDocument
+    score: float
+
+
+def documents_from_snapshot(snapshot) -> Dict[int, SearchDocument]:
+    """
+    Search documents for every active rate card of a catalog snapshot
+
+    Args:
+        snapshot: CatalogSnapshot
+
+    Returns:
+        Documents by rate card id
+    """
+    documents = {}
+    for rc in snapshot.rate_cards:
+        subcategory = snapshot.get_subcategory(rc.subcategory_id)
+        category = snapshot.get_category(rc.category_id)
+        documents[rc.id] = SearchDocument(
+            id=rc.id,
+            name=rc.name,
+            description=rc.description,
+            subcategory=subcategory.name if subcategory else "",
+            category=category.name if category else "",
+            category_id=rc.category_id,
+            price=rc.price,
+            strike_price=rc.strike_price
+        )
+    return documents
+
+
+class ServiceSearchIndex:
+    """
+    BM25 inverted index with incremental add/remove
+
+    Documents live in dense slots; per-slot length, price and category arrays
+    and per-term (slots, frequencies) arrays let a query be scored and
+    filtered with NumPy instead of a Python loop over every posting.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, field_weights: Optional[Dict[str, float]] = None):
+        """
+        Initialize an empty index
+
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+            field_weights: Weight of a term occurrence per field (default: FIELD_WEIGHTS)
+        """
+        self.k1 = k1
+        self.b = b
+        self.field_weights = field_weights or FIELD_WEIGHTS
+        self.documents: Dict[int, SearchDocument] = {}
+        self.source = None  # Snapshot the index was last synced with
+        self.lock = asyncio.Lock()  # Held by async callers while syncing or searching
+
+        self._slots: Dict[int, int] = {}
+        self._slot_ids: List[Optional[int]] = []
+        self._free_slots: List[int] = []
+        self._lengths = np.zeros(0, dtype=np.float64)
+        self._prices = np.zeros(0, dtype=np.float64)
+        self._category_ids = np.zeros(0, dtype=np.int64)
+        self._total_length = 0.0
+
+        self._postings: Dict[str, Dict[int, float]] = {}  # term -> {slot: weighted tf}
+        self._doc_terms: Dict[int, Dict[str, float]] = {}
+        self._compiled: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._vocabulary: List[str] = []  # Sorted, rebuilt lazily for prefix expansion
+        self._vocabulary_dirty = False
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def _weighted_terms(self, document: SearchDocument) -> Dict[str, float]:
+        terms: Counter = Counter()
+        for field_name, weight in self.field_weights.items():
+            for term in tokenize(getattr(document, field_name) or ""):
+                terms[term] += weight
+        return terms
+
+    def _allocate_slot(self) -> int:
+        if self._free_slots:
+            return self._free_slots.pop()
+
+        slot = len(self._slot_ids)
+        self._slot_ids.append(None)
+        if slot >= len(self._lengths):
+            capacity = max(1024, 2 * len(self._lengths))
+            self._lengths = np.resize(self._lengths, capacity)
+            self._prices = np.resize(self._prices, capacity)
+            self._category_ids = np.resize(self._category_ids, capacity)
+        return slot
+
+    def add(self, document: SearchDocument) -> None:
+        """
+        Index a document (replaces a document with the same id)
+
+        Args:
+            document: SearchDocument
+        """
+        if document.id in self.documents:
+            self.remove(document.id)
+
+        slot = self._allocate_slot()
+        terms = self._weighted_terms(document)
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary_dirty = True
+            postings[slot] = frequency
+            self._compiled.pop(term, None)
+
+        length = sum(terms.values())
+        self.documents[document.id] = document
+        self._doc_terms[document.id] = terms
+        self._slots[document.id] = slot
+        self._slot_ids[slot] = document.id
+        self._lengths[slot] = length
+        self._prices[slot] = float(document.price)
+        self._category_ids[slot] = document.category_id
+        self._total_length += length
+
+    def remove(self, document_id: int) -> None:
+        """
+        Remove a document if indexed
+
+        Args:
+            document_id: Rate card id
+        """
+        if document_id not in self.documents:
+            return
+
+        slot = self._slots.pop(document_id)
+        for term in self._doc_terms.pop(document_id):
+            postings = self._postings[term]
+            del postings[slot]
+            self._compiled.pop(term, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+
+        self._total_length -= self._lengths[slot]
+        self._lengths[slot] = 0.0
+        self._slot_ids[slot] = None
+        self._free_slots.append(slot)
+        del self.documents[document_id]
+
+    def sync(self, documents: Dict[int, SearchDocument], source=None) -> Tuple[int, int]:
+        """
+        Bring the index in line with a full set of documents, touching only differences
+
+        Args:
+            documents: Documents by id (e.g. from documents_from_snapshot)
+            source: Object the documents came from, remembered as self.source
+
+        Returns:
+            Tuple of (documents added or changed, documents removed)
+        """
+        removed = [doc_id for doc_id in self.documents if doc_id not in documents]
+        for doc_id in removed:
+            self.remove(doc_id)
+
+        changed = 0
+        for doc_id, document in documents.items():
+            if self.documents.get(doc_id) != document:
+                self.add(document)
+                changed += 1
+
+        self.source = source
+        return changed, len(removed)
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        """Vocabulary words for a query word with their weights: itself, then words it prefixes"""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+
+        expansions = [(term, 1.0)] if term in self._postings else []
+        start = bisect.bisect_right(self._vocabulary, term)
+        for word in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not word.startswith(term):
+                break
+            expansions.append((word, PREFIX_MATCH_WEIGHT))
+        return expansions
+
+    def _compiled_postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        compiled = self._compiled.get(term)
+        if compiled is None:
+            postings = self._postings[term]
+            compiled = (
+                np.fromiter(postings.keys(), dtype=np.int64, count=len(postings)),
+                np.fromiter(postings.values(), dtype=np.float64, count=len(postings))
+            )
+            self._compiled[term] = compiled
+        return compiled
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        max_price: Optional[Any] = None,
+        min_price: Optional[Any] = None,
+        category_id: Optional[int] = None
+    ) -> List[SearchHit]:
+        """
+        Rank documents for a query
+
+        Args:
+            query: Search text
+            limit: Max hits
+            max_price: Only hits priced at or below this
+            min_price: Only hits priced at or above this
+            category_id: Only hits in this category
+
+        Returns:
+            Hits by descending score (cheaper first on ties)
+        """
+        if not self.documents:
+            return []
+
+        count = len(self.documents)
+        average_length = self._total_length / count
+        scores = np.zeros(len(self._slot_ids), dtype=np.float64)
+
+        for query_term in dict.fromkeys(tokenize(query)):
+            for term, weight in self._expand(query_term):
+                slots, frequencies = self._compiled_postings(term)
+                idf = weight * math.log(1 + (count - len(slots) + 0.5) / (len(slots) + 0.5))
+                norms = self.k1 * (1 - self.b + self.b * self._lengths[slots] / average_length)
+                # Slots are unique within one term's postings
+                scores[slots] += idf * frequencies * (self.k1 + 1) / (frequencies + norms)
+
+        mask = scores > 0
+        size = len(scores)
+        if max_price:
+            mask &= self._prices[:size] <= float(Decimal(str(max_price)))
+        if min_price:
+            mask &= self._prices[:size] >= float(Decimal(str(min_price)))
+        if category_id:
+            mask &= self._category_ids[:size] == int(category_id)
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > limit:
+            # Keep everything tied with the limit-th score so price can break ties
+            threshold = -np.partition(-scores[candidates], limit - 1)[limit - 1]
+            candidates = candidates[scores[candidates] >= threshold]
+
+        # Last key is primary: score desc, then price, then slot
+        order = np.lexsort((candidates, self._prices[candidates], -scores[candidates]))[:limit]
+        return [
+            SearchHit(self.documents[self._slot_ids[slot]], float(scores[slot]))
+            for slot in candidates[order]
+        ]
+
+
+_service_search_index: Optional[ServiceSearchIndex] = None
+
+
+def get_service_search_index() -> ServiceSearchIndex:
+    """
+    Get the process-wide service search index (singleton pattern)
+
+    Returns:
+        ServiceSearchIndex instance
+    """
+    global _service_search_index
+    if _service_search_index is None:
+        _service_search_index = ServiceSearchIndex()
+    return _service_search_index
+
+
+async def _sync_locked(index: ServiceSearchIndex, snapshot) -> None:
+    if index.source is snapshot:
+        return
+    changed, removed = await asyncio.to_thread(
+        lambda: index.sync(documents_from_snapshot(snapshot), source=snapshot)
+    )
+    logger.info(
+        f"[ServiceSearchIndex] Synced with catalog v{snapshot.version}: "
+        f"{changed} indexed, {removed} removed, {len(index)} total"
+    )
+
+
+async def sync_service_search_index(db=None) -> ServiceSearchIndex:
+    """
+    Sync the shared index with the current catalog snapshot (e.g. at startup)
+
+    Args:
+        db: Async database session (used if the catalog was never loaded)
+
+    Returns:
+        ServiceSearchIndex instance
+    """
+    from src.services.catalog_snapshot import get_catalog_snapshot
+
+    index = get_service_search_index()
+    snapshot = await get_catalog_snapshot(db)
+    async with index.lock:
+        await _sync_locked(index, snapshot)
+    return index
+
+
+async def search_services(db, query: str, limit: int = 20, **filters) -> List[SearchHit]:
+    """
+    Search active rate cards, syncing the index with the current catalog snapshot first
+
+    Syncing runs in a worker thread; searches wait for it rather than read a
+    half-updated index.
+
+    Args:
+        db: Async database session (used if the catalog was never loaded)
+        query: Search text
+        limit: Max hits
+        **filters: max_price, min_price, category_id
+
+    Returns:
+        Hits by descending score
+    """
+    from src.services.catalog_snapshot import get_catalog_snapshot
+
+    index = get_service_search_index()
+    snapshot = await get_catalog_snapshot(db)
+    async with index.lock:
+        await _sync_locked(index, snapshot)
+        return index.search(query, limit=limit, **filters)
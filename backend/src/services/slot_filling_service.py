@@ -254,9 +254,14 @@ class SlotFillingService:
             List of conversation messages in chronological order
         """
         try:
+            from src.core.database.write_behind import get_write_behind_queue
             from src.core.models import Conversation
             from sqlalchemy import select, asc
 
+            queue = get_write_behind_queue()
+            if queue is not None:
+                await queue.flush_if_pending(Conversation, session_id=session_id)
+
             # Get messages in chronological order (oldest first)
             result = await self.db.execute(
                 select(Conversation)
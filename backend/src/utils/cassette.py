@@ -0,0 +1,143 @@
+"""
+Record/replay cassettes and synthetic latency for local backends.
+
+A cassette is an append-only JSONL file of {"key": ..., "value": {...}}
+entries. Local LLM and vector-store backends record real responses into a
+cassette and replay them later without network access, optionally with a
+synthetic latency distribution so load benchmarks still see realistic
+service times.
+"""
+
+import json
+import logging
+import math
+import random
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Cassette:
+    """
+    Append-only JSONL store of recorded responses keyed by request hash.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize cassette, loading existing entries.
+
+        Args:
+            path: Path of the JSONL cassette file
+        """
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    self._entries[entry["key"]] = entry["value"]
+            logger.info(f"Loaded cassette {self.path} ({len(self._entries)} entries)")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a recorded value.
+
+        Args:
+            key: Request key
+
+        Returns:
+            Recorded value or None
+        """
+        return self._entries.get(key)
+
+    def record(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Record a value (last write wins on replay).
+
+        Args:
+            key: Request key
+            value: JSON-serializable value
+        """
+        with self._lock:
+            self._entries[key] = value
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "value": value}, default=str) + "\n")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LatencyModel:
+    """
+    Synthetic latency distribution for replayed or fake responses.
+
+    Spec strings:
+        recorded                     - replay the latency captured when recording
+        none                         - no delay
+        fixed:<ms>                   - constant delay
+        uniform:<min_ms>:<max_ms>    - uniform delay
+        lognormal:<median_ms>:<sigma> - long-tailed delay, typical of LLM APIs
+    """
+
+    KINDS = ("recorded", "none", "fixed", "uniform", "lognormal")
+
+    def __init__(self, kind: str = "none", params: tuple = (), seed: Optional[int] = None):
+        """
+        Initialize latency model.
+
+        Args:
+            kind: Distribution kind (see KINDS)
+            params: Distribution parameters in milliseconds (sigma is unitless)
+            seed: Seed for reproducible delays
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}', expected one of {self.KINDS}")
+        self.kind = kind
+        self.params = params
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_spec(cls, spec: str, seed: Optional[int] = None) -> "LatencyModel":
+        """
+        Parse a latency spec string.
+
+        Args:
+            spec: Spec string, e.g. "lognormal:800:0.5"
+            seed: Seed for reproducible delays
+
+        Returns:
+            LatencyModel instance
+        """
+        kind, *params = (spec or "none").strip().lower().split(":")
+        return cls(kind, tuple(float(p) for p in params), seed=seed)
+
+    def sample(self, recorded_ms: Optional[float] = None) -> float:
+        """
+        Draw one delay.
+
+        Args:
+            recorded_ms: Latency captured at record time (used by "recorded")
+
+        Returns:
+            Delay in seconds
+        """
+        if self.kind == "recorded":
+            delay_ms = recorded_ms or 0.0
+        elif self.kind == "fixed":
+            delay_ms = self.params[0]
+        elif self.kind == "uniform":
+            delay_ms = self._random.uniform(self.params[0], self.params[1])
+        elif self.kind == "lognormal":
+            median_ms, sigma = self.params
+            delay_ms = self._random.lognormvariate(math.log(median_ms), sigma)
+        else:
+            delay_ms = 0.0
+        return max(delay_ms, 0.0) / 1000
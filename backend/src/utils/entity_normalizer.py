@@ -7,17 +7,212 @@ Centralized entity normalization functions to ensure consistency across:
 - LLM extraction (classifier.py)
 
 All entity extraction paths should use these functions to normalize raw values.
+
+Date, time and location normalization is a compiled engine:
+- every regex and strptime format is compiled once at import
+- normalize_date results are memoised per calendar day (relative expressions
+  like "tomorrow" resolve differently tomorrow), normalize_time and
+  normalize_location results are memoised outright
+- scan_date_time finds the raw date / time / combined date-time spans in a
+  message once, and every extractor reads from that shared scan
 """
 
 import re
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
+from datetime import date, datetime, timedelta
 from dateutil import parser as dateutil_parser
 from dateutil.relativedelta import relativedelta
 
 logger = logging.getLogger(__name__)
 
+_MONTHS = "january|february|march|april|may|june|july|august|september|october|november|december"
+_MONTHS_SHORT = "jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec"
+_WEEKDAYS = "monday|tuesday|wednesday|thursday|friday|saturday|sunday|mon|tue|wed|thu|fri|sat|sun"
+_CLOCK_TIME = r"\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.)"
+
+# normalize_date
+_IN_DAYS_PATTERN = re.compile(r'(?:in|after)\s+(\d+)\s+days?')
+_IN_WEEKS_PATTERN = re.compile(r'(?:in|after)\s+(\d+)\s+weeks?')
+_ISO_DATE_EXACT_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+_NUMERIC_DATE_PATTERN = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})')
+_ORDINAL_SUFFIX_PATTERN = re.compile(r'(\d+)(st|nd|rd|th)')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_MONTH_NAME_PATTERN = re.compile(rf'(?:{_MONTHS_SHORT})')
+_YEAR_PATTERN = re.compile(r'\d{4}')
+
+_WEEKDAY_NUMBERS = {
+    'monday': 0, 'mon': 0,
+    'tuesday': 1, 'tue': 1, 'tues': 1,
+    'wednesday': 2, 'wed': 2,
+    'thursday': 3, 'thu': 3, 'thur': 3, 'thurs': 3,
+    'friday': 4, 'fri': 4,
+    'saturday': 5, 'sat': 5,
+    'sunday': 6, 'sun': 6
+}
+
+# Month-name dates after ordinal suffixes are stripped: "30 october", "october 30",
+# "30 oct 2025", "december 15, 2025", "15 dec, 2025" (the shapes strptime accepted
+# for "%d %B", "%B %d", "%d %b %Y", "%B %d, %Y", ...)
+_MONTH_NUMBERS = {
+    name: number
+    for number, (full, short) in enumerate(zip(_MONTHS.split("|"), _MONTHS_SHORT.split("|")), start=1)
+    for name in (full, short)
+}
+_DAY_MONTH_PATTERN = re.compile(rf'^(\d{{1,2}}) ({_MONTHS}|{_MONTHS_SHORT})(?:,? (\d{{4}}))?$')
+_MONTH_DAY_PATTERN = re.compile(rf'^({_MONTHS}|{_MONTHS_SHORT}) (\d{{1,2}})(?:,? (\d{{4}}))?$')
+
+# normalize_time
+_CLOCK_TIME_PATTERN = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)')
+_TIME_24H_EXACT_PATTERN = re.compile(r'^(\d{1,2}):(\d{2})$')
+_TIME_OF_DAY = (("morning", "10:00"), ("afternoon", "14:00"), ("evening", "18:00"), ("night", "20:00"))
+
+# normalize_location
+_PINCODE_PATTERN = re.compile(r'\b(\d{6})\b')
+
+# scan_date_time: raw date spans, most specific first, with their confidence
+_TODAY_PATTERN = re.compile(r'\b(today|now)\b')
+_TOMORROW_PATTERN = re.compile(r'\b(tomorrow|tmrw|tmr)\b')
+_IN_DAYS_SPAN_PATTERN = re.compile(r'(?:in|after)\s+\d+\s+days?')
+_IN_WEEKS_SPAN_PATTERN = re.compile(r'(?:in|after)\s+\d+\s+weeks?')
+_WEEKDAY_SPAN_PATTERN = re.compile(rf'\b(?:next\s+|this\s+)?({_WEEKDAYS})\b')
+_NATURAL_DATE_WITH_YEAR_PATTERNS = [
+    re.compile(rf'(\d{{1,2}})(st|nd|rd|th)?\s+({_MONTHS}),?\s+\d{{4}}'),
+    re.compile(rf'(\d{{1,2}})(st|nd|rd|th)?\s+({_MONTHS_SHORT}),?\s+\d{{4}}'),
+    re.compile(rf'({_MONTHS})\s+(\d{{1,2}})(st|nd|rd|th)?,?\s+\d{{4}}'),
+    re.compile(rf'({_MONTHS_SHORT})\s+(\d{{1,2}})(st|nd|rd|th)?,?\s+\d{{4}}'),
+]
+_NATURAL_DATE_PATTERNS = [
+    re.compile(rf'(\d{{1,2}})(st|nd|rd|th)?\s+({_MONTHS})'),
+    re.compile(rf'(\d{{1,2}})(st|nd|rd|th)?\s+({_MONTHS_SHORT})'),
+    re.compile(rf'({_MONTHS})\s+(\d{{1,2}})(st|nd|rd|th)?'),
+    re.compile(rf'({_MONTHS_SHORT})\s+(\d{{1,2}})(st|nd|rd|th)?'),
+]
+_ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_TIME_24H_PATTERN = re.compile(r'(\d{1,2}):(\d{2})')
+
+# scan_date_time: combined "<date> [at] <time>" spans
+_COMBINED_DATE_TIME_PATTERNS = [
+    # "tomorrow 4pm", "today 3pm"
+    re.compile(rf'(today|tomorrow|tmrw|tmr)\s+({_CLOCK_TIME})'),
+    # "tomorrow at 4pm", "today at 3:30pm"
+    re.compile(rf'(today|tomorrow|tmrw|tmr)\s+at\s+({_CLOCK_TIME})'),
+    # "in 3 days at 2pm", "after 5 days at 3pm"
+    re.compile(rf'((?:in|after)\s+\d+\s+days?)\s+(?:at\s+)?({_CLOCK_TIME})'),
+    # "December 15th, 2025 at 2pm", "15th Dec, 2025 at 3pm"
+    re.compile(rf'(\d{{1,2}}(?:st|nd|rd|th)?\s+(?:{_MONTHS}|{_MONTHS_SHORT}),?\s+\d{{4}})\s+(?:at\s+)?({_CLOCK_TIME})'),
+    # "31st October 4pm", "December 25th at 2pm"
+    re.compile(rf'(\d{{1,2}}(?:st|nd|rd|th)?\s+(?:{_MONTHS}|{_MONTHS_SHORT}))\s+(?:at\s+)?({_CLOCK_TIME})'),
+    # "Monday 4pm", "next Friday at 3pm"
+    re.compile(rf'(?:next\s+)?({_WEEKDAYS})\s+(?:at\s+)?({_CLOCK_TIME})'),
+    # "2025-12-15 at 3pm", "15/12/2025 at 2pm"
+    re.compile(rf'(\d{{4}}-\d{{2}}-\d{{2}}|\d{{1,2}}[/-]\d{{1,2}}[/-]\d{{4}})\s+(?:at\s+)?({_CLOCK_TIME})'),
+]
+
+
+@dataclass(frozen=True)
+class DateTimeScan:
+    """Raw date / time spans found in a message (values are not normalized)"""
+    date: Optional[str] = None
+    date_confidence: float = 0.0
+    time: Optional[str] = None
+    time_confidence: float = 0.0
+    # (date part, time part) of a combined "tomorrow at 4pm" style span
+    combined: Optional[Tuple[str, str]] = None
+
+
+def _find_date_span(message: str, message_lower: str) -> Tuple[Optional[str], float]:
+    """Find the raw date expression in a message"""
+    match = _TODAY_PATTERN.search(message_lower)
+    if match:
+        return match.group(0), 0.95
+    match = _TOMORROW_PATTERN.search(message_lower)
+    if match:
+        return match.group(0), 0.95
+    if "day after tomorrow" in message_lower:
+        return "day after tomorrow", 0.9
+    if "overmorrow" in message_lower:
+        return "overmorrow", 0.9
+    if "next week" in message_lower:
+        return "next week", 0.8
+    if "next month" in message_lower:
+        return "next month", 0.8
+
+    for pattern in (_IN_DAYS_SPAN_PATTERN, _IN_WEEKS_SPAN_PATTERN, _WEEKDAY_SPAN_PATTERN):
+        match = pattern.search(message_lower)
+        if match:
+            return match.group(0), 0.9
+
+    # Every natural date pattern needs a month name
+    if _MONTH_NAME_PATTERN.search(message_lower):
+        for pattern in _NATURAL_DATE_WITH_YEAR_PATTERNS:
+            match = pattern.search(message_lower)
+            if match:
+                return match.group(0), 0.95
+        for pattern in _NATURAL_DATE_PATTERNS:
+            match = pattern.search(message_lower)
+            if match:
+                return match.group(0), 0.9
+
+    match = _ISO_DATE_PATTERN.search(message)
+    if match:
+        return match.group(0), 0.95
+    match = _NUMERIC_DATE_PATTERN.search(message)
+    if match:
+        return match.group(0), 0.9
+    return None, 0.0
+
+
+def _find_time_span(message: str, message_lower: str) -> Tuple[Optional[str], float]:
+    """Find the raw time expression in a message"""
+    match = _CLOCK_TIME_PATTERN.search(message_lower)
+    if match:
+        return match.group(0), 0.95
+    match = _TIME_24H_PATTERN.search(message)
+    if match:
+        return match.group(0), 0.95
+    for keyword, confidence in (("morning", 0.7), ("afternoon", 0.7), ("evening", 0.7), ("night", 0.6)):
+        if keyword in message_lower:
+            return keyword, confidence
+    return None, 0.0
+
+
+@lru_cache(maxsize=1024)
+def scan_date_time(message: str) -> DateTimeScan:
+    """
+    Find the raw date, time and combined date-time spans in a message
+
+    The scan is shared by every date/time extractor for the same message.
+
+    Args:
+        message: User message
+
+    Returns:
+        DateTimeScan with the raw spans (normalize with normalize_date / normalize_time)
+    """
+    message_lower = message.lower().strip()
+
+    combined = None
+    # Every combined pattern ends in a clock time ("4pm", "10:30 am")
+    if _CLOCK_TIME_PATTERN.search(message_lower):
+        for pattern in _COMBINED_DATE_TIME_PATTERNS:
+            match = pattern.search(message_lower)
+            if match:
+                combined = (match.group(1).strip(), match.group(2).strip())
+                break
+
+    raw_date, date_confidence = _find_date_span(message, message_lower)
+    raw_time, time_confidence = _find_time_span(message, message_lower)
+    return DateTimeScan(
+        date=raw_date,
+        date_confidence=date_confidence,
+        time=raw_time,
+        time_confidence=time_confidence,
+        combined=combined
+    )
+
 
 def normalize_date(raw_value: str) -> Optional[str]:
     """
@@ -34,6 +229,8 @@ def normalize_date(raw_value: str) -> Optional[str]:
     - Weekday names: "monday", "next monday", "this friday"
     - Natural language: "in 3 days", "in 2 weeks", "next month", "after 5 days"
 
+    Results are memoised per calendar day.
+
     Args:
         raw_value: Raw date string from user input or LLM
 
@@ -42,9 +239,13 @@ def normalize_date(raw_value: str) -> Optional[str]:
     """
     if not raw_value:
         return None
+    return _normalize_date_on(str(raw_value), datetime.now().date())
 
-    value_lower = str(raw_value).lower().strip()
-    today = datetime.now().date()
+
+@lru_cache(maxsize=4096)
+def _normalize_date_on(raw_value: str, today: date) -> Optional[str]:
+    """normalize_date relative to a given day (memoised on the value and the day)"""
+    value_lower = raw_value.lower().strip()
 
     # Relative dates - exact matches
     if value_lower in ["today", "now"]:
@@ -60,13 +261,13 @@ def normalize_date(raw_value: str) -> Optional[str]:
         return (today + timedelta(days=7)).isoformat()
 
     # "in X days" or "after X days" patterns
-    in_days_match = re.search(r'(?:in|after)\s+(\d+)\s+days?', value_lower)
+    in_days_match = _IN_DAYS_PATTERN.search(value_lower)
     if in_days_match:
         days = int(in_days_match.group(1))
         return (today + timedelta(days=days)).isoformat()
 
     # "in X weeks" or "after X weeks" patterns
-    in_weeks_match = re.search(r'(?:in|after)\s+(\d+)\s+weeks?', value_lower)
+    in_weeks_match = _IN_WEEKS_PATTERN.search(value_lower)
     if in_weeks_match:
         weeks = int(in_weeks_match.group(1))
         return (today + timedelta(weeks=weeks)).isoformat()
@@ -76,17 +277,7 @@ def normalize_date(raw_value: str) -> Optional[str]:
         return (today + relativedelta(months=1)).isoformat()
 
     # Weekday names: "monday", "next monday", "this friday"
-    weekdays = {
-        'monday': 0, 'mon': 0,
-        'tuesday': 1, 'tue': 1, 'tues': 1,
-        'wednesday': 2, 'wed': 2,
-        'thursday': 3, 'thu': 3, 'thur': 3, 'thurs': 3,
-        'friday': 4, 'fri': 4,
-        'saturday': 5, 'sat': 5,
-        'sunday': 6, 'sun': 6
-    }
-
-    for weekday_name, weekday_num in weekdays.items():
+    for weekday_name, weekday_num in _WEEKDAY_NUMBERS.items():
         if weekday_name in value_lower:
             current_weekday = today.weekday()
 
@@ -107,13 +298,12 @@ def normalize_date(raw_value: str) -> Optional[str]:
             return target_date.isoformat()
 
     # ISO format (YYYY-MM-DD) - already normalized
-    iso_match = re.match(r'^(\d{4})-(\d{2})-(\d{2})$', str(raw_value))
-    if iso_match:
+    if _ISO_DATE_EXACT_PATTERN.match(raw_value):
         return raw_value
 
     # DD/MM/YYYY or DD-MM-YYYY format (European/Indian format)
     # Check if it looks like DD/MM/YYYY (day <= 31, month <= 12)
-    date_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', str(raw_value))
+    date_match = _NUMERIC_DATE_PATTERN.search(raw_value)
     if date_match:
         first_num = int(date_match.group(1))
         second_num = int(date_match.group(2))
@@ -145,46 +335,31 @@ def normalize_date(raw_value: str) -> Optional[str]:
                 pass
 
     # Month names: "30 october", "October 30", "30th October 2025", "December 15th, 2025"
-    # Try to parse using datetime.strptime with various formats
-    month_formats = [
-        "%d %B",  # "30 October"
-        "%d %b",  # "30 Oct"
-        "%B %d",  # "October 30"
-        "%b %d",  # "Oct 30"
-        "%d %B %Y",  # "30 October 2025"
-        "%d %b %Y",  # "30 Oct 2025"
-        "%B %d %Y",  # "October 30 2025"
-        "%b %d %Y",  # "Oct 30 2025"
-        "%B %d, %Y",  # "December 15, 2025" or "November 13, 2025"
-        "%b %d, %Y",  # "Dec 15, 2025"
-        "%d%s %B",  # "30th October" (with ordinal suffix)
-        "%d%s %b",  # "30th Oct"
-        "%d%s %B %Y",  # "30th October 2025"
-        "%d%s %b %Y",  # "30th Oct 2025"
-        "%d%s %B, %Y",  # "15th December, 2025" or "13th November, 2025"
-        "%d%s %b, %Y",  # "15th Dec, 2025"
-        "%B %d%s, %Y",  # "November 13th, 2025" or "December 15th, 2025"
-        "%b %d%s, %Y",  # "Nov 13th, 2025" or "Dec 15th, 2025"
-    ]
-
-    # Remove ordinal suffixes (st, nd, rd, th) and extra spaces
-    value_cleaned = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', value_lower)
-    value_cleaned = re.sub(r'\s+', ' ', value_cleaned).strip()
+    if _MONTH_NAME_PATTERN.search(value_lower):
+        # Remove ordinal suffixes (st, nd, rd, th) and extra spaces
+        value_cleaned = _ORDINAL_SUFFIX_PATTERN.sub(r'\1', value_lower)
+        value_cleaned = _WHITESPACE_PATTERN.sub(' ', value_cleaned).strip()
+
+        month_match = _DAY_MONTH_PATTERN.match(value_cleaned)
+        if month_match:
+            day, month, year = month_match.group(1), month_match.group(2), month_match.group(3)
+        else:
+            month_match = _MONTH_DAY_PATTERN.match(value_cleaned)
+            if month_match:
+                month, day, year = month_match.group(1), month_match.group(2), month_match.group(3)
 
-    for fmt in month_formats:
-        try:
-            # Remove the %s placeholder for ordinal suffix
-            fmt_clean = fmt.replace('%s', '')
-            parsed_date = datetime.strptime(value_cleaned, fmt_clean)
-            # If year is not provided, assume current year
-            if parsed_date.year == 1900:  # Default year from strptime
-                parsed_date = parsed_date.replace(year=today.year)
+        if month_match:
+            try:
+                if year:
+                    return date(int(year), _MONTH_NUMBERS[month], int(day)).isoformat()
+                # If year is not provided, assume current year
+                parsed_date = date(today.year, _MONTH_NUMBERS[month], int(day))
                 # If the date is in the past, assume next year
-                if parsed_date.date() < today:
+                if parsed_date < today:
                     parsed_date = parsed_date.replace(year=today.year + 1)
-            return parsed_date.date().isoformat()
-        except ValueError:
-            continue
+                return parsed_date.isoformat()
+            except ValueError:
+                pass
 
     # Fallback: Use dateutil parser for flexible parsing
     # This handles many natural language formats
@@ -195,16 +370,17 @@ def normalize_date(raw_value: str) -> Optional[str]:
             value_for_parsing = value_for_parsing.replace(f' {word} ', ' ')
 
         # Parse with dateutil (dayfirst=True for international format)
-        parsed_date = dateutil_parser.parse(value_for_parsing, dayfirst=True, fuzzy=True)
+        default = datetime.combine(today, datetime.min.time())
+        parsed_date = dateutil_parser.parse(value_for_parsing, dayfirst=True, fuzzy=True, default=default)
 
         # If parsed date is in the past and no year was specified, assume next year
         if parsed_date.date() < today and parsed_date.year == today.year:
             # Check if year was explicitly mentioned in the original string
-            if not re.search(r'\d{4}', str(raw_value)):
+            if not _YEAR_PATTERN.search(raw_value):
                 parsed_date = parsed_date.replace(year=today.year + 1)
 
         return parsed_date.date().isoformat()
-    except (ValueError, TypeError, AttributeError) as e:
+    except (ValueError, TypeError, AttributeError, OverflowError) as e:
         logger.debug(f"[normalize_date] dateutil parsing failed for '{raw_value}': {e}")
 
     # Could not normalize
@@ -229,29 +405,32 @@ def normalize_time(raw_value: str) -> Optional[str]:
     """
     if not raw_value:
         return None
-    
-    value_str = str(raw_value).strip()
+    return _normalize_time(str(raw_value).strip())
+
+
+@lru_cache(maxsize=1024)
+def _normalize_time(value_str: str) -> Optional[str]:
     value_lower = value_str.lower()
     
     # 12-hour format (2 PM, 10:30 AM, 2pm, 10:30am)
-    time_match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)', value_lower)
+    time_match = _CLOCK_TIME_PATTERN.search(value_lower)
     if time_match:
         hour = int(time_match.group(1))
         minute = int(time_match.group(2)) if time_match.group(2) else 0
         period = time_match.group(3).replace('.', '').replace(' ', '')
         
         # Convert to 24-hour format
-        if period in ["pm", "pm"]:
+        if period == "pm":
             if hour != 12:
                 hour += 12
-        elif period in ["am", "am"]:
+        elif period == "am":
             if hour == 12:
                 hour = 0
         
         return f"{hour:02d}:{minute:02d}"
     
     # 24-hour format (14:00, 09:30) - already normalized
-    time_24h_match = re.match(r'^(\d{1,2}):(\d{2})$', value_str)
+    time_24h_match = _TIME_24H_EXACT_PATTERN.match(value_str)
     if time_24h_match:
         hour = int(time_24h_match.group(1))
         minute = int(time_24h_match.group(2))
@@ -259,17 +438,12 @@ def normalize_time(raw_value: str) -> Optional[str]:
             return f"{hour:02d}:{minute:02d}"
     
     # Time of day keywords
-    if "morning" in value_lower:
-        return "10:00"
-    if "afternoon" in value_lower:
-        return "14:00"
-    if "evening" in value_lower:
-        return "18:00"
-    if "night" in value_lower:
-        return "20:00"
+    for keyword, normalized in _TIME_OF_DAY:
+        if keyword in value_lower:
+            return normalized
     
     # Could not normalize
-    logger.warning(f"[normalize_time] Could not normalize time: {raw_value}")
+    logger.warning(f"[normalize_time] Could not normalize time: {value_str}")
     return None
 
 
@@ -291,20 +465,22 @@ def normalize_location(raw_value: str) -> Optional[str]:
     """
     if not raw_value:
         return None
-    
-    value_str = str(raw_value).strip()
-    
+    return _normalize_location(str(raw_value).strip())
+
+
+@lru_cache(maxsize=1024)
+def _normalize_location(value_str: str) -> Optional[str]:
     # If it's already a full address or city+pincode, return as-is
     if len(value_str) > 5:
         return value_str
     
     # Pincode only (6 digits)
-    pincode_match = re.search(r'\b(\d{6})\b', value_str)
+    pincode_match = _PINCODE_PATTERN.search(value_str)
     if pincode_match:
         return pincode_match.group(1)
     
     # Could not normalize
-    logger.warning(f"[normalize_location] Could not normalize location: {raw_value}")
+    logger.warning(f"[normalize_location] Could not normalize location: {value_str}")
     return None
 
 
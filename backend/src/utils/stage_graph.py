@@ -0,0 +1,103 @@
+"""
+Stage DAG for a request's concurrent I/O.
+
+Each stage is an async function that runs in its own task as soon as the
+stages it depends on have finished, and receives their results as keyword
+arguments. Independent stages overlap; a stage that is only speculative
+(e.g. loading context a blocked message never needs) is cancelled with
+cancel() and never awaited.
+
+    graph = StageGraph()
+    graph.add("guardrails", check_input)
+    graph.add("history", load_history)
+    graph.add("dialog_state", load_dialog_state, after=["history"])
+    graph.start()
+    report = await graph.result("guardrails")
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class StageGraph:
+    """
+    Async stages with dependencies, started together and awaited by name.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, Tuple[Callable[..., Awaitable[Any]], List[str]]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.timings_ms: Dict[str, float] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        after: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Add a stage.
+
+        Args:
+            name: Stage name (unique)
+            func: Async function called with the results of `after` as keyword arguments
+            after: Names of stages that must finish first (added before this one)
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage {name!r} already added")
+        deps = list(after or [])
+        missing = [dep for dep in deps if dep not in self._stages]
+        if missing:
+            raise ValueError(f"Stage {name!r} depends on unknown stages {missing}")
+        self._stages[name] = (func, deps)
+
+    def start(self) -> None:
+        """Start every stage that is not running yet"""
+        for name in self._stages:
+            self._task(name)
+
+    def _task(self, name: str) -> asyncio.Task:
+        if name not in self._tasks:
+            self._tasks[name] = asyncio.ensure_future(self._run(name))
+        return self._tasks[name]
+
+    async def _run(self, name: str) -> Any:
+        func, deps = self._stages[name]
+        inputs = {dep: await self._task(dep) for dep in deps}
+
+        start_time = time.perf_counter()
+        try:
+            return await func(**inputs)
+        finally:
+            self.timings_ms[name] = round((time.perf_counter() - start_time) * 1000, 2)
+
+    async def result(self, name: str) -> Any:
+        """
+        Wait for a stage (starting it and its dependencies if needed).
+
+        Args:
+            name: Stage name
+
+        Returns:
+            The stage's result (its exception is raised)
+        """
+        return await self._task(name)
+
+    async def cancel(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Cancel unfinished stages and wait until they have stopped.
+
+        Args:
+            names: Stages to cancel (default: all)
+
+        Returns:
+            Names of the stages that were still running
+        """
+        names = list(self._stages if names is None else names)
+        tasks = {name: self._tasks[name] for name in names if name in self._tasks}
+        running = [name for name, task in tasks.items() if not task.done()]
+        for name in running:
+            tasks[name].cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        return running
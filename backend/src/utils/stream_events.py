@@ -0,0 +1,187 @@
+"""
+Streaming progress events for a chat turn.
+
+A StreamEventChannel is bound to the current task context while a streaming
+chat turn runs. Code deep in the pipeline (intent classifier, coordinator
+routing, LLM client) publishes stage and token events through the module
+helpers without any plumbing; outside a streaming turn the helpers are no-ops.
+
+Generated text reaches the client through a TokenStream: chunks are buffered
+into sentences and each sentence is published only after the channel's
+output check (the turn's output guardrails) passes it unchanged. Once a
+sentence is blocked or would be sanitized nothing more is streamed, and the
+client gets the final text from the done/replace events.
+"""
+
+import asyncio
+import json
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+_CLOSED = object()
+
+# End of a sentence: terminal punctuation followed by whitespace, or a newline
+_SENTENCE_END = re.compile(r"[.!?](?=\s)|\n")
+
+
+class StreamEventChannel:
+    """
+    Queue of (event, data) pairs produced by one chat turn.
+    """
+
+    def __init__(self, output_check: Optional[Callable[[str], Awaitable[bool]]] = None):
+        """
+        Initialize channel
+
+        Args:
+            output_check: Async predicate a chunk of generated text must pass
+                before it is streamed (default: every chunk passes)
+        """
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self.output_check = output_check
+        self._token_stream_claimed = False
+        self._tokens: List[str] = []
+
+    def emit(self, event: str, data: Dict[str, Any]) -> None:
+        """
+        Publish an event.
+
+        Args:
+            event: Event name (e.g. "classified", "token", "done")
+            data: JSON-serializable payload
+        """
+        self._queue.put_nowait((event, data))
+
+    def open_token_stream(self) -> Optional["TokenStream"]:
+        """
+        Claim the token stream for one user-facing LLM generation.
+
+        Only one generation of a turn streams tokens, so concurrent
+        generations (multi-intent turns) never interleave in the client.
+
+        Returns:
+            TokenStream for the caller, or None if another generation has it
+        """
+        if self._token_stream_claimed:
+            return None
+        self._token_stream_claimed = True
+        return TokenStream(self)
+
+    def emit_token(self, text: str) -> None:
+        """Publish a chunk of generated text"""
+        if text:
+            self._tokens.append(text)
+            self.emit("token", {"text": text})
+
+    @property
+    def streamed_text(self) -> str:
+        """All token text published so far"""
+        return "".join(self._tokens)
+
+    def close(self) -> None:
+        """Signal that the turn has finished"""
+        self._queue.put_nowait(_CLOSED)
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        while True:
+            item = await self._queue.get()
+            if item is _CLOSED:
+                return
+            yield item
+
+
+class TokenStream:
+    """
+    One generation's text, published a sentence at a time once it passes the output check.
+    """
+
+    def __init__(self, channel: StreamEventChannel):
+        self._channel = channel
+        self._buffer = ""
+        self._halted = False
+
+    async def feed(self, text: str) -> None:
+        """
+        Add a chunk of generated text, publishing every sentence it completes
+
+        Args:
+            text: Chunk of generated text
+        """
+        self._buffer += text
+        ends = [match.end() for match in _SENTENCE_END.finditer(self._buffer)]
+        if ends:
+            complete, self._buffer = self._buffer[:ends[-1]], self._buffer[ends[-1]:]
+            await self._publish(complete)
+
+    async def close(self) -> None:
+        """Publish the text after the last sentence end"""
+        remainder, self._buffer = self._buffer, ""
+        await self._publish(remainder)
+
+    async def _publish(self, text: str) -> None:
+        if self._halted or not text:
+            return
+        check = self._channel.output_check
+        if check is not None and not await check(text):
+            # The final text (sanitized or blocked) arrives with the done/replace events
+            self._halted = True
+            return
+        self._channel.emit_token(text)
+
+
+_current_channel: ContextVar[Optional[StreamEventChannel]] = ContextVar(
+    "stream_event_channel",
+    default=None
+)
+
+
+@contextmanager
+def stream_events(channel: StreamEventChannel) -> Iterator[StreamEventChannel]:
+    """
+    Bind a channel to the current context for the duration of a turn.
+
+    Args:
+        channel: Channel receiving the events
+
+    Yields:
+        The bound channel
+    """
+    token = _current_channel.set(channel)
+    try:
+        yield channel
+    finally:
+        _current_channel.reset(token)
+
+
+def get_stream_channel() -> Optional[StreamEventChannel]:
+    """Get the channel of the current streaming turn, if any"""
+    return _current_channel.get()
+
+
+def emit_stage_event(event: str, **data: Any) -> None:
+    """
+    Publish a pipeline stage event if a streaming turn is active.
+
+    Args:
+        event: Stage name (e.g. "classified", "agent_selected")
+        **data: JSON-serializable payload
+    """
+    channel = _current_channel.get()
+    if channel is not None:
+        channel.emit(event, data)
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """
+    Format one Server-Sent Events frame.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        SSE frame text
+    """
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
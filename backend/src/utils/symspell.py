@@ -0,0 +1,207 @@
+"""
+Symmetric-delete spelling correction (SymSpell).
+
+All deletes (up to max_edit_distance characters) of every vocabulary word are
+precomputed once. A lookup generates the deletes of the input only and
+intersects them with that table, so no insert/replace/transpose candidates
+are generated at query time. Candidates are verified with the optimal
+string alignment distance (Damerau-Levenshtein with adjacent transpositions).
+
+Immutable once built; safe to share across requests.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class Suggestion(NamedTuple):
+    """Spelling suggestion for one word"""
+    term: str
+    distance: int
+    count: int
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased alphanumeric words of a text"""
+    return _WORD_PATTERN.findall(text.lower())
+
+
+def _delete_levels(word: str, max_distance: int) -> Iterator[Set[str]]:
+    """Strings obtained by deleting exactly 0, 1, ... max_distance characters"""
+    seen = {word}
+    frontier = {word}
+    yield frontier
+    for _ in range(max_distance):
+        next_frontier = set()
+        for item in frontier:
+            for i in range(len(item)):
+                deleted = item[:i] + item[i + 1:]
+                if deleted not in seen:
+                    next_frontier.add(deleted)
+        seen |= next_frontier
+        frontier = next_frontier
+        yield frontier
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """All strings obtained by deleting up to max_distance characters"""
+    return set().union(*_delete_levels(word, max_distance))
+
+
+def osa_distance(source: str, target: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance, or max_distance + 1 if it is larger
+
+    Args:
+        source: First string
+        target: Second string
+        max_distance: Distance above which the exact value does not matter
+
+    Returns:
+        Edit distance (insert, delete, substitute, transpose adjacent)
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    # Only the differing middle needs the full table
+    start = 0
+    while start < len(source) and start < len(target) and source[start] == target[start]:
+        start += 1
+    end = 0
+    while (
+        end < len(source) - start and end < len(target) - start
+        and source[-1 - end] == target[-1 - end]
+    ):
+        end += 1
+    source = source[start:len(source) - end]
+    target = target[start:len(target) - end]
+    if not source or not target:
+        return len(source) + len(target)
+
+    previous_previous: List[int] = []
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        row_min = current[0]
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                i > 1 and j > 1
+                and source[i - 1] == target[j - 2]
+                and source[i - 2] == target[j - 1]
+            ):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    distance = previous[len(target)]
+    return distance if distance <= max_distance else max_distance + 1
+
+
+class SymSpellDictionary:
+    """
+    Precomputed symmetric-delete dictionary over a word-frequency table
+    """
+
+    def __init__(self, word_counts: Dict[str, int], max_edit_distance: int = 2, prefix_length: int = 7):
+        """
+        Build the delete table.
+
+        Args:
+            word_counts: Vocabulary with frequencies (higher wins ties)
+            max_edit_distance: Max edit distance of a suggestion
+            prefix_length: Only deletes of the first prefix_length characters are indexed
+                (smaller table; candidates are still verified on the full word)
+        """
+        self.word_counts = dict(word_counts)
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self._deletes: Dict[str, List[str]] = {}
+
+        for word in self.word_counts:
+            for deleted in _deletes(word[:prefix_length], max_edit_distance):
+                self._deletes.setdefault(deleted, []).append(word)
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str], **kwargs) -> "SymSpellDictionary":
+        """
+        Build from texts, counting each word's occurrences as its frequency.
+
+        Args:
+            texts: Texts such as catalog names
+            **kwargs: max_edit_distance, prefix_length
+
+        Returns:
+            SymSpellDictionary
+        """
+        word_counts: Dict[str, int] = {}
+        for text in texts:
+            for word in tokenize(text):
+                word_counts[word] = word_counts.get(word, 0) + 1
+        return cls(word_counts, **kwargs)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.word_counts
+
+    def __len__(self) -> int:
+        return len(self.word_counts)
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> List[Suggestion]:
+        """
+        Closest vocabulary words to a word.
+
+        Args:
+            word: Lowercased word
+            max_distance: Max edit distance (default and upper bound: max_edit_distance)
+
+        Returns:
+            Suggestions at the smallest distance found, most frequent first
+        """
+        if max_distance is None or max_distance > self.max_edit_distance:
+            max_distance = self.max_edit_distance
+
+        if word in self.word_counts:
+            return [Suggestion(word, 0, self.word_counts[word])]
+
+        best_distance = max_distance
+        suggestions: List[Suggestion] = []
+        seen: Set[str] = set()
+        for level, deletes in enumerate(_delete_levels(word[:self.prefix_length], max_distance)):
+            # Terms reached by deleting more characters are at least that far away
+            if level > best_distance:
+                break
+            for deleted in deletes:
+                for term in self._deletes.get(deleted, ()):
+                    if term in seen:
+                        continue
+                    seen.add(term)
+                    distance = osa_distance(word, term, best_distance)
+                    if distance > best_distance:
+                        continue
+                    if distance < best_distance:
+                        best_distance = distance
+                        suggestions = [item for item in suggestions if item.distance <= distance]
+                    suggestions.append(Suggestion(term, distance, self.word_counts[term]))
+
+        suggestions.sort(key=lambda item: (item.distance, -item.count, item.term))
+        return suggestions
+
+    def correction(self, word: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """
+        Most likely spelling of a word.
+
+        Args:
+            word: Lowercased word
+            max_distance: Max edit distance (default: max_edit_distance)
+
+        Returns:
+            The word itself if known, the best suggestion, or None
+        """
+        suggestions = self.lookup(word, max_distance)
+        return suggestions[0].term if suggestions else None
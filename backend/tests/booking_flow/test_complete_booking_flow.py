@@ -83,7 +83,7 @@ async def test_complete_booking_flow():
                 'service_type': 'painting'
             }
             
-            question = question_gen.generate(
+            question = await question_gen.generate(
                 entity_type=EntityType.SERVICE_SUBCATEGORY,
                 intent=IntentType.BOOKING_MANAGEMENT,
                 collected_entities={'service_type': 'painting'},
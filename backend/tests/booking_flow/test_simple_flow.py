@@ -3,6 +3,7 @@
 Simple test of booking flow components
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -85,12 +86,12 @@ def test_question_generation():
             'service_type': 'painting'
         }
         
-        question = question_gen.generate(
+        question = asyncio.run(question_gen.generate(
             entity_type=EntityType.SERVICE_SUBCATEGORY,
             intent=IntentType.BOOKING_MANAGEMENT,
             collected_entities={'service_type': 'painting'},
             context=context
-        )
+        ))
         
         print(f"✅ Generated question: {question}")
         return True
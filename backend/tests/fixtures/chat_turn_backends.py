@@ -0,0 +1,96 @@
+"""
+Fake ChatService backends with fixed latencies
+
+Stubs every backend of ChatService.send_message (guardrails, history and
+dialog-state reads, message inserts, coordinator) so the chat-turn stage DAG
+can be exercised without a database, Redis or Gemini.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.core import services as core_services
+from src.schemas.chat import ChatMessageRequest
+from src.services import chat_service as chat_module
+from src.services.chat_service import ChatService
+from src.services.dialog_state_manager import DIALOG_STATE_NOT_LOADED, DialogStateManager
+
+# Stubbed backend latencies (seconds)
+INPUT_GUARDRAILS = 0.040
+OUTPUT_GUARDRAILS = 0.020
+HISTORY_READ = 0.012
+DIALOG_STATE_READ = 0.006
+MESSAGE_INSERT = 0.008
+COORDINATOR_EXECUTE = 0.060
+
+
+class _Report:
+    def __init__(self, blocked=False):
+        self.is_blocked = blocked
+        self.final_text = "Blocked" if blocked else None
+        self.results = []
+        self.total_latency_ms = 0.0
+
+
+class _Guardrails:
+    def __init__(self, block=False):
+        self.block = block
+
+    async def check_input(self, text, user_id, context):
+        await asyncio.sleep(INPUT_GUARDRAILS)
+        return _Report(blocked=self.block)
+
+    async def check_output(self, text, user_id, context):
+        await asyncio.sleep(OUTPUT_GUARDRAILS)
+        return _Report()
+
+
+class _Coordinator:
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def execute(self, message, user, session_id, conversation_history=None,
+                      dialog_state=DIALOG_STATE_NOT_LOADED):
+        if dialog_state is DIALOG_STATE_NOT_LOADED:
+            dialog_state = await DialogStateManager(None).get_active_state(session_id)
+        self.calls.append({"history": conversation_history, "dialog_state": dialog_state})
+        await asyncio.sleep(COORDINATOR_EXECUTE)
+        return {"response": f"reply to {message}", "intent": "general_query", "confidence": 0.9,
+                "agent_used": "coordinator", "classification_method": "pattern", "metadata": {}}
+
+
+def install_backends(monkeypatch):
+    """Stub every backend of ChatService.send_message; returns the recorded state"""
+    state = SimpleNamespace(guardrails=_Guardrails(), stored=[], coordinator_calls=[], history_done=False)
+
+    async def store_message(self, user_id, session_id, role, message, channel, **kwargs):
+        await asyncio.sleep(MESSAGE_INSERT)
+        conversation = SimpleNamespace(id=len(state.stored) + 1, role=role, message=message, intent=None,
+                                       intent_confidence=None, created_at=datetime.now(timezone.utc))
+        state.stored.append(conversation)
+        return conversation
+
+    async def get_history(self, user_id, session_id, limit=10):
+        await asyncio.sleep(HISTORY_READ)
+        state.history_done = True
+        return [{"id": 1, "role": "user", "content": "hi"}, {"id": 2, "role": "assistant", "content": "hello"}]
+
+    async def get_active_state(self, session_id):
+        await asyncio.sleep(DIALOG_STATE_READ)
+        return "active-state"
+
+    async def get_coordinator_agent(db):
+        return _Coordinator(state.coordinator_calls)
+
+    monkeypatch.setattr(chat_module, "get_guardrail_manager", lambda: state.guardrails)
+    monkeypatch.setattr(chat_module, "get_history_compactor", lambda: None)
+    monkeypatch.setattr(ChatService, "_store_message", store_message)
+    monkeypatch.setattr(ChatService, "_get_conversation_history", get_history)
+    monkeypatch.setattr(DialogStateManager, "get_active_state", get_active_state)
+    monkeypatch.setattr(core_services, "get_coordinator_agent", get_coordinator_agent)
+    return state
+
+
+def chat_request():
+    return ChatMessageRequest(message="I want to book an AC service", session_id="session-1", channel="web")
@@ -0,0 +1,218 @@
+"""
+Reference date/time extraction for the compiled normalization engine
+
+The span extraction and normalize_date approach entity_normalizer replaced:
+pattern lists rebuilt inside the function body, every strptime format tried
+for every value, and no memoisation. The unit tests check the compiled
+engine against it and the performance tests time both.
+"""
+
+import re
+from datetime import datetime, timedelta
+
+from dateutil import parser as dateutil_parser
+from dateutil.relativedelta import relativedelta
+
+from src.utils import entity_normalizer
+from src.utils.entity_normalizer import normalize_date, normalize_time, scan_date_time
+
+PHRASES = [
+    "tomorrow",
+    "today at 5pm",
+    "can you come tomorrow at 4pm",
+    "book it for tmrw 10:30 am",
+    "day after tomorrow in the morning",
+    "next monday",
+    "next Friday at 3pm",
+    "this saturday evening",
+    "sat 11am",
+    "in 3 days",
+    "in 3 days at 2pm",
+    "after 2 weeks",
+    "sometime next week",
+    "next month please",
+    "31st October",
+    "31st October 4pm",
+    "on 15th Dec",
+    "December 15th, 2025 at 2pm",
+    "Dec 15, 2025",
+    "15th December, 2025",
+    "2025-12-15",
+    "2025-12-15 at 3pm",
+    "15/12/2025",
+    "12/15/2025 2pm",
+    "26-10-2025 at 9am",
+    "at 14:30",
+    "around 10:30am",
+    "in the afternoon",
+    "late evening is fine",
+    "any time at night",
+    "I need a plumber tomorrow morning",
+    "please send someone on monday around 6 pm",
+]
+
+_MONTHS = "january|february|march|april|may|june|july|august|september|october|november|december"
+_MONTHS_SHORT = "jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec"
+_WEEKDAYS = "monday|tuesday|wednesday|thursday|friday|saturday|sunday|mon|tue|wed|thu|fri|sat|sun"
+_WEEKDAY_NUMBERS = {
+    'monday': 0, 'mon': 0, 'tuesday': 1, 'tue': 1, 'wednesday': 2, 'wed': 2, 'thursday': 3, 'thu': 3,
+    'friday': 4, 'fri': 4, 'saturday': 5, 'sat': 5, 'sunday': 6, 'sun': 6
+}
+
+
+def _legacy_find_date(message: str, message_lower: str):
+    """Date span lookup with the pattern lists built per call"""
+    for pattern, confidence in (
+        (r'\b(today|now)\b', 0.95),
+        (r'\b(tomorrow|tmrw|tmr)\b', 0.95),
+    ):
+        if re.search(pattern, message_lower):
+            return re.search(pattern, message_lower).group(0), confidence
+    for phrase in ("day after tomorrow", "overmorrow", "next week", "next month"):
+        if phrase in message_lower:
+            return phrase, 0.8
+    for pattern in (
+        r'(?:in|after)\s+\d+\s+days?',
+        r'(?:in|after)\s+\d+\s+weeks?',
+        rf'\b(?:next\s+|this\s+)?({_WEEKDAYS})\b',
+    ):
+        if re.search(pattern, message_lower):
+            return re.search(pattern, message_lower).group(0), 0.9
+    natural_date_with_year_patterns = [
+        rf'(\d{{1,2}})(st|nd|rd|th)?\s+({_MONTHS}),?\s+\d{{4}}',
+        rf'(\d{{1,2}})(st|nd|rd|th)?\s+({_MONTHS_SHORT}),?\s+\d{{4}}',
+        rf'({_MONTHS})\s+(\d{{1,2}})(st|nd|rd|th)?,?\s+\d{{4}}',
+        rf'({_MONTHS_SHORT})\s+(\d{{1,2}})(st|nd|rd|th)?,?\s+\d{{4}}',
+    ]
+    natural_date_patterns = [
+        rf'(\d{{1,2}})(st|nd|rd|th)?\s+({_MONTHS})',
+        rf'(\d{{1,2}})(st|nd|rd|th)?\s+({_MONTHS_SHORT})',
+        rf'({_MONTHS})\s+(\d{{1,2}})(st|nd|rd|th)?',
+        rf'({_MONTHS_SHORT})\s+(\d{{1,2}})(st|nd|rd|th)?',
+    ]
+    for patterns, confidence in ((natural_date_with_year_patterns, 0.95), (natural_date_patterns, 0.9)):
+        for pattern in patterns:
+            match = re.search(pattern, message_lower)
+            if match:
+                return match.group(0), confidence
+    for pattern in (r'(\d{4})-(\d{2})-(\d{2})', r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})'):
+        match = re.search(pattern, message)
+        if match:
+            return match.group(0), 0.9
+    return None, 0.0
+
+
+def _legacy_find_combined(message_lower: str):
+    clock = r'(\d{1,2}(?::\d{2})?\s*(?:am|pm|a\.m\.|p\.m\.))'
+    combined_patterns = [
+        rf'(today|tomorrow|tmrw|tmr)\s+{clock}',
+        rf'(today|tomorrow|tmrw|tmr)\s+at\s+{clock}',
+        rf'((?:in|after)\s+\d+\s+days?)\s+(?:at\s+)?{clock}',
+        rf'(\d{{1,2}}(?:st|nd|rd|th)?\s+(?:{_MONTHS}|{_MONTHS_SHORT}),?\s+\d{{4}})\s+(?:at\s+)?{clock}',
+        rf'(\d{{1,2}}(?:st|nd|rd|th)?\s+(?:{_MONTHS}|{_MONTHS_SHORT}))\s+(?:at\s+)?{clock}',
+        rf'(?:next\s+)?({_WEEKDAYS})\s+(?:at\s+)?{clock}',
+        rf'(\d{{4}}-\d{{2}}-\d{{2}}|\d{{1,2}}[/-]\d{{1,2}}[/-]\d{{4}})\s+(?:at\s+)?{clock}',
+    ]
+    for pattern in combined_patterns:
+        match = re.search(pattern, message_lower)
+        if match:
+            return match.group(1).strip(), match.group(2).strip()
+    return None
+
+
+def _legacy_find_time(message: str, message_lower: str):
+    match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)', message_lower)
+    if match:
+        return match.group(0)
+    match = re.search(r'(\d{1,2}):(\d{2})', message)
+    if match:
+        return match.group(0)
+    for keyword in ("morning", "afternoon", "evening", "night"):
+        if keyword in message_lower:
+            return keyword
+    return None
+
+
+def _legacy_normalize_date(raw_value: str):
+    """normalize_date without precompiled patterns, format pruning or memoisation"""
+    value_lower = raw_value.lower().strip()
+    today = datetime.now().date()
+
+    if value_lower in ["today", "now"]:
+        return today.isoformat()
+    if value_lower in ["tomorrow", "tmrw", "tmr"]:
+        return (today + timedelta(days=1)).isoformat()
+    if "day after tomorrow" in value_lower or "overmorrow" in value_lower:
+        return (today + timedelta(days=2)).isoformat()
+    if "next week" in value_lower:
+        return (today + timedelta(days=7)).isoformat()
+    match = re.search(r'(?:in|after)\s+(\d+)\s+days?', value_lower)
+    if match:
+        return (today + timedelta(days=int(match.group(1)))).isoformat()
+    match = re.search(r'(?:in|after)\s+(\d+)\s+weeks?', value_lower)
+    if match:
+        return (today + timedelta(weeks=int(match.group(1)))).isoformat()
+    if "next month" in value_lower:
+        return (today + relativedelta(months=1)).isoformat()
+    for weekday_name, weekday_num in _WEEKDAY_NUMBERS.items():
+        if weekday_name in value_lower:
+            days_ahead = (weekday_num - today.weekday()) % 7 or (7 if "next" in value_lower else 0)
+            return (today + timedelta(days=days_ahead)).isoformat()
+    if re.match(r'^(\d{4})-(\d{2})-(\d{2})$', raw_value):
+        return raw_value
+    match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', raw_value)
+    if match:
+        first, second, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        day, month = (second, first) if second > 12 else (first, second)
+        try:
+            return datetime(year, month, day).date().isoformat()
+        except ValueError:
+            pass
+
+    month_formats = [
+        "%d %B", "%d %b", "%B %d", "%b %d", "%d %B %Y", "%d %b %Y", "%B %d %Y", "%b %d %Y",
+        "%B %d, %Y", "%b %d, %Y", "%d%s %B", "%d%s %b", "%d%s %B %Y", "%d%s %b %Y",
+        "%d%s %B, %Y", "%d%s %b, %Y", "%B %d%s, %Y", "%b %d%s, %Y",
+    ]
+    value_cleaned = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', value_lower)
+    value_cleaned = re.sub(r'\s+', ' ', value_cleaned).strip()
+    for fmt in month_formats:
+        try:
+            parsed = datetime.strptime(value_cleaned, fmt.replace('%s', ''))
+            if parsed.year == 1900:
+                parsed = parsed.replace(year=today.year)
+                if parsed.date() < today:
+                    parsed = parsed.replace(year=today.year + 1)
+            return parsed.date().isoformat()
+        except ValueError:
+            continue
+
+    try:
+        return dateutil_parser.parse(value_lower, dayfirst=True, fuzzy=True).date().isoformat()
+    except (ValueError, OverflowError):
+        return None
+
+
+def legacy_extract(message: str):
+    message_lower = message.lower().strip()
+    _legacy_find_combined(message_lower)
+    raw_date, _ = _legacy_find_date(message, message_lower)
+    raw_time = _legacy_find_time(message, message_lower)
+    return (
+        _legacy_normalize_date(raw_date) if raw_date else None,
+        entity_normalizer._normalize_time.__wrapped__(raw_time) if raw_time else None,
+    )
+
+
+def compiled_extract(message: str):
+    scan = scan_date_time(message)
+    return (
+        normalize_date(scan.date) if scan.date else None,
+        normalize_time(scan.time) if scan.time else None,
+    )
+
+
+def clear_caches():
+    scan_date_time.cache_clear()
+    entity_normalizer._normalize_date_on.cache_clear()
+    entity_normalizer._normalize_time.cache_clear()
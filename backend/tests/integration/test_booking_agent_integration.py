@@ -24,6 +24,7 @@ from src.core.models import (
     Provider, Pincode, ProviderPincode, Booking, BookingItem
 )
 from src.core.database.base import Base
+from src.services.pincode_coverage import get_pincode_coverage_store
 
 # Load environment variables
 load_dotenv()
@@ -205,6 +206,7 @@ async def test_data(db_session):
     db_session.add(cart_item)
     await db_session.flush()
     await db_session.commit()  # Commit all test data
+    await get_pincode_coverage_store().refresh(db_session)  # Index the new pincode coverage
 
     # Debug: Print test data IDs
     print(f"\n=== TEST DATA CREATED ===")
@@ -0,0 +1,46 @@
+"""
+Shared helpers for the performance tests
+
+The microbenchmarks here are marked benchmark and skipped unless selected,
+so their wall-clock assertions cannot fail a normal test run. Correctness
+checks belong in tests/unit. Run them (they print their numbers) with:
+    pytest tests/performance -m benchmark -s --no-cov
+"""
+
+import time
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark tests unless the -m expression selects them"""
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="benchmark: run with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture
+def us_per_call():
+    """
+    Measure the average wall time of one call
+
+    Returns:
+        measure(func, inputs, rounds=1, before_round=None): microseconds per
+        func(input) over rounds passes through inputs; before_round (e.g. a
+        cache clear) runs inside the timed loop before each pass
+    """
+    def measure(func, inputs, rounds=1, before_round=None) -> float:
+        inputs = list(inputs)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            if before_round is not None:
+                before_round()
+            for item in inputs:
+                func(item)
+        return (time.perf_counter() - start) / (rounds * len(inputs)) * 1_000_000
+
+    return measure
@@ -0,0 +1,84 @@
+"""
+Per-query cost of semantic category matching
+
+CategoryMatcher used to encode every category name together with the query on
+each match and score them with sklearn's cosine_similarity. The catalog
+embedding index embeds the names once and scores a query with one
+matrix-vector product. A hashed bag-of-words encoder with a fixed per-text
+cost stands in for the embedding model, so the numbers show the work saved rather than
+model speed.
+"""
+
+import re
+import time
+import zlib
+
+import numpy as np
+import pytest
+
+from src.services.catalog_embedding_index import CATEGORY, CatalogEmbeddingIndex
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 5
+DIM = 384
+# Simulated model cost per encoded text
+ENCODE_SECONDS = 0.0002
+
+CATEGORIES = [
+    {"id": idx, "name": name, "description": ""}
+    for idx, name in enumerate([
+        "Home Cleaning", "Pest Control", "Packers and Movers", "Salon for Men", "Salon for Women",
+        "Appliance Repair", "Car Care", "Carpentry", "Plumbing", "Electrical", "Painting",
+        "Water Purifier", "Massage for Men", "Spa for Women", "Home Repairs", "Smart Home",
+        "Wall Panels", "Interior Design", "Gardening", "Laundry", "Disinfection", "Bathroom Renovation",
+        "Kitchen Renovation", "Waterproofing", "Security Systems", "Solar Installation",
+        "Computer Repair", "Mobile Repair", "Tutoring", "Fitness Trainer",
+    ], 1)
+]
+
+QUERIES = ["house cleaning service", "cockroach treatment", "shifting my house", "fix my fridge", "haircut", "leaking tap"]
+
+
+class BagOfWordsEncoder:
+    """encode()/embed_texts() over hashed bag of words with a fixed cost per text"""
+
+    def _vector(self, text):
+        time.sleep(ENCODE_SECONDS)
+        vector = np.zeros(DIM, dtype=np.float32)
+        for token in re.findall(r"[a-z]+", text.lower()):
+            vector[zlib.crc32(token.encode()) % DIM] += 1.0
+        return vector
+
+    def encode(self, texts):
+        return np.stack([self._vector(text) for text in texts])
+
+    def embed_text(self, text):
+        return self._vector(text).tolist()
+
+    def embed_texts(self, texts):
+        return self.encode(texts).tolist()
+
+
+def _legacy_semantic_match(model, query):
+    input_embedding = model.encode([query])
+    category_embeddings = model.encode([cat["name"] for cat in CATEGORIES])
+    norms = np.linalg.norm(input_embedding) * np.linalg.norm(category_embeddings, axis=1)
+    return (category_embeddings @ input_embedding[0]) / np.maximum(norms, 1e-12)
+
+
+def test_semantic_match_per_query_cost(us_per_call):
+    """Cached normalized matrix vs re-encoding every category per match"""
+    model = BagOfWordsEncoder()
+    index = CatalogEmbeddingIndex(model)
+
+    # Same scores as the per-call encode + cosine similarity
+    for query in QUERIES:
+        cached = [score for _, score in index.similarities(CATEGORY, CATEGORIES, query)]
+        assert np.allclose(cached, _legacy_semantic_match(model, query), atol=1e-5), query
+
+    legacy = us_per_call(lambda query: _legacy_semantic_match(model, query), QUERIES, ROUNDS)
+    cached = us_per_call(lambda query: index.similarities(CATEGORY, CATEGORIES, query), QUERIES, ROUNDS)
+
+    print(f"\nSemantic match over {len(CATEGORIES)} categories: re-encode {legacy:.0f}us -> cached matrix {cached:.0f}us per query")
+    assert cached < legacy
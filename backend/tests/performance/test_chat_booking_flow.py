@@ -0,0 +1,152 @@
+"""
+Multi-turn booking, end to end on the fake LLM backend
+
+Drives ChatService.send_message through a booking conversation (request,
+slot follow-up, confirmation) with the real coordinator, slot-filling graph,
+entity extraction and dialog-state writes. The LLM is the deterministic fake
+backend (LLM_BACKEND=fake), so intent classification, extraction and
+question generation take the same calls as with Gemini but no model time;
+MySQL is an in-memory SQLite database. The numbers are the orchestration
+cost of each turn.
+
+Run with:
+    pytest tests/performance/test_chat_booking_flow.py -m benchmark -s --no-cov
+"""
+
+import statistics
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import BigInteger, MetaData, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+import src.core.database as database_package
+from src.core import services as core_services
+from src.core.config import settings
+from src.core.database import connection, id_allocator, write_behind
+from src.core.database.base import Base
+from src.core.models import Category, DialogState, User
+from src.core.models.dialog_state import DialogStateType
+from src.llm.context import conversation_cache
+from src.llm.gemini.client import reset_llm_registry
+from src.nlp.intent import result_cache
+from src.schemas.chat import ChatMessageRequest
+from src.services import catalog_snapshot, pincode_coverage, service_catalog_index, service_search_index
+from src.services.chat_service import ChatService
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 5
+
+BOOKING_TURNS = [
+    "I want to book AC repair",
+    "Andheri West",  # locality the patterns only guess at; goes to the extraction LLM
+    "yes",
+]
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(type_, compiler, **kwargs):
+    # BIGINT primary keys only autoincrement as SQLite's INTEGER rowid alias
+    return "INTEGER"
+
+
+@pytest.fixture
+async def session_factory(monkeypatch, tmp_path):
+    """In-memory database with every table, used by the request and by side sessions"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    # SQLite index names are database-wide, MySQL's per table; the benchmark needs none
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        table.to_metadata(metadata).indexes.clear()
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(connection, "AsyncSessionLocal", factory)
+    monkeypatch.setattr(database_package, "AsyncSessionLocal", factory)
+
+    monkeypatch.setattr(settings, "LLM_BACKEND", "fake")
+    monkeypatch.setattr(settings, "LLM_LOCAL_LATENCY", "none")
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "INTENT_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "INTENT_EMBEDDING_TIER_ENABLED", False)
+    monkeypatch.setattr(settings, "WRITE_BEHIND_SPILL_PATH", str(tmp_path / "write_behind.jsonl"))
+
+    # Process-wide state bound to another database or backend
+    for module, name in [
+        (write_behind, "_write_behind_queue"),
+        (id_allocator, "_id_allocator"),
+        (catalog_snapshot, "_catalog_snapshot_store"),
+        (pincode_coverage, "_pincode_coverage_store"),
+        (service_catalog_index, "_service_catalog_index"),
+        (service_search_index, "_service_search_index"),
+        (conversation_cache, "_conversation_context_cache"),
+        (result_cache, "_intent_result_cache"),
+    ]:
+        monkeypatch.setattr(module, name, None)
+    reset_llm_registry()
+    core_services.clear_agent_resources()
+
+    async with factory() as db:
+        db.add(User(mobile="9000000001", email="benchmark@example.com", first_name="Bench", last_name="Mark"))
+        db.add(Category(name="AC Services", slug="ac-services", is_active=True))
+        await db.commit()
+
+    yield factory
+
+    queue = write_behind.get_write_behind_queue()
+    if queue is not None:
+        await queue.stop()
+    reset_llm_registry()
+    core_services.clear_agent_resources()
+    await engine.dispose()
+
+
+async def _booking_conversation(factory, session_id):
+    """Run the booking turns in one session; returns per-turn (ms, response, dialog state)"""
+    turns = []
+    async with factory() as db:
+        user = await db.scalar(select(User))
+        service = ChatService(db)
+        for message in BOOKING_TURNS:
+            start = time.perf_counter()
+            response = await service.send_message(
+                user, ChatMessageRequest(message=message, session_id=session_id, channel="web")
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            state = await db.scalar(select(DialogState).where(DialogState.session_id == session_id))
+            turns.append(SimpleNamespace(ms=elapsed_ms, response=response, state=state and (
+                state.state, dict(state.collected_entities or {})
+            )))
+    return turns
+
+
+@pytest.mark.asyncio
+async def test_booking_conversation_latency(session_factory):
+    # Warm-up: tokenizer, compiled graphs and the catalog snapshot load once per process
+    await _booking_conversation(session_factory, "booking-warm-up")
+
+    rounds = [await _booking_conversation(session_factory, f"booking-{i}") for i in range(ROUNDS)]
+
+    print(f"\nBooking conversation on the fake LLM backend ({ROUNDS} sessions):")
+    for index, message in enumerate(BOOKING_TURNS):
+        latencies = [turns[index].ms for turns in rounds]
+        last = rounds[-1][index]
+        print(
+            f"  {message!r:<28} median={statistics.median(latencies):7.1f}ms "
+            f"min={min(latencies):7.1f}ms  agent={last.response.metadata.get('agent_used')}"
+        )
+        for stage, ms in last.response.metadata.get("stage_timings_ms", {}).items():
+            print(f"      {stage:<20} {ms:7.1f}ms")
+    totals = [sum(turn.ms for turn in turns) for turns in rounds]
+    print(f"  {'conversation':<28} median={statistics.median(totals):7.1f}ms")
+
+    # Slot filling fills from the fake extraction answers and reaches the confirmation
+    request, follow_up, _ = rounds[-1]
+    assert request.state[0] == DialogStateType.COLLECTING_INFO
+    assert request.state[1]["action"] == "book"
+    assert follow_up.state[0] == DialogStateType.AWAITING_CONFIRMATION
+    assert follow_up.state[1]["location"] == "Andheri West"
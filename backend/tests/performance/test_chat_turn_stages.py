@@ -0,0 +1,80 @@
+"""
+Chat-turn pre-processing latency, sequential vs stage DAG
+
+Every backend of ChatService.send_message is stubbed with a fixed latency
+(tests/fixtures/chat_turn_backends.py). The legacy turn ran each step after
+the previous one; the stage DAG loads the session's context and builds the
+coordinator while the input guardrails run.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import services as core_services
+from src.core.models.conversation import MessageRole
+from src.services.chat_service import ChatService
+from tests.fixtures.chat_turn_backends import DIALOG_STATE_READ, HISTORY_READ, chat_request, install_backends
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 5
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    return install_backends(monkeypatch)
+
+
+async def _legacy_turn(service, user, request, backends):
+    """The pre-DAG send_message order, step by step against the same stubs"""
+    timings = {}
+
+    async def step(name, awaitable):
+        start = time.perf_counter()
+        result = await awaitable
+        timings[name] = (time.perf_counter() - start) * 1000
+        return result
+
+    await step("input_guardrails", backends.guardrails.check_input(request.message, user.id, {}))
+    await step("user_message", service._store_message(user.id, request.session_id, MessageRole.USER,
+                                                      request.message, request.channel))
+    history = await step("history", service._get_conversation_history(user.id, request.session_id))
+    coordinator = await step("coordinator", core_services.get_coordinator_agent(db=None))
+    result = await step("coordinator_execute (incl. dialog state)",
+                        coordinator.execute(request.message, user, request.session_id, history))
+    await step("output_guardrails", backends.guardrails.check_output(result["response"], user.id, {}))
+    await step("assistant_message", service._store_message(user.id, request.session_id, MessageRole.ASSISTANT,
+                                                           result["response"], request.channel))
+    return timings
+
+
+@pytest.mark.asyncio
+async def test_stage_dag_latency_breakdown(backends):
+    service = ChatService(db=None)
+    user = SimpleNamespace(id=1)
+
+    legacy_total, dag_total = [], []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        legacy_timings = await _legacy_turn(service, user, chat_request(), backends)
+        legacy_total.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        response = await service.send_message(user, chat_request())
+        dag_total.append((time.perf_counter() - start) * 1000)
+
+    before, after = min(legacy_total), min(dag_total)
+    print("\nSequential turn:")
+    for name, ms in legacy_timings.items():
+        print(f"  {name:<42} {ms:7.1f}ms")
+    print(f"  {'total':<42} {before:7.1f}ms")
+    print("Stage DAG turn (stages overlap):")
+    for name, ms in response.metadata["stage_timings_ms"].items():
+        print(f"  {name:<42} {ms:7.1f}ms")
+    print(f"  {'total':<42} {after:7.1f}ms")
+
+    # History and dialog-state reads are hidden behind the input guardrails
+    hidden = (HISTORY_READ + DIALOG_STATE_READ) * 1000
+    assert after < before - hidden / 2
@@ -0,0 +1,30 @@
+"""
+Per-phrase cost of date/time extraction and normalization
+
+Runs a corpus of realistic booking phrases through span extraction plus
+normalize_date / normalize_time and compares the compiled engine in
+entity_normalizer with the reference implementation it replaced.
+"""
+
+import pytest
+
+from tests.fixtures.entity_normalization_reference import PHRASES, clear_caches, compiled_extract, legacy_extract
+
+pytestmark = pytest.mark.benchmark
+
+
+ROUNDS = 20
+
+
+def test_extraction_per_phrase_cost(us_per_call):
+    """Compiled, memoised engine vs per-call pattern lists (cold and warm caches)"""
+    legacy = us_per_call(legacy_extract, PHRASES, ROUNDS)
+    cold = us_per_call(compiled_extract, PHRASES, ROUNDS, before_round=clear_caches)
+    warm = us_per_call(compiled_extract, PHRASES, ROUNDS)
+
+    print(
+        f"\nDate/time extraction over {len(PHRASES)} phrases: legacy {legacy:.1f}us -> "
+        f"compiled {cold:.1f}us (cold) / {warm:.1f}us (warm) per phrase"
+    )
+    assert cold < legacy
+    assert warm < cold
@@ -0,0 +1,77 @@
+"""
+Per-message cost of pattern-based intent matching
+
+Runs IntentPatterns over the examples.py corpus and compares the compiled
+single-pass keyword matcher with the keyword-by-keyword substring scan plus
+per-pattern regex search that match_intent used before.
+"""
+
+import re
+
+import pytest
+
+from src.nlp.intent.config import IntentType
+from src.nlp.intent.examples import get_all_examples, get_multi_intent_examples
+from src.nlp.intent.patterns import IntentPatterns, _scan_keywords
+
+pytestmark = pytest.mark.benchmark
+
+
+ROUNDS = 20
+
+
+def _corpus() -> list:
+    messages = [example for examples in get_all_examples().values() for example in examples]
+    messages.extend(example["query"] for example in get_multi_intent_examples())
+    return messages
+
+
+def _legacy_match_intent(message: str) -> list:
+    """Keyword-by-keyword substring checks and per-pattern regex search"""
+    message_lower = message.lower()
+    intent_scores = {}
+    for intent, keywords in IntentPatterns.INTENT_KEYWORDS.items():
+        score = 0.0
+        matched = 0
+        for keyword in keywords:
+            if keyword in message_lower:
+                matched += 1
+                score += 0.3 if f" {keyword} " in f" {message_lower} " else 0.2
+        if matched:
+            intent_scores[intent] = min(0.95, score)
+    for pattern in IntentPatterns.POLICY_TIMEFRAME_PATTERNS:
+        if re.search(pattern, message_lower):
+            intent_scores[IntentType.POLICY_INQUIRY] = 0.97
+            break
+    for intent, patterns in IntentPatterns.REGEX_PATTERNS.items():
+        for pattern in patterns:
+            if re.search(pattern, message_lower):
+                if intent_scores.get(intent, 0.0) < 0.97:
+                    intent_scores[intent] = max(intent_scores.get(intent, 0.0), 0.95)
+                break
+    return sorted(intent_scores.items(), key=lambda x: x[1], reverse=True)
+
+
+def test_match_intent_per_message_cost(us_per_call):
+    """Compiled matcher vs per-keyword scanning for match_intent"""
+    messages = _corpus()
+
+    legacy = us_per_call(_legacy_match_intent, messages, ROUNDS)
+    compiled = us_per_call(IntentPatterns.match_intent, messages, ROUNDS, before_round=_scan_keywords.cache_clear)
+
+    print(f"\nmatch_intent over {len(messages)} messages: legacy {legacy:.1f}us -> compiled {compiled:.1f}us per message")
+    assert compiled < legacy
+
+
+def test_classifier_fast_path_per_message_cost(us_per_call):
+    """match_intent + extract_entities_from_patterns share one keyword scan"""
+    messages = _corpus()
+
+    def fast_path(message: str):
+        IntentPatterns.match_intent(message)
+        IntentPatterns.extract_entities_from_patterns(message)
+
+    cost = us_per_call(fast_path, messages, ROUNDS, before_round=_scan_keywords.cache_clear)
+
+    print(f"\nPattern fast path (intents + entities): {cost:.1f}us per message")
+    assert cost < 1000
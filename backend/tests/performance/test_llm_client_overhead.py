@@ -0,0 +1,87 @@
+"""
+Per-call LLM client setup overhead
+
+Compares the per-call work the client used to do before every Gemini request
+(new GenerativeModel per system prompt, model_json_schema() plus recursive
+sanitizing per structured call, genai.configure per client) with the pooled
+registry. No network calls are made; only client-side setup is timed.
+"""
+
+import os
+
+import google.generativeai as genai
+import pytest
+
+os.environ.setdefault("GOOGLE_API_KEY", "test-google-api-key")
+
+from src.llm.gemini.client import (
+    LLMClient,
+    StructuredOutputModel,
+    get_generative_model,
+    get_shared_llm_client,
+    reset_llm_registry,
+)
+from src.schemas.intent import IntentClassificationResult
+
+pytestmark = pytest.mark.benchmark
+
+ITERATIONS = 300
+SYSTEM_PROMPT = "You are Lisa, the ConvergeAI assistant for home services."
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    reset_llm_registry()
+    yield
+    reset_llm_registry()
+
+
+def test_model_pool_overhead(us_per_call):
+    """Pooled GenerativeModel lookup vs constructing one per call"""
+    def unpooled():
+        genai.GenerativeModel(model_name="gemini-2.0-flash", system_instruction=SYSTEM_PROMPT)
+
+    def pooled():
+        get_generative_model("gemini-2.0-flash", SYSTEM_PROMPT)
+
+    before = us_per_call(lambda _: unpooled(), range(ITERATIONS))
+    after = us_per_call(lambda _: pooled(), range(ITERATIONS))
+
+    print(f"\nGenerativeModel per call: {before:.1f}us -> pooled: {after:.1f}us")
+    assert after < before
+
+
+def test_structured_schema_overhead(us_per_call):
+    """Cached sanitized schema vs model_json_schema() + sanitizing per call"""
+    client = LLMClient(model="gemini-2.0-flash", temperature=0.0, max_tokens=1024)
+
+    def uncached():
+        structured = client.with_structured_output(IntentClassificationResult)
+        schema = IntentClassificationResult.model_json_schema()
+        structured._remove_additional_properties(schema)
+
+    def cached():
+        client.with_structured_output(IntentClassificationResult)._build_config()
+
+    before = us_per_call(lambda _: uncached(), range(ITERATIONS))
+    after = us_per_call(lambda _: cached(), range(ITERATIONS))
+
+    print(f"\nStructured schema per call: {before:.1f}us -> cached: {after:.1f}us")
+    assert IntentClassificationResult in StructuredOutputModel._schema_cache
+    assert after < before
+
+
+def test_shared_client_overhead(us_per_call):
+    """Shared default client vs a new LLMClient() per service instance"""
+    def fresh():
+        genai.configure(api_key=os.environ["GOOGLE_API_KEY"])
+        LLMClient()
+
+    def shared():
+        get_shared_llm_client()
+
+    before = us_per_call(lambda _: fresh(), range(100))
+    after = us_per_call(lambda _: shared(), range(100))
+
+    print(f"\nLLMClient per service: {before:.1f}us -> shared: {after:.1f}us")
+    assert after < before
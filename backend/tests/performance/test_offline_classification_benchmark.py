@@ -0,0 +1,80 @@
+"""
+Intent classification throughput on the fake LLM backend
+
+Runs the full IntentClassifier path (pattern fast path, LLM client, cache,
+single-flight, tier scheduler, structured-output parsing) against the
+deterministic fake backend with a synthetic Gemini-like latency, so changes
+to the classification pipeline can be compared without network access.
+
+Set LLM_LOCAL_LATENCY (e.g. "lognormal:800:0.5") to change the simulated latency.
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+import pytest
+
+from src.core.config import settings
+from src.llm.gemini.client import LLMClient, reset_llm_registry
+from src.llm.local import reset_llm_cassette
+from src.nlp.intent.classifier import IntentClassifier
+from src.nlp.intent.examples import get_all_examples, get_multi_intent_examples
+
+pytestmark = pytest.mark.benchmark
+
+
+CONCURRENCY = 50
+
+
+def _messages() -> list:
+    """Single- and multi-intent example utterances"""
+    messages = [example for examples in get_all_examples().values() for example in examples]
+    messages.extend(example["query"] for example in get_multi_intent_examples())
+    return messages
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_BACKEND", "fake")
+    monkeypatch.setattr(settings, "LLM_LOCAL_LATENCY", os.getenv("LLM_LOCAL_LATENCY", "uniform:20:60"))
+    # Measure the pipeline, not cache hits from earlier iterations
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", False)
+    reset_llm_registry()
+    reset_llm_cassette()
+    yield
+    reset_llm_registry()
+    reset_llm_cassette()
+
+
+@pytest.mark.asyncio
+async def test_classification_throughput(fake_backend):
+    """Concurrent classification throughput and latency percentiles"""
+    classifier = IntentClassifier(LLMClient.create_for_intent_classification())
+    messages = _messages()
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies = []
+    methods = {}
+
+    async def classify(message: str):
+        async with semaphore:
+            start = time.perf_counter()
+            _, method = await classifier.classify(message)
+            latencies.append((time.perf_counter() - start) * 1000)
+            methods[method] = methods.get(method, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(classify(message) for message in messages))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"\n{len(messages)} messages in {elapsed:.2f}s ({len(messages) / elapsed:.1f} msg/s), "
+        f"p50={p50:.1f}ms p95={p95:.1f}ms, methods={methods}"
+    )
+
+    assert len(latencies) == len(messages)
+    assert "llm" in methods
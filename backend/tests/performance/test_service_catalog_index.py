@@ -0,0 +1,70 @@
+"""
+Per-query cost of service-name fuzzy matching
+
+Builds a synthetic 1000-name catalog of size/tier variants of common home services and
+compares the SequenceMatcher scan over every name that ServiceDictionary.fuzzy_match
+used to run with the trigram-shortlisted ServiceCatalogIndex.
+"""
+
+from difflib import SequenceMatcher
+
+import pytest
+
+from src.services.service_catalog_index import ServiceCatalogIndex
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 5
+
+SERVICES = [
+    "texture painting", "wall painting", "ac repair", "ac installation", "deep cleaning",
+    "sofa cleaning", "tap repair", "pipe leakage", "fan installation", "switchboard repair",
+    "bathroom cleaning", "kitchen cleaning", "pest control", "termite treatment", "ro service",
+    "washing machine repair", "refrigerator repair", "geyser repair", "carpet cleaning", "wood polishing",
+    "waterproofing", "false ceiling", "modular kitchen", "door repair", "window repair",
+    "chimney cleaning", "water tank cleaning", "mosquito control", "bed bug control", "cockroach control",
+    "tv installation", "inverter repair", "microwave repair", "laptop repair", "massage",
+    "haircut", "facial", "manicure", "pedicure", "car wash",
+]
+TIERS = ["basic", "standard", "premium", "express", "weekend"]
+SIZES = ["", "1 bhk ", "2 bhk ", "3 bhk ", "villa "]
+
+QUERIES = [
+    "texture pianting", "ac repiar", "sofa clening", "deep cleaning premium", "pest contrl",
+    "washing machin repair", "geyser repair", "wood polish", "tap repair - basic", "kitchen",
+    "2 bhk deep cleaning - basic", "cockroch control",
+]
+
+
+def _catalog() -> list:
+    return [f"{size}{service} - {tier}" for service in SERVICES for tier in TIERS for size in SIZES]
+
+
+def _legacy_fuzzy_match(names: list, query: str, threshold: float = 0.6) -> list:
+    matches = []
+    for name in names:
+        similarity = SequenceMatcher(None, query, name).ratio()
+        if similarity >= threshold:
+            matches.append((name, similarity))
+    matches.sort(key=lambda item: item[1], reverse=True)
+    return matches
+
+
+def test_fuzzy_match_per_query_cost(us_per_call):
+    """Trigram shortlist vs SequenceMatcher over every catalog name"""
+    names = _catalog()
+    index = ServiceCatalogIndex()
+    index.load(names, {name: {"type": "rate_card"} for name in names})
+
+    # Same top-5 confidences as the full scan (ties may order differently)
+    for query in QUERIES:
+        legacy_top = [ratio for _, ratio in _legacy_fuzzy_match(names, query)[:5]]
+        indexed_top = [match["confidence"] for match in index.fuzzy_match(query)[:5]]
+        assert indexed_top == legacy_top, query
+
+    legacy = us_per_call(lambda query: _legacy_fuzzy_match(names, query), QUERIES, ROUNDS)
+    indexed = us_per_call(index.fuzzy_match, QUERIES, ROUNDS)
+
+    print(f"\nfuzzy_match over {len(names)} names: scan {legacy:.0f}us -> trigram index {indexed:.0f}us per query")
+    assert indexed < legacy
+    assert indexed < 1000
@@ -0,0 +1,86 @@
+"""
+Per-query latency of rate-card search at 10k and 100k rate cards
+
+Generates rate cards for common home services across cities, tiers and
+providers and compares a substring scan with a price sort (what the
+RateCard.name/description ILIKE '%q%' query did, here in-process) with the
+BM25 ServiceSearchIndex, with and without price/category filters.
+"""
+
+import random
+import time
+from decimal import Decimal
+
+import pytest
+
+from src.services.service_search_index import SearchDocument, ServiceSearchIndex
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 3
+
+SERVICES = [
+    ("Home Cleaning", "Deep Cleaning"), ("Home Cleaning", "Sofa Cleaning"), ("Home Cleaning", "Kitchen Cleaning"),
+    ("Appliance Repair", "AC Repair"), ("Appliance Repair", "Washing Machine Repair"),
+    ("Appliance Repair", "Refrigerator Repair"), ("Plumbing", "Tap Repair"), ("Plumbing", "Drain Cleaning"),
+    ("Electrical", "Fan Installation"), ("Electrical", "Wiring"), ("Painting", "Texture Painting"),
+    ("Painting", "Waterproofing"), ("Pest Control", "Cockroach Control"), ("Pest Control", "Termite Control"),
+    ("Salon for Women", "Facial"), ("Salon for Men", "Beard Trimming"), ("Car Care", "Car Washing"),
+    ("Water Purifier", "RO Service"), ("Carpentry", "Furniture Assembly"), ("Packers and Movers", "Local Shifting"),
+]
+TIERS = ["Basic", "Standard", "Premium", "Express"]
+CITIES = ["Mumbai", "Delhi", "Pune", "Chennai", "Kolkata", "Hyderabad", "Bengaluru", "Jaipur"]
+
+QUERIES = ["ac repair", "sofa cleaning", "texture painting", "cockroach", "deep clean", "washing machine", "ro service"]
+
+
+def _documents(count: int) -> dict:
+    rnd = random.Random(count)
+    documents = {}
+    for doc_id in range(count):
+        category, subcategory = SERVICES[doc_id % len(SERVICES)]
+        tier = TIERS[(doc_id // len(SERVICES)) % len(TIERS)]
+        city = CITIES[rnd.randrange(len(CITIES))]
+        documents[doc_id] = SearchDocument(
+            id=doc_id,
+            name=f"{subcategory} - {tier} ({city})",
+            description=f"{subcategory} by verified professionals in {city}, includes inspection and {tier.lower()} service",
+            subcategory=subcategory,
+            category=category,
+            category_id=doc_id % len(SERVICES) // 3 + 1,
+            price=Decimal(rnd.randint(199, 4999)),
+            strike_price=None
+        )
+    return documents
+
+
+def _legacy_search(rows: list, query: str, limit: int = 20) -> list:
+    hits = [doc for doc, name, description in rows if query in name or query in description]
+    hits.sort(key=lambda doc: doc.price)
+    return hits[:limit]
+
+
+@pytest.mark.parametrize("count", [10_000, 100_000])
+def test_search_latency(count, us_per_call):
+    """BM25 index vs substring scan + price sort"""
+    documents = _documents(count)
+    rows = [(doc, doc.name.lower(), (doc.description or "").lower()) for doc in documents.values()]
+
+    start = time.perf_counter()
+    index = ServiceSearchIndex()
+    index.sync(documents)
+    build_seconds = time.perf_counter() - start
+
+    for query in QUERIES:
+        hits = index.search(query)
+        assert hits and all(query.split()[0] in hit.document.name.lower() for hit in hits[:5]), query
+
+    legacy = us_per_call(lambda query: _legacy_search(rows, query), QUERIES, ROUNDS) / 1000
+    indexed = us_per_call(index.search, QUERIES, ROUNDS) / 1000
+    filtered = us_per_call(lambda query: index.search(query, max_price=1000, category_id=2), QUERIES, ROUNDS) / 1000
+
+    print(
+        f"\n{count} rate cards: scan {legacy:.2f}ms -> BM25 {indexed:.2f}ms "
+        f"(filtered {filtered:.2f}ms) per query; build {build_seconds:.2f}s"
+    )
+    assert indexed < legacy
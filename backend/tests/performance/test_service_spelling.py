@@ -0,0 +1,49 @@
+"""
+Per-word cost of service-name spelling correction
+
+Compares pyspellchecker's correction(), which ServiceDictionary used to call
+word by word (edit-distance candidates generated at query time), with the
+SymSpell dictionary precomputed from the catalog names.
+"""
+
+import pytest
+
+from src.utils.symspell import SymSpellDictionary
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 5
+
+NAMES = [
+    f"{size}{service} - {tier}"
+    for service in [
+        "texture painting", "wall painting", "ac repair", "ac installation", "deep cleaning",
+        "sofa cleaning", "tap repair", "pipe leakage", "fan installation", "switchboard repair",
+        "bathroom cleaning", "kitchen cleaning", "pest control", "termite treatment", "ro service",
+        "washing machine repair", "refrigerator repair", "geyser repair", "carpet cleaning", "wood polishing",
+    ]
+    for tier in ["basic", "standard", "premium", "express"]
+    for size in ["", "1 bhk ", "2 bhk ", "villa "]
+]
+
+# Typical mobile typos: transpositions, dropped and doubled letters
+TYPOS = [
+    "pianting", "paintng", "texure", "repiar", "instalation", "clening", "claening", "bathrom",
+    "kitchn", "controll", "termit", "treatmnt", "washng", "machin", "refrigirator", "geysr",
+    "carpt", "polshing", "premum", "standrd", "exprss", "switchbord", "leakge", "servce",
+]
+
+
+def test_spelling_correction_per_word_cost(us_per_call):
+    """Precomputed symmetric deletes vs query-time candidate generation"""
+    spellchecker = pytest.importorskip("spellchecker")
+
+    legacy_checker = spellchecker.SpellChecker()
+    legacy_checker.word_frequency.load_words(NAMES)
+    dictionary = SymSpellDictionary.from_texts(NAMES)
+
+    legacy = us_per_call(legacy_checker.correction, TYPOS, ROUNDS)
+    symspell = us_per_call(dictionary.correction, TYPOS, ROUNDS)
+
+    print(f"\nCorrection of {len(TYPOS)} typos: pyspellchecker {legacy:.0f}us -> SymSpell {symspell:.1f}us per word")
+    assert symspell < legacy
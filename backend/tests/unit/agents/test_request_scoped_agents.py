@@ -0,0 +1,130 @@
+"""
+Concurrency stress test for request-scoped CoordinatorAgents
+
+Every chat gets its own CoordinatorAgent (and sub-agents) bound to its own
+session, while the LLM client, intent classifier and compiled graphs are
+shared. 200 chats run interleaved on one event loop; none may observe another
+chat's session.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from src.agents.coordinator import coordinator_agent as coordinator_module
+from src.agents.coordinator.coordinator_agent import CoordinatorAgent
+from src.core import services as core_services
+from src.core.services import AgentResources, get_coordinator_agent
+from src.graphs import agent_execution_graph
+from src.graphs.agent_execution_graph import create_agent_execution_graph, get_agent_execution_graph
+
+CONCURRENT_CHATS = 200
+
+SUB_AGENTS = ["PolicyAgent", "ServiceAgent", "BookingAgent", "CancellationAgent",
+              "RescheduleAgent", "ComplaintAgent", "SQLAgent"]
+SUB_AGENT_PROPERTIES = ["policy_agent", "service_agent", "booking_agent", "cancellation_agent",
+                        "reschedule_agent", "complaint_agent", "sql_agent"]
+
+
+class _FakeSession:
+    """Stands in for a request's AsyncSession"""
+
+    def __init__(self, chat_id):
+        self.chat_id = chat_id
+
+
+class _FakeAgent:
+    def __init__(self, db, **kwargs):
+        self.db = db
+
+
+@pytest.fixture
+def shared_resources(monkeypatch):
+    resources = AgentResources(llm_client=object(), intent_classifier=object())
+    monkeypatch.setattr(core_services, "_agent_resources", resources)
+    for name in SUB_AGENTS:
+        monkeypatch.setattr(coordinator_module, name, _FakeAgent)
+
+    async def route(self, intent_result, user, session_id):
+        # Yield mid-request so chats interleave inside the graph
+        await asyncio.sleep(random.random() / 1000)
+        return {
+            "response": f"{intent_result.intent} for chat {self.db.chat_id} via {self.service_agent.db.chat_id}",
+            "action_taken": "processed",
+            "agent_used": intent_result.intent,
+            "metadata": {}
+        }
+
+    monkeypatch.setattr(CoordinatorAgent, "_route_to_agent_with_timing", route)
+    return resources
+
+
+async def _chat(chat_id):
+    db = _FakeSession(chat_id)
+    agent = await get_coordinator_agent(db)
+    await asyncio.sleep(random.random() / 1000)
+
+    sessions = {getattr(agent, name).db.chat_id for name in SUB_AGENT_PROPERTIES}
+    result = await create_agent_execution_graph(agent).ainvoke({
+        "user": None,
+        "user_id": chat_id,
+        "session_id": f"session-{chat_id}",
+        "intent_result": {
+            "primary_intent": "service_inquiry",
+            "intents": [
+                {"intent": "service_inquiry", "confidence": 0.9},
+                {"intent": "policy_inquiry", "confidence": 0.8}
+            ]
+        },
+        "agent_timeout": 30,
+        "metadata": {"nodes_executed": []}
+    })
+    await asyncio.sleep(random.random() / 1000)
+
+    return agent, db, sessions, result
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chats_never_share_a_session(shared_resources):
+    results = await asyncio.gather(*(_chat(chat_id) for chat_id in range(CONCURRENT_CHATS)))
+
+    agents = set()
+    for chat_id, (agent, db, sessions, result) in enumerate(results):
+        agents.add(id(agent))
+        assert agent.db is db
+        assert sessions == {chat_id}
+        responses = [resp["response"] for resp in result["parallel_responses"]]
+        assert responses == [
+            f"service_inquiry for chat {chat_id} via {chat_id}",
+            f"policy_inquiry for chat {chat_id} via {chat_id}",
+        ]
+
+        # Heavy parts are shared, not rebuilt per request
+        assert agent.intent_classifier is shared_resources.intent_classifier
+        assert agent.llm_client is shared_resources.llm_client
+
+    assert len(agents) == CONCURRENT_CHATS
+
+
+def test_agent_execution_graph_is_compiled_once(monkeypatch):
+    compiled = []
+    compile_graph = agent_execution_graph.StateGraph.compile
+
+    def counting_compile(self, *args, **kwargs):
+        compiled.append(self)
+        return compile_graph(self, *args, **kwargs)
+
+    monkeypatch.setattr(agent_execution_graph, "_agent_execution_graph", None)
+    monkeypatch.setattr(agent_execution_graph.StateGraph, "compile", counting_compile)
+
+    agents = [object() for _ in range(3)]
+    graphs = [create_agent_execution_graph(agent) for agent in agents]
+    shared = get_agent_execution_graph()
+
+    # Per-request graphs bind the shared compiled graph; only their config differs
+    assert len(compiled) == 1
+    assert len({id(graph) for graph in graphs}) == len(agents)
+    for graph, agent in zip(graphs, agents):
+        assert graph.builder is shared.builder
+        assert graph.config["configurable"]["coordinator_agent"] is agent
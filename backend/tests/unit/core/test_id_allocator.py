@@ -0,0 +1,76 @@
+"""
+Unit tests for the block id allocator
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.database.id_allocator import IdAllocator
+from src.core.models import Conversation
+
+
+class _BlockAllocator(IdAllocator):
+    """Reserves blocks from an in-memory counter instead of id_blocks"""
+
+    def __init__(self, block_size, next_id=1, failures=0):
+        super().__init__(block_size=block_size)
+        self.next_id = next_id
+        self.failures = failures
+        self.reservations = 0
+
+    async def _reserve(self, table):
+        self.reservations += 1
+        await asyncio.sleep(0.01)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        start = self.next_id
+        self.next_id += self.block_size
+        return start, self.next_id
+
+
+@pytest.mark.asyncio
+async def test_ids_are_unique_and_reserved_in_blocks():
+    allocator = _BlockAllocator(block_size=10)
+
+    ids = [await allocator.allocate(Conversation) for _ in range(25)]
+
+    assert ids == list(range(1, 26))
+    assert allocator.reservations == 3
+
+
+@pytest.mark.asyncio
+async def test_next_block_is_reserved_before_the_current_one_runs_out():
+    allocator = _BlockAllocator(block_size=10)
+    for _ in range(6):
+        await allocator.allocate(Conversation)
+
+    # The next block is reserved in the background once half the block is used
+    await asyncio.sleep(0.05)
+    assert allocator.reservations == 2
+
+    reservations = allocator.reservations
+    ids = [await allocator.allocate(Conversation) for _ in range(5)]
+    assert ids == [7, 8, 9, 10, 11]
+    assert allocator.reservations == reservations
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_allocations_share_one_block():
+    allocator = _BlockAllocator(block_size=100)
+
+    ids = await asyncio.gather(*(allocator.allocate(Conversation) for _ in range(20)))
+
+    assert sorted(ids) == list(range(1, 21))
+    assert allocator.reservations == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_reservation_is_retried_on_the_next_allocation():
+    allocator = _BlockAllocator(block_size=10, failures=1)
+
+    with pytest.raises(ConnectionError):
+        await allocator.allocate(Conversation)
+
+    assert await allocator.allocate(Conversation) == 1
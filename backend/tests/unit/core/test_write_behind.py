@@ -0,0 +1,305 @@
+"""
+Unit tests for the write-behind persistence queue
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.core.database.write_behind import WriteBehindQueue
+from src.core.models import Conversation, OpsAuditLog
+from src.core.models.conversation import MessageRole
+
+
+class _FakeDatabase:
+    """Records the batches inserted through its sessions"""
+
+    def __init__(self):
+        self.batches = []
+        self.failures = 0
+        # Messages the database rejects (e.g. a duplicate key)
+        self.rejected = set()
+
+    def __call__(self):
+        return _FakeSession(self)
+
+
+class _FakeSession:
+    def __init__(self, database):
+        self.database = database
+        self.statements = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, rows):
+        await asyncio.sleep(0)
+        if any(row.get("message") in self.database.rejected for row in rows):
+            raise IntegrityError("INSERT INTO conversations", rows, Exception("Duplicate entry"))
+        self.statements.append((statement.table.name, rows))
+
+    async def commit(self):
+        if self.database.failures:
+            self.database.failures -= 1
+            raise ConnectionError("database unavailable")
+        self.database.batches.append(self.statements)
+
+
+def _message(session_id="s1", text="hello"):
+    return Conversation(user_id=1, session_id=session_id, role=MessageRole.USER, message=text)
+
+
+@pytest.fixture
+def database():
+    return _FakeDatabase()
+
+
+@pytest.mark.asyncio
+async def test_rows_are_batched_until_the_interval(database):
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=20, max_batch_rows=100)
+
+    messages = [queue.add(_message(text=f"m{i}")) for i in range(5)]
+    queue.add(OpsAuditLog(staff_id=7, action="view_metrics"))
+
+    # Defaults are applied at enqueue time, nothing is written yet
+    assert all(msg.created_at is not None and msg.id is None for msg in messages)
+    assert database.batches == []
+    assert len(queue) == 6
+
+    await asyncio.sleep(0.1)
+
+    assert len(database.batches) == 1
+    (conv_table, conv_rows), (audit_table, audit_rows) = database.batches[0]
+    assert (conv_table, audit_table) == ("conversations", "ops_audit_log")
+    assert [row["message"] for row in conv_rows] == ["m0", "m1", "m2", "m3", "m4"]
+    assert audit_rows[0]["pii_accessed"] is False
+    assert len(queue) == 0
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_flushed_without_waiting(database):
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10000, max_batch_rows=3)
+
+    for i in range(3):
+        queue.add(_message(text=f"m{i}"))
+    await asyncio.sleep(0.01)
+
+    assert [len(rows) for _, rows in database.batches[0]] == [3]
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_flush_if_pending_only_flushes_for_matching_rows(database):
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10000)
+    queue.add(_message(session_id="s1"))
+
+    await queue.flush_if_pending(Conversation, session_id="s2")
+    assert database.batches == []
+
+    await queue.flush_if_pending(Conversation, session_id="s1")
+    assert len(database.batches) == 1
+    assert not queue.has_pending(Conversation, session_id="s1")
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried(database, tmp_path):
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10000, max_retries=2,
+                             spill_path=str(tmp_path / "spill.jsonl"))
+    database.failures = 1
+    queue.add(_message(text="retried"))
+
+    assert await queue.flush() == 0
+    assert len(queue) == 1
+    assert await queue.flush() == 1
+    assert database.batches[0][0][1][0]["message"] == "retried"
+    assert not (tmp_path / "spill.jsonl").exists()
+
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_rows_the_database_keeps_rejecting_are_spilled_then_replayed(database, tmp_path):
+    spill_path = tmp_path / "spill.jsonl"
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10, max_retries=2,
+                             spill_path=str(spill_path))
+    database.failures = 2
+    message = queue.add(Conversation(user_id=1, session_id="s1", role=MessageRole.ASSISTANT,
+                                     message="spilled", intent_confidence=0.875, agent_calls=[{"agent": "policy"}]))
+
+    # At shutdown a failing batch is retried, then written to the spill file instead of dropped
+    await queue.stop()
+    assert len(queue) == 0
+    assert database.batches == []
+    assert spill_path.exists()
+
+    # The next process replays it when its flusher starts
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10, spill_path=str(spill_path))
+    queue.start()
+    assert not spill_path.exists()
+    await queue.stop()
+
+    (table, rows), = database.batches[0]
+    assert table == "conversations"
+    assert rows[0]["message"] == "spilled"
+    assert rows[0]["role"] is MessageRole.ASSISTANT
+    assert rows[0]["created_at"] == message.created_at
+    assert rows[0]["intent_confidence"] == Decimal("0.875")
+    assert rows[0]["agent_calls"] == [{"agent": "policy"}]
+
+
+@pytest.mark.asyncio
+async def test_spilled_rows_are_replayed_after_the_database_recovers(database, tmp_path):
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10000, max_retries=1,
+                             spill_path=str(tmp_path / "spill.jsonl"))
+    database.failures = 1
+    queue.add(_message(text="during outage"))
+    assert await queue.flush() == 0
+    assert len(queue) == 0
+
+    queue.add(_message(text="after outage"))
+    await queue.flush()
+    await queue.flush()
+
+    written = [row["message"] for batch in database.batches for _, rows in batch for row in rows]
+    assert written == ["after outage", "during outage"]
+    assert not (tmp_path / "spill.jsonl").exists()
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_a_rejected_row_does_not_hold_back_its_batch(database, tmp_path):
+    """The other rows of the batch are written; the rejected one goes to the dead-letter file only"""
+    spill_path, dead_letter_path = tmp_path / "spill.jsonl", tmp_path / "dead_letter.jsonl"
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10000, spill_path=str(spill_path),
+                             dead_letter_path=str(dead_letter_path))
+    database.rejected = {"bad"}
+    for i in range(10):
+        queue.add(_message(text=f"m{i}"))
+        if i == 4:
+            queue.add(_message(text="bad"))
+
+    assert await queue.flush() == 10
+    queue.add(_message(text="later"))
+    await queue.flush()
+
+    written = [row["message"] for batch in database.batches for _, rows in batch for row in rows]
+    assert written == [f"m{i}" for i in range(10)] + ["later"]
+    assert len(queue) == 0
+    assert not spill_path.exists()
+    dead_letters = dead_letter_path.read_text().splitlines()
+    assert len(dead_letters) == 1 and '"bad"' in dead_letters[0] and "Duplicate entry" in dead_letters[0]
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_rows(database):
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10000, max_batch_rows=2)
+
+    for i in range(5):
+        queue.add(_message(text=f"m{i}"))
+    await queue.stop()
+
+    written = [row["message"] for batch in database.batches for _, rows in batch for row in rows]
+    assert written == ["m0", "m1", "m2", "m3", "m4"]
+
+
+class _Ids:
+    """Stand-in allocator handing out consecutive ids"""
+
+    def __init__(self, start=100):
+        self.next_id = start
+
+    async def allocate(self, model):
+        self.next_id += 1
+        return self.next_id - 1
+
+
+@pytest.mark.asyncio
+async def test_chat_messages_are_queued_with_allocated_ids(database, monkeypatch):
+    """ChatService returns its messages before they are inserted, with client-side ids"""
+    from types import SimpleNamespace
+
+    from src.core.database import write_behind
+    from src.core.models.conversation import Channel
+    from src.services import chat_service
+    from src.services.chat_service import ChatService
+
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10000)
+    monkeypatch.setattr(write_behind, "_write_behind_queue", queue)
+    monkeypatch.setattr(chat_service, "get_id_allocator", lambda: _Ids())
+    monkeypatch.setattr(chat_service, "get_conversation_context_cache", lambda: None)
+
+    async def commit():
+        raise AssertionError("the request's session is not committed")
+
+    db = SimpleNamespace(add=None, commit=commit)
+    message = await ChatService(db)._store_message(1, "s1", MessageRole.ASSISTANT, "hello", Channel.WEB)
+
+    assert message.id == 100
+    assert message.created_at is not None
+    assert database.batches == []
+
+    await queue.flush()
+    (table, rows), = database.batches[0]
+    assert table == "conversations"
+    assert rows[0]["id"] == 100
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_chat_message_ids_are_allocated_without_write_behind(monkeypatch):
+    """With write-behind off the row is committed by the request, still with an allocated id"""
+    from types import SimpleNamespace
+
+    from src.core.models.conversation import Channel
+    from src.services import chat_service
+    from src.services.chat_service import ChatService
+
+    monkeypatch.setattr(chat_service, "get_write_behind_queue", lambda: None)
+    monkeypatch.setattr(chat_service, "get_id_allocator", lambda: _Ids(start=7))
+    monkeypatch.setattr(chat_service, "get_conversation_context_cache", lambda: None)
+
+    added = []
+
+    async def commit():
+        pass
+
+    async def refresh(conversation):
+        pass
+
+    db = SimpleNamespace(add=added.append, commit=commit, refresh=refresh)
+    message = await ChatService(db)._store_message(1, "s1", MessageRole.USER, "hello", Channel.WEB)
+
+    assert added == [message]
+    assert message.id == 7
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("auto_commit", [False, True])
+async def test_only_auto_committed_audit_logs_are_queued(database, monkeypatch, auto_commit):
+    """Audit entries on the caller's transaction stay there; standalone ones are batched"""
+    from types import SimpleNamespace
+
+    from src.services import audit_service
+    from src.services.audit_service import AuditService
+
+    queue = WriteBehindQueue(session_factory=database, flush_interval_ms=10000)
+    monkeypatch.setattr(audit_service, "get_write_behind_queue", lambda: queue)
+    added = []
+
+    async def commit():
+        raise AssertionError("the caller's session is not committed")
+
+    db = SimpleNamespace(add=added.append, commit=commit)
+    entry = await AuditService(db).log_access(7, "view_complaint_updates", "complaint", 3, auto_commit=auto_commit)
+
+    assert added == ([] if auto_commit else [entry])
+    assert len(queue) == (1 if auto_commit else 0)
+    await queue.stop()
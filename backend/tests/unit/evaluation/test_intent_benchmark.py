@@ -0,0 +1,153 @@
+"""
+Unit tests for the intent classification benchmark
+"""
+
+import json
+
+import pytest
+
+from src.evaluation.datasets.intent_corpus import (
+    LabelledUtterance,
+    anonymise,
+    load_corpus,
+    load_example_corpus,
+    save_corpus,
+)
+from src.evaluation.intent_benchmark import IntentBenchmark, compare_results, percentile, write_results
+from src.schemas.intent import IntentClassificationResult, IntentResult
+
+
+class ScriptedClassifier:
+    """Stand-in classifier returning a fixed (intent, method) per message"""
+
+    def __init__(self, script):
+        self.script = script
+
+    async def classify(self, message, conversation_history=None, dialog_state=None):
+        intent, method = self.script[message]
+        result = IntentClassificationResult(
+            intents=[IntentResult(intent=intent, confidence=0.9)],
+            primary_intent=intent,
+            requires_clarification=False,
+        )
+        return result, method
+
+
+CORPUS = [
+    LabelledUtterance("book ac", ("booking_management",), "examples"),
+    LabelledUtterance("price of painting", ("pricing_inquiry",), "examples"),
+    LabelledUtterance("my refund is late", ("refund_request",), "conversations"),
+    LabelledUtterance("hello", ("greeting",), "examples"),
+]
+
+SCRIPT = {
+    "book ac": ("booking_management", "pattern_match"),
+    "price of painting": ("pricing_inquiry", "llm"),
+    "my refund is late": ("complaint", "llm"),
+    "hello": ("greeting", "embedding_knn"),
+}
+
+
+@pytest.mark.asyncio
+async def test_summary_reports_accuracy_tiers_and_llm_ratio():
+    """Accuracy, tier ratios and LLM share are aggregated per method"""
+    summary = await IntentBenchmark(ScriptedClassifier(SCRIPT)).run(CORPUS)
+
+    assert summary["corpus_size"] == 4
+    assert summary["accuracy"]["primary"] == 0.75
+    assert summary["accuracy_by_source"]["conversations"]["primary"] == 0.0
+    assert summary["llm_ratio"] == 0.5
+    assert summary["tiers"]["llm"]["count"] == 2
+    assert set(summary["tiers"]["pattern_match"]["latency_ms"]) == {"p50", "p95", "p99"}
+    assert "latency_ms" not in summary["predictions"][0]
+
+
+@pytest.mark.asyncio
+async def test_compare_flags_regressions(tmp_path):
+    """A newly misclassified utterance and a higher LLM share are regressions"""
+    baseline = await IntentBenchmark(ScriptedClassifier(SCRIPT)).run(CORPUS)
+    path = tmp_path / "baseline.json"
+    write_results(baseline, str(path))
+
+    worse = dict(SCRIPT, **{"book ac": ("pricing_inquiry", "llm")})
+    current = await IntentBenchmark(ScriptedClassifier(worse)).run(CORPUS)
+    regressions = compare_results(json.loads(path.read_text()), current)
+
+    assert any("primary accuracy" in r for r in regressions)
+    assert any("LLM ratio" in r for r in regressions)
+    assert any("'book ac'" in r for r in regressions)
+    assert compare_results(baseline, baseline) == []
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) == 0.0
+
+
+def test_corpus_round_trip_and_anonymisation(tmp_path):
+    """Example corpus covers multi-intent rows and survives JSONL round trips"""
+    corpus = load_example_corpus()
+    path = tmp_path / "corpus.jsonl"
+    save_corpus(corpus, str(path))
+
+    assert load_corpus(str(path)) == corpus
+    assert any(len(utterance.intents) > 1 for utterance in corpus)
+    assert "jane@example.com" not in anonymise("mail jane@example.com about order 12345678")
+    assert "12345678" not in anonymise("mail jane@example.com about order 12345678")
+
+
+@pytest.mark.asyncio
+async def test_embedding_tier_skips_only_the_utterances_it_indexes():
+    """examples.py utterances would match themselves in the kNN index; other sources use every tier"""
+    tier_used = {}
+
+    class _Classifier(ScriptedClassifier):
+        embedding_index = object()
+
+        async def classify(self, message, conversation_history=None, dialog_state=None):
+            tier_used[message] = self.embedding_index is not None
+            return await super().classify(message)
+
+    classifier = _Classifier(SCRIPT)
+    await IntentBenchmark(classifier).run(CORPUS)
+
+    assert tier_used == {"book ac": False, "price of painting": False, "my refund is late": True, "hello": False}
+    assert classifier.embedding_index is not None
+
+
+@pytest.mark.asyncio
+async def test_conversation_rows_are_classified_with_their_preceding_turns(tmp_path):
+    """History reaches the classifier, survives the JSONL round trip and is reported apart from context-free rows"""
+    histories = {}
+
+    class _Classifier(ScriptedClassifier):
+        async def classify(self, message, conversation_history=None, dialog_state=None):
+            histories[message] = conversation_history
+            return await super().classify(message)
+
+    follow_up = LabelledUtterance(
+        "yes book it",
+        ("booking_management",),
+        "conversations",
+        history=(("user", "price of painting"), ("assistant", "Painting starts at 499. Shall I book it?"))
+    )
+    path = tmp_path / "corpus.jsonl"
+    save_corpus(CORPUS + [follow_up], str(path))
+    corpus = load_corpus(str(path))
+
+    script = dict(SCRIPT, **{"yes book it": ("booking_management", "llm")})
+    summary = await IntentBenchmark(_Classifier(script)).run(corpus)
+
+    assert corpus[-1] == follow_up
+    assert histories["yes book it"] == [
+        {"role": "user", "content": "price of painting"},
+        {"role": "assistant", "content": "Painting starts at 499. Shall I book it?"},
+    ]
+    assert histories["book ac"] is None
+    assert summary["by_context"]["in_context"]["count"] == 1
+    assert summary["by_context"]["in_context"]["llm_ratio"] == 1.0
+    assert summary["by_context"]["context_free"]["count"] == 4
+    assert summary["by_context"]["context_free"]["tier_ratios"]["llm"] == 0.5
@@ -0,0 +1,207 @@
+"""
+Unit tests for the per-session conversation context cache
+"""
+
+import pytest
+
+from src.llm.context import conversation_cache
+from src.llm.context.conversation_cache import ConversationContextCache
+
+
+class _FakeRedis:
+    """Runs the cache's list scripts against an in-memory dict"""
+
+    def __init__(self):
+        self.lists = {}
+        self.failures = 0
+
+    async def eval(self, script, keys, args):
+        key = keys[0]
+        if self.failures:
+            # RedisClient.eval logs errors and returns None
+            self.failures -= 1
+            return None
+        if script == conversation_cache._READ_SCRIPT:
+            return [item.encode() for item in self.lists.get(key, [])]
+
+        max_messages, items = int(args[0]), [str(item) for item in args[2:]]
+        if script == conversation_cache._APPEND_SCRIPT:
+            if key not in self.lists:
+                return 0
+            items = self.lists[key] + items
+        if items:
+            self.lists[key] = items[-max_messages:]
+        else:
+            self.lists.pop(key, None)
+        return 1
+
+    async def delete(self, *keys):
+        return sum(self.lists.pop(key, None) is not None for key in keys)
+
+
+def _message(id, role="user", content=None):
+    return {"id": id, "role": role, "content": content or f"message {id}"}
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request, monkeypatch):
+    cache = ConversationContextCache(max_messages=4, token_budget=1000)
+    redis = _FakeRedis() if request.param == "redis" else None
+    monkeypatch.setattr(ConversationContextCache, "_redis", staticmethod(lambda: redis))
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_miss_until_seeded_then_appends_are_read_back(cache):
+    assert await cache.get(1, "s1") is None
+
+    # Appends never create a buffer: it would lack the messages before them
+    await cache.append(1, "s1", [_message(1)])
+    assert await cache.get(1, "s1") is None
+
+    await cache.seed(1, "s1", [_message(1), _message(2, "assistant")])
+    await cache.append(1, "s1", [_message(3), _message(4, "assistant"), _message(5)])
+
+    history = await cache.get(1, "s1")
+    assert [msg["id"] for msg in history] == [2, 3, 4, 5]  # ring buffer keeps the last 4
+    assert history[1] == {"id": 3, "role": "user", "content": "message 3"}
+    assert await cache.get(2, "s1") is None  # keyed per user
+
+
+@pytest.mark.asyncio
+async def test_token_budget_drops_oldest_messages(cache):
+    cache.token_budget = 30
+    long_reply = "word " * 25
+    await cache.seed(1, "s1", [_message(1, content=long_reply), _message(2), _message(3, "assistant")])
+
+    assert [msg["id"] for msg in await cache.get(1, "s1")] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_newest_message_is_kept_even_over_budget(cache):
+    cache.token_budget = 1
+    await cache.seed(1, "s1", [_message(1), _message(2, content="word " * 50)])
+
+    assert [msg["id"] for msg in await cache.get(1, "s1")] == [2]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_a_reload(cache):
+    await cache.seed(1, "s1", [_message(1)])
+    await cache.invalidate(1, "s1")
+
+    assert await cache.get(1, "s1") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_redis_append_drops_the_buffer(monkeypatch):
+    """A buffer that missed an append is never served (later appends would hide the gap)"""
+    cache = ConversationContextCache(max_messages=4, token_budget=1000)
+    redis = _FakeRedis()
+    monkeypatch.setattr(ConversationContextCache, "_redis", staticmethod(lambda: redis))
+    await cache.seed(1, "s1", [_message(1), _message(2, "assistant")])
+
+    redis.failures = 1
+    await cache.append(1, "s1", [_message(3)])
+    await cache.append(1, "s1", [_message(4, "assistant")])
+
+    assert await cache.get(1, "s1") is None
+
+
+@pytest.mark.asyncio
+async def test_in_process_buffer_is_checked_against_the_newest_stored_message(monkeypatch):
+    """Without Redis each worker has its own buffer; one that missed another worker's turn is a miss"""
+    monkeypatch.setattr(ConversationContextCache, "_redis", staticmethod(lambda: None))
+    worker_a = ConversationContextCache(max_messages=4, token_budget=1000)
+    worker_b = ConversationContextCache(max_messages=4, token_budget=1000)
+    stored = [_message(1), _message(2, "assistant")]
+
+    async def latest_id():
+        return stored[-1]["id"] if stored else None
+
+    await worker_a.seed(1, "s1", stored)
+    assert [msg["id"] for msg in await worker_a.get(1, "s1", latest_id=latest_id)] == [1, 2]
+
+    # Worker B handles the next turn; worker A's append is a no-op without a buffer there
+    stored += [_message(3), _message(4, "assistant")]
+    await worker_b.append(1, "s1", stored[2:])
+
+    assert await worker_a.get(1, "s1", latest_id=latest_id) is None
+    assert await worker_a.get(1, "s1") is None  # the stale buffer is dropped
+
+    # A session deleted elsewhere has no stored messages
+    await worker_a.seed(1, "s1", stored)
+    stored.clear()
+    assert await worker_a.get(1, "s1", latest_id=latest_id) is None
+
+
+@pytest.mark.asyncio
+async def test_trusted_in_process_buffer_skips_the_newest_message_check(monkeypatch):
+    """With one worker per session the buffer it wrote is complete; no id lookup per turn"""
+    monkeypatch.setattr(ConversationContextCache, "_redis", staticmethod(lambda: None))
+    cache = ConversationContextCache(max_messages=4, token_budget=1000, trust_local_buffers=True)
+    lookups = []
+
+    async def latest_id():
+        lookups.append(1)
+        return 2
+
+    await cache.seed(1, "s1", [_message(1)])
+    await cache.append(1, "s1", [_message(2, "assistant")])
+
+    assert [msg["id"] for msg in await cache.get(1, "s1", latest_id=latest_id)] == [1, 2]
+    assert lookups == []
+
+
+class _NullDatabase:
+    """Session factory whose sessions accept every insert"""
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, rows):
+        pass
+
+    async def commit(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_rolling_summary_folds_write_behind_messages_once(cache):
+    """Queued messages have no id yet; the summary still folds each of them exactly once"""
+    from src.core.database.write_behind import WriteBehindQueue
+    from src.core.models import Conversation
+    from src.core.models.conversation import MessageRole
+    from src.llm.context.history_compactor import HistoryCompactor
+
+    queue = WriteBehindQueue(session_factory=_NullDatabase(), flush_interval_ms=10000)
+    compactor = HistoryCompactor(token_budget=1000, keep_recent=2, summary_max_tokens=1000)
+    await cache.seed(1, "s1", [_message(1), _message(2, "assistant")])
+
+    async def turn(number):
+        rows = [
+            queue.add(Conversation(user_id=1, session_id="s1", role=MessageRole.USER, message=f"question {number}")),
+            queue.add(Conversation(user_id=1, session_id="s1", role=MessageRole.ASSISTANT, message=f"answer {number}")),
+        ]
+        await cache.append(1, "s1", [{"id": row.id, "role": row.role.value, "content": row.message} for row in rows])
+        return await compactor.compact_session("s1", await cache.get(1, "s1"))
+
+    await turn(1)
+    compacted = await turn(2)
+    assert all(msg["id"] is None for msg in (await cache.get(1, "s1"))[-2:])
+    assert [msg["content"] for msg in compacted] == ["question 2", "answer 2"]
+
+    # The cache keeps 4 messages, so message 1 and 2 have left the window but stay summarized
+    compacted = await turn(3)
+    assert compacted.summary.splitlines() == [
+        "User: message 1", "Assistant: message 2", "User: question 1", "Assistant: answer 1",
+        "User: question 2", "Assistant: answer 2",
+    ]
+    assert compactor._summaries.get("s1")["lines"] == compacted.summary.splitlines()
+    await queue.stop()
@@ -0,0 +1,90 @@
+"""
+Unit tests for conversation-history compaction
+"""
+
+import pytest
+
+from src.llm.context.history_compactor import (
+    ConversationHistory,
+    HistoryCompactor,
+    render_history,
+    truncate_message,
+)
+from src.llm.context.tokens import count_tokens
+from src.llm.gemini.prompts import build_context_aware_intent_prompt
+
+SERVICE_LIST = (
+    "Here are the services we offer:\n"
+    + "\n".join(f"- Service {i}: professional home service with certified technicians" for i in range(15))
+    + "\nWhich service would you like to book?"
+)
+
+
+def _conversation(turns: int, with_ids: bool = False) -> list:
+    history = []
+    for i in range(turns):
+        history.append({"role": "user", "content": f"what services do you offer in sector {i}?"})
+        history.append({"role": "assistant", "content": SERVICE_LIST})
+    if with_ids:
+        for i, msg in enumerate(history, start=1):
+            msg["id"] = i
+    return history
+
+
+def test_assistant_truncation_keeps_closing_question():
+    """Long assistant replies keep their opening and the question being answered"""
+    text = truncate_message("assistant", SERVICE_LIST, max_tokens=40)
+
+    assert count_tokens(text) <= 45
+    assert text.startswith("Here are the services")
+    assert text.endswith("Which service would you like to book?")
+
+
+def test_compact_respects_token_budget():
+    """Rendered history never exceeds the budget"""
+    compactor = HistoryCompactor(token_budget=150, keep_recent=4, max_message_tokens=80)
+    history = _conversation(6)
+
+    compacted = compactor.compact(history)
+
+    assert isinstance(compacted, ConversationHistory)
+    assert count_tokens(render_history(compacted, compacted.summary)) <= 150
+    assert compacted[-1]["role"] == "assistant"
+    assert count_tokens(render_history(history[-5:])) > 150
+
+
+def test_older_messages_are_summarized():
+    """Messages beyond the recent window become one summary line each"""
+    compactor = HistoryCompactor(token_budget=1000, keep_recent=2)
+
+    compacted = compactor.compact(_conversation(3))
+
+    assert len(compacted) == 2
+    assert "User: what services do you offer in sector 0?" in compacted.summary
+    assert "(listed 15 items)" in compacted.summary
+
+
+@pytest.mark.asyncio
+async def test_rolling_summary_folds_each_message_once():
+    """A session's summary only grows by messages that newly left the window"""
+    compactor = HistoryCompactor(token_budget=1000, keep_recent=2, summary_max_tokens=1000)
+    history = _conversation(5, with_ids=True)
+
+    # Turn 1: window of the first 6 messages, then the next turn slides it by 2
+    await compactor.compact_session("session_1", history[:6])
+    compacted = await compactor.compact_session("session_1", history[2:8])
+
+    summary_lines = compacted.summary.splitlines()
+    assert len(summary_lines) == 6
+    assert summary_lines[0] == "User: what services do you offer in sector 0?"
+    assert summary_lines[-2] == "User: what services do you offer in sector 2?"
+
+
+def test_prompt_uses_compacted_history():
+    """The context-aware prompt inlines the compacted history instead of raw messages"""
+    history = _conversation(6)
+
+    prompt = build_context_aware_intent_prompt("yes", conversation_history=history)
+
+    assert "Summary of earlier conversation" in prompt or "(+12 more)" in prompt
+    assert prompt.count("Service 14") == 0
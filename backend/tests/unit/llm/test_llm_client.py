@@ -0,0 +1,201 @@
+"""
+Unit tests for LLMClient async entry points
+"""
+
+import asyncio
+import os
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from pydantic import BaseModel
+
+os.environ.setdefault("GOOGLE_API_KEY", "test-google-api-key")
+
+from src.llm.cache.response_cache import get_llm_response_cache
+from src.llm.gemini.client import (
+    LLMClient,
+    StructuredOutputModel,
+    get_shared_llm_client,
+    reset_llm_registry,
+)
+
+
+class SampleOutput(BaseModel):
+    """Sample structured output schema"""
+    label: str
+    confidence: float
+
+
+def _response(text: str):
+    response = MagicMock()
+    response.text = text
+    response.usage_metadata = None
+    return response
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_state():
+    """Start every test with an empty response cache and model registry"""
+    get_llm_response_cache().clear()
+    reset_llm_registry()
+    yield
+    get_llm_response_cache().clear()
+    reset_llm_registry()
+
+
+@pytest.fixture
+def llm_client():
+    """Create LLMClient with the Gemini SDK patched out"""
+    with patch("src.llm.gemini.client.genai") as mock_genai:
+        mock_genai.GenerativeModel.return_value = MagicMock()
+        mock_genai.GenerationConfig.side_effect = lambda **kwargs: SimpleNamespace(**kwargs)
+        client = LLMClient(model="gemini-test", temperature=0.0, max_tokens=64)
+        yield client, mock_genai
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_uses_async_sdk(llm_client):
+    """ainvoke awaits generate_content_async instead of the blocking call"""
+    client, _ = llm_client
+    client.client.generate_content_async = AsyncMock(return_value=_response("hello"))
+
+    result = await client.ainvoke("hi")
+
+    assert result == "hello"
+    client.client.generate_content_async.assert_awaited_once()
+    client.client.generate_content.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_with_messages_uses_system_instruction(llm_client):
+    """System messages become the model's system instruction"""
+    client, mock_genai = llm_client
+    system_model = MagicMock()
+    system_model.generate_content_async = AsyncMock(return_value=_response("ok"))
+    mock_genai.GenerativeModel.return_value = system_model
+
+    result = await client.ainvoke_with_messages([
+        {"role": "system", "content": "Be brief"},
+        {"role": "user", "content": "hi"},
+    ])
+
+    assert result == "ok"
+    _, kwargs = mock_genai.GenerativeModel.call_args
+    assert kwargs["system_instruction"] == "Be brief"
+    system_model.generate_content_async.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_structured_ainvoke_parses_schema(llm_client):
+    """StructuredOutputModel.ainvoke returns a validated Pydantic instance"""
+    client, _ = llm_client
+    client.client.generate_content_async = AsyncMock(
+        return_value=_response('{"label": "greeting", "confidence": 0.9}')
+    )
+
+    result = await client.with_structured_output(SampleOutput).ainvoke("hi")
+
+    assert result == SampleOutput(label="greeting", confidence=0.9)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_overlap(llm_client):
+    """N concurrent calls take roughly one round-trip, not N"""
+    client, _ = llm_client
+
+    async def slow_call(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return _response("done")
+
+    client.client.generate_content_async = slow_call
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results = await asyncio.gather(*(client.ainvoke(f"msg {i}") for i in range(10)))
+    elapsed = loop.time() - start
+
+    assert results == ["done"] * 10
+    assert elapsed < 0.25
+
+
+@pytest.mark.asyncio
+async def test_deterministic_calls_are_cached(llm_client):
+    """Temperature 0 calls are served from the cache on repeat"""
+    client, _ = llm_client
+    client.client.generate_content_async = AsyncMock(return_value=_response("cached answer"))
+
+    first = await client.ainvoke("what services do you offer?")
+    second = await client.ainvoke("what services do you offer?")
+
+    assert first == second == "cached answer"
+    assert client.client.generate_content_async.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_structured_output_is_cached(llm_client):
+    """Structured results are re-validated from the cached JSON"""
+    client, _ = llm_client
+    client.client.generate_content_async = AsyncMock(
+        return_value=_response('{"label": "greeting", "confidence": 0.9}')
+    )
+    structured = client.with_structured_output(SampleOutput)
+
+    await structured.ainvoke("hi")
+    result = await structured.ainvoke("hi")
+
+    assert result == SampleOutput(label="greeting", confidence=0.9)
+    assert client.client.generate_content_async.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_non_deterministic_and_opted_out_calls_skip_cache(llm_client):
+    """Temperature > 0 and use_cache=False always reach the model"""
+    client, _ = llm_client
+    client.client.generate_content_async = AsyncMock(return_value=_response("fresh"))
+
+    await client.generate("hello", temperature=0.7)
+    await client.generate("hello", temperature=0.7)
+    await client.ainvoke("hello", use_cache=False)
+    await client.ainvoke("hello", use_cache=False)
+
+    assert client.client.generate_content_async.await_count == 4
+
+
+def test_models_are_pooled_per_system_instruction(llm_client):
+    """GenerativeModel instances are reused per (model, system_instruction)"""
+    client, mock_genai = llm_client
+    mock_genai.GenerativeModel.side_effect = lambda **kwargs: MagicMock()
+
+    first = client._get_model("You are Lisa")
+    second = client._get_model("You are Lisa")
+    other = client._get_model("You are a SQL expert")
+
+    assert first is second
+    assert first is not other
+    assert client._get_model() is client.client
+
+
+def test_structured_schema_is_sanitized_once(llm_client):
+    """The sanitized JSON schema is computed once per Pydantic class"""
+    client, _ = llm_client
+
+    with patch.object(SampleOutput, "model_json_schema", wraps=SampleOutput.model_json_schema) as schema_spy:
+        first = client.with_structured_output(SampleOutput)._build_config()
+        second = client.with_structured_output(SampleOutput)._build_config()
+
+    assert schema_spy.call_count == 1
+    assert first.response_schema is second.response_schema
+    assert "title" not in first.response_schema
+    assert SampleOutput in StructuredOutputModel._schema_cache
+
+
+def test_shared_client_is_reused(llm_client):
+    """Default clients are shared process-wide and configure the SDK once"""
+    _, mock_genai = llm_client
+
+    first = get_shared_llm_client()
+    second = get_shared_llm_client()
+
+    assert first is second
+    assert get_shared_llm_client(temperature=0.0) is not first
+    assert mock_genai.configure.call_count == 1
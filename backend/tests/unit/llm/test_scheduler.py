@@ -0,0 +1,106 @@
+"""
+Unit tests for the priority-tiered LLM scheduler
+"""
+
+import asyncio
+import pytest
+
+from src.llm.scheduler import LLMScheduler, LLMSchedulerRejected, LLMTier
+from src.nlp.llm.retry import async_retry
+
+
+def _scheduler(generation: int = 1, max_queue_depth: int = 2, max_wait: float = 1.0) -> LLMScheduler:
+    return LLMScheduler(
+        concurrency={
+            LLMTier.CLASSIFICATION: 2,
+            LLMTier.EXTRACTION: 2,
+            LLMTier.GENERATION: generation,
+        },
+        max_queue_depth=max_queue_depth,
+        max_queue_wait_seconds=max_wait
+    )
+
+
+async def _hold(scheduler: LLMScheduler, tier: LLMTier, release: asyncio.Event):
+    async with scheduler.slot(tier):
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_saturated_generation_does_not_block_classification():
+    """Long generations cannot starve classification calls"""
+    scheduler = _scheduler(generation=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, LLMTier.GENERATION, release))
+    await asyncio.sleep(0)
+
+    async with asyncio.timeout(0.5):
+        async with scheduler.slot(LLMTier.CLASSIFICATION):
+            pass
+
+    release.set()
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_full_queue_fails_fast():
+    """Calls beyond the max queue depth are rejected without waiting"""
+    scheduler = _scheduler(generation=1, max_queue_depth=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, LLMTier.GENERATION, release))
+    queued = asyncio.create_task(_hold(scheduler, LLMTier.GENERATION, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(LLMSchedulerRejected) as exc_info:
+        async with scheduler.slot(LLMTier.GENERATION):
+            pass
+    assert exc_info.value.reason == "queue_full"
+
+    release.set()
+    await asyncio.gather(holder, queued)
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_bounded():
+    """A queued call gives up after max_queue_wait_seconds"""
+    scheduler = _scheduler(generation=1, max_wait=0.05)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, LLMTier.GENERATION, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(LLMSchedulerRejected) as exc_info:
+        async with scheduler.slot(LLMTier.GENERATION):
+            pass
+    assert exc_info.value.reason == "queue_timeout"
+
+    release.set()
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_slots_are_released_on_error():
+    """A failing call frees its slot for the next one"""
+    scheduler = _scheduler(generation=1)
+
+    with pytest.raises(RuntimeError):
+        async with scheduler.slot(LLMTier.GENERATION):
+            raise RuntimeError("503 overloaded")
+
+    async with asyncio.timeout(0.5):
+        async with scheduler.slot(LLMTier.GENERATION):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_rejected_calls_are_not_retried():
+    """async_retry lets load-shedding errors through immediately"""
+    attempts = {"count": 0}
+
+    @async_retry(max_retries=3, initial_delay=0.01, use_throttle=False)
+    async def call():
+        attempts["count"] += 1
+        raise LLMSchedulerRejected(LLMTier.GENERATION, "queue_full")
+
+    with pytest.raises(LLMSchedulerRejected):
+        await call()
+    assert attempts["count"] == 1
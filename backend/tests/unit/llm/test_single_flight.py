@@ -0,0 +1,144 @@
+"""
+Unit tests for single-flight coalescing of identical LLM calls
+"""
+
+import asyncio
+import os
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("GOOGLE_API_KEY", "test-google-api-key")
+
+from src.llm.cache.response_cache import get_llm_response_cache
+from src.llm.cache.single_flight import SingleFlight
+from src.llm.gemini.client import LLMClient, reset_llm_registry
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_state():
+    """Start every test with an empty response cache and model registry"""
+    get_llm_response_cache().clear()
+    reset_llm_registry()
+    yield
+    get_llm_response_cache().clear()
+    reset_llm_registry()
+
+
+@pytest.fixture
+def slow_client():
+    """LLMClient whose async SDK call takes a while and counts invocations"""
+    with patch("src.llm.gemini.client.genai") as mock_genai:
+        mock_genai.GenerativeModel.return_value = MagicMock()
+        mock_genai.GenerationConfig.side_effect = lambda **kwargs: SimpleNamespace(**kwargs)
+        client = LLMClient(model="gemini-test", temperature=0.0, max_tokens=64)
+
+        calls = {"count": 0}
+
+        async def fake_generate(contents, generation_config):
+            calls["count"] += 1
+            await asyncio.sleep(0.05)
+            response = MagicMock()
+            response.text = f"answer to {contents[0]}"
+            response.usage_metadata = None
+            return response
+
+        client.client.generate_content_async = fake_generate
+        yield client, calls
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_request(slow_client):
+    """Concurrent identical prompts issue a single Gemini call"""
+    client, calls = slow_client
+
+    results = await asyncio.gather(*[client.generate("hi there", temperature=0.0) for _ in range(10)])
+
+    assert results == ["answer to hi there"] * 10
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sampled_calls_are_not_coalesced(slow_client):
+    """Calls that are not cache-eligible each get their own response"""
+    client, calls = slow_client
+
+    await asyncio.gather(*[client.generate("hi there", temperature=0.7) for _ in range(3)])
+
+    assert calls["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_different_prompts_are_not_coalesced(slow_client):
+    """Only identical requests are coalesced"""
+    client, calls = slow_client
+
+    await asyncio.gather(client.ainvoke("hi"), client.ainvoke("hello"))
+
+    assert calls["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_opted_out_calls_are_not_coalesced(slow_client):
+    """use_cache=False asks for a fresh response"""
+    client, calls = slow_client
+
+    await asyncio.gather(*[client.ainvoke("hi", use_cache=False) for _ in range(3)])
+
+    assert calls["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    """Cancelling the first caller leaves the shared call running for others"""
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def call():
+        started.set()
+        await asyncio.sleep(0.05)
+        return "shared"
+
+    first = asyncio.create_task(single_flight.run("key", call, model="m", operation="op"))
+    await started.wait()
+    second = asyncio.create_task(single_flight.run("key", call, model="m", operation="op"))
+    await asyncio.sleep(0)
+
+    first.cancel()
+
+    assert await second == "shared"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert len(single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_call_does_not_see_the_callers_context():
+    """Per-request contextvars of the first caller stay out of the shared call"""
+    from src.nlp.llm.retry import get_current_retry_budget, llm_retry_budget
+
+    single_flight = SingleFlight()
+
+    async def call():
+        return get_current_retry_budget()
+
+    with llm_retry_budget(4):
+        assert await single_flight.run("key", call, model="m", operation="op") is None
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_all_waiters():
+    """A failed shared call raises in every waiter and is not retained"""
+    single_flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("503 overloaded")
+
+    results = await asyncio.gather(
+        *[single_flight.run("key", call, model="m", operation="op") for _ in range(3)],
+        return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(single_flight) == 0
@@ -0,0 +1,158 @@
+"""
+Unit tests for the embedding kNN intent tier
+"""
+
+import re
+import zlib
+
+import numpy as np
+import pytest
+
+from src.nlp.intent.config import IntentType
+from src.nlp.intent.embedding_tier import EmbeddingIntentIndex
+from src.nlp.intent.examples import get_multi_intent_examples
+
+
+class BagOfWordsEmbeddings:
+    """Deterministic stand-in for MiniLM: hashed bag of words"""
+
+    DIM = 512
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_text(self, text):
+        self.calls += 1
+        vector = np.zeros(self.DIM, dtype=np.float32)
+        for token in re.findall(r"[a-z']+", text.lower()):
+            vector[zlib.crc32(token.encode()) % self.DIM] += 1.0
+        return vector.tolist()
+
+    def embed_texts(self, texts):
+        return [self.embed_text(text) for text in texts]
+
+
+@pytest.fixture
+def index():
+    return EmbeddingIntentIndex(BagOfWordsEmbeddings(), top_k=3, min_similarity=0.6, min_margin=0.5)
+
+
+def test_accepts_message_close_to_one_intent(index):
+    """A message matching refund examples is classified locally"""
+    intent, confidence = index.classify("When will I get my refund?")
+
+    assert intent == IntentType.REFUND_REQUEST
+    assert 0.5 < confidence <= 1.0
+
+
+def test_defers_multi_intent_messages(index):
+    """Messages closest to the multi-intent examples go to the LLM"""
+    query = get_multi_intent_examples()[0]["query"]
+
+    assert index.classify(query) is None
+
+
+def test_defers_unrelated_messages(index):
+    """Nothing similar enough in the index means no local decision"""
+    assert index.classify("zebra quantum xylophone") is None
+
+
+@pytest.mark.asyncio
+async def test_aclassify_builds_once_and_skips_failed_messages():
+    """The index is embedded once; a failed message embedding only defers that message"""
+    embeddings = BagOfWordsEmbeddings()
+    index = EmbeddingIntentIndex(embeddings, top_k=3, min_similarity=0.6, min_margin=0.5)
+
+    await index.aclassify("Show me my bookings")
+    calls_after_build = embeddings.calls
+    await index.aclassify("Show me my bookings")
+    assert index.is_built
+    assert embeddings.calls == calls_after_build + 1
+
+    embed_text = embeddings.embed_text
+
+    def flaky(text):
+        embeddings.embed_text = embed_text
+        raise RuntimeError("CUDA out of memory")
+
+    embeddings.embed_text = flaky
+    assert await index.aclassify("When will I get my refund?") is None
+    intent, _ = await index.aclassify("When will I get my refund?")
+    assert intent == IntentType.REFUND_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_aclassify_disables_the_tier_when_the_build_fails():
+    """A model that cannot be loaded turns the tier off for the process"""
+    embeddings = BagOfWordsEmbeddings()
+    index = EmbeddingIntentIndex(embeddings, top_k=3, min_similarity=0.6, min_margin=0.5)
+
+    def broken(texts):
+        raise RuntimeError("model unavailable")
+
+    embeddings.embed_texts = broken
+    assert await index.aclassify("When will I get my refund?") is None
+
+    embeddings.embed_texts = BagOfWordsEmbeddings().embed_texts
+    assert await index.aclassify("When will I get my refund?") is None
+    assert not index.is_built
+
+
+@pytest.mark.asyncio
+async def test_classifier_runs_the_tier_with_chat_service_history(index, monkeypatch):
+    """Chat turns always carry history (ending with the stored user message); the tier still runs"""
+    from src.nlp.intent.classifier import IntentClassifier
+
+    async def classify_with_llm(message, conversation_history=None, dialog_state=None):
+        raise AssertionError("LLM should not be called")
+
+    classifier = IntentClassifier(llm_client=object(), embedding_index=index)
+    monkeypatch.setattr(classifier, "_classify_with_llm", classify_with_llm)
+    message = "When will I get my refund money back?"
+    history = [
+        {"id": 11, "role": "user", "content": "Hi"},
+        {"id": 12, "role": "assistant", "content": "Hello! How can I help you today?"},
+        {"id": 13, "role": "user", "content": message},
+    ]
+
+    result, method = await classifier.classify(message, conversation_history=history)
+    assert method == "embedding_knn"
+    assert result.primary_intent == IntentType.REFUND_REQUEST.value
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("message", ["yes", "Yes please book the refund", "When will I get it back?", "the second refund one"])
+async def test_classifier_skips_the_tier_for_follow_ups(index, monkeypatch, message):
+    """Short replies, yes/no answers and references to earlier turns go to the context-aware LLM"""
+    from src.nlp.intent.classifier import IntentClassifier
+
+    llm_calls = []
+
+    async def classify_with_llm(message, conversation_history=None, dialog_state=None):
+        llm_calls.append(message)
+        raise RuntimeError("LLM unavailable")
+
+    classifier = IntentClassifier(llm_client=object(), embedding_index=index)
+    monkeypatch.setattr(classifier, "_classify_with_llm", classify_with_llm)
+    history = [{"role": "assistant", "content": "Which booking should I refund?"}]
+
+    _, method = await classifier.classify(message, conversation_history=history)
+    assert method == "fallback"
+    assert llm_calls == [message]
+
+
+@pytest.mark.asyncio
+async def test_classifier_skips_the_tier_during_slot_filling(index, monkeypatch):
+    """An active dialog state sends even self-contained messages to the LLM"""
+    from types import SimpleNamespace
+    from src.nlp.intent.classifier import IntentClassifier
+
+    async def classify_with_llm(message, conversation_history=None, dialog_state=None):
+        raise RuntimeError("LLM unavailable")
+
+    classifier = IntentClassifier(llm_client=object(), embedding_index=index)
+    monkeypatch.setattr(classifier, "_classify_with_llm", classify_with_llm)
+    dialog_state = SimpleNamespace(state=SimpleNamespace(value="collecting_info"), intent="booking_management")
+
+    _, method = await classifier.classify("When will I get my refund money back?", dialog_state=dialog_state)
+    assert method == "fallback"
@@ -0,0 +1,122 @@
+"""
+Unit tests for the intent classification result cache
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.nlp.intent.result_cache import CachedIntentClassifier, IntentResultCache
+from src.schemas.intent import IntentClassificationResult, IntentResult
+
+
+class CountingClassifier:
+    """Stand-in classifier that counts calls"""
+
+    def __init__(self, method: str = "llm"):
+        self.calls = 0
+        self.method = method
+        self.thresholds = "delegated"
+
+    async def classify(self, message, conversation_history=None, dialog_state=None):
+        self.calls += 1
+        result = IntentClassificationResult(
+            intents=[IntentResult(intent="booking_management", confidence=0.9)],
+            primary_intent="booking_management",
+            requires_clarification=False,
+        )
+        return result, self.method
+
+
+def _dialog_state(needed):
+    return SimpleNamespace(intent="booking_management", state=SimpleNamespace(value="collecting_info"), needed_entities=needed)
+
+
+@pytest.fixture
+def classifier():
+    return CountingClassifier()
+
+
+@pytest.mark.asyncio
+async def test_repeated_follow_up_is_served_from_cache(classifier):
+    """Normalized repeats hit the cache and return the original method"""
+    cached = CachedIntentClassifier(classifier, IntentResultCache())
+
+    await cached.classify("Show my bookings")
+    result, method = await cached.classify("  show MY bookings!")
+
+    assert classifier.calls == 1
+    assert method == "llm"
+    assert result.primary_intent == "booking_management"
+
+
+@pytest.mark.asyncio
+async def test_cached_results_are_copies(classifier):
+    """Callers mutating a result do not corrupt the cache"""
+    cached = CachedIntentClassifier(classifier, IntentResultCache())
+
+    first, _ = await cached.classify("yes")
+    first.requires_clarification = True
+    second, _ = await cached.classify("yes")
+
+    assert second.requires_clarification is False
+
+
+@pytest.mark.asyncio
+async def test_dialog_fingerprint_separates_entries(classifier):
+    """Different needed entities or history context are different keys"""
+    cached = CachedIntentClassifier(classifier, IntentResultCache())
+
+    await cached.classify("tomorrow", dialog_state=_dialog_state(["date"]))
+    await cached.classify("tomorrow", dialog_state=_dialog_state(["date"]))
+    await cached.classify("tomorrow", dialog_state=_dialog_state(["time"]))
+    await cached.classify("yes", conversation_history=[{"role": "assistant", "content": "Book AC?"}])
+    await cached.classify("yes", conversation_history=[{"role": "assistant", "content": "Cancel it?"}])
+
+    assert classifier.calls == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("message", [
+    "my email is jane@example.com",
+    "call me on 9876543210",
+    "pincode 110001",
+    "221 Baker Street",
+])
+async def test_pii_messages_are_never_cached(classifier, message):
+    """Messages carrying PII always reach the classifier"""
+    cached = CachedIntentClassifier(classifier, IntentResultCache())
+
+    await cached.classify(message)
+    await cached.classify(message)
+
+    assert classifier.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_fallback_results_are_not_cached():
+    """Failed classifications are retried on the next call"""
+    classifier = CountingClassifier(method="fallback")
+    cached = CachedIntentClassifier(classifier, IntentResultCache())
+
+    await cached.classify("hmm")
+    await cached.classify("hmm")
+
+    assert classifier.calls == 2
+    assert cached.thresholds == "delegated"
+
+
+def test_cache_is_bounded():
+    """The LRU tier never exceeds max_entries"""
+    cache = IntentResultCache(max_entries=2)
+    result = IntentClassificationResult(
+        intents=[IntentResult(intent="greeting", confidence=0.9)],
+        primary_intent="greeting",
+        requires_clarification=False,
+    )
+
+    for message in ["hi", "hello", "hey"]:
+        cache.set(cache.build_key(message), result, "pattern_match")
+
+    assert len(cache.memory) == 2
+    assert cache.get(cache.build_key("hi")) is None
@@ -0,0 +1,41 @@
+"""
+Unit tests for the compiled keyword matcher
+"""
+
+import re
+
+from src.nlp.intent.config import IntentType
+from src.nlp.intent.keyword_matcher import KeywordMatcher
+from src.nlp.intent.patterns import IntentPatterns
+
+
+def test_reports_overlapping_and_nested_keywords():
+    """Every occurrence is found, including keywords nested in longer ones"""
+    matcher = KeywordMatcher(["cancel", "cancel booking", "booking", "king"])
+
+    hits = {(hit.keyword, hit.start) for hit in matcher.find_all("cancel booking")}
+
+    assert hits == {("cancel", 0), ("cancel booking", 0), ("booking", 7), ("king", 10)}
+
+
+def test_scan_matches_substring_and_boundary_semantics():
+    """found / space_bounded / word_bounded agree with the checks they replace"""
+    keywords = ["ac", "book", "set up", "rate"]
+    matcher = KeywordMatcher(keywords)
+
+    for text in ["each ac unit", "ac", "booking a slot", "set up, please", "rate?", "separate rates"]:
+        scan = matcher.scan(text)
+        for keyword in keywords:
+            assert (keyword in scan.found) == (keyword in text)
+            assert (keyword in scan.space_bounded) == (f" {keyword} " in f" {text} ")
+            assert (keyword in scan.word_bounded) == bool(re.search(rf"\b{re.escape(keyword)}\b", text))
+
+
+def test_patterns_single_pass_results():
+    """Intent scores and entities come from the shared compiled scan"""
+    intents = dict(IntentPatterns.match_intent("I want to cancel my latest booking"))
+    entities = IntentPatterns.extract_entities_from_patterns("show my pending bookings in Mumbai")
+
+    assert intents[IntentType.BOOKING_MANAGEMENT] == 0.95
+    assert entities["action"] == "list"
+    assert entities["status_filter"] == "pending"
@@ -0,0 +1,116 @@
+"""
+Unit tests for async LLM retry, retry budget and throttle
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.nlp.llm.retry import (
+    LLMThrottle,
+    LLMThrottleTimeout,
+    async_retry,
+    compute_backoff_delay,
+    llm_retry_budget,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep():
+    """Make backoff sleeps instant so tests stay fast"""
+    with patch("src.nlp.llm.retry.random.uniform", return_value=0.0):
+        yield
+
+
+def test_backoff_delay_is_capped_and_jittered():
+    """Full jitter never exceeds the capped exponential delay"""
+    with patch("src.nlp.llm.retry.random.uniform", side_effect=lambda a, b: b):
+        assert compute_backoff_delay(0, 1.0, 2.0, 8.0) == 1.0
+        assert compute_backoff_delay(2, 1.0, 2.0, 8.0) == 4.0
+        assert compute_backoff_delay(10, 1.0, 2.0, 8.0) == 8.0
+
+
+@pytest.mark.asyncio
+async def test_retries_retryable_errors_then_succeeds():
+    """429 errors are retried until the call succeeds"""
+    call = AsyncMock(side_effect=[Exception("429 rate limit"), Exception("503"), "ok"])
+
+    @async_retry(max_retries=3, use_throttle=False)
+    async def invoke():
+        return await call()
+
+    assert await invoke() == "ok"
+    assert call.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_raises_immediately():
+    """Validation-style errors are not retried"""
+    call = AsyncMock(side_effect=ValueError("bad schema"))
+
+    @async_retry(max_retries=3, use_throttle=False)
+    async def invoke():
+        return await call()
+
+    with pytest.raises(ValueError):
+        await invoke()
+    assert call.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_attempt_timeout_is_retried():
+    """A hung attempt times out and the next attempt runs"""
+    attempts = []
+
+    @async_retry(max_retries=1, attempt_timeout=0.01, use_throttle=False)
+    async def invoke():
+        attempts.append(1)
+        if len(attempts) == 1:
+            await asyncio.sleep(1)
+        return "ok"
+
+    assert await invoke() == "ok"
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_is_shared_across_calls():
+    """Once the request budget is spent, later calls stop retrying"""
+    call = AsyncMock(side_effect=Exception("429 quota"))
+
+    @async_retry(max_retries=5, use_throttle=False)
+    async def invoke():
+        return await call()
+
+    with llm_retry_budget(2) as budget:
+        with pytest.raises(Exception):
+            await invoke()
+        assert budget.remaining == 0
+        assert call.await_count == 3
+
+        with pytest.raises(Exception):
+            await invoke()
+        assert call.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_throttle_spaces_calls_without_redis():
+    """The in-process fallback reserves evenly spaced slots"""
+    throttle = LLMThrottle(min_interval_ms=20, max_wait_seconds=1.0)
+
+    with patch("src.core.cache.redis_client.redis_client.eval", AsyncMock(return_value=None)):
+        waits = await asyncio.gather(*(throttle.acquire() for _ in range(3)))
+
+    assert sorted(waits)[0] == 0.0
+    assert sorted(waits)[-1] >= 0.03
+
+
+@pytest.mark.asyncio
+async def test_throttle_fails_fast_beyond_max_wait():
+    """Calls that would wait past max_wait raise instead of queueing"""
+    throttle = LLMThrottle(min_interval_ms=1000, max_wait_seconds=0.5)
+
+    with patch("src.core.cache.redis_client.redis_client.eval", AsyncMock(return_value=None)):
+        await throttle.acquire()
+        with pytest.raises(LLMThrottleTimeout):
+            await throttle.acquire()
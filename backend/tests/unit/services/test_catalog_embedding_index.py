@@ -0,0 +1,114 @@
+"""
+Unit tests for the cached category/subcategory embedding matrices
+"""
+
+import re
+import zlib
+
+import numpy as np
+import pytest
+
+from src.services.catalog_embedding_index import CATEGORY, SUBCATEGORY, CatalogEmbeddingIndex
+
+CATEGORIES = [
+    {"id": 1, "name": "Home Cleaning", "description": ""},
+    {"id": 2, "name": "Pest Control", "description": ""},
+    {"id": 3, "name": "Packers and Movers", "description": ""},
+]
+
+
+class BagOfWordsEmbeddings:
+    """Deterministic stand-in for the embedding model: hashed bag of words, counts texts embedded"""
+
+    DIM = 256
+
+    def __init__(self):
+        self.embedded = 0
+
+    def embed_text(self, text):
+        self.embedded += 1
+        vector = np.zeros(self.DIM, dtype=np.float32)
+        for token in re.findall(r"[a-z]+", text.lower()):
+            vector[zlib.crc32(token.encode()) % self.DIM] += 1.0
+        return vector.tolist()
+
+    def embed_texts(self, texts):
+        return [self.embed_text(text) for text in texts]
+
+
+@pytest.fixture
+def embeddings():
+    return BagOfWordsEmbeddings()
+
+
+def test_matrix_rows_are_normalized(embeddings):
+    index = CatalogEmbeddingIndex(embeddings)
+
+    matrix = index.get_matrix(CATEGORY, CATEGORIES).matrix
+
+    assert matrix.shape == (3, BagOfWordsEmbeddings.DIM)
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+
+
+def test_similarities_rank_closest_category_first(embeddings):
+    index = CatalogEmbeddingIndex(embeddings)
+
+    scores = index.similarities(CATEGORY, CATEGORIES, "pest control service")
+    best, similarity = max(scores, key=lambda item: item[1])
+
+    assert best["name"] == "Pest Control"
+    assert 0.5 < similarity <= 1.0
+
+
+@pytest.mark.parametrize("query", ["house cleaning service", "cockroach treatment", "shifting my house"])
+def test_similarities_equal_cosine_similarity(embeddings, query):
+    """The cached matrix scores a query like encoding every name with it did"""
+    index = CatalogEmbeddingIndex(embeddings)
+
+    names = np.asarray(embeddings.embed_texts([cat["name"] for cat in CATEGORIES]))
+    vector = np.asarray(embeddings.embed_text(query))
+    expected = names @ vector / np.maximum(np.linalg.norm(names, axis=1) * np.linalg.norm(vector), 1e-12)
+
+    scores = [score for _, score in index.similarities(CATEGORY, CATEGORIES, query)]
+    assert np.allclose(scores, expected, atol=1e-5)
+
+
+def test_catalog_is_embedded_once_per_version(embeddings):
+    """Only the query is embedded until the (id, name) rows change"""
+    index = CatalogEmbeddingIndex(embeddings)
+
+    index.similarities(CATEGORY, CATEGORIES, "cleaning")
+    assert embeddings.embedded == len(CATEGORIES) + 1
+
+    index.similarities(CATEGORY, list(CATEGORIES), "movers")
+    assert embeddings.embedded == len(CATEGORIES) + 2
+
+    renamed = CATEGORIES[:2] + [{"id": 3, "name": "Relocation", "description": ""}]
+    best, _ = max(index.similarities(CATEGORY, renamed, "relocation"), key=lambda item: item[1])
+    assert best["id"] == 3
+    assert embeddings.embedded == 2 * len(CATEGORIES) + 3
+
+
+def test_kinds_are_cached_separately(embeddings):
+    index = CatalogEmbeddingIndex(embeddings)
+    subcategories = [{"id": 10, "name": "Kitchen Cleaning"}, {"id": 11, "name": "Sofa Cleaning"}]
+
+    index.get_matrix(CATEGORY, CATEGORIES)
+    embedded = index.get_matrix(SUBCATEGORY, subcategories)
+
+    assert [entry["id"] for entry in embedded.entries] == [10, 11]
+    assert index.get_matrix(CATEGORY, CATEGORIES).matrix.shape[0] == 3
+    assert index.similarities(SUBCATEGORY, [], "anything") == []
+
+
+def test_default_index_uses_the_rag_embedding_service(embeddings, monkeypatch):
+    from src.core.config import settings
+    from src.rag import embeddings as rag_embeddings
+
+    monkeypatch.setattr(settings, "CATEGORY_EMBEDDING_MODEL", None)
+    monkeypatch.setattr(rag_embeddings, "get_embedding_service", lambda: embeddings)
+
+    index = CatalogEmbeddingIndex()
+    index.get_matrix(CATEGORY, CATEGORIES)
+
+    assert embeddings.embedded == len(CATEGORIES)
@@ -0,0 +1,141 @@
+"""
+Unit tests for the in-memory catalog snapshot and its version-driven hot swap
+"""
+
+from contextlib import asynccontextmanager
+from decimal import Decimal
+
+import pytest
+
+from src.services import catalog_snapshot
+from src.services.catalog_snapshot import (
+    CatalogSnapshot,
+    CatalogSnapshotStore,
+    CategoryEntry,
+    RateCardEntry,
+    SubcategoryEntry,
+)
+
+
+def _category(id, name, display_order=0, subcategory_count=0):
+    return CategoryEntry(
+        id=id, name=name, slug=name.lower().replace(" ", "-"), description=None, image=None,
+        display_order=display_order, is_active=True, subcategory_count=subcategory_count
+    )
+
+
+def _subcategory(id, category_id, name, display_order=0, rate_card_count=0):
+    return SubcategoryEntry(
+        id=id, category_id=category_id, name=name, slug=name.lower().replace(" ", "-"), description=None,
+        image=None, display_order=display_order, is_active=True, rate_card_count=rate_card_count
+    )
+
+
+def _rate_card(id, subcategory_id, name, price):
+    return RateCardEntry(
+        id=id, category_id=1, subcategory_id=subcategory_id, provider_id=1, name=name, description=None,
+        price=Decimal(price), strike_price=None, is_active=True
+    )
+
+
+def _snapshot(version=1):
+    return CatalogSnapshot(
+        version=version,
+        categories=[_category(2, "Plumbing", 2), _category(1, "Home Cleaning", 1, subcategory_count=3)],
+        subcategories=[
+            _subcategory(11, 1, "Sofa Cleaning", 2, rate_card_count=2),
+            _subcategory(10, 1, "Deep Cleaning", 1, rate_card_count=1),
+            _subcategory(20, 2, "Tap Repair", 1),
+        ],
+        rate_cards=[
+            _rate_card(101, 11, "Sofa Cleaning - 5 Seater", "899"),
+            _rate_card(100, 11, "Sofa Cleaning - 3 Seater", "599"),
+            _rate_card(102, 10, "Deep Cleaning - 2 BHK", "2999"),
+        ]
+    )
+
+
+def test_lists_keep_display_order():
+    snapshot = _snapshot()
+
+    assert [cat.name for cat in snapshot.categories] == ["Home Cleaning", "Plumbing"]
+    assert [sub.name for sub in snapshot.list_subcategories(1)] == ["Deep Cleaning", "Sofa Cleaning"]
+    assert [rc.id for rc in snapshot.list_rate_cards(11)] == [100, 101]
+    assert snapshot.list_subcategories(99) == ()
+
+
+def test_id_slug_and_name_indexes():
+    snapshot = _snapshot()
+
+    assert snapshot.get_category(1).name == "Home Cleaning"
+    assert snapshot.get_category_by_slug("plumbing").id == 2
+    assert snapshot.get_category_by_name(" home cleaning ").id == 1
+    assert [sub.id for sub in snapshot.get_subcategories_by_slug("tap-repair")] == [20]
+    assert [sub.id for sub in snapshot.get_subcategories_by_name("Sofa Cleaning")] == [11]
+    assert snapshot.get_rate_card(102).price == Decimal("2999")
+    assert snapshot.get_category(3) is None
+
+
+def test_search_matches_substrings_like_sql_like():
+    snapshot = _snapshot()
+
+    assert [sub.id for sub in snapshot.search_subcategories("cleaning")] == [10, 11]
+    assert [cat.id for cat in snapshot.search_categories("plumb")] == [2]
+    assert [rc.id for rc in snapshot.rate_cards_by_price(11)] == [100, 101]
+
+
+@asynccontextmanager
+async def _session():
+    yield object()
+
+
+@pytest.mark.asyncio
+async def test_store_loads_once_and_swaps_on_version_change(monkeypatch):
+    """Readers get the loaded snapshot until the Redis counter moves"""
+    remote = {"version": 1}
+    loads = []
+
+    async def read_version():
+        return remote["version"]
+
+    async def load(db, version=0):
+        loads.append(version)
+        return _snapshot(version)
+
+    monkeypatch.setattr(catalog_snapshot, "read_catalog_version", read_version)
+    monkeypatch.setattr(catalog_snapshot, "load_catalog_snapshot", load)
+    store = CatalogSnapshotStore(version_check_seconds=0, session_factory=_session)
+
+    first = await store.get(db=object())
+    assert await store.get() is first
+    assert loads == [1]
+
+    remote["version"] = 2
+    assert await store.get() is first  # stale snapshot served while reloading
+    await store._refresh_task
+    assert store.snapshot.version == 2
+    assert loads == [1, 2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("redis_version", [None, 1], ids=["redis_down", "redis_up"])
+async def test_store_reloads_after_max_age(monkeypatch, redis_version):
+    """Writes that never bumped the version are picked up by age, with or without Redis"""
+    async def read_version():
+        return redis_version
+
+    async def load(db, version=0):
+        return _snapshot(version)
+
+    monkeypatch.setattr(catalog_snapshot, "read_catalog_version", read_version)
+    monkeypatch.setattr(catalog_snapshot, "load_catalog_snapshot", load)
+    store = CatalogSnapshotStore(version_check_seconds=0, max_age_seconds=3600, session_factory=_session)
+
+    first = await store.get(db=object())
+    assert await store.get() is first
+    assert store._refresh_task is None
+
+    store.max_age_seconds = 0
+    await store.get()
+    await store._refresh_task
+    assert store.snapshot is not first
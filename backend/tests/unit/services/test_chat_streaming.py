@@ -0,0 +1,172 @@
+"""
+Unit tests for the SSE streaming chat turn
+"""
+
+import json
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.guardrails.core.guardrail_result import Action
+from src.schemas.chat import ChatMessageRequest, ChatMessageResponse, MessageResponse
+from src.services.chat_service import ChatService, stream_chat_message
+from src.utils.stream_events import StreamEventChannel, emit_stage_event, get_stream_channel, stream_events
+
+
+def _parse_frames(frames):
+    """Parse SSE frames into (event, data) tuples"""
+    events = []
+    for frame in frames:
+        lines = frame.strip().split("\n")
+        event = lines[0][len("event: "):]
+        data = json.loads(lines[1][len("data: "):])
+        events.append((event, data))
+    return events
+
+
+def _response(session_id: str, text: str) -> ChatMessageResponse:
+    now = datetime.now(timezone.utc)
+    return ChatMessageResponse(
+        session_id=session_id,
+        user_message=MessageResponse(id=1, role="user", message="hi", created_at=now),
+        assistant_message=MessageResponse(id=2, role="assistant", message=text, created_at=now),
+        response_time_ms=5,
+        metadata={"intent": "greeting"}
+    )
+
+
+@pytest.fixture
+def session_factory():
+    """Patch the session factory used by the streaming turn"""
+    db = AsyncMock()
+    db.get = AsyncMock(return_value=SimpleNamespace(id=7))
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=db)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    with patch("src.core.database.connection.AsyncSessionLocal", factory):
+        yield db
+
+
+class _OutputGuardrails:
+    """Output guardrails that sanitize any text containing a phone number"""
+
+    def __init__(self):
+        self.checked = []
+
+    async def check_output(self, text, user_id, context):
+        self.checked.append(text)
+        action = Action.SANITIZE if "98765" in text else Action.ALLOW
+        return SimpleNamespace(is_blocked=False, final_action=action)
+
+
+@pytest.fixture
+def output_guardrails():
+    guardrails = _OutputGuardrails()
+    with patch("src.services.chat_service.get_guardrail_manager", lambda: guardrails):
+        yield guardrails
+
+
+async def _collect(request: ChatMessageRequest):
+    return [frame async for frame in stream_chat_message(7, request)]
+
+
+@pytest.mark.asyncio
+async def test_stream_emits_stages_tokens_and_final_message(session_factory, output_guardrails):
+    """Stage and token events arrive before the final persisted response"""
+    async def fake_send_message(self, user, request):
+        emit_stage_event("classified", intent="greeting", confidence=0.95, method="pattern_match")
+        emit_stage_event("agent_selected", agent="coordinator", intent="greeting")
+        tokens = get_stream_channel().open_token_stream()
+        assert tokens is not None
+        assert get_stream_channel().open_token_stream() is None
+        await tokens.feed("Hi there! How ")
+        await tokens.feed("can I help?")
+        await tokens.close()
+        return _response(request.session_id, "Hi there! How can I help?")
+
+    with patch.object(ChatService, "send_message", fake_send_message):
+        events = _parse_frames(await _collect(ChatMessageRequest(message="hi")))
+
+    names = [name for name, _ in events]
+    assert names == ["session", "classified", "agent_selected", "token", "token", "done"]
+    assert [data["text"] for name, data in events if name == "token"] == ["Hi there!", " How can I help?"]
+    session_id = events[0][1]["session_id"]
+    assert session_id.startswith("session_")
+    assert events[-1][1]["session_id"] == session_id
+    assert events[-1][1]["assistant_message"]["message"] == "Hi there! How can I help?"
+
+
+@pytest.mark.asyncio
+async def test_stream_holds_text_the_output_guardrails_change(session_factory, output_guardrails):
+    """Sentences are checked before they are sent; the sanitized answer replaces the streamed prefix"""
+
+    async def fake_send_message(self, user, request):
+        tokens = get_stream_channel().open_token_stream()
+        for chunk in ["Sure. Call me ", "at 98765 43210. ", "Anything else?"]:
+            await tokens.feed(chunk)
+        await tokens.close()
+        return _response(request.session_id, "Sure. Call me at [REDACTED]. Anything else?")
+
+    with patch.object(ChatService, "send_message", fake_send_message):
+        events = _parse_frames(await _collect(ChatMessageRequest(message="hi", session_id="session_abc")))
+
+    assert events[0] == ("session", {"session_id": "session_abc"})
+    # The PII sentence and everything after it never reach the client
+    assert [data["text"] for name, data in events if name == "token"] == ["Sure."]
+    assert output_guardrails.checked == ["Sure.", " Call me at 98765 43210."]
+    assert ("replace", {"text": "Sure. Call me at [REDACTED]. Anything else?"}) in events
+    assert events[-1][0] == "done"
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_errors(session_factory):
+    """Failures are reported as an error event instead of a broken stream"""
+    async def fake_send_message(self, user, request):
+        raise RuntimeError("database unavailable")
+
+    with patch.object(ChatService, "send_message", fake_send_message):
+        events = _parse_frames(await _collect(ChatMessageRequest(message="hi")))
+
+    assert events[-1] == ("error", {"detail": "Failed to process message", "status_code": 500})
+
+
+@pytest.mark.asyncio
+async def test_llm_generation_streams_tokens_into_channel():
+    """The generation tagged as the answer streams its chunks when a channel is bound"""
+    import os
+    os.environ.setdefault("GOOGLE_API_KEY", "test-google-api-key")
+    from src.llm.gemini.client import LLMClient, reset_llm_registry
+
+    reset_llm_registry()
+    with patch("src.llm.gemini.client.genai") as mock_genai:
+        mock_genai.GenerativeModel.return_value = MagicMock()
+        mock_genai.GenerationConfig.side_effect = lambda **kwargs: SimpleNamespace(**kwargs)
+        client = LLMClient(model="gemini-test", temperature=0.7, max_tokens=64)
+
+        class FakeStream:
+            usage_metadata = None
+
+            def __aiter__(self):
+                async def chunks():
+                    for text in ["Hello", ", ", "Priya"]:
+                        yield SimpleNamespace(text=text)
+                return chunks()
+
+        client.client.generate_content_async = AsyncMock(
+            side_effect=[SimpleNamespace(text="booking summary", usage_metadata=None), FakeStream()]
+        )
+
+        channel = StreamEventChannel()
+        with stream_events(channel):
+            # Generations not tagged as the answer (e.g. extraction) never stream
+            await client.generate("summarise the booking")
+            text = await client.generate("greet the user", stream_to_user=True)
+
+    reset_llm_registry()
+
+    assert text == "Hello, Priya"
+    assert channel.streamed_text == "Hello, Priya"
+    calls = client.client.generate_content_async.await_args_list
+    assert "stream" not in calls[0].kwargs
+    assert calls[1].kwargs["stream"] is True
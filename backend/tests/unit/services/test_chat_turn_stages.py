@@ -0,0 +1,90 @@
+"""
+Unit tests for the chat-turn stage DAG in ChatService.send_message
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.chat_service import ChatService
+from tests.fixtures.chat_turn_backends import INPUT_GUARDRAILS, chat_request, install_backends
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    return install_backends(monkeypatch)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_gets_the_prefetched_context(backends):
+    """History and dialog state are loaded alongside the input guardrails and handed over"""
+    service = ChatService(db=None)
+
+    await service.send_message(SimpleNamespace(id=1), chat_request())
+
+    # The coordinator got the prefetched dialog state and the history plus the current message
+    call = backends.coordinator_calls[-1]
+    assert call["dialog_state"] == "active-state"
+    assert [msg["content"] for msg in call["history"]] == ["hi", "hello", "I want to book an AC service"]
+
+
+@pytest.mark.asyncio
+async def test_blocked_input_cancels_speculative_stages(backends, monkeypatch):
+    service = ChatService(db=None)
+    backends.guardrails.block = True
+    rollbacks = []
+
+    async def slow_history(self, user_id, session_id, limit=10):
+        await asyncio.sleep(10)
+        backends.history_done = True
+        return []
+
+    async def rollback():
+        rollbacks.append(True)
+
+    monkeypatch.setattr(ChatService, "_get_conversation_history", slow_history)
+    service.db = SimpleNamespace(rollback=rollback)
+
+    start = time.perf_counter()
+    response = await service.send_message(SimpleNamespace(id=1), chat_request())
+    elapsed = time.perf_counter() - start
+
+    assert response.metadata["guardrail_blocked"] is True
+    assert elapsed < 1
+    assert not backends.history_done
+    assert rollbacks  # the interrupted read is rolled back before the blocked turn is stored
+    # Only the original message and the blocked response are stored
+    assert [msg.message for msg in backends.stored] == ["I want to book an AC service", "Blocked"]
+    assert backends.coordinator_calls == []
+
+
+@pytest.mark.asyncio
+async def test_failed_turn_cancels_speculative_stages(backends, monkeypatch):
+    service = ChatService(db=None)
+    rollbacks = []
+
+    async def failing_check(text, user_id, context):
+        await asyncio.sleep(INPUT_GUARDRAILS)
+        raise ConnectionError("guardrail backend unavailable")
+
+    async def slow_history(self, user_id, session_id, limit=10):
+        await asyncio.sleep(10)
+        backends.history_done = True
+        return []
+
+    async def rollback():
+        rollbacks.append(True)
+
+    monkeypatch.setattr(backends.guardrails, "check_input", failing_check)
+    monkeypatch.setattr(ChatService, "_get_conversation_history", slow_history)
+    service.db = SimpleNamespace(rollback=rollback)
+
+    with pytest.raises(ConnectionError):
+        await service.send_message(SimpleNamespace(id=1), chat_request())
+    await asyncio.sleep(0)
+
+    assert not backends.history_done
+    assert rollbacks
+    assert backends.stored == []
@@ -0,0 +1,102 @@
+"""
+Unit tests for multi-slot (batched) entity extraction
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.nlp.intent.config import EntityType
+from src.services.entity_extractor import (
+    EntityExtractor,
+    MultiExtractionOutput,
+    SlotExtractionOutput,
+)
+
+MESSAGE = "order 55512 near the old fort area"
+CONTEXT = {"collected_entities": {}, "last_question": "Which booking?"}
+
+
+def _llm_client(slots):
+    """LLM client whose structured output returns the given slots"""
+    structured = MagicMock()
+    structured.ainvoke = AsyncMock(return_value=MultiExtractionOutput(slots=slots))
+    client = MagicMock()
+    client.with_structured_output = MagicMock(return_value=structured)
+    return client, structured
+
+
+@pytest.mark.asyncio
+async def test_pattern_misses_share_one_llm_call():
+    """All slots the patterns miss are extracted with a single LLM call"""
+    client, structured = _llm_client([
+        SlotExtractionOutput(entity_type="booking_id", entity_value="55512", confidence=0.9, normalized_value="BOOK-55512"),
+        SlotExtractionOutput(entity_type="location", entity_value="NOT_FOUND", confidence=0.0),
+    ])
+    extractor = EntityExtractor(llm_client=client)
+
+    results = await extractor.extract_multiple_entities(
+        MESSAGE, [EntityType.BOOKING_ID, EntityType.LOCATION], CONTEXT
+    )
+
+    assert structured.ainvoke.await_count == 1
+    client.with_structured_output.assert_called_once_with(MultiExtractionOutput)
+    assert list(results) == ["booking_id"]
+    assert results["booking_id"].extraction_method == "llm"
+    assert results["booking_id"].normalized_value == "BOOK-55512"
+
+
+@pytest.mark.asyncio
+async def test_llm_not_found_overrides_low_confidence_pattern_result():
+    """A slot the LLM answered NOT_FOUND is not filled with the pattern guess"""
+    client, _ = _llm_client([
+        SlotExtractionOutput(entity_type="booking_id", entity_value="NOT_FOUND", confidence=0.0),
+        SlotExtractionOutput(entity_type="location", entity_value="Old Fort", confidence=0.8),
+    ])
+    extractor = EntityExtractor(llm_client=client)
+
+    results = await extractor.extract_multiple_entities(
+        MESSAGE, [EntityType.BOOKING_ID, EntityType.LOCATION], CONTEXT
+    )
+
+    assert list(results) == ["location"]
+    assert results["location"].entity_value == "Old Fort"
+
+
+@pytest.mark.asyncio
+async def test_low_confidence_pattern_result_is_kept_without_llm_answer():
+    """Per-slot fallback to the pattern guess when the LLM call fails or omits the slot"""
+    client, structured = _llm_client([
+        SlotExtractionOutput(entity_type="location", entity_value="Old Fort", confidence=0.8),
+    ])
+    extractor = EntityExtractor(llm_client=client)
+
+    results = await extractor.extract_multiple_entities(
+        MESSAGE, [EntityType.BOOKING_ID, EntityType.LOCATION], CONTEXT
+    )
+
+    assert list(results) == ["booking_id", "location"]
+    assert results["booking_id"].extraction_method == "heuristic"
+
+    structured.ainvoke.side_effect = ConnectionError("LLM unavailable")
+    results = await extractor.extract_multiple_entities(
+        MESSAGE, [EntityType.BOOKING_ID, EntityType.LOCATION], CONTEXT
+    )
+
+    assert list(results) == ["booking_id"]
+    assert results["booking_id"].extraction_method == "heuristic"
+
+
+@pytest.mark.asyncio
+async def test_pattern_hits_skip_the_llm():
+    """Nothing missing means no LLM call"""
+    client, structured = _llm_client([])
+    extractor = EntityExtractor(llm_client=client)
+
+    results = await extractor.extract_multiple_entities(
+        "ORDA5D9F532 at 560001", [EntityType.BOOKING_ID, EntityType.LOCATION], CONTEXT
+    )
+
+    assert structured.ainvoke.await_count == 0
+    assert results["booking_id"].normalized_value == "ORDA5D9F532"
+    assert results["location"].entity_value == "560001"
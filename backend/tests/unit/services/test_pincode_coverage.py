@@ -0,0 +1,205 @@
+"""
+Unit tests for the in-memory pincode coverage index and its incremental refresh
+"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import pincode_coverage
+from src.services.pincode_coverage import PincodeCoverageIndex, PincodeCoverageStore, PincodeEntry
+
+
+def _pincodes():
+    return [
+        PincodeEntry(id=1, pincode="560001", city="Bangalore", state="Karnataka", is_serviceable=True),
+        PincodeEntry(id=2, pincode="560002", city="Bangalore", state="Karnataka", is_serviceable=True),
+        PincodeEntry(id=3, pincode="400001", city="Mumbai", state="Maharashtra", is_serviceable=False),
+    ]
+
+
+def _rate_card(id, provider_id):
+    return SimpleNamespace(id=id, provider_id=provider_id, name=f"Service {id}")
+
+
+def test_pincode_lookup_and_provider_counts():
+    index = PincodeCoverageIndex(_pincodes(), {10: [1, 2], 11: [1]})
+
+    assert index.get_pincode("560002").id == 2
+    assert not index.get_pincode("400001").is_serviceable
+    assert index.get_pincode("999999") is None
+    assert index.available_providers(1) == 2
+    assert index.available_providers(2) == 1
+    assert index.available_providers(3) == 0
+
+
+def test_uncovered_rate_cards():
+    index = PincodeCoverageIndex(_pincodes(), {10: [1, 2], 11: [1]})
+    cart = [_rate_card(100, 10), _rate_card(101, 11), _rate_card(102, 12)]
+
+    assert [rc.id for rc in index.uncovered_rate_cards(1, cart)] == [102]
+    assert [rc.id for rc in index.uncovered_rate_cards(2, cart)] == [101, 102]
+    assert [rc.id for rc in index.uncovered_rate_cards(99, cart)] == [100, 101, 102]
+
+
+def test_set_provider_coverage_matches_fresh_build():
+    index = PincodeCoverageIndex(_pincodes(), {10: [1, 2], 11: [1]})
+
+    index.set_provider_coverage(10, [2, 3])
+    index.set_provider_coverage(11, [])
+    index.set_provider_coverage(12, [1])
+    fresh = PincodeCoverageIndex(_pincodes(), {10: [2, 3], 12: [1]})
+
+    for pincode_id in (1, 2, 3):
+        assert index.available_providers(pincode_id) == fresh.available_providers(pincode_id)
+        for provider_id in (10, 11, 12):
+            assert index.covers(provider_id, pincode_id) == fresh.covers(provider_id, pincode_id)
+    assert index.provider_count == 2
+
+
+@asynccontextmanager
+async def _session():
+    yield object()
+
+
+@pytest.mark.asyncio
+async def test_store_reloads_only_changed_providers(monkeypatch):
+    """A logged provider change reloads that provider's rows, not the whole table"""
+    remote = {"version": 1, "changed": set()}
+    rows = {10: [1, 2], 11: [1]}
+    full_loads = []
+    provider_loads = []
+
+    async def read_changes(since):
+        if remote["version"] <= since:
+            return remote["version"], set()
+        return remote["version"], remote["changed"]
+
+    async def load_all(db, version=0):
+        full_loads.append(version)
+        return PincodeCoverageIndex(_pincodes(), rows, version=version)
+
+    async def load_providers(db, provider_ids=None):
+        provider_loads.append(set(provider_ids))
+        return {provider_id: rows.get(provider_id, []) for provider_id in provider_ids}
+
+    monkeypatch.setattr(pincode_coverage, "read_coverage_changes", read_changes)
+    monkeypatch.setattr(pincode_coverage, "load_pincode_coverage", load_all)
+    monkeypatch.setattr(pincode_coverage, "load_provider_coverage", load_providers)
+    store = PincodeCoverageStore(version_check_seconds=0, session_factory=_session)
+
+    first = await store.get(db=object())
+    assert first.available_providers(2) == 1
+
+    rows[11] = [1, 2]
+    remote.update(version=2, changed={11})
+    assert await store.get() is first  # current index served while updating
+    await store._refresh_task
+
+    assert store.index is first
+    assert store.index.version == 2
+    assert first.available_providers(2) == 2
+    assert full_loads == [1]
+    assert provider_loads == [{11}]
+
+
+@pytest.mark.asyncio
+async def test_store_full_reload_when_change_log_incomplete(monkeypatch):
+    remote = {"version": 1}
+
+    async def read_changes(since):
+        return remote["version"], (set() if remote["version"] <= since else None)
+
+    async def load_all(db, version=0):
+        return PincodeCoverageIndex(_pincodes(), {}, version=version)
+
+    monkeypatch.setattr(pincode_coverage, "read_coverage_changes", read_changes)
+    monkeypatch.setattr(pincode_coverage, "load_pincode_coverage", load_all)
+    store = PincodeCoverageStore(version_check_seconds=0, session_factory=_session)
+
+    first = await store.get(db=object())
+    remote["version"] = 5
+    await store.get()
+    await store._refresh_task
+
+    assert store.index is not first
+    assert store.index.version == 5
+
+
+@pytest.mark.asyncio
+async def test_store_reloads_after_max_age_with_redis_up(monkeypatch):
+    """Writes never published to the change log are picked up once the index is max_age old"""
+    rows = {10: [1]}
+
+    async def read_changes(since):
+        return 1, set()
+
+    async def load_all(db, version=0):
+        return PincodeCoverageIndex(_pincodes(), dict(rows), version=version)
+
+    monkeypatch.setattr(pincode_coverage, "read_coverage_changes", read_changes)
+    monkeypatch.setattr(pincode_coverage, "load_pincode_coverage", load_all)
+    store = PincodeCoverageStore(version_check_seconds=0, max_age_seconds=3600, session_factory=_session)
+
+    first = await store.get(db=object())
+    rows[11] = [1]
+    assert await store.get() is first
+    assert store._refresh_task is None
+
+    store.max_age_seconds = 0
+    await store.get()
+    await store._refresh_task
+
+    assert store.index is not first
+    assert store.index.available_providers(1) == 2
+
+
+@pytest.fixture
+def database(monkeypatch):
+    """Current pincode rows and provider coverage; records published changes"""
+    state = SimpleNamespace(pincodes={p.pincode: p for p in _pincodes()}, rows={10: [1, 2], 11: [1]}, published=[])
+
+    async def load_entry(db, pincode):
+        return state.pincodes.get(pincode)
+
+    async def load_providers(db, provider_ids=None):
+        return {provider_id: state.rows.get(provider_id, []) for provider_id in provider_ids}
+
+    async def publish(provider_id=None):
+        state.published.append(provider_id)
+        return len(state.published)
+
+    monkeypatch.setattr(pincode_coverage, "load_pincode_entry", load_entry)
+    monkeypatch.setattr(pincode_coverage, "load_provider_coverage", load_providers)
+    monkeypatch.setattr(pincode_coverage, "publish_coverage_change", publish)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_confirm_coverage_reads_through_a_stale_index(database):
+    """A provider deactivated after the index was loaded is not bookable; the change is published"""
+    index = PincodeCoverageIndex(_pincodes(), {10: [1, 2], 11: [1]})
+    cart = [_rate_card(100, 10), _rate_card(101, 11)]
+
+    entry, uncovered = await pincode_coverage.confirm_coverage(object(), index, "560001", cart)
+    assert entry.id == 1 and uncovered == []
+    assert database.published == []
+
+    del database.rows[10]
+    entry, uncovered = await pincode_coverage.confirm_coverage(object(), index, "560001", cart)
+    assert [rc.id for rc in uncovered] == [100]
+    assert database.published == [10]
+
+
+@pytest.mark.asyncio
+async def test_confirm_coverage_finds_pincodes_the_index_lacks(database):
+    """A pincode added after the index was loaded is bookable and triggers a full reload"""
+    index = PincodeCoverageIndex(_pincodes(), {10: [1, 2], 11: [1]})
+    database.pincodes["560003"] = PincodeEntry(id=4, pincode="560003", city="Bangalore", state="Karnataka", is_serviceable=True)
+    database.rows[10] = [1, 2, 4]
+
+    entry, uncovered = await pincode_coverage.confirm_coverage(object(), index, "560003", [_rate_card(100, 10)])
+
+    assert entry.id == 4 and uncovered == []
+    assert database.published[0] is None
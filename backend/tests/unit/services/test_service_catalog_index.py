@@ -0,0 +1,141 @@
+"""
+Unit tests for the process-wide service catalog index
+"""
+
+from decimal import Decimal
+from difflib import SequenceMatcher
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import catalog_snapshot
+from src.services.catalog_snapshot import CatalogSnapshot, CategoryEntry, RateCardEntry, SubcategoryEntry
+from src.services.service_catalog_index import (
+    ServiceCatalogIndex,
+    TrigramIndex,
+    build_catalog_entries,
+)
+from src.services.service_dictionary import ServiceDictionary
+
+NAMES = [
+    "texture painting - basic",
+    "texture painting - premium",
+    "wall painting",
+    "ac repair",
+    "ac installation",
+    "deep cleaning",
+    "sofa cleaning",
+    "tap repair",
+]
+
+
+def _catalog():
+    rate_cards = [
+        SimpleNamespace(id=i, name=name.title(), category_id=1, subcategory_id=10, price=499)
+        for i, name in enumerate(NAMES, start=1)
+    ]
+    subcategories = [SimpleNamespace(id=10, name="Texture Painting", category_id=1)]
+    categories = [SimpleNamespace(id=1, name="Painting"), SimpleNamespace(id=2, name="Wall Painting")]
+    return build_catalog_entries(rate_cards, subcategories, categories)
+
+
+def _snapshot(version, rate_card_names):
+    return CatalogSnapshot(
+        version=version,
+        categories=[CategoryEntry(
+            id=1, name="Painting", slug="painting", description=None, image=None, display_order=0, is_active=True
+        )],
+        subcategories=[SubcategoryEntry(
+            id=10, category_id=1, name="Texture Painting", slug="texture-painting", description=None,
+            image=None, display_order=0, is_active=True
+        )],
+        rate_cards=[
+            RateCardEntry(
+                id=i, category_id=1, subcategory_id=10, provider_id=1, name=name.title(), description=None,
+                price=Decimal("499"), strike_price=None, is_active=True
+            )
+            for i, name in enumerate(rate_card_names, start=1)
+        ]
+    )
+
+
+@pytest.fixture
+def current_snapshot(monkeypatch):
+    """Catalog snapshot returned by get_catalog_snapshot (replace .snapshot to move the version)"""
+    current = SimpleNamespace(snapshot=_snapshot(1, NAMES), loads=0)
+
+    async def get_catalog_snapshot(db=None):
+        current.loads += 1
+        return current.snapshot
+
+    monkeypatch.setattr(catalog_snapshot, "get_catalog_snapshot", get_catalog_snapshot)
+    return current
+
+
+def test_build_catalog_entries_keeps_first_position_and_last_metadata():
+    """A category sharing a rate card's name replaces its metadata, not its position"""
+    names, metadata = _catalog()
+
+    assert names.count("wall painting") == 1
+    assert names.index("wall painting") == NAMES.index("wall painting")
+    assert metadata["wall painting"]["type"] == "category"
+    assert metadata["texture painting"]["type"] == "subcategory"
+
+
+@pytest.mark.parametrize("query", ["texture pianting", "ac repiar", "sofa clening", "painting", "tap"])
+def test_trigram_fuzzy_match_agrees_with_full_scan(query):
+    """The trigram shortlist finds the same matches as scoring every name"""
+    names, _ = _catalog()
+    full_scan = sorted(
+        ((name, SequenceMatcher(None, query, name).ratio()) for name in names),
+        key=lambda item: item[1],
+        reverse=True
+    )
+    expected = [(name, ratio) for name, ratio in full_scan if ratio >= 0.6]
+
+    assert TrigramIndex(names).fuzzy_match(query, threshold=0.6) == expected
+
+
+@pytest.mark.asyncio
+async def test_index_is_built_once_per_snapshot_and_shared(current_snapshot):
+    """Dictionaries share one index built from the catalog snapshot, not their own DB load"""
+    index = ServiceCatalogIndex()
+
+    first = ServiceDictionary(db=object(), index=index)
+    second = ServiceDictionary(db=object(), index=index)
+    await first.search("wall painting")
+    data = index.data
+    results = await second.search("texture pianting - basic")
+
+    assert index.data is data
+    assert index.version == 1
+    assert results[0]["name"] == "texture painting - basic"
+    assert results[0]["method"] in ("spell_corrected", "fuzzy")
+    assert results[0]["metadata"]["type"] == "rate_card"
+
+
+@pytest.mark.asyncio
+async def test_index_follows_the_catalog_snapshot_version(current_snapshot):
+    """A rate card the snapshot dropped is no longer resolved; a new one is"""
+    index = ServiceCatalogIndex()
+    dictionary = ServiceDictionary(db=object(), index=index)
+    assert (await dictionary.search("ac repair"))[0]["metadata"]["id"] == NAMES.index("ac repair") + 1
+
+    current_snapshot.snapshot = _snapshot(2, [name for name in NAMES if name != "ac repair"] + ["geyser repair"])
+
+    assert all(match["name"] != "ac repair" for match in await dictionary.search("ac repair"))
+    assert (await dictionary.search("geyser repair"))[0]["name"] == "geyser repair"
+    assert index.version == 2
+
+
+@pytest.mark.asyncio
+async def test_an_older_snapshot_does_not_replace_a_newer_index(current_snapshot):
+    index = ServiceCatalogIndex()
+    older = current_snapshot.snapshot
+    current_snapshot.snapshot = _snapshot(2, ["ac repair"])
+    await index.ensure_loaded()
+
+    async with index._lock:
+        await index._sync_locked(older)
+
+    assert index.version == 2
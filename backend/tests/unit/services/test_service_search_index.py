@@ -0,0 +1,83 @@
+"""
+Unit tests for the BM25 service search index
+"""
+
+from dataclasses import replace
+from decimal import Decimal
+
+import pytest
+
+from src.services.service_search_index import SearchDocument, ServiceSearchIndex
+
+
+def _doc(id, name, price, subcategory="", category="", category_id=1, description=None):
+    return SearchDocument(
+        id=id, name=name, description=description, subcategory=subcategory, category=category,
+        category_id=category_id, price=Decimal(price), strike_price=None
+    )
+
+
+DOCUMENTS = {
+    1: _doc(1, "AC Repair - Basic", "499", "AC Repair", "Appliance Repair", 2),
+    2: _doc(2, "AC Installation", "1499", "AC Installation", "Appliance Repair", 2),
+    3: _doc(3, "Sofa Cleaning - 5 Seater", "899", "Sofa Cleaning", "Home Cleaning", 1),
+    4: _doc(4, "Deep Cleaning - 2 BHK", "2999", "Deep Cleaning", "Home Cleaning", 1,
+            description="Full home deep clean including sofa vacuuming"),
+    5: _doc(5, "Tap Repair", "199", "Tap Repair", "Plumbing", 3),
+}
+
+
+@pytest.fixture
+def index():
+    index = ServiceSearchIndex()
+    index.sync(DOCUMENTS)
+    return index
+
+
+def _ids(hits):
+    return [hit.document.id for hit in hits]
+
+
+def test_ranks_by_relevance_not_price(index):
+    """Name matches beat description-only matches regardless of price"""
+    hits = index.search("sofa cleaning")
+
+    assert _ids(hits)[:2] == [3, 4]
+    assert hits[0].score > hits[1].score
+
+
+def test_all_query_terms_outrank_one(index):
+    assert _ids(index.search("ac repair"))[0] == 1
+
+
+def test_partial_words_expand_to_vocabulary(index):
+    """'clean' finds 'cleaning' like ILIKE '%clean%' did; the exact word ranks first"""
+    assert _ids(index.search("clean")) == [4, 3]
+    assert _ids(index.search("instal")) == [2]
+    assert index.search("zzz") == []
+
+
+def test_filters(index):
+    assert _ids(index.search("repair", max_price=500)) == [1, 5]  # three "repair" fields beat two
+    assert _ids(index.search("repair", min_price=300, max_price=600)) == [1]
+    assert _ids(index.search("cleaning", category_id=1)) == [3, 4]
+    assert index.search("cleaning", category_id="2") == []
+
+
+def test_incremental_updates_match_a_fresh_build(index):
+    """Removing, changing and adding documents scores like rebuilding from scratch"""
+    updated = dict(DOCUMENTS)
+    del updated[5]
+    updated[3] = replace(DOCUMENTS[3], name="Sofa Shampooing - 5 Seater")
+    updated[6] = _doc(6, "Kitchen Cleaning", "1299", "Kitchen Cleaning", "Home Cleaning", 1)
+
+    assert index.sync(updated) == (2, 1)
+    fresh = ServiceSearchIndex()
+    fresh.sync(updated)
+
+    for query in ["cleaning", "sofa", "repair", "shampoo"]:
+        incremental = [(hit.document.id, round(hit.score, 9)) for hit in index.search(query)]
+        rebuilt = [(hit.document.id, round(hit.score, 9)) for hit in fresh.search(query)]
+        assert incremental == rebuilt, query
+    assert index.search("tap") == []
+    assert len(index) == 5
@@ -0,0 +1,79 @@
+"""
+Unit tests for SymSpell-based service-name spelling correction
+"""
+
+import pytest
+
+from src.services.service_catalog_index import ServiceCatalogIndex
+from src.services.service_dictionary import ServiceDictionary
+from src.utils.symspell import SymSpellDictionary, osa_distance
+
+NAMES = [
+    "texture painting - basic",
+    "texture painting - premium",
+    "wall painting",
+    "ac repair",
+    "ac installation",
+    "sofa cleaning",
+    "deep cleaning",
+]
+
+
+@pytest.mark.parametrize("source,target,expected", [
+    ("painting", "painting", 0),
+    ("pianting", "painting", 1),  # adjacent transposition
+    ("paintng", "painting", 1),
+    ("pianitng", "painting", 2),
+    ("repair", "painting", 3),  # capped at max_distance + 1
+])
+def test_osa_distance(source, target, expected):
+    assert osa_distance(source, target, max_distance=2) == expected
+
+
+def test_correction_prefers_smallest_distance_then_frequency():
+    """Ties at the same distance go to the more frequent word"""
+    dictionary = SymSpellDictionary({"cleaning": 5, "clearing": 1, "painting": 3})
+
+    assert dictionary.correction("cleaning") == "cleaning"
+    assert dictionary.correction("cleaing") == "cleaning"
+    assert dictionary.correction("paintign") == "painting"
+    assert dictionary.correction("xyzxyzxyz") is None
+
+
+def test_from_texts_counts_catalog_words():
+    dictionary = SymSpellDictionary.from_texts(NAMES)
+
+    assert dictionary.word_counts["painting"] == 3
+    assert dictionary.word_counts["cleaning"] == 2
+    assert "-" not in dictionary
+
+
+def test_common_typos_correct_to_catalog_words():
+    """Transpositions, dropped and doubled letters resolve to catalog words"""
+    dictionary = SymSpellDictionary.from_texts(NAMES)
+
+    corrected = [dictionary.correction(word) for word in ["pianting", "paintng", "texure", "repiar", "clening", "instalation"]]
+
+    assert corrected == ["painting", "painting", "texture", "repair", "cleaning", "installation"]
+
+
+def test_max_distance_limits_suggestions():
+    dictionary = SymSpellDictionary.from_texts(NAMES, max_edit_distance=2)
+
+    assert dictionary.correction("pianitng") == "painting"
+    assert dictionary.correction("pianitng", max_distance=1) is None
+
+
+@pytest.mark.asyncio
+async def test_correct_spelling_uses_catalog_dictionary():
+    """Typos are corrected word by word; separators are left alone"""
+    index = ServiceCatalogIndex()
+    index.load(NAMES, {name: {"type": "rate_card", "name": name} for name in NAMES})
+    dictionary = ServiceDictionary(db=None, index=index)
+
+    assert await dictionary.correct_spelling("texture pianting - basic") == ("texture painting - basic", 0.8)
+    assert await dictionary.correct_spelling("wall painting") == ("wall painting", 1.0)
+
+    results = await dictionary.search("sofa claening")
+    assert results[0]["name"] == "sofa cleaning"
+    assert results[0]["method"] == "spell_corrected"
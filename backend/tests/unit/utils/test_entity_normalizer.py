@@ -0,0 +1,15 @@
+"""
+Unit tests for the compiled date/time normalization engine
+"""
+
+from tests.fixtures.entity_normalization_reference import PHRASES, clear_caches, compiled_extract, legacy_extract
+
+
+def test_compiled_engine_matches_reference():
+    """Compiled engine resolves the corpus to the same dates as the reference"""
+    clear_caches()
+    for phrase in PHRASES:
+        legacy_date, _ = legacy_extract(phrase)
+        compiled_date, compiled_time = compiled_extract(phrase)
+        assert compiled_date == legacy_date, phrase
+        assert compiled_date or compiled_time, phrase